@@ -0,0 +1,125 @@
+// HR Dashboard service worker - generated by src/visualization/service_worker.py
+// HR 대시보드 서비스 워커 - src/visualization/service_worker.py에서 생성
+
+const PRECACHE_VERSION = 'd5921785a7526b5d';
+const PRECACHE_PREFIX = 'hr-precache-';
+const PRECACHE = PRECACHE_PREFIX + PRECACHE_VERSION;
+const RUNTIME = 'hr-runtime';
+const MANIFEST_URL = 'precache-manifest.json';
+const MANIFEST_KEY = new URL('__precache-manifest__', self.registration.scope).href;
+const CDN_HOSTS = ["cdn.jsdelivr.net", "d3js.org", "cdn.plot.ly"];
+
+function scopeUrl(path) {
+    return new URL(path, self.registration.scope).href;
+}
+
+// Previous precache and its manifest, so unchanged files are copied instead of re-downloaded
+// 이전 사전 캐시와 매니페스트 (변경 없는 파일은 다시 받지 않고 복사)
+async function findPreviousPrecache() {
+    const names = (await caches.keys()).filter(name => name.startsWith(PRECACHE_PREFIX) && name !== PRECACHE);
+    for (const name of names.reverse()) {
+        const cache = await caches.open(name);
+        const manifestResponse = await cache.match(MANIFEST_KEY);
+        if (manifestResponse) {
+            const manifest = await manifestResponse.json();
+            const hashes = new Map(manifest.files.map(entry => [entry.url, entry.hash]));
+            return { cache, hashes };
+        }
+    }
+    return null;
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const response = await fetch(`${MANIFEST_URL}?v=${PRECACHE_VERSION}`, { cache: 'no-store' });
+        const manifest = await response.json();
+        const cache = await caches.open(PRECACHE);
+        const previous = await findPreviousPrecache();
+
+        await Promise.all(manifest.files.map(async entry => {
+            const url = scopeUrl(entry.url);
+            if (previous && previous.hashes.get(entry.url) === entry.hash) {
+                const reused = await previous.cache.match(url);
+                if (reused) return cache.put(url, reused);
+            }
+            const fresh = await fetch(url, { cache: 'no-cache' });
+            if (!fresh.ok) throw new Error(`Precache failed: ${entry.url} (${fresh.status})`);
+            return cache.put(url, fresh);
+        }));
+
+        await cache.put(MANIFEST_KEY, new Response(JSON.stringify(manifest)));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        const names = await caches.keys();
+        await Promise.all(names
+            .filter(name => name.startsWith(PRECACHE_PREFIX) && name !== PRECACHE)
+            .map(name => caches.delete(name)));
+        await self.clients.claim();
+    })());
+});
+
+// dashboards.json: answer from cache immediately, refresh it in the background
+// dashboards.json: 캐시로 즉시 응답하고 백그라운드에서 갱신
+async function staleWhileRevalidate(event, url) {
+    const cache = await caches.open(RUNTIME);
+    const key = url.origin + url.pathname;
+    const cached = await cache.match(key);
+    const network = fetch(event.request, { cache: 'no-cache' }).then(response => {
+        if (response.ok) cache.put(key, response.clone());
+        return response;
+    });
+    event.waitUntil(network.catch(() => null));
+    return cached || network;
+}
+
+// Same-origin pages: precache first, then network with a runtime-cache fallback
+// 동일 출처 페이지: 사전 캐시 우선, 이후 네트워크 (실패 시 런타임 캐시)
+async function precacheFirst(request, url) {
+    const precache = await caches.open(PRECACHE);
+    const path = url.pathname.endsWith('/') ? url.pathname + 'index.html' : url.pathname;
+    const precached = await precache.match(url.origin + path);
+    if (precached) return precached;
+
+    const runtime = await caches.open(RUNTIME);
+    try {
+        const response = await fetch(request);
+        if (response.ok) runtime.put(request, response.clone());
+        return response;
+    } catch (e) {
+        const cached = await runtime.match(request, { ignoreSearch: true });
+        if (cached) return cached;
+        throw e;
+    }
+}
+
+// Versioned CDN libraries never change: cache-first
+// 버전이 고정된 CDN 라이브러리는 변하지 않으므로 cache-first
+async function cacheFirst(request) {
+    const runtime = await caches.open(RUNTIME);
+    const cached = await runtime.match(request);
+    if (cached) return cached;
+
+    const response = await fetch(request);
+    if (response.ok || response.type === 'opaque') runtime.put(request, response.clone());
+    return response;
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+
+    const url = new URL(request.url);
+    if (url.origin === self.location.origin) {
+        if (url.pathname.endsWith('/dashboards.json')) {
+            event.respondWith(staleWhileRevalidate(event, url));
+        } else if (!url.pathname.endsWith('/' + MANIFEST_URL)) {
+            event.respondWith(precacheFirst(request, url));
+        }
+    } else if (CDN_HOSTS.includes(url.hostname)) {
+        event.respondWith(cacheFirst(request));
+    }
+});
@@ -7,7 +7,10 @@ HR 대시보드 데이터 구조에 최적화
 """
 
 import pandas as pd
+import hashlib
 import json
+import os
+import pickle
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
@@ -16,13 +19,39 @@ import sys
 # Add parent directory to path for imports
 if __name__ == '__main__':
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from src.data import columnar_store, excel_reader, file_index, schemas
     from src.data.monthly_data_collector import MonthlyDataCollector
+    from src.utils import encoding_cache
     from src.utils.employee_counter import count_employees_by_month
     from src.utils.date_handler import parse_entrance_date, parse_stop_date, parse_date_column
+    from src.utils.file_hash import file_signature
 else:
+    from ..data import columnar_store, excel_reader, file_index, schemas
     from ..data.monthly_data_collector import MonthlyDataCollector
+    from ..utils import encoding_cache
     from ..utils.employee_counter import count_employees_by_month
     from ..utils.date_handler import parse_entrance_date, parse_stop_date, parse_date_column
+    from ..utils.file_hash import file_signature
+
+CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "metric_definitions.json"
+
+# Bump to discard persisted metrics after a change the fingerprint cannot see
+# 서명으로 감지할 수 없는 변경 후 저장된 메트릭을 버리려면 증가
+METRIC_CACHE_VERSION = 1
+
+# Modules besides this one whose code shapes the metric values, including the ones
+# that pick, decode and type the input files; editing one invalidates persisted metrics
+# 이 모듈 외에 메트릭 값에 영향을 주는 모듈 (입력 파일 선택/디코딩/타입 지정 포함, 수정 시 저장된 메트릭 무효화)
+FINGERPRINT_MODULES = [
+    sys.modules[MonthlyDataCollector.__module__],
+    sys.modules[count_employees_by_month.__module__],
+    sys.modules[parse_entrance_date.__module__],
+    schemas,
+    file_index,
+    columnar_store,
+    excel_reader,
+    encoding_cache,
+]
 
 
 class HRMetricCalculator:
@@ -62,6 +91,10 @@ class HRMetricCalculator:
         self._cache_enabled = self._config.get('performance', {}).get('cache_data', True)
         cache_ttl = self._config.get('performance', {}).get('cache_ttl_minutes', 30)
         HRMetricCalculator._cache_ttl_minutes = cache_ttl
+        # Persistent tier shared with other processes (e.g. sync_monthly_data.py --warm)
+        # 다른 프로세스와 공유되는 디스크 캐시 (예: sync_monthly_data.py --warm)
+        hr_root = getattr(data_collector, 'hr_root', None)
+        self._persist_dir = Path(hr_root) / '.cache' / 'metrics' if isinstance(hr_root, Path) else None
 
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -69,8 +102,7 @@ class HRMetricCalculator:
         메트릭 정의 설정 로드
         """
         try:
-            config_path = Path(__file__).parent.parent.parent / "config" / "metric_definitions.json"
-            with open(config_path, 'r', encoding='utf-8') as f:
+            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except Exception as e:
             print(f"⚠️  Warning: Could not load config: {e}")
@@ -126,6 +158,69 @@ class HRMetricCalculator:
             return self._metrics_cache.get(cache_key, {}).copy()
         return None
 
+    def _input_fingerprint(self, year_month: str) -> Optional[str]:
+        """
+        Signature of everything a month's metrics are computed from: the month's and
+        previous month's input files, metric_definitions.json, this module and
+        FINGERPRINT_MODULES, SCHEMA_VERSION and METRIC_CACHE_VERSION
+        월 메트릭 계산에 사용되는 모든 입력의 서명: 해당 월/이전 월 입력 파일,
+        metric_definitions.json, 이 모듈과 FINGERPRINT_MODULES, SCHEMA_VERSION, METRIC_CACHE_VERSION
+
+        Returns:
+            Hex digest, or None for a malformed month or unreadable inputs
+            16진 다이제스트 (잘못된 월 형식이나 읽을 수 없는 입력이면 None)
+        """
+        try:
+            year, month = (int(part) for part in year_month.split('-'))
+            prev_month = f"{year - 1}-12" if month == 1 else f"{year}-{month - 1:02d}"
+            files = [CONFIG_PATH, Path(__file__)] + [Path(module.__file__) for module in FINGERPRINT_MODULES]
+            for ym in [year_month, prev_month]:
+                paths = self.data_collector.get_file_paths_for_month(ym)
+                files.extend(path for _, path in sorted(paths.items()) if path)
+            parts = [f"cache:{METRIC_CACHE_VERSION}", f"schema:{schemas.SCHEMA_VERSION}"] + [
+                f"{path.name}:{file_signature(path)}" if path.exists() else f"{path.name}:missing"
+                for path in files
+            ]
+        except (OSError, ValueError):
+            return None
+        return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+    def _load_persisted_metrics(self, cache_key: str, fingerprint: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Metrics persisted by an earlier process, if computed from the same inputs
+        이전 프로세스가 저장한 메트릭 (같은 입력으로 계산된 경우)
+        """
+        if not (self._cache_enabled and self._persist_dir and fingerprint):
+            return None
+        cache_file = self._persist_dir / f"{cache_key}.pkl"
+        if not cache_file.exists():
+            return None
+        try:
+            with open(cache_file, 'rb') as f:
+                entry = pickle.load(f)
+        except Exception:
+            return None
+        if entry.get('fingerprint') != fingerprint:
+            return None
+        return entry.get('metrics')
+
+    def _persist_metrics(self, cache_key: str, fingerprint: Optional[str], metrics: Dict[str, Any]) -> None:
+        """
+        Save metrics with the input fingerprint taken before computing them (atomic write)
+        계산 전에 얻은 입력 서명과 함께 메트릭 저장 (원자적 쓰기)
+        """
+        if not (self._cache_enabled and self._persist_dir and fingerprint):
+            return
+        try:
+            self._persist_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = self._persist_dir / f"{cache_key}.pkl"
+            tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+            with open(tmp_file, 'wb') as f:
+                pickle.dump({'fingerprint': fingerprint, 'metrics': metrics}, f)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            print(f"⚠️ Could not persist metrics {cache_key}: {e}")
+
     @classmethod
     def clear_cache(cls) -> None:
         """
@@ -135,6 +230,20 @@ class HRMetricCalculator:
         cls._metrics_cache.clear()
         cls._cache_timestamps.clear()
 
+    @classmethod
+    def invalidate_month(cls, year_month: str) -> None:
+        """
+        Drop cached metrics of one month for every report date
+        한 달의 캐시된 메트릭을 모든 보고 기준일에 대해 삭제
+
+        Args:
+            year_month: Month in 'YYYY-MM' format
+        """
+        prefix = f"{year_month}_"
+        for cache_key in [key for key in cls._metrics_cache if key.startswith(prefix)]:
+            cls._metrics_cache.pop(cache_key, None)
+            cls._cache_timestamps.pop(cache_key, None)
+
     @classmethod
     def get_cache_stats(cls) -> Dict[str, Any]:
         """
@@ -159,6 +268,12 @@ class HRMetricCalculator:
         for month in months:
             cache_key = self._get_cache_key(month)
             cached = self._get_cached_metrics(cache_key)
+            fingerprint = None
+            if not cached:
+                fingerprint = self._input_fingerprint(month)
+                cached = self._load_persisted_metrics(cache_key, fingerprint)
+                if cached:
+                    self._cache_metrics(cache_key, cached)
 
             if cached:
                 self.monthly_metrics[month] = cached
@@ -167,6 +282,7 @@ class HRMetricCalculator:
                 metrics = self._calculate_month(month)
                 self.monthly_metrics[month] = metrics
                 self._cache_metrics(cache_key, metrics)
+                self._persist_metrics(cache_key, fingerprint, metrics)
                 cache_misses += 1
 
         # Log cache performance (only if there's activity)
@@ -180,7 +296,7 @@ class HRMetricCalculator:
 
     def _calculate_month(self, year_month: str) -> Dict[str, Any]:
         """Calculate all metrics for a specific month"""
-        data = self.data_collector.load_month_data(year_month)
+        data = self.data_collector.load_month_data(year_month, sources=['basic_manpower', 'attendance'])
         df = data.get('basic_manpower', pd.DataFrame())
         attendance_df = data.get('attendance', pd.DataFrame())
 
@@ -1187,7 +1303,7 @@ class HRMetricCalculator:
 
             # Load previous month's attendance data
             # 이전 달 출근 데이터 로드
-            prev_data = self.data_collector.load_month_data(prev_month_str)
+            prev_data = self.data_collector.load_month_data(prev_month_str, sources=['attendance'])
             prev_attendance = prev_data.get('attendance', pd.DataFrame())
 
             if not prev_attendance.empty and 'Work Date' in prev_attendance.columns:
@@ -0,0 +1,12 @@
+"""
+api package - Local HTTP access to dashboard data
+API 패키지 - 대시보드 데이터 로컬 HTTP 접근
+"""
+
+from .metrics_api import DashboardDataStore, MetricsRequestHandler, create_server
+
+__all__ = [
+    'DashboardDataStore',
+    'MetricsRequestHandler',
+    'create_server'
+]
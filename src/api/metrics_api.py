@@ -0,0 +1,415 @@
+"""
+metrics_api.py - Local JSON API for HR dashboard data
+HR 대시보드 데이터용 로컬 JSON API
+
+Serves the datasets computed by CompleteDashboardBuilder over HTTP using only
+the standard library, so the dashboard JS and other internal tools can fetch
+HR KPIs without re-running the pipeline or scraping the baked HTML.
+CompleteDashboardBuilder가 계산한 데이터셋을 표준 라이브러리만으로 HTTP 제공하여
+대시보드 JS와 내부 도구가 파이프라인 재실행이나 HTML 스크래핑 없이 HR KPI를 조회할 수 있습니다.
+
+Endpoints / 엔드포인트:
+    GET /api/months
+    GET /api/metrics/{YYYY-MM}
+    GET /api/teams/{YYYY-MM}
+    GET /api/employees/{YYYY-MM}?team=ASSEMBLY&flag=is_active
+    GET /api/attendance/{YYYY-MM}/{employee_no}
+
+Responses carry a weak ETag (If-None-Match → 304) and are gzip-compressed
+when the client accepts it. Encoded responses are cached per normalized route
+in a bounded LRU, so a repeated request is neither re-serialized nor
+re-compressed. Cross-origin access is off unless origins are allow-listed.
+응답에는 weak ETag가 포함되며 (If-None-Match → 304), 클라이언트가 허용하면 gzip 압축됩니다.
+인코딩된 응답은 정규화된 경로별로 크기 제한 LRU에 캐시되어 반복 요청 시 직렬화와 압축을
+다시 하지 않습니다. 교차 출처 접근은 허용 목록에 있는 출처만 가능합니다.
+"""
+
+import gzip
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlencode, urlparse
+
+import pandas as pd
+
+from ..analytics.hr_metric_calculator import HRMetricCalculator
+from ..data.input_file_watcher import InputFileWatcher
+from ..data.monthly_data_collector import MonthlyDataCollector
+from ..visualization.complete_dashboard_builder import CompleteDashboardBuilder
+
+
+MONTH_PATTERN = re.compile(r'^\d{4}-\d{2}$')
+
+# Responses smaller than this are sent uncompressed / 이보다 작은 응답은 압축하지 않음
+GZIP_MIN_BYTES = 1024
+
+# Encoded responses kept in memory / 메모리에 유지하는 인코딩된 응답 수
+RESPONSE_CACHE_SIZE = 256
+
+# Query parameters each resource reads; others do not change the response
+# 리소스별로 읽는 쿼리 파라미터 (그 외 파라미터는 응답에 영향 없음)
+ROUTE_PARAMS = {
+    'employees': ('team', 'flag'),
+}
+
+
+@dataclass(frozen=True)
+class EncodedResponse:
+    """
+    Serialized JSON response with its ETag and precompressed body
+    ETag와 미리 압축된 본문을 포함한 직렬화된 JSON 응답
+    """
+    status: int
+    body: bytes
+    etag: str
+    gzipped: Optional[bytes] = None
+
+    @classmethod
+    def encode(cls, status: int, body: bytes) -> 'EncodedResponse':
+        gzipped = gzip.compress(body) if len(body) >= GZIP_MIN_BYTES else None
+        return cls(status, body, f'W/"{hashlib.sha1(body).hexdigest()}"', gzipped)
+
+
+def route_key(parts: List[str], query: Dict[str, List[str]]) -> str:
+    """
+    Cache key of an /api/ request: the path plus the query parameters its resource reads
+    /api/ 요청의 캐시 키: 경로 + 해당 리소스가 읽는 쿼리 파라미터
+
+    Args:
+        parts: Path segments after 'api' / 'api' 뒤의 경로 세그먼트
+        query: Parsed query string / 파싱된 쿼리 문자열
+
+    Returns:
+        e.g. 'employees/2025-11?flag=is_active&team=ASSEMBLY'
+    """
+    params = [(name, query[name][0]) for name in ROUTE_PARAMS.get(parts[0], ()) if query.get(name, [''])[0]]
+    key = '/'.join(parts)
+    return f"{key}?{urlencode(sorted(params))}" if params else key
+
+
+class DashboardDataStore:
+    """
+    Warm in-memory cache of prepared dashboard builders, one per month
+    월별로 준비된 대시보드 빌더의 메모리 캐시
+
+    Builders share one caching MonthlyDataCollector per year. The input
+    directory is polled at most every `refresh_interval` seconds; any change
+    drops the cached builders and month data so the next request recomputes.
+    빌더는 연도별 캐싱 수집기를 공유하며, 입력 디렉토리를 주기적으로 확인하여
+    변경 시 캐시를 비우고 다음 요청에서 다시 계산합니다.
+    """
+
+    def __init__(self, hr_root: Path, language: str = 'ko', year: Optional[int] = None,
+                 refresh_interval: float = 5.0, max_responses: int = RESPONSE_CACHE_SIZE):
+        """
+        Args:
+            hr_root: HR project root / HR 프로젝트 루트
+            language: Language used for month labels / 월 레이블 언어
+            year: Year used to resolve month-name files for /api/months (default: current year)
+                  /api/months에서 월 이름 파일을 해석할 연도 (기본값: 현재 연도)
+            refresh_interval: Minimum seconds between input change checks
+                              입력 변경 확인 최소 간격 (초)
+            max_responses: Encoded responses kept, least recently used dropped first
+                           유지할 인코딩된 응답 수 (가장 오래 사용되지 않은 응답부터 삭제)
+        """
+        self.hr_root = Path(hr_root)
+        self.language = language
+        self.year = year or datetime.now().year
+        self.refresh_interval = refresh_interval
+        self._collectors: Dict[int, MonthlyDataCollector] = {}
+        self._builders: Dict[str, CompleteDashboardBuilder] = {}
+        self.max_responses = max_responses
+        # Encoded responses keyed by route_key(), in LRU order / route_key()별 인코딩된 응답 (LRU 순서)
+        self.responses: 'OrderedDict[str, EncodedResponse]' = OrderedDict()
+        self._lock = threading.RLock()
+        self._watcher = InputFileWatcher(self.hr_root / "input_files")
+        self._last_refresh = time.monotonic()
+
+    def _get_collector(self, year: int) -> MonthlyDataCollector:
+        if year not in self._collectors:
+            self._collectors[year] = MonthlyDataCollector(self.hr_root, target_year=year, cache_data=True)
+        return self._collectors[year]
+
+    def refresh_if_changed(self) -> None:
+        """
+        Drop cached data if input files changed since the last check
+        마지막 확인 이후 입력 파일이 변경되었으면 캐시 삭제
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_refresh < self.refresh_interval:
+                return
+            self._last_refresh = now
+
+            if not self._watcher.poll():
+                return
+
+            for collector in self._collectors.values():
+                collector.invalidate_cache()
+                collector.detect_available_months()
+            HRMetricCalculator.clear_cache()
+            self._builders.clear()
+            self.responses.clear()
+
+    def get_response(self, key: str) -> Optional[EncodedResponse]:
+        """
+        Cached response of a route, marked as recently used
+        경로의 캐시된 응답 (최근 사용으로 표시)
+        """
+        with self._lock:
+            response = self.responses.get(key)
+            if response is not None:
+                self.responses.move_to_end(key)
+            return response
+
+    def put_response(self, key: str, response: EncodedResponse) -> None:
+        """
+        Cache a response, evicting the least recently used beyond max_responses
+        응답 캐시 (max_responses 초과 시 가장 오래 사용되지 않은 응답 삭제)
+        """
+        with self._lock:
+            self.responses[key] = response
+            self.responses.move_to_end(key)
+            while len(self.responses) > self.max_responses:
+                self.responses.popitem(last=False)
+
+    def list_months(self) -> List[str]:
+        """
+        List months that have input data
+        입력 데이터가 있는 월 목록
+        """
+        with self._lock:
+            return list(self._get_collector(self.year).detect_available_months())
+
+    def get_builder(self, year_month: str) -> CompleteDashboardBuilder:
+        """
+        Get the prepared builder of a month, computing it on first use
+        월별 준비된 빌더 반환 (처음 요청 시 계산)
+
+        Args:
+            year_month: Month in 'YYYY-MM' format
+
+        Raises:
+            KeyError: If the month has no input data / 해당 월 데이터가 없는 경우
+        """
+        with self._lock:
+            if year_month in self._builders:
+                return self._builders[year_month]
+
+            year, month = (int(part) for part in year_month.split('-'))
+            collector = self._get_collector(year)
+            if year_month not in collector.detect_available_months():
+                raise KeyError(year_month)
+
+            month_start = pd.Timestamp(f"{year}-{month:02d}-01")
+            builder = CompleteDashboardBuilder(
+                target_month=year_month,
+                language=self.language,
+                report_date=month_start + pd.DateOffset(months=1) - pd.DateOffset(days=1),
+                collector=collector
+            )
+            builder.prepare()
+            self._builders[year_month] = builder
+            return builder
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP handler for the /api/* JSON endpoints
+    /api/* JSON 엔드포인트용 HTTP 핸들러
+    """
+
+    # Set on the handler subclass created by create_server()
+    # create_server()에서 생성한 하위 클래스에 설정됨
+    store: DashboardDataStore = None
+    # Origins allowed to read responses cross-origin / 교차 출처 읽기를 허용할 출처
+    allowed_origins: frozenset = frozenset()
+
+    server_version = "HRDashboardAPI/1.0"
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        parts = [unquote(part) for part in parsed.path.strip('/').split('/') if part]
+        query = parse_qs(parsed.query)
+
+        if len(parts) < 2 or parts[0] != 'api':
+            self._send_error(404, 'Not found')
+            return
+
+        self.store.refresh_if_changed()
+
+        key = route_key(parts[1:], query)
+        cached = self.store.get_response(key)
+        if cached:
+            self._send_response(cached)
+            return
+
+        try:
+            status, payload = self._route(parts[1:], query)
+        except KeyError as e:
+            status, payload = 404, {'error': f'No data for {e.args[0]}'}
+        except Exception as e:
+            status, payload = 500, {'error': str(e)}
+
+        response = EncodedResponse.encode(status, self._serialize(payload))
+        if status == 200:
+            self.store.put_response(key, response)
+        self._send_response(response)
+
+    def _route(self, parts: List[str], query: Dict[str, List[str]]) -> Tuple[int, Any]:
+        """
+        Resolve an /api/ path to (status, payload)
+        /api/ 경로를 (상태 코드, 응답 데이터)로 변환
+        """
+        resource, args = parts[0], parts[1:]
+
+        if resource == 'months' and not args:
+            return 200, {'months': self.store.list_months()}
+
+        if not args or not MONTH_PATTERN.match(args[0]):
+            return 400, {'error': 'Month must be given as YYYY-MM'}
+        year_month = args[0]
+
+        if resource == 'metrics' and len(args) == 1:
+            builder = self.store.get_builder(year_month)
+            return 200, {
+                'month': year_month,
+                'metrics': builder.monthly_metrics.get(year_month, {}),
+                'quality_score': builder.quality_score.score if builder.quality_score else None
+            }
+
+        if resource == 'teams' and len(args) == 1:
+            builder = self.store.get_builder(year_month)
+            return 200, {'month': year_month, 'teams': builder.team_data}
+
+        if resource == 'employees' and len(args) == 1:
+            return self._employees(year_month, query)
+
+        if resource == 'attendance' and len(args) == 2:
+            builder = self.store.get_builder(year_month)
+            start, end = builder.attendance_offsets.get(args[1], (0, 0))
+            records = builder.attendance_data[start:end]
+            return 200, {'month': year_month, 'employee_no': args[1], 'records': records}
+
+        return 404, {'error': 'Not found'}
+
+    def _employees(self, year_month: str, query: Dict[str, List[str]]) -> Tuple[int, Any]:
+        """
+        Employee details filtered by ?team= and boolean ?flag=
+        ?team= 및 불리언 ?flag=로 필터링한 직원 상세
+        """
+        builder = self.store.get_builder(year_month)
+        employees = builder.employee_details
+
+        team = query.get('team', [None])[0]
+        if team:
+            employees = [e for e in employees if e.get('team') == team]
+
+        flag = query.get('flag', [None])[0]
+        if flag:
+            flags = {key for key, value in (builder.employee_details[:1] or [{}])[0].items()
+                     if isinstance(value, bool)}
+            if flag not in flags:
+                return 400, {'error': f"Unknown flag '{flag}'", 'flags': sorted(flags)}
+            employees = [e for e in employees if e.get(flag)]
+
+        return 200, {'month': year_month, 'count': len(employees), 'employees': employees}
+
+    @staticmethod
+    def _serialize(payload: Any) -> bytes:
+        """
+        Serialize payload with the builder's NaN/numpy-safe JSON encoder
+        빌더의 NaN/numpy 안전 JSON 인코더로 직렬화
+        """
+        return CompleteDashboardBuilder._safe_json_dumps(
+            payload, ensure_ascii=False, sort_keys=True
+        ).encode('utf-8')
+
+    def _send_response(self, response: EncodedResponse) -> None:
+        """
+        Send an encoded JSON response with ETag and optional gzip
+        ETag 및 선택적 gzip을 포함한 인코딩된 JSON 응답 전송
+        """
+        if response.status == 200 and self._etag_matches(response.etag):
+            self.send_response(304)
+            self.send_header('ETag', response.etag)
+            self.send_header('Vary', 'Accept-Encoding, Origin')
+            self._send_cors_header()
+            self.end_headers()
+            return
+
+        accepts_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        compressed = accepts_gzip and response.gzipped is not None
+        body = response.gzipped if compressed else response.body
+
+        self.send_response(response.status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding, Origin')
+        self.send_header('Cache-Control', 'no-cache')
+        self._send_cors_header()
+        if response.status == 200:
+            self.send_header('ETag', response.etag)
+        if compressed:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_cors_header(self) -> None:
+        # Echo the request origin only when it is allow-listed
+        # 허용 목록에 있는 요청 출처만 그대로 반환
+        origin = self.headers.get('Origin')
+        if origin and origin in self.allowed_origins:
+            self.send_header('Access-Control-Allow-Origin', origin)
+
+    def _send_error(self, status: int, message: str) -> None:
+        self._send_response(EncodedResponse.encode(status, self._serialize({'error': message})))
+
+    def _etag_matches(self, etag: str) -> bool:
+        if_none_match = self.headers.get('If-None-Match')
+        if not if_none_match:
+            return False
+        candidates = [tag.strip() for tag in if_none_match.split(',')]
+        # Weak comparison: ignore the W/ prefix / 약한 비교: W/ 접두사 무시
+        bare = etag[2:] if etag.startswith('W/') else etag
+        return '*' in candidates or any(
+            (tag[2:] if tag.startswith('W/') else tag) == bare for tag in candidates
+        )
+
+    def log_message(self, format, *args):
+        print(f"🌐 {self.address_string()} - {format % args}")
+
+
+def create_server(hr_root: Path, host: str = '127.0.0.1', port: int = 8765,
+                  language: str = 'ko', year: Optional[int] = None,
+                  allowed_origins: Iterable[str] = ()) -> ThreadingHTTPServer:
+    """
+    Create the API server (call serve_forever() to run it)
+    API 서버 생성 (serve_forever()로 실행)
+
+    Args:
+        hr_root: HR project root / HR 프로젝트 루트
+        host: Bind address / 바인드 주소
+        port: Port / 포트
+        language: Language used for month labels / 월 레이블 언어
+        year: Year used to resolve month-name files / 월 이름 파일 해석 연도
+        allowed_origins: Origins (e.g. 'http://localhost:8000') allowed to read
+                         responses cross-origin (default: none)
+                         교차 출처 읽기를 허용할 출처 (기본값: 없음)
+
+    Returns:
+        ThreadingHTTPServer instance / ThreadingHTTPServer 인스턴스
+    """
+    store = DashboardDataStore(hr_root, language=language, year=year)
+    handler = type('BoundMetricsRequestHandler', (MetricsRequestHandler,), {
+        'store': store,
+        'allowed_origins': frozenset(allowed_origins)
+    })
+    return ThreadingHTTPServer((host, port), handler)
@@ -25,6 +25,10 @@ import json
 
 from ..utils.logger import get_logger
 from ..utils.date_parser import DateParser
+from ..utils.encoding_cache import EncodingCache
+from ..data.columnar_store import ColumnarStore
+from ..data.excel_reader import read_excel_streaming
+from ..data.schemas import SCHEMA_VERSION, apply_schema, read_dtypes
 
 try:
     from ..integration.google_drive_sync import GoogleDriveSync, GOOGLE_DRIVE_AVAILABLE
@@ -42,7 +46,9 @@ class DataLoader:
         self,
         data_root: Optional[str] = None,
         cache_enabled: bool = True,
-        date_parser: Optional[DateParser] = None
+        date_parser: Optional[DateParser] = None,
+        encoding_cache: Optional[EncodingCache] = None,
+        columnar_store: Optional[ColumnarStore] = None
     ):
         """
         Initialize DataLoader
@@ -52,12 +58,16 @@ class DataLoader:
             data_root: Root directory for data files / 데이터 파일 루트 디렉토리
             cache_enabled: Enable DataFrame caching / DataFrame 캐싱 활성화
             date_parser: Custom date parser instance / 커스텀 날짜 파서 인스턴스
+            encoding_cache: Shared encoding detection cache (default: the project's
+                .cache/encodings.json) / 공유 인코딩 탐지 캐시 (기본값: 프로젝트 .cache/encodings.json)
+            columnar_store: Cache of parsed Excel workbooks (default: the project's
+                .cache/columnar) / 파싱된 Excel 워크북 캐시 (기본값: 프로젝트 .cache/columnar)
         """
         self.logger = get_logger()
 
         # Set default data root / 기본 데이터 루트 설정
+        hr_root = Path(__file__).parent.parent.parent
         if data_root is None:
-            hr_root = Path(__file__).parent.parent.parent
             data_root = hr_root / "data" / "input"
 
         self.data_root = Path(data_root)
@@ -67,6 +77,8 @@ class DataLoader:
         self.cache: Dict[str, pd.DataFrame] = {}
 
         self.date_parser = date_parser or DateParser()
+        self.encodings = encoding_cache or EncodingCache.for_project(hr_root)
+        self.store = columnar_store or ColumnarStore(hr_root / ".cache" / "columnar", input_root=self.data_root)
 
         # Google Drive sync (optional) / Google Drive 동기화 (선택)
         self.drive_sync: Optional[GoogleDriveSync] = None
@@ -134,7 +146,7 @@ class DataLoader:
 
         # Load data / 데이터 로드
         try:
-            df = self._load_csv_or_excel(file_path)
+            df = self._load_csv_or_excel(file_path, source='basic_manpower')
 
             # Normalize column names / 열 이름 정규화
             df = self._normalize_column_names(df)
@@ -220,7 +232,8 @@ class DataLoader:
 
         # Load data / 데이터 로드
         try:
-            df = self._load_csv_or_excel(file_path)
+            # The schema describes the converted layout / 스키마는 변환된 형식 기준
+            df = self._load_csv_or_excel(file_path, source='attendance' if converted else None)
 
             # Normalize column names / 열 이름 정규화
             df = self._normalize_column_names(df)
@@ -295,7 +308,7 @@ class DataLoader:
 
         # Load data / 데이터 로드
         try:
-            df = self._load_csv_or_excel(file_path)
+            df = self._load_csv_or_excel(file_path, source='aql')
             df = self._normalize_column_names(df)
 
             # Cache result / 결과 캐시
@@ -367,7 +380,7 @@ class DataLoader:
 
         # Load data / 데이터 로드
         try:
-            df = self._load_csv_or_excel(file_path)
+            df = self._load_csv_or_excel(file_path, source='5prs')
             df = self._normalize_column_names(df)
 
             # Cache result / 결과 캐시
@@ -401,13 +414,20 @@ class DataLoader:
             )
             return pd.DataFrame()
 
-    def _load_csv_or_excel(self, file_path: Path) -> pd.DataFrame:
+    def _load_csv_or_excel(self, file_path: Path, source: Optional[str] = None) -> pd.DataFrame:
         """
         Load data from CSV or Excel file with automatic format detection
         자동 형식 감지로 CSV 또는 Excel 파일에서 데이터 로드
 
+        .xlsx workbooks are streamed in read-only batches and kept in the columnar
+        cache, so an unchanged workbook is never parsed again.
+        .xlsx 워크북은 읽기 전용 배치로 스트리밍되어 컬럼형 캐시에 저장되므로 변경되지 않은
+        워크북은 다시 파싱하지 않습니다.
+
         Args:
             file_path: Path to file / 파일 경로
+            source: Schema to type the data with ('basic_manpower', 'attendance', 'aql', '5prs')
+                    데이터 타입 지정에 사용할 스키마
 
         Returns:
             DataFrame with loaded data / 로드된 데이터가 있는 DataFrame
@@ -423,22 +443,35 @@ class DataLoader:
 
         try:
             if suffix == '.csv':
-                # Try different encodings / 다양한 인코딩 시도
-                for encoding in ['utf-8', 'cp949', 'euc-kr', 'latin1']:
-                    try:
-                        df = pd.read_csv(file_path, encoding=encoding)
-                        self.logger.debug(
-                            f"CSV 로드 성공",
-                            f"CSV loaded successfully",
+                # Encoding sniffed once per file content / 파일 콘텐츠당 한 번 탐지한 인코딩 사용
+                df = self.encodings.read_csv(file_path, dtype=read_dtypes(source) if source else None)
+                self.logger.debug(
+                    f"CSV 로드 성공",
+                    f"CSV loaded successfully",
+                    file=str(file_path),
+                    encoding=self.encodings.lookup(file_path)
+                )
+                if source:
+                    df, violations = apply_schema(df, source)
+                    for violation in violations:
+                        self.logger.warning(
+                            f"스키마 위반",
+                            f"Schema violation",
                             file=str(file_path),
-                            encoding=encoding
+                            detail=violation
                         )
-                        return df
-                    except UnicodeDecodeError:
-                        continue
-                raise ValueError(f"Could not decode CSV file / CSV 파일 디코딩 불가: {file_path}")
+                return df
+
+            elif suffix == '.xlsx':
+                return self.store.read_through(
+                    file_path,
+                    lambda path: read_excel_streaming(path, source),
+                    schema_version=SCHEMA_VERSION,
+                    schema_source=source
+                )
 
-            elif suffix in ['.xlsx', '.xls']:
+            elif suffix == '.xls':
+                # Legacy binary workbooks cannot be streamed / 구형 바이너리 워크북은 스트리밍 불가
                 df = pd.read_excel(file_path)
                 return df
 
@@ -0,0 +1,244 @@
+"""
+attendance_converter.py - Original → converted attendance conversion
+원본 → 변환 출근 데이터 변환
+
+Google Drive only provides the raw attendance export
+(input_files/attendance/original/attendance data {month}.csv), while the dashboard
+reads input_files/attendance/converted/attendance data {month}_converted.csv.
+This module produces the converted file inside the pipeline:
+- Streams the original in chunks into the converted CSV (only one raw chunk is
+  held in memory at a time)
+- Standardizes column names (Personnel Number → ID No, Attendance Name → compAdd, ...)
+- Work Date: YYYY.MM.DD, YYYY-MM-DD and YYYY/MM/DD → YYYY.MM.DD
+- compAdd: Unicode NFC + canonical 'Đi làm' / 'Vắng mặt' spelling
+- Reason Description: NFC, whitespace collapsed, reason codes as 'AR1 - ...'
+- Come late / Leave early: numeric minutes (decimal commas accepted, blanks → 0)
+The converted CSV is then read back once with the attendance schema (schemas.py),
+exactly as the collector would read it, and the typed frame is stored in the
+columnar cache, so the first build after a sync does not parse the CSV again.
+Conversion is skipped when the original's content hash matches the one recorded
+with the cached frame.
+Google Drive는 원본 출근 데이터만 제공하지만 대시보드는 변환된 파일을 읽습니다.
+이 모듈은 파이프라인 안에서 변환 파일을 생성합니다:
+- 원본을 청크 단위로 변환 CSV에 스트리밍 (메모리에는 한 번에 원본 청크 하나만 유지)
+- 컬럼명 표준화 (Personnel Number → ID No, Attendance Name → compAdd 등)
+- Work Date: YYYY.MM.DD, YYYY-MM-DD, YYYY/MM/DD → YYYY.MM.DD
+- compAdd: 유니코드 NFC + 'Đi làm' / 'Vắng mặt' 표기 통일
+- Reason Description: NFC, 공백 정리, 사유 코드를 'AR1 - ...' 형식으로
+- Come late / Leave early: 숫자(분) 변환 (소수점 쉼표 허용, 빈 값 → 0)
+이후 변환 CSV를 수집기와 동일하게 출근 스키마(schemas.py)로 한 번 다시 읽고, 타입이 지정된 프레임을
+컬럼형 캐시에 저장하여 동기화 후 첫 빌드에서 CSV를 다시 파싱하지 않습니다.
+원본의 콘텐츠 해시가 캐시에 기록된 값과 같으면 변환을 건너뜁니다.
+"""
+
+import os
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+from .columnar_store import ColumnarStore
+from .schemas import SCHEMA_VERSION, read_source
+from ..utils.encoding_cache import EncodingCache
+from ..utils.file_hash import compute_content_hash
+
+# Raw export column → dashboard column / 원본 컬럼 → 대시보드 컬럼
+COLUMN_MAPPING = {
+    'Sequence': 'No.',
+    'Company Code': 'CoCode',
+    'Combination Department Code': 'Department',
+    'Personnel Number': 'ID No',
+    'Attendance Name': 'compAdd',
+    'Work Time Code': 'WTime'
+}
+
+# Canonical compAdd values, looked up case-insensitively / 표준 compAdd 값 (대소문자 무시)
+COMPADD_VALUES = {value.casefold(): value for value in ['Đi làm', 'Vắng mặt']}
+
+MINUTE_COLUMNS = ['Come late', 'Leave early']
+
+_DATE_PATTERN = r'^\s*(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})'
+_REASON_CODE_PATTERN = re.compile(r'^([A-Za-z]+\d+)\s*-\s*(.+)$')
+
+
+def _nfc(value):
+    if isinstance(value, str):
+        return unicodedata.normalize('NFC', value).strip()
+    return value
+
+
+def _normalize_reason(value):
+    if not isinstance(value, str):
+        return value
+    value = ' '.join(unicodedata.normalize('NFC', value).split())
+    match = _REASON_CODE_PATTERN.match(value)
+    if match:
+        return f"{match.group(1).upper()} - {match.group(2)}"
+    return value
+
+
+def normalize_work_date(series: pd.Series) -> pd.Series:
+    """
+    Normalize Work Date strings to YYYY.MM.DD (unparseable values are kept)
+    Work Date 문자열을 YYYY.MM.DD로 정규화 (해석 불가 값은 유지)
+    """
+    parts = series.astype('string').str.extract(_DATE_PATTERN)
+    normalized = parts[0] + '.' + parts[1].str.zfill(2) + '.' + parts[2].str.zfill(2)
+    return normalized.astype(object).fillna(series)
+
+
+class AttendanceConverter:
+    """
+    Convert original attendance exports into converted CSVs and cached frames
+    원본 출근 데이터를 변환 CSV 및 캐시 프레임으로 변환
+    """
+
+    def __init__(self, hr_root: Path, store: Optional[ColumnarStore] = None, chunk_size: int = 50_000):
+        """
+        Args:
+            hr_root: Project root containing input_files/ / input_files/가 있는 프로젝트 루트
+            store: Columnar cache (default: <hr_root>/.cache/columnar) / 컬럼형 캐시
+            chunk_size: Rows per streamed chunk / 청크당 행 수
+        """
+        self.hr_root = Path(hr_root)
+        self.input_dir = self.hr_root / 'input_files'
+        self.store = store or ColumnarStore(self.hr_root / '.cache' / 'columnar', input_root=self.input_dir)
+        self.encodings = EncodingCache.for_project(self.hr_root)
+        self.chunk_size = chunk_size
+
+    def paths(self, month_name: str, year: Optional[int] = None):
+        """
+        (original, converted) paths for a month name such as 'november', under
+        input_files/{year}/ when a year folder is given
+        월 이름에 대한 (원본, 변환) 경로 (연도 폴더가 주어지면 input_files/{year}/ 아래)
+        """
+        input_dir = self.input_dir / str(year) if year else self.input_dir
+        attendance_dir = input_dir / 'attendance'
+        return (
+            attendance_dir / 'original' / f'attendance data {month_name}.csv',
+            attendance_dir / 'converted' / f'attendance data {month_name}_converted.csv'
+        )
+
+    def is_up_to_date(self, month_name: str, source_hash: Optional[str] = None,
+                      year: Optional[int] = None) -> bool:
+        """
+        Converted output is current and was produced from the present original
+        변환 결과가 최신이고 현재 원본으로부터 생성되었는지 확인
+        """
+        original, converted = self.paths(month_name, year)
+        meta = self.store.meta(converted)
+        if not meta or not self.store.is_current(converted):
+            return False
+        return meta.get('source_hash') == (source_hash or compute_content_hash(original))
+
+    def normalize_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Normalize one chunk of the original export
+        원본 데이터 청크 하나를 정규화
+
+        Args:
+            chunk: Chunk read with dtype=str / dtype=str로 읽은 청크
+
+        Returns:
+            Normalized chunk / 정규화된 청크
+        """
+        chunk = chunk.rename(columns={k: v for k, v in COLUMN_MAPPING.items() if k in chunk.columns})
+
+        if 'Work Date' in chunk.columns:
+            chunk['Work Date'] = normalize_work_date(chunk['Work Date'])
+
+        if 'compAdd' in chunk.columns:
+            values = chunk['compAdd'].map(_nfc)
+            chunk['compAdd'] = values.map(
+                lambda v: COMPADD_VALUES.get(v.casefold(), v) if isinstance(v, str) else v
+            )
+
+        if 'Reason Description' in chunk.columns:
+            chunk['Reason Description'] = chunk['Reason Description'].map(_normalize_reason)
+
+        for column in MINUTE_COLUMNS:
+            if column in chunk.columns:
+                minutes = chunk[column].astype('string').str.strip().str.replace(',', '.', regex=False)
+                chunk[column] = pd.to_numeric(minutes, errors='coerce').fillna(0)
+
+        return chunk
+
+    def _write_part(self, original: Path, part_path: Path, encoding: str) -> int:
+        """
+        Stream the normalized original into part_path (overwritten), chunk by chunk
+        정규화한 원본을 청크 단위로 part_path에 기록 (덮어쓰기)
+
+        Returns:
+            Rows written / 기록한 행 수
+        """
+        rows = 0
+        reader = pd.read_csv(original, dtype=str, chunksize=self.chunk_size, encoding=encoding)
+        with open(part_path, 'w', encoding='utf-8', newline='') as out:
+            for index, chunk in enumerate(reader):
+                chunk = self.normalize_chunk(chunk)
+                chunk.to_csv(out, index=False, header=index == 0, float_format='%g')
+                rows += len(chunk)
+            out.flush()
+            os.fsync(out.fileno())
+        return rows
+
+    def convert(self, month_name: str, force: bool = False, year: Optional[int] = None) -> Optional[Path]:
+        """
+        Convert one month's original attendance export
+        한 달의 원본 출근 데이터를 변환
+
+        Args:
+            month_name: Lowercase English month name / 소문자 영문 월 이름
+            force: Convert even when the original is unchanged / 원본이 같아도 변환
+            year: Year folder of the original (None: input_files/ itself) / 원본의 연도 폴더
+
+        Returns:
+            Converted path, or None when there is no original / 변환 경로 (원본이 없으면 None)
+        """
+        original, converted = self.paths(month_name, year)
+        if not original.exists():
+            return None
+
+        source_hash = compute_content_hash(original)
+        if not force and self.is_up_to_date(month_name, source_hash, year):
+            print(f"⏭️ Attendance {month_name}: original unchanged, conversion skipped")
+            return converted
+
+        converted.parent.mkdir(parents=True, exist_ok=True)
+        part_path = converted.with_name(converted.name + '.part')
+        try:
+            # A decode error late in the file restarts the stream with the next encoding
+            # 파일 뒷부분에서 디코딩 오류가 나면 다음 인코딩으로 처음부터 다시 스트리밍
+            rows = self.encodings.read_with(
+                original, lambda encoding: self._write_part(original, part_path, encoding)
+            )
+            os.replace(part_path, converted)
+        finally:
+            if part_path.exists():
+                part_path.unlink()
+
+        # Typed from the written file, so the cache holds what the collector would parse
+        # 기록된 파일에서 타입 지정 (캐시에 수집기가 파싱할 결과와 같은 프레임 저장)
+        frame = read_source(converted, 'attendance')
+        self.store.write(converted, frame, source_hash=source_hash, schema_version=SCHEMA_VERSION)
+        print(f"✅ Attendance {month_name}: {rows:,} rows converted → {converted.name}")
+        return converted
+
+    def convert_months(self, month_names, force: bool = False) -> Dict[str, Optional[Path]]:
+        """
+        Convert several months; a failing month does not stop the others
+        여러 달 변환 (한 달이 실패해도 나머지는 계속)
+
+        Returns:
+            {month name: converted path or None} / {월 이름: 변환 경로 또는 None}
+        """
+        results = {}
+        for month_name in month_names:
+            try:
+                results[month_name] = self.convert(month_name, force=force)
+            except Exception as e:
+                print(f"⚠️ Attendance {month_name}: conversion failed: {e}")
+                results[month_name] = None
+        return results
@@ -0,0 +1,199 @@
+"""
+columnar_store.py - On-disk columnar cache of parsed input frames
+파싱된 입력 데이터프레임의 디스크 컬럼형 캐시
+
+Each input file (or converted output) is stored once as a typed DataFrame next to a
+small JSON sidecar recording where it came from:
+- path: input file the frame mirrors (relative to the input root)
+- signature: size + mtime of that file when the frame was written
+- source_hash: optional content hash of the upstream file (e.g. the original
+  attendance export a converted file was produced from)
+Reads are valid while the file's signature is unchanged, so a warm build only
+stats the CSV instead of parsing it.
+각 입력 파일(또는 변환 결과)은 출처를 기록한 작은 JSON 사이드카와 함께 타입이 지정된
+DataFrame으로 한 번 저장됩니다.
+- path: 프레임이 대응하는 입력 파일 (입력 루트 기준 상대 경로)
+- signature: 프레임 저장 시점의 파일 크기 + 수정 시간
+- source_hash: 상위 파일의 콘텐츠 해시 (선택, 예: 변환 파일의 원본 출근 데이터)
+파일 서명이 바뀌지 않는 동안 캐시가 유효하므로 웜 빌드는 CSV를 파싱하지 않고 stat만 합니다.
+
+Frames are written as Parquet when pyarrow is installed, otherwise as pandas pickles
+(both keep dtypes such as int64 IDs, categoricals and datetimes).
+pyarrow가 설치되어 있으면 Parquet, 아니면 pandas pickle로 저장합니다
+(둘 다 int64 ID, 범주형, 날짜 등 dtype을 유지).
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+
+from ..utils.file_hash import file_signature
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+class ColumnarStore:
+    """
+    Signature-checked cache of DataFrames keyed by input file path
+    입력 파일 경로를 키로 하는 서명 검증 DataFrame 캐시
+    """
+
+    def __init__(self, cache_dir: Path, input_root: Optional[Path] = None):
+        """
+        Args:
+            cache_dir: Directory for frames and sidecars / 프레임 및 사이드카 디렉토리
+            input_root: Paths are recorded relative to this directory / 경로 기록 기준 디렉토리
+        """
+        self.cache_dir = Path(cache_dir)
+        self.input_root = Path(input_root) if input_root else None
+        self.format = 'parquet' if PARQUET_AVAILABLE else 'pickle'
+
+    def _relative(self, path: Path) -> str:
+        path = Path(path)
+        if self.input_root:
+            try:
+                return path.resolve().relative_to(self.input_root.resolve()).as_posix()
+            except ValueError:
+                pass
+        return path.resolve().as_posix()
+
+    def _entry_paths(self, path: Path):
+        key = hashlib.sha1(self._relative(path).encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{key}.json", self.cache_dir / key
+
+    def meta(self, path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Sidecar of the cached frame for path (None if not cached)
+        path에 대한 캐시 프레임의 사이드카 (없으면 None)
+        """
+        meta_path, _ = self._entry_paths(path)
+        if not meta_path.exists():
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_current(self, path: Path) -> bool:
+        """
+        Cached frame exists and path is unchanged since it was written
+        캐시 프레임이 존재하고 이후 path가 변경되지 않았는지 확인
+        """
+        meta = self.meta(path)
+        return bool(meta) and Path(path).exists() and meta.get('signature') == file_signature(path)
+
+    def read(self, path: Path, **expected: Any) -> Optional[pd.DataFrame]:
+        """
+        Cached frame for path if it is still current
+        path의 캐시 프레임 (유효한 경우)
+
+        Args:
+            path: Input file / 입력 파일
+            **expected: Sidecar fields the frame must have been written with,
+                        e.g. schema_version / 프레임 저장 시 기록되어야 하는 사이드카 필드
+
+        Returns:
+            DataFrame, or None when missing or stale / 없거나 오래되면 None
+        """
+        if not self.is_current(path):
+            return None
+
+        meta = self.meta(path)
+        if any(meta.get(key) != value for key, value in expected.items()):
+            return None
+        _, frame_base = self._entry_paths(path)
+        frame_path = frame_base.with_suffix('.' + meta['format'])
+        try:
+            if meta['format'] == 'parquet':
+                return pd.read_parquet(frame_path)
+            return pd.read_pickle(frame_path)
+        except Exception:
+            # Unreadable (e.g. written by a pyarrow-enabled machine) / 읽을 수 없는 캐시
+            return None
+
+    def write(
+        self,
+        path: Path,
+        df: pd.DataFrame,
+        signature: Optional[Dict[str, int]] = None,
+        **extra: Any
+    ) -> Dict[str, Any]:
+        """
+        Store df as the parsed form of path
+        df를 path의 파싱 결과로 저장
+
+        Args:
+            path: Input file the frame mirrors (must exist) / 프레임이 대응하는 입력 파일
+            df: Parsed frame / 파싱된 프레임
+            signature: Signature taken before parsing (default: current) / 파싱 전에 얻은 서명
+            **extra: Additional sidecar fields, e.g. source_hash / 추가 사이드카 필드
+
+        Returns:
+            The sidecar / 사이드카
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        meta_path, frame_base = self._entry_paths(path)
+        frame_path = frame_base.with_suffix('.' + self.format)
+
+        tmp_path = frame_path.with_name(frame_path.name + '.tmp')
+        if self.format == 'parquet':
+            df.to_parquet(tmp_path, index=False)
+        else:
+            df.to_pickle(tmp_path)
+        os.replace(tmp_path, frame_path)
+
+        meta = dict(extra)
+        meta.update({
+            'path': self._relative(path),
+            'signature': signature or file_signature(path),
+            'format': self.format,
+            'rows': int(len(df)),
+            'columns': [str(c) for c in df.columns]
+        })
+        tmp_meta = meta_path.with_name(meta_path.name + '.tmp')
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_meta, meta_path)
+        return meta
+
+    def read_through(
+        self,
+        path: Path,
+        loader: Callable[[Path], pd.DataFrame],
+        **extra: Any
+    ) -> pd.DataFrame:
+        """
+        Cached frame for path, parsing it with loader and caching on a miss
+        path의 캐시 프레임 (없으면 loader로 파싱 후 캐시)
+
+        Args:
+            path: Input file / 입력 파일
+            loader: Parses path into a DataFrame / path를 DataFrame으로 파싱하는 함수
+            **extra: Sidecar fields recorded on write and required on read
+                     (e.g. schema_version) / 저장 시 기록되고 읽을 때 요구되는 사이드카 필드
+
+        Returns:
+            DataFrame
+        """
+        df = self.read(path, **extra)
+        if df is not None:
+            return df
+
+        # Taken before parsing so a concurrent rewrite is never cached as current
+        # 파싱 전에 서명을 얻어 동시에 다시 쓰인 파일이 최신으로 캐시되지 않도록 함
+        signature = file_signature(path)
+        df = loader(path)
+        try:
+            self.write(path, df, signature=signature, **extra)
+        except Exception as e:
+            print(f"⚠️ Could not cache {Path(path).name}: {e}")
+        return df
@@ -0,0 +1,145 @@
+"""
+excel_reader.py - Streaming read-only Excel ingestion
+스트리밍 읽기 전용 Excel 적재
+
+pd.read_excel builds the whole workbook in memory before the first row is returned.
+This reader opens the workbook in openpyxl's read_only mode, which parses the sheet
+XML as a stream, and turns every batch of rows into a schema-typed DataFrame
+(schemas.py) right away. Raw cell values are held for one batch at a time, so peak
+memory is the compact typed frame plus one batch. Callers store the result in the
+columnar cache, so a workbook is read once per change.
+pd.read_excel은 첫 행을 반환하기 전에 전체 워크북을 메모리에 만듭니다.
+이 리더는 시트 XML을 스트림으로 파싱하는 openpyxl read_only 모드로 워크북을 열고,
+행 배치마다 즉시 스키마 타입(schemas.py)의 DataFrame으로 변환합니다. 원시 셀 값은 한 번에
+한 배치만 유지되므로 최대 메모리는 압축된 타입 프레임과 배치 하나입니다. 호출자가 결과를
+컬럼형 캐시에 저장하므로 워크북은 변경될 때마다 한 번만 읽힙니다.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from .schemas import SCHEMAS, apply_schema
+
+try:
+    from openpyxl import load_workbook
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+EXCEL_BATCH_ROWS = 10_000
+
+
+def _header(row) -> List[str]:
+    return [str(value) if value is not None else f'Unnamed: {i}' for i, value in enumerate(row)]
+
+
+def iter_excel_batches(
+    path: Path,
+    batch_size: int = EXCEL_BATCH_ROWS,
+    sheet_name: Optional[str] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a worksheet as DataFrames of at most batch_size rows
+    워크시트를 최대 batch_size 행의 DataFrame으로 스트리밍
+
+    Args:
+        path: .xlsx file / .xlsx 파일
+        batch_size: Rows per batch / 배치당 행 수
+        sheet_name: Worksheet (default: the active sheet) / 워크시트 (기본값: 활성 시트)
+
+    Yields:
+        DataFrame per batch, columns from the first row / 배치별 DataFrame (첫 행이 컬럼)
+    """
+    if not OPENPYXL_AVAILABLE:
+        raise ImportError("openpyxl is required to read .xlsx files / .xlsx 파일을 읽으려면 openpyxl이 필요합니다")
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.active
+        rows = sheet.iter_rows(values_only=True)
+        columns = _header(next(rows, ()))
+        width = len(columns)
+
+        batch = []
+        start = 0
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            row = tuple(row[:width]) + (None,) * (width - len(row))
+            batch.append(row)
+            if len(batch) == batch_size:
+                yield pd.DataFrame(batch, columns=columns, index=range(start, start + len(batch)))
+                start += len(batch)
+                batch = []
+        if batch or start == 0:
+            yield pd.DataFrame(batch, columns=columns, index=range(start, start + len(batch)))
+    finally:
+        workbook.close()
+
+
+def _date_text(value):
+    # Date cells arrive as datetime; store them like the CSV exports (YYYY-MM-DD)
+    # 날짜 셀은 datetime으로 읽히므로 CSV 내보내기와 같은 형식(YYYY-MM-DD)으로 저장
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d')
+    return value
+
+
+def _concat(batches: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate typed batches, merging per-batch categories instead of
+    falling back to object columns
+    타입 배치를 연결 (배치별 범주를 병합하여 object 컬럼으로 바뀌지 않도록 함)
+    """
+    if len(batches) == 1:
+        return batches[0]
+    index = pd.RangeIndex(sum(len(batch) for batch in batches))
+    columns = {}
+    for column in batches[0].columns:
+        parts = [batch[column] for batch in batches]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            columns[column] = pd.Series(union_categoricals(parts, sort_categories=True), index=index)
+        else:
+            columns[column] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(columns, index=index)
+
+
+def read_excel_streaming(
+    path: Path,
+    source: Optional[str] = None,
+    batch_size: int = EXCEL_BATCH_ROWS,
+    sheet_name: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Read an .xlsx file batch by batch, typing each batch with the source schema
+    .xlsx 파일을 배치 단위로 읽고 각 배치를 소스 스키마로 타입 지정
+
+    Args:
+        path: .xlsx file / .xlsx 파일
+        source: Data source schema to apply (None: keep inferred types)
+                적용할 데이터 소스 스키마 (None이면 추론 타입 유지)
+        batch_size: Rows per batch / 배치당 행 수
+        sheet_name: Worksheet (default: the active sheet) / 워크시트 (기본값: 활성 시트)
+
+    Returns:
+        DataFrame
+    """
+    date_columns = [column for column, dtype in SCHEMAS.get(source, {}).items() if dtype == 'date']
+    batches = []
+    violations = []
+    for batch in iter_excel_batches(path, batch_size=batch_size, sheet_name=sheet_name):
+        if source:
+            for column in date_columns:
+                if column in batch.columns:
+                    batch[column] = batch[column].map(_date_text)
+            batch, batch_violations = apply_schema(batch, source)
+            violations.extend(v for v in batch_violations if v not in violations)
+        batches.append(batch)
+
+    for violation in violations:
+        print(f"⚠️ Schema violation in {Path(path).name}: {violation}")
+    return _concat(batches)
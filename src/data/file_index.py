@@ -0,0 +1,298 @@
+"""
+file_index.py - Persistent index of monthly input files
+월별 입력 파일의 영구 인덱스
+
+Maps (source, year, month) to the input file's path, size, mtime and content hash,
+so month discovery and path resolution are dictionary lookups instead of glob scans
+and per-candidate stat calls. The index is built with one walk of input_files/ and
+saved to .cache/file_index.json; later refreshes only stat the recorded directories
+and files, and walk again when a directory changed (file added, removed or renamed).
+(source, year, month)를 입력 파일의 경로, 크기, 수정 시간, 콘텐츠 해시로 매핑하여
+월 탐지와 경로 조회를 glob 스캔 및 후보별 stat 대신 딕셔너리 조회로 처리합니다.
+인덱스는 input_files/를 한 번 순회하여 생성되고 .cache/file_index.json에 저장됩니다.
+이후 갱신은 기록된 디렉토리와 파일만 stat하며, 디렉토리가 바뀐 경우(파일 추가/삭제/이름 변경)에만
+다시 순회합니다.
+
+Year of a file, in order of precedence / 파일 연도 결정 순서:
+1. Year in the file name (attendance_2025_09.csv, 1.HSRG AQL REPORT-JULY.2024.csv,
+   basic manpower data september 2024.csv)
+2. A YYYY directory in its path (input_files/2024/basic manpower data september.csv)
+3. sync_manifest.json entry of the month name (Google Drive folder year)
+4. The collector's target year
+Month-name files of different years can therefore live side by side in year folders
+or with a year suffix. / 연도 폴더나 연도 접미사로 여러 연도의 월 이름 파일을 함께 둘 수 있습니다.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.file_hash import compute_content_hash
+
+INDEX_VERSION = 1
+
+# Drive sync manifest giving the year of month-name files / 월 이름 파일의 연도를 제공하는 Drive 동기화 매니페스트
+MANIFEST_FILE = 'sync_manifest.json'
+
+MONTH_NAMES = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    '1월': 1, '2월': 2, '3월': 3, '4월': 4,
+    '5월': 5, '6월': 6, '7월': 7, '8월': 8,
+    '9월': 9, '10월': 10, '11월': 11, '12월': 12
+}
+
+# (source, directory relative to input_files/, file name pattern, priority)
+# Lower priority wins when several files map to the same (source, year, month).
+# (소스, input_files/ 기준 디렉토리, 파일명 패턴, 우선순위) - 같은 키에서는 낮은 우선순위가 선택됨
+_YEAR_SUFFIX = r'(?:[ _](?P<year>\d{4}))?'
+FILE_PATTERNS = [
+    ('basic_manpower', (), re.compile(r'^basic manpower data (?P<month>\S+?)' + _YEAR_SUFFIX + r'\.csv$', re.I), 0),
+    ('attendance', ('attendance', 'converted'),
+     re.compile(r'^attendance_(?P<year>\d{4})_(?P<month>\d{1,2})\.csv$', re.I), 0),
+    ('attendance', ('attendance', 'converted'),
+     re.compile(r'^attendance data (?P<month>\S+?)' + _YEAR_SUFFIX + r'_converted\.csv$', re.I), 1),
+    ('aql', ('AQL history',), re.compile(r'^AQL history (?P<month>\S+?)' + _YEAR_SUFFIX + r'\.csv$', re.I), 0),
+    ('aql', ('AQL history',),
+     re.compile(r'^(?:\d+\.)?HSRG AQL REPORT-(?P<month>[^.]+)\.(?P<year>\d{4})\.csv$', re.I), 1),
+    ('5prs', (), re.compile(r'^5prs data (?P<month>\S+?)' + _YEAR_SUFFIX + r'\.csv$', re.I), 0),
+]
+
+SOURCES = ['basic_manpower', 'attendance', 'aql', '5prs']
+
+
+def parse_input_path(relative_path: str, check_directory: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Recognize a monthly input file from its path relative to input_files/
+    input_files/ 기준 상대 경로로 월별 입력 파일 식별
+
+    Args:
+        relative_path: e.g. 'attendance/converted/attendance data may_converted.csv'
+        check_directory: Require the source's directory (False: file name only)
+                         소스 디렉토리 일치 여부 확인 (False: 파일명만 확인)
+
+    Returns:
+        {'source', 'month', 'month_name', 'year' (None if not in the path), 'priority'}
+        or None for other files / 그 외 파일은 None
+    """
+    parts = Path(relative_path).parts
+    if not parts:
+        return None
+    directories = [part for part in parts[:-1] if not re.fullmatch(r'\d{4}', part)]
+    year_dirs = [int(part) for part in parts[:-1] if re.fullmatch(r'\d{4}', part)]
+
+    for source, directory, pattern, priority in FILE_PATTERNS:
+        if check_directory and tuple(directories) != directory:
+            continue
+        match = pattern.match(parts[-1])
+        if not match:
+            continue
+        month_text = match.group('month').lower()
+        month = int(month_text) if month_text.isdigit() else MONTH_NAMES.get(month_text)
+        if not month or not 1 <= month <= 12:
+            continue
+        year = match.groupdict().get('year')
+        return {
+            'source': source,
+            'month': month,
+            'month_name': month_text if not month_text.isdigit() else None,
+            'year': int(year) if year else (year_dirs[-1] if year_dirs else None),
+            'priority': priority
+        }
+    return None
+
+
+class InputFileIndex:
+    """
+    Persistent (source, year, month) → file index of input_files/
+    input_files/의 영구 (소스, 연도, 월) → 파일 인덱스
+    """
+
+    def __init__(self, input_dir: Path, index_path: Optional[Path] = None):
+        """
+        Args:
+            input_dir: input_files/ directory / input_files/ 디렉토리
+            index_path: Where the index is persisted (None keeps it in memory)
+                        인덱스 저장 위치 (None이면 메모리에만 유지)
+        """
+        self.input_dir = Path(input_dir)
+        self.index_path = Path(index_path) if index_path else None
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.directories: Dict[str, int] = {}
+        self.manifest_years: Dict[str, int] = {}
+        self.manifest_mtime_ns: Optional[int] = None
+        self._load()
+
+    def _load(self) -> None:
+        if not (self.index_path and self.index_path.exists()):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != INDEX_VERSION or data.get('input_dir') != str(self.input_dir.resolve()):
+            return
+        self.files = data.get('files', {})
+        self.directories = data.get('directories', {})
+        self.manifest_years = data.get('manifest_years', {})
+        self.manifest_mtime_ns = data.get('manifest_mtime_ns')
+
+    def _save(self) -> None:
+        if not self.index_path:
+            return
+        data = {
+            'version': INDEX_VERSION,
+            'input_dir': str(self.input_dir.resolve()),
+            'manifest_mtime_ns': self.manifest_mtime_ns,
+            'manifest_years': self.manifest_years,
+            'directories': self.directories,
+            'files': self.files
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"⚠️ Could not save input file index: {e}")
+
+    def _directories_changed(self) -> bool:
+        if not self.directories:
+            return True
+        for relative, mtime_ns in self.directories.items():
+            try:
+                if os.stat(self.input_dir / relative).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _walk(self) -> Dict[str, os.stat_result]:
+        """
+        One walk of input_files/: records directory mtimes, returns monthly files
+        input_files/ 1회 순회: 디렉토리 mtime 기록 후 월별 파일 반환
+        """
+        self.directories = {}
+        found = {}
+        if not self.input_dir.exists():
+            return found
+        for dirpath, dirnames, filenames in os.walk(self.input_dir):
+            dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+            relative_dir = Path(dirpath).relative_to(self.input_dir)
+            self.directories[relative_dir.as_posix()] = os.stat(dirpath).st_mtime_ns
+            for filename in filenames:
+                relative = (relative_dir / filename).as_posix()
+                if parse_input_path(relative):
+                    try:
+                        found[relative] = os.stat(os.path.join(dirpath, filename))
+                    except OSError:
+                        continue
+        return found
+
+    def _refresh_manifest(self) -> bool:
+        manifest_path = self.input_dir / MANIFEST_FILE
+        try:
+            mtime_ns = manifest_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns == self.manifest_mtime_ns:
+            return False
+
+        self.manifest_mtime_ns = mtime_ns
+        self.manifest_years = {}
+        if mtime_ns is not None:
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    months = json.load(f).get('months', {})
+                self.manifest_years = {
+                    name.lower(): int(entry['year'])
+                    for name, entry in months.items()
+                    if isinstance(entry, dict) and entry.get('year')
+                }
+            except (OSError, ValueError, TypeError, KeyError):
+                pass
+        return True
+
+    def refresh(self) -> bool:
+        """
+        Bring the index up to date with input_files/
+        인덱스를 input_files/의 현재 상태로 갱신
+
+        Returns:
+            bool: True if anything changed / 변경이 있으면 True
+        """
+        changed = self._refresh_manifest()
+
+        if self._directories_changed():
+            current = self._walk()
+            changed = True
+        else:
+            current = {}
+            for relative in self.files:
+                try:
+                    current[relative] = os.stat(self.input_dir / relative)
+                except OSError:
+                    self.directories = {}  # force a walk next time / 다음에 다시 순회
+                    changed = True
+
+        files = {}
+        for relative, stat in current.items():
+            previous = self.files.get(relative)
+            if previous and previous['size'] == stat.st_size and previous['mtime_ns'] == stat.st_mtime_ns:
+                files[relative] = previous
+                continue
+            try:
+                content_hash = compute_content_hash(self.input_dir / relative)
+            except OSError:
+                continue
+            files[relative] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'hash': content_hash}
+            changed = True
+
+        if changed or files.keys() != self.files.keys():
+            self.files = files
+            self._save()
+            return True
+        return False
+
+    def resolve(self, default_year: int) -> Dict[Tuple[str, int, int], Dict[str, Any]]:
+        """
+        (source, year, month) → entry map; files without a year in their path use the
+        sync manifest year of their month name, else default_year
+        (소스, 연도, 월) → 항목 맵. 경로에 연도가 없는 파일은 매니페스트 연도, 없으면 default_year 사용
+
+        When several files map to one key, the lowest pattern priority wins, then a file
+        with an explicit year in its path or name, then the first relative path in sort
+        order, so the choice does not depend on directory walk order.
+        여러 파일이 같은 키에 해당하면 패턴 우선순위, 경로/파일명의 명시적 연도, 상대 경로 정렬 순으로
+        선택하여 디렉토리 순회 순서와 무관하게 결정됩니다.
+
+        Args:
+            default_year: Collector's target year / 수집기 대상 연도
+
+        Returns:
+            Entries with 'path' (absolute Path), 'size', 'mtime_ns' and 'hash'
+        """
+        resolved = {}
+        ranks = {}
+        for relative, entry in self.files.items():
+            info = parse_input_path(relative)
+            if not info:
+                continue
+            key = (info['source'], self.year_for(info, default_year), info['month'])
+            rank = (info['priority'], info['year'] is None, relative)
+            if key in ranks and ranks[key] <= rank:
+                continue
+            ranks[key] = rank
+            resolved[key] = dict(entry, path=self.input_dir / relative)
+        return resolved
+
+    def year_for(self, info: Dict[str, Any], default_year: int) -> int:
+        """
+        Year of a parsed input path (see resolve) / 파싱된 입력 경로의 연도
+        """
+        return info['year'] or self.manifest_years.get(info['month_name'] or '', default_year)
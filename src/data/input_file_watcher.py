@@ -0,0 +1,110 @@
+"""
+input_file_watcher.py - Polling watcher for input_files changes
+input_files 변경 감지용 폴링 감시기
+
+Detects added, modified and removed input files by comparing (mtime, size)
+snapshots, and debounces bursts of changes such as a Google Drive sync
+writing several files in a row. The watched files are the ones InputFileIndex
+recognizes (including input_files/YYYY/ folders and year-suffixed names) plus
+sync_manifest.json, so the watcher and the collector agree on what an input is.
+(mtime, size) 스냅샷 비교로 추가/수정/삭제된 입력 파일을 감지하고,
+Google Drive 동기화처럼 연속으로 발생하는 변경을 디바운스합니다. 감시 대상은
+InputFileIndex가 인식하는 파일(input_files/YYYY/ 폴더와 연도 접미사 파일 포함)과
+sync_manifest.json이므로 감시기와 수집기가 같은 입력 파일 기준을 사용합니다.
+
+Uses only the standard library so it works on every platform without
+inotify/FSEvents bindings.
+inotify/FSEvents 바인딩 없이 모든 플랫폼에서 동작하도록 표준 라이브러리만 사용합니다.
+"""
+
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from .file_index import MANIFEST_FILE, InputFileIndex
+
+
+class InputFileWatcher:
+    """
+    Poll input files and report debounced change sets
+    입력 파일을 폴링하여 디바운스된 변경 집합 보고
+    """
+
+    def __init__(self,
+                 input_dir: Path,
+                 poll_interval: float = 1.0,
+                 debounce_seconds: float = 2.0):
+        """
+        Args:
+            input_dir: Directory to watch (usually input_files/) / 감시할 디렉토리
+            poll_interval: Seconds between polls / 폴링 간격 (초)
+            debounce_seconds: Quiet period required before reporting changes
+                              변경 보고 전 필요한 무변경 대기 시간 (초)
+        """
+        self.input_dir = Path(input_dir)
+        # In memory: a poll only stats the recorded directories and files
+        # 메모리 인덱스: 폴링은 기록된 디렉토리와 파일만 stat
+        self.index = InputFileIndex(self.input_dir)
+        self.poll_interval = poll_interval
+        self.debounce_seconds = debounce_seconds
+        self._snapshot: Dict[Path, Tuple[int, int]] = self.snapshot()
+
+    def snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        """
+        Take a (mtime, size) snapshot of every watched file
+        감시 대상 파일의 (mtime, size) 스냅샷 생성
+        """
+        self.index.refresh()
+        state = {
+            self.input_dir / relative: (entry['mtime_ns'], entry['size'])
+            for relative, entry in self.index.files.items()
+        }
+        manifest = self.input_dir / MANIFEST_FILE
+        try:
+            stat = manifest.stat()
+            state[manifest] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass
+        return state
+
+    def poll(self) -> Set[Path]:
+        """
+        Return files added, modified or removed since the previous poll
+        이전 폴링 이후 추가/수정/삭제된 파일 반환
+        """
+        current = self.snapshot()
+        changed = {
+            path for path in set(current) | set(self._snapshot)
+            if current.get(path) != self._snapshot.get(path)
+        }
+        self._snapshot = current
+        return changed
+
+    def wait_for_changes(self, should_stop: Optional[Callable[[], bool]] = None) -> Set[Path]:
+        """
+        Block until a burst of changes has settled, then return all changed files
+        변경이 잠잠해질 때까지 대기한 후 변경된 모든 파일 반환
+
+        Args:
+            should_stop: Optional callback; returning True aborts the wait
+                         True를 반환하면 대기를 중단하는 콜백 (선택)
+
+        Returns:
+            Changed files (empty if aborted) / 변경된 파일 (중단 시 빈 집합)
+        """
+        pending: Set[Path] = set()
+        last_change = 0.0
+
+        while True:
+            if should_stop and should_stop():
+                return set()
+
+            changed = self.poll()
+            now = time.monotonic()
+            if changed:
+                pending |= changed
+                last_change = now
+            elif pending and now - last_change >= self.debounce_seconds:
+                return pending
+
+            time.sleep(self.poll_interval)
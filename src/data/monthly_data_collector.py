@@ -11,13 +11,16 @@ by scanning the input_files directory structure.
 어떤 월에 사용 가능한 데이터가 있는지 자동으로 탐지합니다.
 """
 
-import os
-import glob
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime
 import pandas as pd
 
+from .columnar_store import ColumnarStore
+from .file_index import InputFileIndex, MONTH_NAMES, SOURCES, parse_input_path
+from .schemas import SCHEMA_VERSION, read_source
+from ..utils.encoding_cache import EncodingCache
+
 
 class MonthlyDataCollector:
     """
@@ -28,34 +31,53 @@ class MonthlyDataCollector:
     하드코딩 없음: 사용 가능한 월을 자동으로 스캔
     """
 
-    MONTH_NAMES = {
-        'january': 1, 'february': 2, 'march': 3, 'april': 4,
-        'may': 5, 'june': 6, 'july': 7, 'august': 8,
-        'september': 9, 'october': 10, 'november': 11, 'december': 12,
-        # Korean month names (한국어 월 이름)
-        '1월': 1, '2월': 2, '3월': 3, '4월': 4,
-        '5월': 5, '6월': 6, '7월': 7, '8월': 8,
-        '9월': 9, '10월': 10, '11월': 11, '12월': 12
-    }
-
-    def __init__(self, hr_root: Path, target_year: int = None):
+    MONTH_NAMES = MONTH_NAMES
+
+    def __init__(self, hr_root: Path, target_year: int = None, cache_data: bool = False):
         """
         Initialize MonthlyDataCollector
 
         Args:
             hr_root: Path to HR project root directory
             target_year: Target year for data (defaults to current year)
+            cache_data: Keep loaded month frames in memory so that repeated
+                load_month_data() calls (e.g. batch regeneration of several
+                dashboards) parse each file only once
+                로드된 월 데이터를 메모리에 유지하여 반복 호출 시 파일을 한 번만 파싱
         """
         self.hr_root = Path(hr_root)
         self.input_dir = self.hr_root / "input_files"
         self.available_months: List[str] = []
         self.month_data_map: Dict[str, Dict[str, Path]] = {}
         self.target_year = target_year or datetime.now().year
+        self.cache_data = cache_data
+        self._month_data_cache: Dict[str, Dict[str, pd.DataFrame]] = {}
+        # Parsed files (including converted attendance) / 파싱된 파일 캐시 (변환된 출근 데이터 포함)
+        self.store = ColumnarStore(self.hr_root / ".cache" / "columnar", input_root=self.input_dir)
+        # (source, year, month) → file entry / (소스, 연도, 월) → 파일 항목
+        self.file_index = InputFileIndex(self.input_dir, self.hr_root / ".cache" / "file_index.json")
+        # Detected encoding per file content / 파일 콘텐츠별 탐지된 인코딩
+        self.encodings = EncodingCache.for_project(self.hr_root)
+        self._file_map: Optional[Dict[Tuple[str, int, int], Dict[str, Any]]] = None
+
+    def _get_file_map(self, refresh: bool = False) -> Dict[Tuple[str, int, int], Dict[str, Any]]:
+        """
+        (source, year, month) → file entry map, refreshing the index on first use
+        (소스, 연도, 월) → 파일 항목 맵 (처음 사용 시 인덱스 갱신)
+
+        Args:
+            refresh: Re-check input_files/ for added, removed or modified files
+                     input_files/의 추가/삭제/수정 파일 다시 확인
+        """
+        if self._file_map is None or refresh:
+            self.file_index.refresh()
+            self._file_map = self.file_index.resolve(self.target_year)
+        return self._file_map
 
     def detect_available_months(self, start_year: int = 2025, start_month: int = 7) -> List[str]:
         """
-        Scan input_files directory to detect which months have data
-        input_files 디렉토리를 스캔하여 어떤 월에 데이터가 있는지 탐지
+        Detect which months have data from the input file index (refreshed first)
+        입력 파일 인덱스로 어떤 월에 데이터가 있는지 탐지 (먼저 인덱스 갱신)
 
         Args:
             start_year: Starting year to scan from (기본: 2025)
@@ -71,139 +93,36 @@ class MonthlyDataCollector:
             >>> print(months)
             ['2025-07', '2025-08', '2025-09', '2025-10', '2025-11']
         """
-        detected_months = set()
-
-        # Pattern 1: Basic manpower data files
-        # 패턴 1: 기본 인력 데이터 파일
-        manpower_pattern = str(self.input_dir / "basic manpower data *.csv")
-        for file_path in glob.glob(manpower_pattern):
-            month_str = self._extract_month_from_filename(file_path, "basic manpower data")
-            if month_str:
-                detected_months.add(month_str)
-
-        # Pattern 2: Attendance data files in converted directory
-        # 패턴 2: converted 디렉토리의 출근 데이터 파일
-        attendance_dir = self.input_dir / "attendance" / "converted"
-        if attendance_dir.exists():
-            # Try pattern: attendance_YYYY_MM.csv
-            attendance_pattern = str(attendance_dir / "attendance_*.csv")
-            for file_path in glob.glob(attendance_pattern):
-                month_str = self._extract_month_from_attendance(file_path)
-                if month_str:
-                    detected_months.add(month_str)
-
-            # Try pattern: attendance data {month}_converted.csv
-            attendance_pattern2 = str(attendance_dir / "attendance data *_converted.csv")
-            for file_path in glob.glob(attendance_pattern2):
-                month_str = self._extract_month_from_filename(file_path, "attendance data")
-                if month_str:
-                    detected_months.add(month_str)
-
-        # Pattern 3: AQL history files
-        # 패턴 3: AQL 이력 파일
-        aql_dir = self.input_dir / "AQL history"
-        if aql_dir.exists():
-            # Try pattern: AQL history {month}.csv
-            aql_pattern = str(aql_dir / "AQL history *.csv")
-            for file_path in glob.glob(aql_pattern):
-                month_str = self._extract_month_from_filename(file_path, "AQL history")
-                if month_str:
-                    detected_months.add(month_str)
-
-            # Try pattern: 1.HSRG AQL REPORT-{MONTH}.{YEAR}.csv
-            # 여러 연도 패턴 지원
-            for year in [self.target_year, 2024, 2025, 2023]:
-                aql_pattern2 = str(aql_dir / f"*.HSRG AQL REPORT-*.{year}.csv")
-                for file_path in glob.glob(aql_pattern2):
-                    month_str = self._extract_month_from_aql(file_path)
-                    if month_str:
-                        detected_months.add(month_str)
-
-        # Pattern 4: 5PRS data files
-        # 패턴 4: 5PRS 데이터 파일
-        prs_pattern = str(self.input_dir / "5prs data *.csv")
-        for file_path in glob.glob(prs_pattern):
-            month_str = self._extract_month_from_filename(file_path, "5prs data")
-            if month_str:
-                detected_months.add(month_str)
+        files = self._get_file_map(refresh=True)
 
         # Sort chronologically
         # 시간순으로 정렬
-        self.available_months = sorted(list(detected_months))
+        self.available_months = sorted({f"{year}-{month:02d}" for _, year, month in files})
 
         return self.available_months
 
-    def _extract_month_from_filename(self, file_path: str, prefix: str) -> Optional[str]:
+    def find_month_for_file(self, file_path: Path) -> Optional[str]:
         """
-        Extract month from filename
-        파일명에서 월 추출
+        Determine which month an input file belongs to (file may no longer exist)
+        입력 파일이 속한 월 판별 (파일이 이미 삭제되었어도 동작)
 
         Args:
-            file_path: Full path to file
-            prefix: Prefix to remove (e.g., "basic manpower data")
+            file_path: Path of an input file
 
         Returns:
-            Month string in 'YYYY-MM' format or None
+            Month string in 'YYYY-MM' format or None if not a monthly file
         """
+        self._get_file_map()
+        file_path = Path(file_path)
         try:
-            filename = os.path.basename(file_path)
-            # Remove prefix and extension
-            month_part = filename.replace(prefix, "").replace(".csv", "").strip()
+            relative = file_path.resolve().relative_to(self.input_dir.resolve())
+        except ValueError:
+            relative = Path(file_path.name)
 
-            # Try to parse as month name
-            month_num = self.MONTH_NAMES.get(month_part.lower())
-            if month_num:
-                # Use target year from initialization
-                # 초기화 시 지정된 대상 연도 사용
-                return f"{self.target_year}-{month_num:02d}"
-
-            return None
-
-        except Exception:
-            return None
-
-    def _extract_month_from_attendance(self, file_path: str) -> Optional[str]:
-        """
-        Extract month from attendance filename
-        출근 파일명에서 월 추출
-
-        Pattern: attendance_YYYY_MM.csv
-        """
-        try:
-            filename = os.path.basename(file_path)
-            # attendance_2025_09.csv → 2025_09
-            parts = filename.replace("attendance_", "").replace(".csv", "").split("_")
-            if len(parts) == 2:
-                year, month = parts
-                return f"{year}-{month}"
-            return None
-        except Exception:
-            return None
-
-    def _extract_month_from_aql(self, file_path: str) -> Optional[str]:
-        """
-        Extract month from AQL filename
-        AQL 파일명에서 월 추출
-
-        Pattern: 1.HSRG AQL REPORT-{MONTH}.{YEAR}.csv
-        Example: 1.HSRG AQL REPORT-JULY.2024.csv → 2024-07
-        """
-        try:
-            filename = os.path.basename(file_path)
-            # Extract month part between '-' and '.YEAR'
-            # 다양한 연도 형식 지원
-            if "REPORT-" in filename:
-                # Find year in filename (could be 2024, 2025, etc.)
-                for year in [self.target_year, 2024, 2025, 2023]:
-                    year_pattern = f".{year}"
-                    if year_pattern in filename:
-                        month_part = filename.split("REPORT-")[1].split(year_pattern)[0]
-                        month_num = self.MONTH_NAMES.get(month_part.lower())
-                        if month_num:
-                            return f"{year}-{month_num:02d}"
-            return None
-        except Exception:
+        info = parse_input_path(relative.as_posix(), check_directory=False)
+        if not info:
             return None
+        return f"{self.file_index.year_for(info, self.target_year)}-{info['month']:02d}"
 
     def get_month_range(self, target_month: str) -> List[str]:
         """
@@ -295,73 +214,63 @@ class MonthlyDataCollector:
                 '5prs': Path('input_files/5prs data september.csv')
             }
         """
-        year, month_num = year_month.split('-')
-        month_num_int = int(month_num)
-
-        # Reverse lookup: month number to name
-        month_name = None
-        for name, num in self.MONTH_NAMES.items():
-            if num == month_num_int and name.isalpha() and name.islower():
-                month_name = name
-                break
+        year, month = (int(part) for part in year_month.split('-'))
+        files = self._get_file_map()
 
         paths = {}
-
-        if month_name:
-            # Basic manpower
-            manpower_path = self.input_dir / f"basic manpower data {month_name}.csv"
-            paths['basic_manpower'] = manpower_path if manpower_path.exists() else None
-
-            # Attendance - try multiple patterns
-            attendance_path1 = self.input_dir / "attendance" / "converted" / f"attendance_{year}_{month_num}.csv"
-            attendance_path2 = self.input_dir / "attendance" / "converted" / f"attendance data {month_name}_converted.csv"
-
-            if attendance_path1.exists():
-                paths['attendance'] = attendance_path1
-            elif attendance_path2.exists():
-                paths['attendance'] = attendance_path2
-            else:
-                paths['attendance'] = None
-
-            # AQL - try multiple patterns
-            # AQL - 여러 패턴 시도 (연도 포함)
-            aql_path1 = self.input_dir / "AQL history" / f"AQL history {month_name}.csv"
-            aql_path2 = self.input_dir / "AQL history" / f"1.HSRG AQL REPORT-{month_name.upper()}.{year}.csv"
-
-            if aql_path1.exists():
-                paths['aql'] = aql_path1
-            elif aql_path2.exists():
-                paths['aql'] = aql_path2
-            else:
-                paths['aql'] = None
-
-            # 5PRS
-            prs_path = self.input_dir / f"5prs data {month_name}.csv"
-            paths['5prs'] = prs_path if prs_path.exists() else None
+        for source in SOURCES:
+            entry = files.get((source, year, month))
+            paths[source] = entry['path'] if entry else None
 
         return paths
 
-    def load_month_data(self, year_month: str) -> Dict[str, pd.DataFrame]:
+    def load_month_data(self, year_month: str, sources: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
         """
-        Load all data for a specific month
-        특정 월의 모든 데이터 로드
+        Load data for a specific month
+        특정 월의 데이터 로드
 
         Args:
             year_month: Month in 'YYYY-MM' format
+            sources: Data sources to load, e.g. ['basic_manpower', 'attendance']
+                     (default: all of basic_manpower, attendance, aql, 5prs).
+                     Only these files are read, so callers that never use AQL or
+                     5PRS data do not pay for parsing them.
+                     로드할 데이터 소스 (기본값: 전체). 지정한 파일만 읽습니다.
 
         Returns:
-            Dictionary mapping data source to DataFrame
+            Dictionary mapping each requested data source to DataFrame, typed by
+            the source schema (src/data/schemas.py) / 소스 스키마로 타입이 지정된 DataFrame
 
         NO FAKE DATA: Returns empty DataFrame if file doesn't exist
         가짜 데이터 없음: 파일이 없으면 빈 DataFrame 반환
         """
-        paths = self.get_file_paths_for_month(year_month)
-        data = {}
+        sources = list(SOURCES) if sources is None else list(sources)
+        unknown = [source for source in sources if source not in SOURCES]
+        if unknown:
+            raise ValueError(f"Unknown data source(s): {unknown} (expected {SOURCES})")
+
+        cached = self._month_data_cache.get(year_month, {}) if self.cache_data else {}
+        missing = [source for source in sources if source not in cached]
+        paths = self.get_file_paths_for_month(year_month) if missing else {}
 
-        for source, path in paths.items():
+        data = {}
+        for source in sources:
+            if source in cached:
+                # Hand out copies so callers can add columns without touching the cache
+                # 호출자가 컬럼을 추가해도 캐시가 변경되지 않도록 복사본 반환
+                data[source] = cached[source].copy()
+                continue
+
+            path = paths.get(source)
             if path and path.exists():
                 try:
-                    df = pd.read_csv(path, encoding='utf-8')
+                    df = self.store.read_through(
+                        path,
+                        lambda p, source=source: self.encodings.read_with(
+                            p, lambda encoding: read_source(p, source, encoding=encoding)
+                        ),
+                        schema_version=SCHEMA_VERSION
+                    )
                     data[source] = df
                 except Exception as e:
                     print(f"⚠️ Failed to load {source} for {year_month}: {e}")
@@ -370,8 +279,24 @@ class MonthlyDataCollector:
                 # NO FAKE DATA - return empty DataFrame
                 data[source] = pd.DataFrame()
 
+            if self.cache_data:
+                self._month_data_cache.setdefault(year_month, {})[source] = data[source].copy()
+
         return data
 
+    def invalidate_cache(self, year_month: Optional[str] = None) -> None:
+        """
+        Drop cached month frames (all months if year_month is None)
+        캐시된 월 데이터 삭제 (year_month가 None이면 전체)
+
+        Args:
+            year_month: Month in 'YYYY-MM' format, or None for all months
+        """
+        if year_month is None:
+            self._month_data_cache.clear()
+        else:
+            self._month_data_cache.pop(year_month, None)
+
     def get_data_availability_report(self) -> Dict[str, Any]:
         """
         Generate report of data availability across months
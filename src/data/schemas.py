@@ -0,0 +1,170 @@
+"""
+schemas.py - Typed schema registry of the monthly input sources
+월별 입력 소스의 타입 스키마 레지스트리
+
+Declares the dtype of every known column of basic manpower, attendance, AQL and 5PRS
+files instead of relying on pd.read_csv inference:
+- IDs are int64 (Employee No, ID No); the boss ID, which is blank for top managers,
+  is nullable Int64 instead of float64, so it never needs '600000.0' → '600000' fixing
+- Repeated labels (positions, TYPE, BUILDING, LINE, compAdd, reasons) are categoricals,
+  which stores each distinct label once per frame
+- Date columns are validated against the configured date formats (config/date_config.py);
+  they stay text because the dashboard embeds them verbatim and reshapes Work Date strings
+Values that do not fit the schema are reported as violations instead of failing the
+load: non-numeric values in a nullable ID become <NA>, an int64 column that cannot be
+converted keeps its read values.
+기본 인력, 출근, AQL, 5PRS 파일의 알려진 모든 컬럼의 dtype을 pd.read_csv 추론 대신 선언합니다.
+- ID는 int64 (Employee No, ID No). 최상위 관리자는 비어 있는 상사 ID는 float64 대신
+  nullable Int64로 읽어 '600000.0' → '600000' 변환이 필요 없습니다
+- 반복되는 라벨 (직급, TYPE, BUILDING, LINE, compAdd, 사유)은 범주형으로 저장되어
+  프레임마다 고유 라벨을 한 번만 저장합니다
+- 날짜 컬럼은 설정된 날짜 형식(config/date_config.py)으로 검증만 하고 텍스트로 유지합니다
+  (대시보드가 그대로 사용하고 Work Date 문자열을 변환하기 때문)
+스키마에 맞지 않는 값은 로드를 실패시키지 않고 위반으로 보고합니다. nullable ID의 숫자가
+아닌 값은 <NA>가 되고, 변환할 수 없는 int64 컬럼은 읽은 값을 유지합니다.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from ..config.date_config import DATE_FORMATS
+
+# Bump when a schema changes so cached frames are re-parsed
+# 스키마 변경 시 증가시켜 캐시된 프레임을 다시 파싱
+SCHEMA_VERSION = 1
+
+# dtype pd.read_csv gives text columns (object before pandas 3, str from 3 on)
+# pd.read_csv가 텍스트 컬럼에 사용하는 dtype (pandas 3 이전 object, 이후 str)
+TEXT_DTYPE = pd.Series(['']).dtype
+
+# Column → dtype. 'date' marks a text column validated against DATE_FORMATS.
+# Columns not listed keep pd.read_csv inference.
+# 컬럼 → dtype. 'date'는 DATE_FORMATS로 검증하는 텍스트 날짜 컬럼. 목록에 없는 컬럼은 추론 유지.
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    'basic_manpower': {
+        'Employee No': 'int64',
+        'Full Name': 'str',
+        'Entrance Date': 'date',
+        'Stop working Date': 'date',
+        'ROLE TYPE STD': 'category',
+        'QIP POSITION 1ST  NAME': 'category',
+        'QIP POSITION 2ND  NAME': 'category',
+        'QIP POSITION 3RD  NAME': 'category',
+        'FINAL QIP POSITION NAME CODE': 'category',
+        'MST direct boss name': 'Int64',
+        'BUILDING': 'category',
+        'LINE': 'category',
+        'pregnant vacation-yes or no': 'category',
+    },
+    'attendance': {
+        'ID No': 'int64',
+        'Last name': 'str',
+        'Work Date': 'date',
+        'compAdd': 'category',
+        'Reason Description': 'category',
+    },
+    # The AQL and 5PRS exports have no fixed layout yet; inference is kept
+    # AQL, 5PRS 파일은 아직 고정된 레이아웃이 없어 추론 유지
+    'aql': {},
+    '5prs': {},
+}
+
+
+def read_dtypes(source: str) -> Dict[str, object]:
+    """
+    dtype argument for pd.read_csv: text and categorical columns
+    pd.read_csv의 dtype 인자: 텍스트 및 범주형 컬럼
+
+    IDs are read by inference and converted in apply_schema, so a stray non-numeric
+    value is reported instead of aborting the read.
+    ID는 추론으로 읽고 apply_schema에서 변환하여 숫자가 아닌 값이 읽기를 중단시키지 않고 보고됩니다.
+    """
+    dtypes = {}
+    for column, dtype in SCHEMAS[source].items():
+        if dtype == 'category':
+            dtypes[column] = 'category'
+        elif dtype in ('str', 'date'):
+            dtypes[column] = TEXT_DTYPE
+    return dtypes
+
+
+def apply_schema(df: pd.DataFrame, source: str) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Cast df to the source's schema
+    df를 소스 스키마로 변환
+
+    Args:
+        df: Frame read from a source file / 소스 파일에서 읽은 프레임
+        source: 'basic_manpower', 'attendance', 'aql' or '5prs'
+
+    Returns:
+        (typed frame, list of violation messages) / (변환된 프레임, 위반 메시지 목록)
+    """
+    violations = []
+    df = df.copy()
+    for column, dtype in SCHEMAS[source].items():
+        if column not in df.columns:
+            continue
+        series = df[column]
+
+        if dtype in ('int64', 'Int64'):
+            numeric = pd.to_numeric(series, errors='coerce')
+            bad = series.notna() & (numeric.isna() | (numeric % 1 != 0))
+            if bad.any():
+                violations.append(
+                    f"{column}: {int(bad.sum())} value(s) are not integer IDs (e.g. {series[bad].iloc[0]!r})"
+                )
+            if dtype == 'Int64':
+                df[column] = numeric.where(~bad).astype('Int64')
+            elif numeric.isna().any():
+                if not bad.any():
+                    violations.append(f"{column}: {int(numeric.isna().sum())} blank ID(s)")
+            else:
+                df[column] = numeric.astype('int64')
+
+        elif dtype == 'category':
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                # Text categories, as pd.read_csv(dtype='category') gives
+                # pd.read_csv(dtype='category')와 같은 텍스트 범주
+                df[column] = series.astype(TEXT_DTYPE).astype('category')
+
+        elif dtype == 'date':
+            text = series.astype(TEXT_DTYPE)
+            invalid = text.notna() & (text.str.strip() != '')
+            for date_format in [DATE_FORMATS['PRIMARY']] + DATE_FORMATS['ALTERNATIVES']:
+                if not invalid.any():
+                    break
+                remaining = text[invalid]
+                invalid.loc[remaining.index] = pd.to_datetime(remaining, format=date_format, errors='coerce').isna()
+            if invalid.any():
+                violations.append(
+                    f"{column}: {int(invalid.sum())} value(s) are not dates (e.g. {text[invalid].iloc[0]!r})"
+                )
+            df[column] = text
+
+        else:
+            df[column] = series.astype(TEXT_DTYPE)
+
+    return df, violations
+
+
+def read_source(path: Path, source: str, encoding: str = 'utf-8') -> pd.DataFrame:
+    """
+    Read a monthly input file with its source schema, printing any violations
+    소스 스키마로 월별 입력 파일을 읽고 위반 사항 출력
+
+    Args:
+        path: CSV file / CSV 파일
+        source: Data source name / 데이터 소스 이름
+        encoding: File encoding / 파일 인코딩
+
+    Returns:
+        Typed DataFrame / 타입이 지정된 DataFrame
+    """
+    df = pd.read_csv(path, encoding=encoding, dtype=read_dtypes(source))
+    df, violations = apply_schema(df, source)
+    for violation in violations:
+        print(f"⚠️ Schema violation in {Path(path).name}: {violation}")
+    return df
@@ -25,6 +25,7 @@ import json
 import shutil
 from pathlib import Path
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 import pandas as pd
 
@@ -34,10 +35,20 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.visualization.complete_dashboard_builder import CompleteDashboardBuilder
+from src.visualization.service_worker import ServiceWorkerGenerator
+from src.utils.file_hash import compute_content_hash
+from src.utils.month_range import parse_month_range
+from src.data.monthly_data_collector import MonthlyDataCollector
+from src.data.input_file_watcher import InputFileWatcher
+from src.analytics.hr_metric_calculator import HRMetricCalculator
+from src.api.metrics_api import create_server
 from src.utils.pre_validator import run_pre_validation
 from src.utils.logger import init_logger, get_logger
 
 
+SUPPORTED_LANGUAGES = ['ko', 'en', 'vi']
+
+
 def check_dependencies() -> bool:
     """
     Check Python version and required packages
@@ -57,7 +68,7 @@ def check_dependencies() -> bool:
 
     # Check required packages
     # 필수 패키지 확인
-    required_packages = ['pandas', 'numpy', 'chardet']
+    required_packages = ['pandas', 'numpy']
     missing = []
 
     for pkg in required_packages:
@@ -143,6 +154,201 @@ def detect_data_year(month: int, project_root: Path) -> int:
     return datetime.now().year
 
 
+def parse_languages(value: str) -> list:
+    """
+    Parse a comma-separated language list for --languages
+    --languages용 쉼표 구분 언어 목록 파싱
+
+    Args:
+        value: e.g. "ko,en,vi" / 예: "ko,en,vi"
+
+    Returns:
+        list: Unique languages in the given order / 입력 순서대로 중복 제거된 언어 목록
+    """
+    languages = []
+    for lang in value.split(','):
+        lang = lang.strip().lower()
+        if not lang:
+            continue
+        if lang not in SUPPORTED_LANGUAGES:
+            raise argparse.ArgumentTypeError(
+                f"invalid language '{lang}' (choose from {', '.join(SUPPORTED_LANGUAGES)})"
+            )
+        if lang not in languages:
+            languages.append(lang)
+
+    if not languages:
+        raise argparse.ArgumentTypeError("at least one language is required")
+
+    return languages
+
+
+def get_dashboard_filename(year: int, month: int, language: str = None) -> str:
+    """
+    Build dashboard file name, with an optional language suffix
+    대시보드 파일명 생성 (선택적 언어 접미사 포함)
+
+    Args:
+        year: Dashboard year / 대시보드 연도
+        month: Dashboard month / 대시보드 월
+        language: Language suffix for secondary variants / 보조 언어 변형용 접미사
+
+    Returns:
+        str: File name / 파일명
+    """
+    suffix = f"_{language}" if language else ""
+    return f"HR_Dashboard_Complete_{year}_{month:02d}{suffix}.html"
+
+
+def get_report_date(year: int, month: int) -> pd.Timestamp:
+    """
+    Get report date (last day of the target month)
+    보고 기준일 (대상 월의 마지막 날) 계산
+
+    Args:
+        year: Target year / 대상 연도
+        month: Target month / 대상 월
+
+    Returns:
+        pd.Timestamp: Month end date / 월말 날짜
+    """
+    month_start = pd.Timestamp(f"{year}-{month:02d}-01")
+    return month_start + pd.DateOffset(months=1) - pd.DateOffset(days=1)
+
+
+def get_output_dir(args) -> Path:
+    """
+    Resolve and create the dashboard output directory
+    대시보드 출력 디렉토리 결정 및 생성
+
+    Args:
+        args: Parsed command line arguments / 파싱된 명령줄 인수
+
+    Returns:
+        Path: Output directory / 출력 디렉토리
+    """
+    if args.output_dir:
+        output_dir = Path(args.output_dir)
+    else:
+        output_dir = Path(__file__).parent.parent / "output_files"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+
+def write_dashboard_files(builder, year: int, month: int, languages: list,
+                          output_dir: Path, project_root: Path) -> list:
+    """
+    Render every language variant of a prepared builder and save it
+    준비된 빌더의 언어별 변형을 렌더링하여 저장
+
+    The first language is written under the standard file name, the others
+    get a _<lang> suffix. Each file is also copied to docs/ for GitHub Pages.
+    첫 번째 언어는 기본 파일명, 나머지는 _<lang> 접미사로 저장되며
+    GitHub Pages용 docs/에도 복사됩니다.
+
+    Args:
+        builder: CompleteDashboardBuilder after prepare() / prepare() 완료된 빌더
+        year: Dashboard year / 대시보드 연도
+        month: Dashboard month / 대시보드 월
+        languages: Languages to render / 렌더링할 언어 목록
+        output_dir: Output directory / 출력 디렉토리
+        project_root: Project root path / 프로젝트 루트 경로
+
+    Returns:
+        list: (output_file, docs_file) tuples in language order / 언어 순서의 (출력 파일, docs 파일) 목록
+    """
+    docs_dir = project_root / "docs"
+    docs_dir.mkdir(parents=True, exist_ok=True)
+
+    written_files = []
+    for language in languages:
+        # Render each language variant from the shared in-memory results
+        # 공유된 메모리 결과로 언어별 변형 렌더링
+        html_content = builder.render(language)
+
+        suffix_language = None if language == languages[0] else language
+        output_file = output_dir / get_dashboard_filename(year, month, suffix_language)
+
+        # Backup existing dashboard before overwriting
+        # 덮어쓰기 전 기존 대시보드 백업
+        backup_existing_dashboard(output_file)
+
+        print(f"💾 Saving dashboard ({language.upper()}) to: {output_file}")
+        print(f"💾 대시보드 저장 중 ({language.upper()}): {output_file}")
+
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+
+        # Copy to docs folder for GitHub Pages
+        # GitHub Pages용 docs 폴더에 복사
+        docs_file = docs_dir / output_file.name
+        shutil.copy(output_file, docs_file)
+        print(f"📂 Copied to docs/: {docs_file}")
+        print(f"📂 docs/에 복사됨: {docs_file}")
+
+        written_files.append((output_file, docs_file))
+
+    copy_vendor_libraries(output_dir, project_root)
+    return written_files
+
+
+def copy_vendor_libraries(output_dir: Path, project_root: Path) -> None:
+    """
+    Copy the vendored D3/Plotly files (docs/vendor/) next to the dashboards in
+    output_dir, so their offline fallback (vendor/...) resolves there as well
+    docs/vendor/의 D3/Plotly 파일을 output_dir 대시보드 옆에 복사하여
+    오프라인 대체 경로(vendor/...)가 그곳에서도 동작하도록 함
+
+    Args:
+        output_dir: Output directory / 출력 디렉토리
+        project_root: Project root path / 프로젝트 루트 경로
+    """
+    vendor_dir = project_root / "docs" / "vendor"
+    target_dir = output_dir / "vendor"
+    if not vendor_dir.is_dir() or target_dir.resolve() == vendor_dir.resolve():
+        return
+
+    for source in sorted(vendor_dir.iterdir()):
+        target = target_dir / source.name
+        if not source.is_file() or (target.exists() and target.stat().st_size == source.stat().st_size):
+            continue
+        target_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, target)
+
+
+def extract_dashboard_stats(builder, year: int, month: int) -> dict:
+    """
+    Extract dashboards.json summary stats from a prepared builder
+    준비된 빌더에서 dashboards.json 요약 통계 추출
+
+    Args:
+        builder: CompleteDashboardBuilder after prepare() / prepare() 완료된 빌더
+        year: Dashboard year / 대시보드 연도
+        month: Dashboard month / 대시보드 월
+
+    Returns:
+        dict: total / absenceRate / resignationRate ("-" when unavailable)
+    """
+    target_month_key = f"{year}-{month:02d}"
+    stats = {
+        "total": "-",
+        "absenceRate": "-",
+        "resignationRate": "-"
+    }
+
+    if hasattr(builder, 'monthly_metrics') and target_month_key in builder.monthly_metrics:
+        metrics = builder.monthly_metrics[target_month_key]
+        stats["total"] = str(metrics.get('total_employees', '-'))
+        absence_rate = metrics.get('absence_rate')
+        if absence_rate is not None:
+            stats["absenceRate"] = f"{absence_rate}%"
+        resignation_rate = metrics.get('resignation_rate')
+        if resignation_rate is not None:
+            stats["resignationRate"] = f"{resignation_rate}%"
+
+    return stats
+
+
 def update_dashboards_json(year: int, month: int, stats: dict, project_root: Path):
     """
     Update docs/dashboards.json with new dashboard entry
@@ -154,6 +360,18 @@ def update_dashboards_json(year: int, month: int, stats: dict, project_root: Pat
         stats: Dashboard statistics / 대시보드 통계
         project_root: Project root path / 프로젝트 루트 경로
     """
+    update_dashboards_json_entries([(year, month, stats)], project_root)
+
+
+def update_dashboards_json_entries(entries: list, project_root: Path):
+    """
+    Update docs/dashboards.json with several dashboard entries in one write
+    여러 대시보드 항목을 한 번의 쓰기로 docs/dashboards.json에 반영
+
+    Args:
+        entries: (year, month, stats) tuples / (연도, 월, 통계) 튜플 목록
+        project_root: Project root path / 프로젝트 루트 경로
+    """
     dashboards_json_path = project_root / "docs" / "dashboards.json"
 
     # Load existing data or create new
@@ -168,26 +386,34 @@ def update_dashboards_json(year: int, month: int, stats: dict, project_root: Pat
             "dashboards": []
         }
 
-    # Create new dashboard entry
-    # 새 대시보드 항목 생성
-    new_entry = {
-        "file": f"HR_Dashboard_Complete_{year}_{month:02d}.html",
-        "year": year,
-        "month": month,
-        "updated": datetime.now().strftime("%Y-%m-%d %H:%M"),
-        "stats": stats
-    }
+    updated = datetime.now().strftime("%Y-%m-%d %H:%M")
+    for year, month, stats in entries:
+        # Create new dashboard entry
+        # 새 대시보드 항목 생성
+        new_entry = {
+            "file": get_dashboard_filename(year, month),
+            "year": year,
+            "month": month,
+            "updated": updated,
+            "stats": stats
+        }
 
-    # Remove existing entry for same year/month if exists
-    # 같은 연도/월의 기존 항목이 있으면 제거
-    data["dashboards"] = [
-        d for d in data["dashboards"]
-        if not (d.get("year") == year and d.get("month") == month)
-    ]
+        # Content hash lets docs/app.html reuse its IndexedDB copy until the file changes
+        # 콘텐츠 해시로 docs/app.html이 파일이 바뀔 때까지 IndexedDB 사본을 재사용
+        docs_file = project_root / "docs" / new_entry["file"]
+        if docs_file.exists():
+            new_entry["hash"] = compute_content_hash(docs_file)
+
+        # Remove existing entry for same year/month if exists
+        # 같은 연도/월의 기존 항목이 있으면 제거
+        data["dashboards"] = [
+            d for d in data["dashboards"]
+            if not (d.get("year") == year and d.get("month") == month)
+        ]
 
-    # Add new entry at the beginning
-    # 새 항목을 맨 앞에 추가
-    data["dashboards"].insert(0, new_entry)
+        # Add new entry at the beginning
+        # 새 항목을 맨 앞에 추가
+        data["dashboards"].insert(0, new_entry)
 
     # Sort by year and month (descending)
     # 연도와 월로 정렬 (내림차순)
@@ -205,6 +431,492 @@ def update_dashboards_json(year: int, month: int, stats: dict, project_root: Pat
     print(f"📋 Updated dashboards.json: {dashboards_json_path}")
     print(f"📋 dashboards.json 업데이트됨: {dashboards_json_path}")
 
+    # Refresh the offline precache so the service worker picks up the new files
+    # 서비스 워커가 새 파일을 받도록 오프라인 사전 캐시 갱신
+    precache = ServiceWorkerGenerator(project_root / "docs").write()
+    print(f"📦 Service worker precache: {len(precache['files'])} files (version {precache['version']})")
+    print(f"📦 서비스 워커 사전 캐시: {len(precache['files'])}개 파일 (버전 {precache['version']})")
+
+
+def get_published_months(project_root: Path) -> list:
+    """
+    List (year, month) of every dashboard registered in docs/dashboards.json
+    docs/dashboards.json에 등록된 모든 대시보드의 (연도, 월) 목록
+
+    Args:
+        project_root: Project root path / 프로젝트 루트 경로
+
+    Returns:
+        list: Sorted (year, month) tuples / 정렬된 (연도, 월) 튜플 목록
+    """
+    dashboards_json_path = project_root / "docs" / "dashboards.json"
+    if not dashboards_json_path.exists():
+        return []
+
+    with open(dashboards_json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    return sorted({
+        (int(d["year"]), int(d["month"]))
+        for d in data.get("dashboards", [])
+        if d.get("year") and d.get("month")
+    })
+
+
+def write_metrics_bundle(builder, year: int, month: int, output_dir: Path) -> Path:
+    """
+    Write the headless metrics bundle (JSON) of a prepared builder
+    준비된 빌더의 헤드리스 메트릭 번들(JSON) 저장
+
+    Args:
+        builder: CompleteDashboardBuilder after prepare() / prepare() 완료된 빌더
+        year: Dashboard year / 대시보드 연도
+        month: Dashboard month / 대시보드 월
+        output_dir: Output directory / 출력 디렉토리
+
+    Returns:
+        Path: Written bundle file / 저장된 번들 파일
+    """
+    bundle = builder.to_metrics_bundle()
+    bundle['stats'] = extract_dashboard_stats(builder, year, month)
+
+    bundle_file = output_dir / f"HR_Metrics_{year}_{month:02d}.json"
+    with open(bundle_file, 'w', encoding='utf-8') as f:
+        json.dump(bundle, f, ensure_ascii=False, indent=2)
+
+    print(f"💾 Saved metrics bundle to: {bundle_file}")
+    print(f"💾 메트릭 번들 저장: {bundle_file}")
+    return bundle_file
+
+
+def warm_month_cache(year: int, month: int, collector=None) -> int:
+    """
+    Fill the on-disk caches a build of this month reads, without writing any output:
+    input files are ingested into the columnar store (.cache/columnar) and the
+    metrics of every trend month are persisted (.cache/metrics) for the month-end
+    report date, so the next interactive build of the month starts warm
+    출력 파일 없이 이 월의 빌드가 읽는 디스크 캐시를 채움: 입력 파일을 컬럼형 저장소
+    (.cache/columnar)에 적재하고 월말 보고 기준일로 모든 트렌드 월의 메트릭을
+    (.cache/metrics)에 저장하여 다음 대화형 빌드가 웜 상태로 시작되도록 함
+
+    Args:
+        year: Dashboard year / 대시보드 연도
+        month: Dashboard month / 대시보드 월
+        collector: Shared MonthlyDataCollector / 공유 수집기
+
+    Returns:
+        int: Exit code / 종료 코드
+    """
+    builder = CompleteDashboardBuilder(
+        target_month=f"{year}-{month:02d}",
+        report_date=get_report_date(year, month),
+        collector=collector
+    )
+    builder.prepare(metrics_only=True)
+
+    print(f"🔥 Caches warmed for {year}-{month:02d} ({len(builder.available_months)} trend months)")
+    print(f"🔥 {year}-{month:02d} 캐시 준비 완료 (트렌드 {len(builder.available_months)}개월)")
+    return 0
+
+
+def build_month_dashboard(year: int, month: int, languages: list, output_dir: Path,
+                          project_root: Path, collector=None, output_format: str = 'html') -> tuple:
+    """
+    Prepare one month's dashboard and write every language variant
+    (or only the metrics bundle when output_format is 'json')
+    한 달 대시보드를 준비하고 언어별 변형을 모두 저장
+    (output_format이 'json'이면 메트릭 번들만 저장)
+
+    Args:
+        year: Dashboard year / 대시보드 연도
+        month: Dashboard month / 대시보드 월
+        languages: Languages to render / 렌더링할 언어 목록
+        output_dir: Output directory / 출력 디렉토리
+        project_root: Project root path / 프로젝트 루트 경로
+        collector: Shared MonthlyDataCollector for cross-month reuse / 월 간 재사용용 공유 수집기
+        output_format: 'html' (dashboard) or 'json' (metrics bundle only) / 출력 형식
+
+    Returns:
+        tuple: (stats, written_files) / (통계, 저장된 파일 목록)
+    """
+    builder = CompleteDashboardBuilder(
+        target_month=f"{year}-{month:02d}",
+        language=languages[0],
+        report_date=get_report_date(year, month),
+        collector=collector
+    )
+
+    if output_format == 'json':
+        builder.prepare(metrics_only=True)
+        bundle_file = write_metrics_bundle(builder, year, month, output_dir)
+        return extract_dashboard_stats(builder, year, month), [(bundle_file, None)]
+
+    builder.prepare()
+
+    written_files = write_dashboard_files(builder, year, month, languages, output_dir, project_root)
+    return extract_dashboard_stats(builder, year, month), written_files
+
+
+# Per-process collectors used by batch worker processes, keyed by year
+# 배치 워커 프로세스에서 사용하는 프로세스별 수집기 (연도별)
+_worker_collectors = {}
+
+
+def get_shared_collector(year: int, collectors: dict):
+    """
+    Get (or create) the caching collector shared by all dashboards of a year
+    연도별로 모든 대시보드가 공유하는 캐싱 수집기 가져오기 (없으면 생성)
+
+    Args:
+        year: Target year / 대상 연도
+        collectors: Collector registry keyed by year / 연도별 수집기 저장소
+
+    Returns:
+        MonthlyDataCollector: Collector with cache_data enabled / 캐시가 활성화된 수집기
+    """
+    if year not in collectors:
+        collectors[year] = MonthlyDataCollector(project_root, target_year=year, cache_data=True)
+    return collectors[year]
+
+
+def _build_month_in_worker(year: int, month: int, languages: list, output_dir: str,
+                           output_format: str = 'html') -> tuple:
+    """
+    Process pool entry point: build one month with the worker's warm collector
+    프로세스 풀 진입점: 워커의 캐시된 수집기로 한 달 빌드
+    """
+    collector = get_shared_collector(year, _worker_collectors)
+    stats, written_files = build_month_dashboard(
+        year, month, languages, Path(output_dir), project_root,
+        collector=collector, output_format=output_format
+    )
+    return year, month, stats, [str(output_file) for output_file, _ in written_files]
+
+
+def run_batch_regeneration(months: list, languages: list, args, logger) -> int:
+    """
+    Regenerate several monthly dashboards in one run
+    한 번의 실행으로 여러 월 대시보드 재생성
+
+    Month files are loaded once per process through a shared caching collector,
+    so trend windows that overlap between dashboards are not re-read.
+    With --workers > 1 the months are built in a process pool.
+    dashboards.json is updated once at the end.
+    월 데이터는 공유 캐싱 수집기를 통해 프로세스당 한 번만 로드되며,
+    --workers > 1이면 프로세스 풀에서 병렬로 빌드합니다.
+    dashboards.json은 마지막에 한 번만 업데이트됩니다.
+
+    Args:
+        months: (year, month) tuples to regenerate / 재생성할 (연도, 월) 목록
+        languages: Languages to render / 렌더링할 언어 목록
+        args: Parsed command line arguments / 파싱된 명령줄 인수
+        logger: Application logger / 애플리케이션 로거
+
+    Returns:
+        int: Exit code / 종료 코드
+    """
+    print("=" * 70)
+    print("HR Dashboard Generator - Batch Regeneration")
+    print("HR 대시보드 생성기 - 일괄 재생성")
+    print("=" * 70)
+    print(f"Months / 대상 월: {', '.join(f'{y}-{m:02d}' for y, m in months)}")
+    print(f"Language / 언어: {', '.join(lang.upper() for lang in languages)}")
+    print(f"Workers / 워커: {args.workers}")
+    print("=" * 70)
+    print()
+
+    logger.info(
+        "일괄 대시보드 재생성 시작",
+        "Batch dashboard regeneration started",
+        months=len(months),
+        workers=args.workers
+    )
+
+    # Pre-validation per month; months that fail are skipped
+    # 월별 사전 검증; 실패한 월은 건너뜀
+    if not args.skip_validation:
+        valid_months = []
+        for year, month in months:
+            validation_passed, _ = run_pre_validation(
+                project_root=project_root,
+                year=year,
+                month=month,
+                language=languages[0]
+            )
+            if validation_passed:
+                valid_months.append((year, month))
+            else:
+                print(f"⏭️  Skipping {year}-{month:02d}: pre-validation failed")
+                print(f"⏭️  {year}-{month:02d} 건너뛰기: 사전 검증 실패")
+        months = valid_months
+
+    results, failures = build_month_dashboards(
+        months, languages, get_output_dir(args), {}, args.workers, logger,
+        output_format=args.output_format
+    )
+    print_batch_summary(results, failures)
+
+    return 1 if failures or not results else 0
+
+
+def build_month_dashboards(months: list, languages: list, output_dir: Path, collectors: dict,
+                           workers: int, logger, output_format: str = 'html') -> tuple:
+    """
+    Build several monthly dashboards and update dashboards.json once
+    (metrics bundles only, without touching dashboards.json, when output_format is 'json')
+    여러 월 대시보드를 빌드하고 dashboards.json을 한 번만 업데이트
+    (output_format이 'json'이면 dashboards.json 변경 없이 메트릭 번들만 생성)
+
+    Args:
+        months: (year, month) tuples / (연도, 월) 목록
+        languages: Languages to render / 렌더링할 언어 목록
+        output_dir: Output directory / 출력 디렉토리
+        collectors: Caching collectors keyed by year, reused across calls
+                    호출 간 재사용되는 연도별 캐싱 수집기
+        workers: Worker processes (1 = in-process with the given collectors)
+                 워커 프로세스 수 (1 = 전달된 수집기로 현재 프로세스에서 실행)
+        logger: Application logger / 애플리케이션 로거
+        output_format: 'html' or 'json' / 출력 형식
+
+    Returns:
+        tuple: ({(year, month): stats}, {(year, month): error}) / (성공 통계, 실패 오류)
+    """
+    results = {}
+    failures = {}
+
+    if workers > 1 and len(months) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _build_month_in_worker, year, month, languages, str(output_dir), output_format
+                ): (year, month)
+                for year, month in months
+            }
+            for future in as_completed(futures):
+                year, month = futures[future]
+                try:
+                    _, _, stats, _ = future.result()
+                    results[(year, month)] = stats
+                except Exception as e:
+                    failures[(year, month)] = str(e)
+    else:
+        for year, month in months:
+            print(f"🔨 Building {year}-{month:02d}...")
+            try:
+                stats, _ = build_month_dashboard(
+                    year, month, languages, output_dir, project_root,
+                    collector=get_shared_collector(year, collectors),
+                    output_format=output_format
+                )
+                results[(year, month)] = stats
+            except Exception as e:
+                failures[(year, month)] = str(e)
+
+    for (year, month), error in sorted(failures.items()):
+        logger.log_error_with_traceback(
+            f"대시보드 생성 실패 ({year}-{month:02d}): {error}",
+            f"Dashboard generation failed ({year}-{month:02d}): {error}"
+        )
+
+    # Update dashboards.json once for all successful months
+    # 성공한 모든 월에 대해 dashboards.json을 한 번만 업데이트
+    if results and output_format == 'html':
+        update_dashboards_json_entries(
+            [(year, month, stats) for (year, month), stats in sorted(results.items())],
+            project_root
+        )
+
+    return results, failures
+
+
+def print_batch_summary(results: dict, failures: dict) -> None:
+    """
+    Print regenerated and failed dashboards
+    재생성 및 실패한 대시보드 출력
+
+    Args:
+        results: {(year, month): stats} / 성공 통계
+        failures: {(year, month): error} / 실패 오류
+    """
+    print()
+    print("=" * 70)
+    print(f"✅ Regenerated / 재생성 완료: {len(results)} / {len(results) + len(failures)}")
+    for year, month in sorted(results):
+        print(f"   • {year}-{month:02d}")
+    if failures:
+        print(f"❌ Failed / 실패: {len(failures)}")
+        for (year, month), error in sorted(failures.items()):
+            print(f"   • {year}-{month:02d}: {error}")
+    print("=" * 70)
+
+
+def get_affected_targets(changed_files: set, targets: list, collectors: dict) -> list:
+    """
+    Invalidate caches for changed input files and list dashboards to rebuild
+    변경된 입력 파일의 캐시를 무효화하고 재빌드할 대시보드 목록 반환
+
+    A dashboard's trend window covers every available month up to its target,
+    so a change in month M affects every target >= M. Files that cannot be
+    mapped to a month (e.g. sync_manifest.json) invalidate everything.
+    대시보드 트렌드 범위는 대상 월까지의 모든 월이므로 M월 변경은 M 이후의 모든
+    대상에 영향을 줍니다. 월을 알 수 없는 파일(예: sync_manifest.json)은 전체 무효화합니다.
+
+    Args:
+        changed_files: Changed input file paths / 변경된 입력 파일 경로
+        targets: Watched (year, month) dashboards / 감시 중인 (연도, 월) 대시보드
+        collectors: Caching collectors keyed by year / 연도별 캐싱 수집기
+
+    Returns:
+        list: (year, month) dashboards to rebuild / 재빌드할 (연도, 월) 목록
+    """
+    changed_months = set()
+    invalidate_all = False
+
+    for file_path in changed_files:
+        months = {
+            collector.find_month_for_file(file_path)
+            for collector in collectors.values()
+        } or {MonthlyDataCollector(project_root).find_month_for_file(file_path)}
+        months.discard(None)
+        if months:
+            changed_months |= months
+        else:
+            invalidate_all = True
+
+    for collector in collectors.values():
+        # Re-scan so newly added or removed months are picked up
+        # 추가/삭제된 월을 반영하기 위해 재탐지
+        collector.detect_available_months()
+        if invalidate_all:
+            collector.invalidate_cache()
+        for year_month in changed_months:
+            collector.invalidate_cache(year_month)
+
+    if invalidate_all:
+        HRMetricCalculator.clear_cache()
+        return list(targets)
+
+    for year_month in changed_months:
+        HRMetricCalculator.invalidate_month(year_month)
+
+    if not changed_months:
+        return []
+
+    earliest = min(changed_months)
+    return [(year, month) for year, month in targets if f"{year}-{month:02d}" >= earliest]
+
+
+def run_watch_mode(targets: list, languages: list, args, logger) -> int:
+    """
+    Build dashboards, then rebuild only affected ones when input files change
+    대시보드를 빌드한 후 입력 파일 변경 시 영향받는 대시보드만 재빌드
+
+    Month data and metrics stay cached in this process between rebuilds,
+    so only months whose files changed are reloaded.
+    재빌드 사이에도 월 데이터와 메트릭이 프로세스 내 캐시에 유지되어
+    파일이 변경된 월만 다시 로드됩니다.
+
+    Args:
+        targets: (year, month) dashboards to keep up to date / 최신 상태로 유지할 (연도, 월) 목록
+        languages: Languages to render / 렌더링할 언어 목록
+        args: Parsed command line arguments / 파싱된 명령줄 인수
+        logger: Application logger / 애플리케이션 로거
+
+    Returns:
+        int: Exit code / 종료 코드
+    """
+    output_dir = get_output_dir(args)
+    collectors = {}
+
+    print("=" * 70)
+    print("HR Dashboard Generator - Watch Mode")
+    print("HR 대시보드 생성기 - 감시 모드")
+    print("=" * 70)
+    print(f"Dashboards / 대시보드: {', '.join(f'{y}-{m:02d}' for y, m in targets)}")
+    print(f"Language / 언어: {', '.join(lang.upper() for lang in languages)}")
+    print("=" * 70)
+    print()
+
+    results, failures = build_month_dashboards(
+        targets, languages, output_dir, collectors, 1, logger, output_format=args.output_format
+    )
+    print_batch_summary(results, failures)
+
+    watcher = InputFileWatcher(
+        project_root / "input_files",
+        poll_interval=args.watch_interval,
+        debounce_seconds=args.watch_debounce
+    )
+    print(f"👀 Watching / 감시 중: {watcher.input_dir} (Ctrl+C to stop / Ctrl+C로 종료)")
+
+    try:
+        while True:
+            changed_files = watcher.wait_for_changes()
+            print()
+            print(f"🔄 Input change detected / 입력 변경 감지: {len(changed_files)} file(s)")
+            for file_path in sorted(changed_files):
+                print(f"   • {file_path.name}")
+
+            affected = get_affected_targets(changed_files, targets, collectors)
+            if not affected:
+                print("⏭️  No watched dashboard affected / 영향받는 대시보드 없음")
+                continue
+
+            logger.info(
+                "입력 변경으로 대시보드 재빌드",
+                "Rebuilding dashboards after input change",
+                changed_files=len(changed_files),
+                dashboards=len(affected)
+            )
+            results, failures = build_month_dashboards(
+                affected, languages, output_dir, collectors, 1, logger, output_format=args.output_format
+            )
+            print_batch_summary(results, failures)
+            print(f"👀 Watching / 감시 중: {watcher.input_dir}")
+    except KeyboardInterrupt:
+        print()
+        print("👋 Watch mode stopped / 감시 모드 종료")
+
+    return 0
+
+
+def run_api_server(args) -> int:
+    """
+    Run the local JSON metrics API until interrupted
+    중단될 때까지 로컬 JSON 메트릭 API 실행
+
+    Args:
+        args: Parsed command line arguments / 파싱된 명령줄 인수
+
+    Returns:
+        int: Exit code / 종료 코드
+    """
+    server = create_server(project_root, host=args.host, port=args.port,
+                           language=args.language, year=args.year,
+                           allowed_origins=args.allow_origin or ())
+
+    print("=" * 70)
+    print("HR Dashboard Metrics API")
+    print("HR 대시보드 메트릭 API")
+    print("=" * 70)
+    print(f"🌐 http://{args.host}:{args.port}/api/months")
+    print(f"   /api/metrics/{{YYYY-MM}}")
+    print(f"   /api/teams/{{YYYY-MM}}")
+    print(f"   /api/employees/{{YYYY-MM}}?team=&flag=")
+    print(f"   /api/attendance/{{YYYY-MM}}/{{employee_no}}")
+    print("Ctrl+C to stop / Ctrl+C로 종료")
+    print("=" * 70)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print()
+        print("👋 API server stopped / API 서버 종료")
+    finally:
+        server.server_close()
+
+    return 0
+
 
 def generate_partial_dashboard(
     target_month: str,
@@ -333,6 +1045,11 @@ def validate_inputs(args, project_root: Path) -> bool:
     Returns:
         bool: True if all inputs are valid / 모든 입력이 유효하면 True
     """
+    if args.workers < 1:
+        print(f"❌ Invalid --workers: {args.workers} (must be >= 1)")
+        print(f"❌ 잘못된 --workers: {args.workers} (1 이상이어야 함)")
+        return False
+
     # Validate year range (reasonable range: 2020-2050)
     # 연도 범위 검증 (합리적인 범위: 2020-2050)
     if not (2020 <= args.year <= 2050):
@@ -390,6 +1107,24 @@ Examples / 예시:
   # Generate dashboard for October 2025 in English
   python src/generate_dashboard.py --month 10 --year 2025 --language en
 
+  # Generate Korean, English and Vietnamese dashboards from one data load
+  python src/generate_dashboard.py --month 10 --year 2025 --languages ko,en,vi
+
+  # Regenerate every dashboard listed in docs/dashboards.json
+  python src/generate_dashboard.py --all --workers 4
+
+  # Regenerate a range of months in one run
+  python src/generate_dashboard.py --months 2025-07..2025-12
+
+  # Rebuild affected dashboards whenever files in input_files/ change
+  python src/generate_dashboard.py --month 10 --year 2025 --watch
+
+  # Serve /api/months, /api/metrics/2025-10, ... from a warm in-memory cache
+  python src/generate_dashboard.py serve --year 2025 --port 8765
+
+  # Metrics only (no HTML) for BI and verification scripts
+  python src/generate_dashboard.py --month 10 --year 2025 --output-format json
+
   # Generate dashboard for current month
   python src/generate_dashboard.py
         """
@@ -399,6 +1134,15 @@ Examples / 예시:
     # 현재 월/년도를 기본값으로 가져오기
     now = datetime.now()
 
+    parser.add_argument(
+        'command',
+        nargs='?',
+        choices=['serve'],
+        default=None,
+        help='Optional command: "serve" starts the local JSON metrics API '
+             '/ 선택 명령: "serve"는 로컬 JSON 메트릭 API를 시작'
+    )
+
     parser.add_argument(
         '--month', '-m',
         type=int,
@@ -418,10 +1162,107 @@ Examples / 예시:
         '--language', '-l',
         type=str,
         default='ko',
-        choices=['ko', 'en', 'vi'],
+        choices=SUPPORTED_LANGUAGES,
         help='Dashboard language (ko/en/vi) / 대시보드 언어 (ko/en/vi)'
     )
 
+    parser.add_argument(
+        '--languages',
+        type=parse_languages,
+        default=None,
+        help='Comma-separated languages rendered from one data load, e.g. ko,en,vi. '
+             'The first is written under the standard file name, the others get a _<lang> suffix '
+             '/ 한 번의 데이터 로드로 렌더링할 언어 목록 (예: ko,en,vi). 첫 언어는 기본 파일명, '
+             '나머지는 _<lang> 접미사 사용'
+    )
+
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='Regenerate every dashboard listed in docs/dashboards.json in one run '
+             '/ docs/dashboards.json에 등록된 모든 대시보드를 한 번에 재생성'
+    )
+
+    parser.add_argument(
+        '--months',
+        type=parse_month_range,
+        default=None,
+        help='Regenerate a month range or list in one run, e.g. 2025-07..2025-12 '
+             '/ 월 범위 또는 목록을 한 번에 재생성 (예: 2025-07..2025-12)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker processes for --all/--months (default: 1, sequential with full data reuse) '
+             '/ --all/--months용 워커 프로세스 수 (기본값: 1)'
+    )
+
+    parser.add_argument(
+        '--output-format',
+        type=str,
+        default='html',
+        choices=['html', 'json'],
+        help='html: full dashboard (default); json: headless metrics bundle HR_Metrics_YYYY_MM.json '
+             'without HTML rendering or dashboards.json updates '
+             '/ html: 전체 대시보드 (기본값), json: HTML 렌더링 없이 메트릭 번들만 생성'
+    )
+
+    parser.add_argument(
+        '--warm-cache',
+        action='store_true',
+        help='Only ingest input files and persist metrics for the month (no output files); '
+             'run by sync_monthly_data.py --warm '
+             '/ 출력 없이 입력 파일 적재 및 메트릭 저장만 수행 (sync_monthly_data.py --warm에서 실행)'
+    )
+
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and rebuild affected dashboards when input_files/ change '
+             '/ input_files/ 변경 시 영향받는 대시보드를 자동 재빌드'
+    )
+
+    parser.add_argument(
+        '--watch-interval',
+        type=float,
+        default=1.0,
+        help='Seconds between input file polls in --watch mode (default: 1.0) '
+             '/ --watch 모드의 파일 폴링 간격 (초)'
+    )
+
+    parser.add_argument(
+        '--watch-debounce',
+        type=float,
+        default=2.0,
+        help='Quiet seconds to wait after the last change before rebuilding (default: 2.0) '
+             '/ 마지막 변경 후 재빌드 전 대기 시간 (초)'
+    )
+
+    parser.add_argument(
+        '--host',
+        type=str,
+        default='127.0.0.1',
+        help='Bind address for "serve" (default: 127.0.0.1) / "serve" 바인드 주소'
+    )
+
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8765,
+        help='Port for "serve" (default: 8765) / "serve" 포트'
+    )
+
+    parser.add_argument(
+        '--allow-origin',
+        action='append',
+        metavar='ORIGIN',
+        help='Origin allowed to call "serve" from a browser, e.g. http://localhost:8000 '
+             '(repeatable; default: same-origin only) '
+             '/ 브라우저에서 "serve" 호출을 허용할 출처 (반복 가능, 기본값: 동일 출처만)'
+    )
+
     parser.add_argument(
         '--sync',
         action='store_true',
@@ -484,6 +1325,33 @@ def main():
     if not validate_inputs(args, project_root):
         return 1
 
+    # --languages overrides --language; the first entry is the primary variant
+    # --languages가 --language보다 우선하며 첫 번째 언어가 기본 변형
+    languages = args.languages or [args.language]
+    args.language = languages[0]
+
+    if args.command == 'serve':
+        return run_api_server(args)
+
+    if args.warm_cache:
+        return warm_month_cache(args.year, args.month)
+
+    # Batch regeneration of several months
+    # 여러 월 일괄 재생성
+    if args.all or args.months:
+        months = set(args.months or [])
+        if args.all:
+            months.update(get_published_months(project_root))
+        if not months:
+            print("❌ No months to regenerate / 재생성할 월이 없습니다")
+            return 1
+        if args.watch:
+            return run_watch_mode(sorted(months), languages, args, logger)
+        return run_batch_regeneration(sorted(months), languages, args, logger)
+
+    if args.watch:
+        return run_watch_mode([(args.year, args.month)], languages, args, logger)
+
     logger.info(
         f"대시보드 생성 시작",
         f"Dashboard generation started",
@@ -526,7 +1394,7 @@ def main():
     print("HR 대시보드 생성기 - 완전판")
     print("=" * 70)
     print(f"Target Month / 대상 월: {target_month}")
-    print(f"Language / 언어: {args.language.upper()}")
+    print(f"Language / 언어: {', '.join(lang.upper() for lang in languages)}")
     print("=" * 70)
     print()
 
@@ -552,9 +1420,7 @@ def main():
     try:
         # Calculate report_date as end of target month
         # target month의 마지막 날을 report_date로 계산
-        import pandas as pd
-        month_start = pd.Timestamp(f"{args.year}-{args.month:02d}-01")
-        report_date = month_start + pd.DateOffset(months=1) - pd.DateOffset(days=1)
+        report_date = get_report_date(args.year, args.month)
 
         print(f"📅 Report Date (month end): {report_date.strftime('%Y-%m-%d')}")
         print()
@@ -570,64 +1436,51 @@ def main():
             report_date=report_date
         )
 
-        # Build dashboard HTML
-        # 대시보드 HTML 빌드
+        output_dir = get_output_dir(args)
+
+        # Headless mode: metrics bundle only, no HTML/JS rendering
+        # 헤드리스 모드: HTML/JS 렌더링 없이 메트릭 번들만 생성
+        if args.output_format == 'json':
+            print("🔨 Computing metrics (headless)...")
+            print("🔨 메트릭 계산 중 (헤드리스)...")
+            builder.prepare(metrics_only=True)
+            bundle_file = write_metrics_bundle(builder, args.year, args.month, output_dir)
+            logger.info(
+                "메트릭 번들 생성 완료",
+                "Metrics bundle generation completed",
+                output_file=str(bundle_file)
+            )
+            logger.log_file_operation("write", str(bundle_file), success=True)
+            print()
+            print("=" * 70)
+            print("✅ Metrics bundle generated successfully!")
+            print("✅ 메트릭 번들이 성공적으로 생성되었습니다!")
+            print(f"📁 Output file / 출력 파일: {bundle_file}")
+            print("=" * 70)
+            return 0
+
+        # Load data and compute metrics once for all languages
+        # 모든 언어에 대해 데이터 로드 및 메트릭 계산을 한 번만 수행
         print("🔨 Building dashboard HTML...")
         print("🔨 대시보드 HTML 빌드 중...")
 
-        html_content = builder.build()
-
-        # Save to output file
-        # 출력 파일에 저장
-        if args.output_dir:
-            output_dir = Path(args.output_dir)
-        else:
-            output_dir = Path(__file__).parent.parent / "output_files"
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        output_file = output_dir / f"HR_Dashboard_Complete_{args.year}_{args.month:02d}.html"
+        builder.prepare()
 
-        # Backup existing dashboard before overwriting
-        # 덮어쓰기 전 기존 대시보드 백업
-        backup_existing_dashboard(output_file)
-
-        print(f"💾 Saving dashboard to: {output_file}")
-        print(f"💾 대시보드 저장 중: {output_file}")
+        written_files = write_dashboard_files(
+            builder, args.year, args.month, languages, output_dir, project_root
+        )
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # The primary language file is the one registered in dashboards.json
+        # dashboards.json에는 기본 언어 파일이 등록됨
+        output_file, docs_file = written_files[0]
 
         # Get file size
         # 파일 크기 가져오기
         file_size_kb = output_file.stat().st_size / 1024
 
-        # Copy to docs folder for GitHub Pages
-        # GitHub Pages용 docs 폴더에 복사
-        docs_dir = project_root / "docs"
-        docs_dir.mkdir(parents=True, exist_ok=True)
-        docs_file = docs_dir / output_file.name
-        shutil.copy(output_file, docs_file)
-        print(f"📂 Copied to docs/: {docs_file}")
-        print(f"📂 docs/에 복사됨: {docs_file}")
-
         # Extract stats from builder for dashboards.json
         # dashboards.json용 통계 추출
-        target_month_key = f"{args.year}-{args.month:02d}"
-        stats = {
-            "total": "-",
-            "absenceRate": "-",
-            "resignationRate": "-"
-        }
-
-        if hasattr(builder, 'monthly_metrics') and target_month_key in builder.monthly_metrics:
-            metrics = builder.monthly_metrics[target_month_key]
-            stats["total"] = str(metrics.get('total_employees', '-'))
-            absence_rate = metrics.get('absence_rate')
-            if absence_rate is not None:
-                stats["absenceRate"] = f"{absence_rate}%"
-            resignation_rate = metrics.get('resignation_rate')
-            if resignation_rate is not None:
-                stats["resignationRate"] = f"{resignation_rate}%"
+        stats = extract_dashboard_stats(builder, args.year, args.month)
 
         # Update dashboards.json
         # dashboards.json 업데이트
@@ -655,6 +1508,8 @@ def main():
         generation_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         print(f"📁 Output file / 출력 파일: {output_file}")
         print(f"📂 Docs file / Docs 파일: {docs_file}")
+        for extra_output, _ in written_files[1:]:
+            print(f"📁 Language variant / 언어 변형: {extra_output}")
         print(f"📏 File size / 파일 크기: {file_size_kb:.1f} KB")
         print(f"🕐 Generated / 생성 시간: {generation_time}")
         print()
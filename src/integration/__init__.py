@@ -4,7 +4,11 @@ integration package - External service integrations
 """
 
 from .google_drive_sync import GoogleDriveSync
+from .drive_sync_engine import ConcurrentDriveSync, DriveSyncTask, DriveSyncOutcome
 
 __all__ = [
-    'GoogleDriveSync'
+    'GoogleDriveSync',
+    'ConcurrentDriveSync',
+    'DriveSyncTask',
+    'DriveSyncOutcome'
 ]
@@ -0,0 +1,148 @@
+"""
+drive_download.py - Streaming, atomic Google Drive downloads
+스트리밍 방식의 원자적 Google Drive 다운로드
+
+Downloads are written chunk by chunk to "<destination>.part" in the destination
+directory, fsynced, checked against Drive's md5Checksum and then renamed over the
+destination with os.replace. A crash or network error therefore never leaves a
+half-written CSV in input_files/, and peak memory is one chunk instead of two
+copies of the whole file. A leftover .part file is resumed with a ranged request
+on the next attempt.
+다운로드는 대상 디렉토리의 "<대상>.part"에 청크 단위로 기록되고, fsync 후 Drive의
+md5Checksum과 비교한 다음 os.replace로 대상 파일을 교체합니다. 따라서 중단이나
+네트워크 오류가 발생해도 input_files/에 절반만 쓰인 CSV가 남지 않으며, 최대 메모리는
+파일 전체 두 벌이 아닌 청크 하나입니다. 남아 있는 .part 파일은 다음 시도에서
+Range 요청으로 이어받습니다.
+"""
+
+import hashlib
+import io
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# 8 MB chunks (multiple of 256 KB as required by the Drive media API)
+# 8MB 청크 (Drive 미디어 API 요구사항인 256KB의 배수)
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class DownloadIntegrityError(Exception):
+    """Downloaded content does not match Drive's md5Checksum / 다운로드 내용이 md5Checksum과 불일치"""
+
+
+class _HashingWriter:
+    """
+    File wrapper that updates an md5 digest on every write
+    쓰기마다 md5 다이제스트를 갱신하는 파일 래퍼
+    """
+
+    def __init__(self, fh, digest):
+        self.fh = fh
+        self.digest = digest
+
+    def write(self, data) -> int:
+        self.digest.update(data)
+        return self.fh.write(data)
+
+
+def google_media_download(
+    request: Any,
+    fh: io.IOBase,
+    start: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_progress: Optional[Callable[[float], None]] = None
+):
+    """
+    Stream a files().get_media request into a file object with MediaIoBaseDownload
+    MediaIoBaseDownload로 files().get_media 요청을 파일 객체에 스트리밍
+
+    Args:
+        request: files().get_media request / get_media 요청
+        fh: Writable file object / 쓰기 가능한 파일 객체
+        start: Byte offset to resume from / 이어받을 바이트 위치
+        chunk_size: Bytes per ranged request / Range 요청당 바이트 수
+        on_progress: Called with progress 0..1 after each chunk / 청크마다 진행률(0..1) 콜백
+    """
+    from googleapiclient.http import MediaIoBaseDownload
+
+    downloader = MediaIoBaseDownload(fh, request, chunksize=chunk_size)
+    # MediaIoBaseDownload requests "bytes=<_progress>-..." and has no public offset argument
+    # MediaIoBaseDownload는 "bytes=<_progress>-..."로 요청하며 공개된 시작 위치 인자가 없음
+    downloader._progress = start
+
+    done = False
+    while not done:
+        status, done = downloader.next_chunk()
+        if status and on_progress:
+            on_progress(status.progress())
+
+
+def download_atomic(
+    request: Any,
+    destination: str,
+    expected_md5: Optional[str] = None,
+    expected_size: Optional[int] = None,
+    media_download: Callable[..., None] = google_media_download,
+    resume: bool = True,
+    on_progress: Optional[Callable[[float], None]] = None
+) -> int:
+    """
+    Stream a Drive file to destination via a verified, fsynced temp file
+    검증 및 fsync된 임시 파일을 거쳐 Drive 파일을 대상 경로로 스트리밍
+
+    Args:
+        request: files().get_media request / get_media 요청
+        destination: Local destination path / 로컬 대상 경로
+        expected_md5: Drive md5Checksum (None for Google-native files) / Drive md5Checksum
+        expected_size: Drive size in bytes, enables resuming / Drive 파일 크기 (이어받기에 사용)
+        media_download: Writes the request into (fh, start=..) / 요청을 fh에 기록하는 함수
+        resume: Continue an existing .part file / 기존 .part 파일 이어받기
+        on_progress: Progress callback (0..1) / 진행률 콜백
+
+    Returns:
+        int: Size of the downloaded file in bytes / 다운로드한 파일 크기
+
+    Raises:
+        DownloadIntegrityError: md5 or size mismatch (the .part file is removed)
+                                md5 또는 크기 불일치 (.part 파일 삭제)
+    """
+    dest_path = Path(destination)
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = dest_path.with_name(dest_path.name + '.part')
+
+    digest = hashlib.md5()
+    start = 0
+    if resume and expected_size and part_path.exists() and part_path.stat().st_size <= expected_size:
+        # Re-hash what is already on disk so the final md5 covers the whole file
+        # 최종 md5가 전체 파일을 포함하도록 이미 받은 부분을 다시 해시
+        with open(part_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        start = part_path.stat().st_size
+    elif part_path.exists():
+        part_path.unlink()
+
+    with open(part_path, 'ab' if start else 'wb') as f:
+        if not (start and start == expected_size):
+            media_download(request, _HashingWriter(f, digest), start=start, on_progress=on_progress)
+        f.flush()
+        os.fsync(f.fileno())
+
+    size = part_path.stat().st_size
+    mismatch = None
+    if expected_size is not None and size != expected_size:
+        mismatch = f"size {size} != {expected_size}"
+    elif expected_md5 and digest.hexdigest() != expected_md5.lower():
+        mismatch = f"md5 {digest.hexdigest()} != {expected_md5}"
+
+    if mismatch:
+        part_path.unlink()
+        if start:
+            # The resumed prefix may belong to an older revision; start over once
+            # 이어받은 앞부분이 이전 리비전일 수 있으므로 처음부터 한 번 다시 받음
+            return download_atomic(request, destination, expected_md5, expected_size,
+                                   media_download, resume=False, on_progress=on_progress)
+        raise DownloadIntegrityError(f"{dest_path.name}: {mismatch}")
+
+    os.replace(part_path, dest_path)
+    return size
@@ -0,0 +1,487 @@
+"""
+drive_sync_engine.py - Concurrent Google Drive file sync
+Google Drive 파일 동시 동기화 엔진
+
+Resolves Drive paths and downloads files on a bounded thread pool. Folder lookups
+are shared between workers (each folder is listed once per run), transient API
+errors (429/5xx, connection resets) are retried with exponential backoff, and
+the cache metadata written by GoogleDriveManager is reused so unchanged files are
+not downloaded again.
+
+Resolved folder and file IDs are persisted in <cache_dir>/path_index.json together
+with a Drive changes start page token. Later syncs read the changes feed first and
+only re-resolve paths whose files changed, so a periodic sync with no changes costs
+a single changes().list request, and files are downloaded only when their md5 differs.
+제한된 스레드 풀에서 Drive 경로 탐색과 다운로드를 병렬로 수행합니다. 폴더 조회는
+워커 간에 공유되고(실행당 폴더별 1회), 일시적 API 오류(429/5xx, 연결 끊김)는
+지수 백오프로 재시도하며, GoogleDriveManager의 캐시 메타데이터를 재사용하여
+변경되지 않은 파일은 다시 받지 않습니다.
+
+탐색한 폴더/파일 ID는 Drive 변경 내역 시작 페이지 토큰과 함께
+<cache_dir>/path_index.json에 저장됩니다. 이후 동기화는 변경 내역을 먼저 읽고 변경된
+파일의 경로만 다시 탐색하므로, 변경이 없는 주기적 동기화는 changes().list 요청 1회만
+사용하며 md5가 다른 파일만 다운로드합니다.
+
+The engine only needs a Drive v3 style service object, so it can run against a
+local stand-in in tests; googleapiclient is imported lazily for real downloads.
+Drive v3 형식의 서비스 객체만 있으면 되므로 테스트에서는 로컬 대체 서비스로 실행할 수
+있으며, googleapiclient는 실제 다운로드 시에만 import합니다.
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .drive_download import download_atomic, google_media_download
+
+logger = logging.getLogger(__name__)
+
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
+PATH_INDEX_FILE = 'path_index.json'
+
+# Metadata kept per resolved file / 탐색한 파일별로 보관하는 메타데이터
+FILE_FIELDS = ('id', 'name', 'modifiedTime', 'size', 'md5Checksum')
+
+CHANGE_FIELDS = ('nextPageToken, newStartPageToken, '
+                 'changes(fileId, removed, file(id, name, parents, trashed, modifiedTime, size, md5Checksum))')
+
+# HTTP statuses worth retrying / 재시도할 HTTP 상태 코드
+TRANSIENT_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class DriveSyncTask:
+    """One Drive file to sync / 동기화할 Drive 파일 하나"""
+    drive_path: str
+    local_path: str
+    label: str = ""
+
+
+@dataclass
+class DriveSyncOutcome:
+    """Result of one task / 작업 하나의 결과"""
+    task: DriveSyncTask
+    status: str  # 'downloaded', 'cached', 'missing' or 'failed'
+    attempts: int = 0
+    seconds: float = 0.0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Downloaded or already current / 다운로드됨 또는 이미 최신"""
+        return self.status in ('downloaded', 'cached')
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Whether an API error is worth retrying
+    API 오류가 재시도할 가치가 있는지 여부
+
+    Args:
+        error: Raised exception (HttpError exposes resp.status) / 발생한 예외
+
+    Returns:
+        bool: True for rate limits, server errors and dropped connections
+    """
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    if status is not None:
+        return int(status) in TRANSIENT_STATUSES
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+class ConcurrentDriveSync:
+    """
+    Sync many Drive files in parallel with retries
+    여러 Drive 파일을 재시도와 함께 병렬 동기화
+    """
+
+    def __init__(
+        self,
+        service_factory: Callable[[], Any],
+        root_folder_id: str,
+        cache_dir: Optional[Path] = None,
+        cache_duration_hours: float = 24,
+        max_workers: int = 4,
+        retry_attempts: int = 3,
+        backoff_seconds: float = 1.0,
+        media_download: Callable[..., None] = google_media_download
+    ):
+        """
+        Args:
+            service_factory: Returns a Drive service; called once per worker thread because
+                             googleapiclient services are not thread-safe
+                             Drive 서비스 생성 함수 (googleapiclient 서비스는 스레드 안전하지 않아 워커 스레드마다 호출)
+            root_folder_id: Folder that drive paths are relative to / Drive 경로의 기준 폴더
+            cache_dir: Directory of <file_id>.meta files and path_index.json (None disables caching)
+                       캐시 메타데이터와 path_index.json 디렉토리 (None이면 캐시 미사용)
+            cache_duration_hours: Maximum age of cache metadata / 캐시 메타데이터 최대 유효 시간
+            max_workers: Concurrent requests / 동시 요청 수
+            retry_attempts: Attempts per API call / API 호출당 시도 횟수
+            backoff_seconds: First retry delay, doubled each attempt / 첫 재시도 대기 (시도마다 2배)
+            media_download: Streams a get_media request into a file object (see drive_download)
+                            get_media 요청을 파일 객체에 스트리밍 (drive_download 참고)
+        """
+        self.service_factory = service_factory
+        self.root_folder_id = root_folder_id
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_duration = timedelta(hours=cache_duration_hours)
+        self.max_workers = max(1, max_workers)
+        self.retry_attempts = max(1, retry_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.media_download = media_download
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._folder_ids: Dict[tuple, Future] = {}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._start_page_token: Optional[str] = None
+        self._load_path_index()
+
+    def _index_path(self) -> Optional[Path]:
+        return self.cache_dir / PATH_INDEX_FILE if self.cache_dir else None
+
+    def _load_path_index(self):
+        """
+        Restore folder/file IDs and the changes token from path_index.json
+        path_index.json에서 폴더/파일 ID와 변경 내역 토큰 복원
+        """
+        index_path = self._index_path()
+        if index_path is None or not index_path.exists():
+            return
+
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable path index {index_path}: {e}")
+            return
+
+        if index.get('root_folder_id') != self.root_folder_id:
+            return
+
+        for parent_id, name, folder_id in index.get('folders', []):
+            future = Future()
+            future.set_result(folder_id)
+            self._folder_ids[(parent_id, name)] = future
+        self._files = index.get('files', {})
+        self._start_page_token = index.get('start_page_token')
+
+    def _save_path_index(self):
+        """
+        Persist resolved IDs and the changes token
+        탐색한 ID와 변경 내역 토큰 저장
+        """
+        index_path = self._index_path()
+        if index_path is None:
+            return
+
+        with self._lock:
+            folders = [
+                [parent_id, name, future.result()]
+                for (parent_id, name), future in self._folder_ids.items()
+                if future.done() and not future.exception() and future.result()
+            ]
+            index = {
+                'root_folder_id': self.root_folder_id,
+                'start_page_token': self._start_page_token,
+                'folders': folders,
+                'files': dict(self._files)
+            }
+
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_name(index_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, ensure_ascii=False)
+        tmp_path.replace(index_path)
+
+    def _forget_resolved_paths(self):
+        with self._lock:
+            self._folder_ids.clear()
+            self._files.clear()
+
+    def _apply_changes(self, attempts: List[int]):
+        """
+        Read the Drive changes feed since the stored token and drop stale index entries
+        저장된 토큰 이후의 Drive 변경 내역을 읽고 오래된 인덱스 항목 제거
+
+        Without a token (first run) a new one is fetched before any path is resolved,
+        so nothing that changes during this sync is missed.
+        토큰이 없으면(첫 실행) 경로 탐색 전에 새 토큰을 받아 이번 동기화 중의 변경도 놓치지 않습니다.
+        """
+        if not self._start_page_token:
+            self._forget_resolved_paths()
+            response = self._call(lambda service: service.changes().getStartPageToken().execute(), attempts)
+            self._start_page_token = response['startPageToken']
+            return
+
+        changes = {}
+        page_token = self._start_page_token
+        while page_token:
+            page = self._call(lambda service: service.changes().list(
+                pageToken=page_token, pageSize=1000, fields=CHANGE_FIELDS
+            ).execute(), attempts)
+            for change in page.get('changes', []):
+                changes[change['fileId']] = change
+            if page.get('newStartPageToken'):
+                self._start_page_token = page['newStartPageToken']
+            page_token = page.get('nextPageToken')
+
+        if not changes:
+            return
+
+        with self._lock:
+            folder_ids = {f.result() for f in self._folder_ids.values() if f.done() and not f.exception()}
+        if folder_ids & changes.keys():
+            # A folder was renamed, moved or deleted: resolve everything again
+            # 폴더 이름 변경/이동/삭제: 전체 다시 탐색
+            logger.info("Drive folder changed, re-resolving all paths")
+            self._forget_resolved_paths()
+            return
+
+        with self._lock:
+            for drive_path, meta in list(self._files.items()):
+                change = changes.get(meta['id'])
+                if change is None:
+                    continue
+                file = change.get('file') or {}
+                if (change.get('removed') or file.get('trashed')
+                        or file.get('name') != meta['name'] or meta.get('parent') not in file.get('parents', [])):
+                    del self._files[drive_path]
+                else:
+                    self._files[drive_path] = dict({k: file.get(k) for k in FILE_FIELDS}, parent=meta.get('parent'))
+
+    def _service(self) -> Any:
+        """Drive service of the current thread / 현재 스레드의 Drive 서비스"""
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = self._local.service = self.service_factory()
+        return service
+
+    def _call(self, make_request: Callable[[Any], Any], attempts: List[int]) -> Any:
+        """
+        Execute an API call, retrying transient errors with exponential backoff and jitter
+        API 호출 실행 (일시적 오류는 지수 백오프 + 지터로 재시도)
+        """
+        for attempt in range(self.retry_attempts):
+            attempts[0] += 1
+            try:
+                return make_request(self._service())
+            except Exception as e:
+                if attempt == self.retry_attempts - 1 or not is_transient_error(e):
+                    raise
+                delay = self.backoff_seconds * (2 ** attempt) + random.uniform(0, self.backoff_seconds)
+                logger.warning(f"Transient Drive error ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def _list(self, query: str, fields: str, attempts: List[int]) -> List[Dict[str, Any]]:
+        results = self._call(lambda service: service.files().list(q=query, fields=fields).execute(), attempts)
+        return results.get('files', [])
+
+    @staticmethod
+    def _quote(name: str) -> str:
+        return name.replace('\\', '\\\\').replace("'", "\\'")
+
+    def _resolve_folder(self, parent_id: str, name: str, attempts: List[int]) -> Optional[str]:
+        """
+        Folder ID of parent/name; concurrent lookups of the same folder share one request
+        parent/name 폴더 ID (같은 폴더의 동시 조회는 요청 하나를 공유)
+        """
+        key = (parent_id, name)
+        with self._lock:
+            future = self._folder_ids.get(key)
+            owner = future is None
+            if owner:
+                future = self._folder_ids[key] = Future()
+
+        if owner:
+            try:
+                query = f"name='{self._quote(name)}' and '{parent_id}' in parents and mimeType='{FOLDER_MIME_TYPE}'"
+                items = self._list(query, 'files(id, name)', attempts)
+                future.set_result(items[0]['id'] if items else None)
+            except Exception as e:
+                # Let a later task try again / 이후 작업이 다시 시도할 수 있도록 제거
+                with self._lock:
+                    self._folder_ids.pop(key, None)
+                future.set_exception(e)
+
+        return future.result()
+
+    def _find_file(self, drive_path: str, attempts: List[int]) -> Optional[Dict[str, Any]]:
+        """
+        Metadata (id, modifiedTime, size, md5Checksum) of the file at drive_path,
+        from the path index when it is still current
+        drive_path 파일의 메타데이터 (id, modifiedTime, size, md5Checksum), 유효하면 경로 인덱스에서 조회
+        """
+        with self._lock:
+            indexed = self._files.get(drive_path)
+        if indexed:
+            return indexed
+
+        *folders, file_name = drive_path.split('/')
+        parent_id = self.root_folder_id
+        for folder in folders:
+            parent_id = self._resolve_folder(parent_id, folder, attempts)
+            if not parent_id:
+                logger.warning(f"Folder not found: {folder}")
+                return None
+
+        query = f"name='{self._quote(file_name)}' and '{parent_id}' in parents"
+        items = self._list(query, f"files({', '.join(FILE_FIELDS)})", attempts)
+        if not items:
+            return None
+
+        file_meta = dict({k: items[0].get(k) for k in FILE_FIELDS}, parent=parent_id)
+        with self._lock:
+            self._files[drive_path] = file_meta
+        return file_meta
+
+    def _cache_file(self, file_id: str) -> Optional[Path]:
+        return self.cache_dir / f"{file_id}.meta" if self.cache_dir else None
+
+    def _is_cache_valid(self, file_meta: Dict[str, Any], local_path: str) -> bool:
+        """
+        Local copy is current: same md5 as Drive, or (without an md5) the rules of
+        GoogleDriveManager._is_cache_valid using the listed modifiedTime
+        로컬 사본이 최신인지 확인: Drive와 md5가 같거나, md5가 없으면 GoogleDriveManager._is_cache_valid 규칙 적용
+        """
+        cache_file = self._cache_file(file_meta['id'])
+        if cache_file is None or not cache_file.exists() or not Path(local_path).exists():
+            return False
+
+        try:
+            with open(cache_file, 'r') as f:
+                metadata = json.load(f)
+            if file_meta.get('md5Checksum') and metadata.get('md5_checksum'):
+                return file_meta['md5Checksum'] == metadata['md5_checksum']
+            if datetime.now() - datetime.fromisoformat(metadata['cached_at']) > self.cache_duration:
+                return False
+            drive_modified = datetime.fromisoformat(file_meta['modifiedTime'].replace('Z', '+00:00'))
+            return drive_modified <= datetime.fromisoformat(metadata['drive_modified'])
+        except Exception as e:
+            logger.debug(f"Cache validation error: {e}")
+            return False
+
+    def _update_cache_metadata(self, file_meta: Dict[str, Any], local_path: str):
+        cache_file = self._cache_file(file_meta['id'])
+        if cache_file is None:
+            return
+
+        metadata = {
+            'file_id': file_meta['id'],
+            'local_path': local_path,
+            'cached_at': datetime.now().isoformat(),
+            'drive_modified': file_meta['modifiedTime'].replace('Z', '+00:00'),
+            'file_name': file_meta['name'],
+            'file_size': file_meta.get('size', 0),
+            'md5_checksum': file_meta.get('md5Checksum')
+        }
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump(metadata, f)
+
+    def _download(self, file_meta: Dict[str, Any], destination: str, attempts: List[int]):
+        """
+        Stream to destination atomically; a retry resumes the .part file left by a failed attempt
+        대상 경로로 원자적 스트리밍 (재시도 시 실패한 시도의 .part 파일을 이어받음)
+        """
+        size = file_meta.get('size')
+        self._call(lambda service: download_atomic(
+            service.files().get_media(fileId=file_meta['id']),
+            destination,
+            expected_md5=file_meta.get('md5Checksum'),
+            expected_size=int(size) if size is not None else None,
+            media_download=self.media_download
+        ), attempts)
+
+    def sync_one(self, task: DriveSyncTask) -> DriveSyncOutcome:
+        """
+        Resolve, check the cache and download one file
+        파일 하나를 탐색, 캐시 확인, 다운로드
+
+        Args:
+            task: File to sync / 동기화할 파일
+
+        Returns:
+            DriveSyncOutcome (errors are captured, not raised) / 결과 (오류는 예외 대신 결과에 기록)
+        """
+        started = time.perf_counter()
+        attempts = [0]
+
+        def outcome(status: str, error: str = "") -> DriveSyncOutcome:
+            return DriveSyncOutcome(task, status, attempts[0], time.perf_counter() - started, error)
+
+        try:
+            file_meta = self._find_file(task.drive_path, attempts)
+            if not file_meta:
+                logger.warning(f"File not found in Drive: {task.drive_path}")
+                return outcome('missing')
+
+            if self._is_cache_valid(file_meta, task.local_path):
+                logger.info(f"Using cached version of {task.drive_path}")
+                return outcome('cached')
+
+            self._download(file_meta, task.local_path, attempts)
+            self._update_cache_metadata(file_meta, task.local_path)
+            logger.info(f"Successfully synced {task.drive_path} to {task.local_path}")
+            return outcome('downloaded')
+
+        except Exception as e:
+            # Resolve this path again next time / 다음 동기화에서 경로 다시 탐색
+            with self._lock:
+                self._files.pop(task.drive_path, None)
+            logger.error(f"Error syncing {task.drive_path}: {e}")
+            return outcome('failed', str(e))
+
+    def sync(self, tasks: List[DriveSyncTask]) -> List[DriveSyncOutcome]:
+        """
+        Sync tasks concurrently (duplicate drive paths are synced once)
+        작업을 동시에 동기화 (중복 Drive 경로는 한 번만 동기화)
+
+        Args:
+            tasks: Files to sync / 동기화할 파일 목록
+
+        Returns:
+            One outcome per unique drive path, in order of first appearance
+            고유 Drive 경로별 결과 하나 (처음 나온 순서)
+
+        Raises:
+            ValueError: If two drive paths would be written to the same local file
+                        서로 다른 Drive 경로가 같은 로컬 파일에 기록되는 경우
+        """
+        by_path: Dict[str, DriveSyncTask] = {}
+        destinations: Dict[Path, DriveSyncTask] = {}
+        for task in tasks:
+            if by_path.setdefault(task.drive_path, task) is not task:
+                continue
+            other = destinations.setdefault(Path(task.local_path), task)
+            if other is not task:
+                raise ValueError(
+                    f"{other.drive_path} and {task.drive_path} would both be written to {task.local_path}"
+                )
+        unique = list(by_path.values())
+        if not unique:
+            return []
+
+        if self.cache_dir:
+            try:
+                self._apply_changes([0])
+            except Exception as e:
+                # Expired token or changes API unavailable: fall back to full resolution
+                # 토큰 만료 또는 변경 내역 API 사용 불가: 전체 탐색으로 대체
+                logger.warning(f"Drive changes feed unavailable ({e}), resolving all paths")
+                self._start_page_token = None
+                self._forget_resolved_paths()
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique))) as executor:
+            outcomes = list(executor.map(self.sync_one, unique))
+
+        self._save_path_index()
+        return outcomes
@@ -4,6 +4,7 @@ This module handles automatic synchronization of data files from Google Drive
 """
 
 import os
+import sys
 import json
 import logging
 from datetime import datetime, timedelta
@@ -19,8 +20,20 @@ from google.oauth2.service_account import Credentials as ServiceAccountCredentia
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseDownload
-import io
+
+# Add project root to path when run as a script
+# 스크립트로 실행할 때 프로젝트 루트를 경로에 추가
+if __name__ == '__main__':
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from src.data.attendance_converter import AttendanceConverter
+    from src.integration.drive_download import DownloadIntegrityError, download_atomic
+    from src.integration.drive_sync_engine import ConcurrentDriveSync, DriveSyncTask
+    from src.utils.month_range import parse_month_range
+else:
+    from ..data.attendance_converter import AttendanceConverter
+    from .drive_download import DownloadIntegrityError, download_atomic
+    from .drive_sync_engine import ConcurrentDriveSync, DriveSyncTask
+    from ..utils.month_range import parse_month_range
 
 # Setup logging
 logging.basicConfig(
@@ -62,6 +75,7 @@ class GoogleDriveManager:
         self.config_path = config_path
         self.config = self._load_config()
         self.service = None
+        self.credentials = None
         self.cache_dir = Path(self.config['local_paths']['cache_dir'])
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
@@ -95,6 +109,7 @@ class GoogleDriveManager:
                 "auto_sync_enabled": True,
                 "sync_interval_minutes": 60,
                 "retry_attempts": 3,
+                "max_concurrent_downloads": 4,
                 "cache_duration_hours": 24
             },
             "local_paths": {
@@ -165,6 +180,7 @@ class GoogleDriveManager:
         credentials = ServiceAccountCredentials.from_service_account_file(
             key_file, scopes=SCOPES
         )
+        self.credentials = credentials
         
         return build('drive', 'v3', credentials=credentials)
     
@@ -203,6 +219,7 @@ class GoogleDriveManager:
             with open(token_file, 'wb') as token:
                 pickle.dump(creds, token)
         
+        self.credentials = creds
         return build('drive', 'v3', credentials=creds)
     
     def _test_connection(self):
@@ -225,93 +242,165 @@ class GoogleDriveManager:
         Returns:
             SyncResult object
         """
-        logger.info(f"Starting sync for {month} {year}")
+        return self.sync_months([(year, month)])
+    
+    @staticmethod
+    def _archived_months(months: List[Tuple[int, str]]) -> set:
+        """
+        (year, month name) pairs written under input_files/{year}/: every year of a month
+        name except the latest, which keeps the plain path the dashboard tools read
+        input_files/{year}/ 아래에 기록할 (연도, 월 이름) 쌍: 같은 월 이름의 최신 연도를 제외한 모든 연도
+        (최신 연도는 대시보드 도구가 읽는 기본 경로 유지)
+        """
+        latest = {}
+        for year, month in months:
+            latest[month] = max(year, latest.get(month, year))
+        return {(year, month) for year, month in months if year != latest[month]}
+    
+    @staticmethod
+    def _input_prefix(year: int, archived: bool) -> str:
+        return f"input_files/{year}" if archived else "input_files"
+    
+    def _monthly_sync_tasks(self, year: int, month: str, archived: bool = False) -> List[DriveSyncTask]:
+        """
+        Files needed for one month: monthly data, 3 months of AQL history and configs
+        한 달에 필요한 파일: 월별 데이터, 3개월 AQL 이력, 설정 파일
         
-        files_synced = 0
-        files_failed = 0
-        sync_details = {}
+        Args:
+            year: Year (e.g., 2025)
+            month: Month name (e.g., 'july')
+            archived: Write the monthly data under input_files/{year}/ (see _archived_months)
+                      월별 데이터를 input_files/{year}/ 아래에 기록
+        """
+        month_num = self._get_month_number(month)
+        if not month_num:
+            raise ValueError(f"Unknown month: {month}")
+        
+        # Current month data
+        current_month_folder = f"{year}_{month_num:02d}"
+        prefix = self._input_prefix(year, archived)
+        monthly_files = [
+            ('basic_manpower_data.csv', f'basic manpower data {month}.csv'),
+            ('attendance_data.csv', f'attendance/original/attendance data {month}.csv'),
+            ('5prs_data.csv', f'5prs data {month}.csv')
+        ]
+        tasks = [
+            DriveSyncTask(f"monthly_data/{current_month_folder}/{drive_name}", f"{prefix}/{local_name}", drive_name)
+            for drive_name, local_name in monthly_files
+        ]
         
-        try:
-            # Get month number
-            month_num = self._get_month_number(month)
-            
-            # Sync current month data
-            current_month_folder = f"{year}_{month_num:02d}"
-            monthly_files = [
-                ('basic_manpower_data.csv', f'basic manpower data {month}.csv'),
-                ('attendance_data.csv', f'attendance/original/attendance data {month}.csv'),
-                ('5prs_data.csv', f'5prs data {month}.csv')
-            ]
-            
-            for drive_name, local_name in monthly_files:
-                success = self._sync_file_from_path(
-                    f"monthly_data/{current_month_folder}/{drive_name}",
-                    f"input_files/{local_name}"
-                )
-                if success:
-                    files_synced += 1
-                    sync_details[drive_name] = "Success"
-                else:
-                    files_failed += 1
-                    sync_details[drive_name] = "Failed"
-            
-            # Sync AQL history for current and previous months
-            months_to_sync = self._get_months_for_aql(month_num, year)
-            for m_name, m_year in months_to_sync:
-                aql_file = f"AQL_REPORT_{m_name.upper()}_{m_year}.csv"
-                local_path = f"input_files/AQL history/1.HSRG AQL REPORT-{m_name.upper()}.{m_year}.csv"
-                
-                success = self._sync_file_from_path(
-                    f"aql_history/{aql_file}",
-                    local_path
-                )
-                if success:
-                    files_synced += 1
-                    sync_details[aql_file] = "Success"
-                else:
-                    files_failed += 1
-                    sync_details[aql_file] = "Failed"
-            
-            # Sync configuration files
-            config_files = [
-                ('auditor_trainer_area_mapping.json', 'auditor_trainer_area_mapping.json'),
-                ('type2_position_mapping.json', 'type2_position_mapping.json')
-            ]
-            
-            for drive_name, local_name in config_files:
-                success = self._sync_file_from_path(
-                    f"configs/{drive_name}",
-                    local_name
-                )
-                if success:
-                    files_synced += 1
-                    sync_details[drive_name] = "Success"
-                else:
-                    files_failed += 1
-                    sync_details[drive_name] = "Failed"
-            
-            # Generate sync result
-            success = files_failed == 0
-            result = SyncResult(
-                success=success,
-                files_synced=files_synced,
-                files_failed=files_failed,
-                error_message="" if success else f"{files_failed} files failed to sync",
-                details=sync_details
-            )
+        # AQL history for current and previous months
+        for m_name, m_year in self._get_months_for_aql(month_num, year):
+            aql_file = f"AQL_REPORT_{m_name.upper()}_{m_year}.csv"
+            local_path = f"input_files/AQL history/1.HSRG AQL REPORT-{m_name.upper()}.{m_year}.csv"
+            tasks.append(DriveSyncTask(f"aql_history/{aql_file}", local_path, aql_file))
+        
+        # Configuration files
+        for drive_name in ['auditor_trainer_area_mapping.json', 'type2_position_mapping.json']:
+            tasks.append(DriveSyncTask(f"configs/{drive_name}", drive_name, drive_name))
+        
+        return tasks
+    
+    def _thread_service(self) -> Any:
+        """
+        Drive service for a sync worker thread (googleapiclient services are not thread-safe)
+        동기화 워커 스레드용 Drive 서비스 (googleapiclient 서비스는 스레드 안전하지 않음)
+        """
+        if self.credentials is None:
+            return self.service
+        return build('drive', 'v3', credentials=self.credentials, cache_discovery=False)
+    
+    def create_sync_engine(self, max_workers: Optional[int] = None) -> ConcurrentDriveSync:
+        """
+        Concurrent sync engine configured from sync_settings
+        sync_settings 기반 동시 동기화 엔진 생성
+        
+        Args:
+            max_workers: Concurrent downloads (default: sync_settings.max_concurrent_downloads or 4)
             
-            logger.info(f"Sync completed: {files_synced} succeeded, {files_failed} failed")
-            return result
+        Returns:
+            ConcurrentDriveSync
+        """
+        settings = self.config['sync_settings']
+        return ConcurrentDriveSync(
+            service_factory=self._thread_service,
+            root_folder_id=self.config['google_drive']['root_folder_id'],
+            cache_dir=self.cache_dir,
+            cache_duration_hours=settings.get('cache_duration_hours', 24),
+            max_workers=max_workers or settings.get('max_concurrent_downloads', 4),
+            retry_attempts=settings.get('retry_attempts', 3)
+        )
+    
+    def sync_months(self, months: List[Tuple[int, str]], max_workers: Optional[int] = None) -> SyncResult:
+        """
+        Sync several months at once; all files are resolved and downloaded concurrently,
+        so the sync takes about as long as the slowest file
+        여러 달을 한 번에 동기화 (모든 파일을 동시에 탐색/다운로드하므로 가장 느린 파일 시간만큼 소요)
+        
+        Args:
+            months: (year, month name) tuples / (연도, 월 이름) 튜플 목록
+            max_workers: Concurrent downloads / 동시 다운로드 수
             
+        Returns:
+            SyncResult object (details keyed by file name for one month, by Drive path otherwise)
+        
+        The same month name in several years (ranges over 12 months) would share one local
+        file, so all but its latest year are written under input_files/{year}/.
+        같은 월 이름이 여러 연도에 걸치면 최신 연도를 제외하고 input_files/{year}/ 아래에 기록합니다.
+        """
+        labels = ', '.join(f"{month} {year}" for year, month in months)
+        logger.info(f"Starting sync for {labels}")
+        
+        try:
+            archived = self._archived_months(months)
+            tasks = [
+                task for year, month in months
+                for task in self._monthly_sync_tasks(year, month, (year, month) in archived)
+            ]
+            outcomes = self.create_sync_engine(max_workers).sync(tasks)
         except Exception as e:
             logger.error(f"Error during sync: {e}")
-            return SyncResult(
-                success=False,
-                files_synced=files_synced,
-                files_failed=files_failed,
-                error_message=str(e),
-                details=sync_details
-            )
+            return SyncResult(success=False, files_synced=0, files_failed=0, error_message=str(e), details={})
+        
+        sync_details = {}
+        for outcome in outcomes:
+            key = outcome.task.label if len(months) == 1 else outcome.task.drive_path
+            sync_details[key] = "Success" if outcome.ok else "Failed"
+        
+        self._convert_attendance(months, outcomes)
+        
+        files_synced = sum(1 for outcome in outcomes if outcome.ok)
+        files_failed = len(outcomes) - files_synced
+        slowest = max((outcome.seconds for outcome in outcomes), default=0.0)
+        
+        success = files_failed == 0
+        result = SyncResult(
+            success=success,
+            files_synced=files_synced,
+            files_failed=files_failed,
+            error_message="" if success else f"{files_failed} files failed to sync",
+            details=sync_details
+        )
+        
+        logger.info(f"Sync completed: {files_synced} succeeded, {files_failed} failed (slowest file {slowest:.1f}s)")
+        return result
+    
+    def _convert_attendance(self, months: List[Tuple[int, str]], outcomes: List[Any]) -> None:
+        """
+        Convert the synced original attendance exports (unchanged originals are skipped)
+        동기화된 원본 출근 데이터 변환 (변경되지 않은 원본은 건너뜀)
+        """
+        synced = {outcome.task.local_path for outcome in outcomes if outcome.ok}
+        converter = AttendanceConverter(Path(self.config['local_paths']['data_root']).parent)
+        archived = self._archived_months(months)
+        for year, month in months:
+            is_archived = (year, month) in archived
+            prefix = self._input_prefix(year, is_archived)
+            if f"{prefix}/attendance/original/attendance data {month}.csv" in synced:
+                try:
+                    converter.convert(month, year=year if is_archived else None)
+                except Exception as e:
+                    logger.error(f"Attendance conversion failed for {month} {year}: {e}")
     
     def _get_month_number(self, month: str) -> int:
         """Convert month name to number"""
@@ -437,28 +526,24 @@ class GoogleDriveManager:
             bool: True if download successful
         """
         try:
-            # Create destination directory if needed
-            Path(destination).parent.mkdir(parents=True, exist_ok=True)
-            
-            # Download file
-            request = self.service.files().get_media(fileId=file_id)
-            fh = io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
-            
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
-                if status:
-                    logger.debug(f"Download {int(status.progress() * 100)}%")
+            file_meta = self.service.files().get(
+                fileId=file_id,
+                fields='size,md5Checksum'
+            ).execute()
             
-            # Write to file
-            fh.seek(0)
-            with open(destination, 'wb') as f:
-                f.write(fh.read())
+            # Stream to <destination>.part, verify md5, then rename into place
+            size = file_meta.get('size')
+            download_atomic(
+                self.service.files().get_media(fileId=file_id),
+                destination,
+                expected_md5=file_meta.get('md5Checksum'),
+                expected_size=int(size) if size is not None else None,
+                on_progress=lambda progress: logger.debug(f"Download {int(progress * 100)}%")
+            )
             
             return True
             
-        except HttpError as e:
+        except (HttpError, DownloadIntegrityError, OSError) as e:
             logger.error(f"Error downloading file {file_id}: {e}")
             return False
     
@@ -528,23 +613,25 @@ class GoogleDriveManager:
         except Exception as e:
             logger.warning(f"Failed to update cache metadata: {e}")
     
-    def validate_synced_data(self, month: str) -> Dict[str, bool]:
+    def validate_synced_data(self, month: str, year: Optional[int] = None) -> Dict[str, bool]:
         """
         Validate that all required files are present and valid
         
         Args:
             month: Month name
+            year: Year folder the month was archived to (None: input_files/ itself)
             
         Returns:
             Dictionary of file validation results
         """
         validation_results = {}
+        prefix = self._input_prefix(year, year is not None)
         
         # Define required files (only critical data files)
         required_files = [
-            f'input_files/basic manpower data {month}.csv',
-            f'input_files/attendance/original/attendance data {month}.csv',
-            f'input_files/5prs data {month}.csv'
+            f'{prefix}/basic manpower data {month}.csv',
+            f'{prefix}/attendance/original/attendance data {month}.csv',
+            f'{prefix}/5prs data {month}.csv'
         ]
         
         # Optional config files (already exist locally in config_files folder)
@@ -680,8 +767,12 @@ if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description='Google Drive Sync Manager for QIP System')
-    parser.add_argument('--month', type=str, required=True, help='Month to sync (e.g., july)')
+    month_group = parser.add_mutually_exclusive_group(required=True)
+    month_group.add_argument('--month', type=str, help='Month to sync (e.g., july)')
+    month_group.add_argument('--months', type=parse_month_range,
+                             help='Month range or list to sync concurrently (e.g., 2025-07..2025-09)')
     parser.add_argument('--year', type=int, default=2025, help='Year (default: 2025)')
+    parser.add_argument('--workers', type=int, help='Concurrent downloads (default: config or 4)')
     parser.add_argument('--config', type=str, default='config_files/drive_config.json', 
                        help='Path to configuration file')
     parser.add_argument('--auth', type=str, choices=['service_account', 'oauth2'],
@@ -693,17 +784,30 @@ if __name__ == "__main__":
     # Initialize manager
     manager = GoogleDriveManager(args.config)
     
+    if args.months:
+        month_names = [
+            'january', 'february', 'march', 'april', 'may', 'june',
+            'july', 'august', 'september', 'october', 'november', 'december'
+        ]
+        months = [(year, month_names[month - 1]) for year, month in args.months]
+    else:
+        months = [(args.year, args.month.lower())]
+    
     # Connect to Google Drive
     if manager.initialize(args.auth, args.credentials):
         # Sync data
-        result = manager.sync_monthly_data(args.year, args.month)
+        result = manager.sync_months(months, max_workers=args.workers)
         
         if result.success:
             print(f"✅ Successfully synced {result.files_synced} files")
             print("\nValidating synced data...")
             
             # Validate data
-            validation = manager.validate_synced_data(args.month)
+            validation = {}
+            archived = manager._archived_months(months)
+            for year, month_name in months:
+                archive_year = year if (year, month_name) in archived else None
+                validation.update(manager.validate_synced_data(month_name, archive_year))
             
             all_valid = all(validation.values())
             if all_valid:
@@ -20,7 +20,6 @@ IMPORTANT / 중요:
 """
 
 import os
-import io
 import json
 import time
 import hashlib
@@ -36,12 +35,12 @@ try:
     from google_auth_oauthlib.flow import InstalledAppFlow
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
-    from googleapiclient.http import MediaIoBaseDownload
     GOOGLE_DRIVE_AVAILABLE = True
 except ImportError:
     GOOGLE_DRIVE_AVAILABLE = False
 
 from ..utils.logger import get_logger
+from .drive_download import DownloadIntegrityError, download_atomic
 
 # Google Drive API scope / Google Drive API 범위
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
@@ -290,7 +289,8 @@ class GoogleDriveSync:
         file_id: str,
         destination_path: str,
         overwrite: bool = False,
-        use_cache: bool = True
+        use_cache: bool = True,
+        file_metadata: Optional[FileMetadata] = None
     ) -> bool:
         """
         Download a file from Google Drive
@@ -301,6 +301,8 @@ class GoogleDriveSync:
             destination_path: Local destination path / 로컬 대상 경로
             overwrite: Whether to overwrite existing file / 기존 파일 덮어쓰기 여부
             use_cache: Whether to use cached metadata / 캐시된 메타데이터 사용 여부
+            file_metadata: Metadata from search_files; avoids a files().get per file
+                          search_files의 메타데이터 (파일별 files().get 생략)
 
         Returns:
             True if download successful / 다운로드 성공 시 True
@@ -322,7 +324,7 @@ class GoogleDriveSync:
         # Check if file already exists and is up-to-date
         # 파일이 이미 존재하고 최신인지 확인
         if dest_path.exists() and not overwrite and use_cache:
-            if self._is_file_up_to_date(file_id, dest_path):
+            if self._is_file_up_to_date(file_id, dest_path, file_metadata):
                 self.logger.info(
                     f"파일이 이미 최신 상태입니다",
                     f"File already up-to-date",
@@ -332,33 +334,39 @@ class GoogleDriveSync:
 
         try:
             # Get file metadata / 파일 메타데이터 가져오기
-            file_metadata = self.service.files().get(
-                fileId=file_id,
-                fields='id, name, mimeType, size, modifiedTime, md5Checksum'
-            ).execute()
-
-            # Create parent directory if needed / 필요한 경우 부모 디렉토리 생성
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Download file / 파일 다운로드
-            request = self.service.files().get_media(fileId=file_id)
-            file_stream = io.BytesIO()
-            downloader = MediaIoBaseDownload(file_stream, request)
-
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    self.logger.debug(
-                        f"다운로드 진행률: {progress}%",
-                        f"Download progress: {progress}%",
-                        file=file_metadata['name']
-                    )
+            if file_metadata is not None:
+                file_metadata = {
+                    'id': file_metadata.file_id,
+                    'name': file_metadata.name,
+                    'mimeType': file_metadata.mime_type,
+                    'size': file_metadata.size,
+                    'modifiedTime': file_metadata.modified_time,
+                    'md5Checksum': file_metadata.md5_checksum
+                }
+            else:
+                file_metadata = self.service.files().get(
+                    fileId=file_id,
+                    fields='id, name, mimeType, size, modifiedTime, md5Checksum'
+                ).execute()
+
+            # Stream to a verified temp file and rename it into place
+            # 검증된 임시 파일로 스트리밍한 후 대상 경로로 이름 변경
+            def log_progress(fraction: float):
+                progress = int(fraction * 100)
+                self.logger.debug(
+                    f"다운로드 진행률: {progress}%",
+                    f"Download progress: {progress}%",
+                    file=file_metadata['name']
+                )
 
-            # Write to file / 파일에 쓰기
-            with open(dest_path, 'wb') as f:
-                f.write(file_stream.getvalue())
+            size = file_metadata.get('size')
+            download_atomic(
+                self.service.files().get_media(fileId=file_id),
+                str(dest_path),
+                expected_md5=file_metadata.get('md5Checksum'),
+                expected_size=int(size) if size is not None else None,
+                on_progress=log_progress
+            )
 
             # Update metadata cache / 메타데이터 캐시 업데이트
             self.metadata_cache[str(dest_path)] = {
@@ -379,7 +387,7 @@ class GoogleDriveSync:
             )
             return True
 
-        except HttpError as e:
+        except (HttpError, DownloadIntegrityError, OSError) as e:
             self.logger.error(
                 f"파일 다운로드 실패",
                 f"Failed to download file",
@@ -388,14 +396,25 @@ class GoogleDriveSync:
             )
             return False
 
-    def _is_file_up_to_date(self, file_id: str, local_path: Path) -> bool:
+    def _is_file_up_to_date(
+        self,
+        file_id: str,
+        local_path: Path,
+        remote: Optional[FileMetadata] = None
+    ) -> bool:
         """
         Check if local file is up-to-date with Google Drive version
         로컬 파일이 Google Drive 버전과 최신 상태인지 확인
 
+        Files with an MD5 checksum are compared by content only; the one-hour
+        re-download only applies to files without one (Google-native documents).
+        MD5 체크섬이 있는 파일은 내용만 비교하며, 1시간 재다운로드는 체크섬이 없는
+        파일(Google 문서 형식)에만 적용됩니다.
+
         Args:
             file_id: Google Drive file ID / Google Drive 파일 ID
             local_path: Path to local file / 로컬 파일 경로
+            remote: Already listed Drive metadata (skips files().get) / 이미 조회한 Drive 메타데이터
 
         Returns:
             True if file is up-to-date / 파일이 최신 상태면 True
@@ -412,6 +431,24 @@ class GoogleDriveSync:
         if cached_metadata.get('file_id') != file_id:
             return False
 
+        try:
+            # Get current file metadata from Drive / Drive에서 현재 파일 메타데이터 가져오기
+            if remote is not None:
+                current_metadata = {'modifiedTime': remote.modified_time, 'md5Checksum': remote.md5_checksum}
+            else:
+                current_metadata = self.service.files().get(
+                    fileId=file_id,
+                    fields='modifiedTime, md5Checksum'
+                ).execute()
+        except HttpError:
+            # If we can't check, assume it's not up-to-date
+            # 확인할 수 없으면 최신이 아니라고 가정
+            return False
+
+        # Same content as the last download / 마지막 다운로드와 같은 내용
+        if current_metadata.get('md5Checksum') and cached_metadata.get('md5_checksum'):
+            return current_metadata['md5Checksum'] == cached_metadata['md5_checksum']
+
         # Check if more than 1 hour has passed since last download
         # 마지막 다운로드로부터 1시간이 지났는지 확인
         if 'download_time' in cached_metadata:
@@ -425,28 +462,8 @@ class GoogleDriveSync:
                 )
                 return False
 
-        try:
-            # Get current file metadata from Drive / Drive에서 현재 파일 메타데이터 가져오기
-            current_metadata = self.service.files().get(
-                fileId=file_id,
-                fields='modifiedTime, md5Checksum'
-            ).execute()
-
-            # Compare modification times / 수정 시간 비교
-            if cached_metadata.get('modified_time') != current_metadata.get('modifiedTime'):
-                return False
-
-            # Compare MD5 checksums if available / 가능한 경우 MD5 체크섬 비교
-            if current_metadata.get('md5Checksum'):
-                if cached_metadata.get('md5_checksum') != current_metadata.get('md5Checksum'):
-                    return False
-
-            return True
-
-        except HttpError:
-            # If we can't check, assume it's not up-to-date
-            # 확인할 수 없으면 최신이 아니라고 가정
-            return False
+        # Compare modification times / 수정 시간 비교
+        return cached_metadata.get('modified_time') == current_metadata.get('modifiedTime')
 
     def search_files(
         self,
@@ -580,7 +597,7 @@ class GoogleDriveSync:
                 dest_path = dest_dir / file.name
 
                 # Download file / 파일 다운로드
-                if self.download_file(file.file_id, str(dest_path), use_cache=True):
+                if self.download_file(file.file_id, str(dest_path), use_cache=True, file_metadata=file):
                     result.files_synced += 1
                 else:
                     result.files_failed += 1
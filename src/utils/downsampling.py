@@ -0,0 +1,140 @@
+"""
+downsampling.py - Series decimation for overview charts
+개요 차트용 시계열 다운샘플링
+
+Long daily series (multi-month or multi-year) are reduced to a fixed number of
+points before they are embedded in chart configs. LTTB (Largest-Triangle-Three-
+Buckets) keeps the visual shape of a line; min/max bucketing keeps every spike.
+긴 일별 시계열(여러 달 또는 여러 해)을 차트 설정에 포함하기 전에 고정된 개수의
+포인트로 줄입니다. LTTB는 선의 시각적 형태를 유지하고, min/max 버킷은 모든
+급등락을 유지합니다.
+"""
+
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+DOWNSAMPLE_METHODS = ('lttb', 'minmax')
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def lttb_indices(values: Sequence[Any], threshold: int, x: Optional[Sequence[float]] = None) -> List[int]:
+    """
+    Select point indices with Largest-Triangle-Three-Buckets
+    LTTB 알고리즘으로 유지할 포인트 인덱스 선택
+
+    Args:
+        values: Y values (None/NaN points are only kept if a bucket has nothing else)
+                Y 값 (None/NaN은 버킷에 다른 값이 없을 때만 유지)
+        threshold: Number of points to keep (>= 3) / 유지할 포인트 수 (3 이상)
+        x: X positions, e.g. timestamps (default: list position) / X 위치 (기본값: 목록 위치)
+
+    Returns:
+        Ascending indices, always including the first and last point
+        첫/마지막 포인트를 포함한 오름차순 인덱스
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    xs = list(x) if x is not None else list(range(n))
+    ys = [None if _is_missing(v) else float(v) for v in values]
+
+    selected = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        # Average of the next bucket (or the last point) / 다음 버킷의 평균 (또는 마지막 포인트)
+        next_start, next_end = end, min(int((i + 2) * bucket_size) + 1, n)
+        next_points = [(xs[j], ys[j]) for j in range(next_start, next_end) if ys[j] is not None]
+        if not next_points:
+            next_points = [(xs[n - 1], ys[n - 1] if ys[n - 1] is not None else 0.0)]
+        avg_x = sum(p[0] for p in next_points) / len(next_points)
+        avg_y = sum(p[1] for p in next_points) / len(next_points)
+
+        ax, ay = xs[a], ys[a] if ys[a] is not None else avg_y
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            if ys[j] is None:
+                continue
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+
+        selected.append(best)
+        a = best
+
+    selected.append(n - 1)
+    return selected
+
+
+def minmax_indices(values: Sequence[Any], threshold: int) -> List[int]:
+    """
+    Keep the first/last point plus the minimum and maximum of each interior bucket
+    첫/마지막 포인트와 내부 각 버킷의 최소/최대값 유지
+
+    Args:
+        values: Y values / Y 값
+        threshold: Maximum number of points to keep / 유지할 최대 포인트 수
+
+    Returns:
+        Ascending indices, always including the first and last point
+        첫/마지막 포인트를 포함한 오름차순 인덱스
+    """
+    n = len(values)
+    buckets = (threshold - 2) // 2
+    if threshold >= n or buckets < 1:
+        return list(range(n))
+
+    selected = {0, n - 1}
+    bucket_size = (n - 2) / buckets
+    for i in range(buckets):
+        present = [j for j in range(int(i * bucket_size) + 1, int((i + 1) * bucket_size) + 1)
+                   if not _is_missing(values[j])]
+        if present:
+            selected.add(min(present, key=lambda j: values[j]))
+            selected.add(max(present, key=lambda j: values[j]))
+
+    return sorted(selected)
+
+
+def downsample_series(
+    labels: Sequence[Any],
+    values: Sequence[Any],
+    max_points: int,
+    method: str = 'lttb',
+    x: Optional[Sequence[float]] = None
+) -> Tuple[List[Any], List[Any], List[int]]:
+    """
+    Downsample a labelled series to at most max_points points
+    라벨이 있는 시계열을 최대 max_points개 포인트로 다운샘플링
+
+    Args:
+        labels: X-axis labels / X축 라벨
+        values: Y values / Y 값
+        max_points: Maximum number of points to keep / 유지할 최대 포인트 수
+        method: 'lttb' or 'minmax' / 'lttb' 또는 'minmax'
+        x: Numeric X positions for LTTB (e.g. timestamps) / LTTB용 숫자 X 위치 (예: 타임스탬프)
+
+    Returns:
+        (labels, values, kept indices) / (라벨, 값, 유지된 인덱스)
+
+    Raises:
+        ValueError: Unknown method / 알 수 없는 방식
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unknown downsampling method '{method}' (expected one of {DOWNSAMPLE_METHODS})")
+
+    if method == 'lttb':
+        indices = lttb_indices(values, max_points, x=x)
+    else:
+        indices = minmax_indices(values, max_points)
+
+    return [labels[i] for i in indices], [values[i] for i in indices], indices
@@ -0,0 +1,215 @@
+"""
+encoding_cache.py - Persistent text-encoding detection for input CSV files
+입력 CSV 파일의 영구 텍스트 인코딩 탐지
+
+The encoding of a file is sniffed once from a small prefix and stored by content
+hash in .cache/encodings.json, next to the input file index. The pre-validator and
+the data loaders read it from there, so a cp949 export is parsed once with the
+right encoding instead of failing as UTF-8 first, and no check re-reads the bytes
+just to guess the encoding again. A path → (size, mtime, hash) map avoids
+re-hashing files that have not changed.
+파일 인코딩은 앞부분의 작은 샘플로 한 번만 판별되어 입력 파일 인덱스 옆의
+.cache/encodings.json에 콘텐츠 해시별로 저장됩니다. 사전 검증기와 데이터 로더가 이 결과를
+사용하므로 cp949 파일을 UTF-8로 먼저 읽다 실패하지 않고 한 번에 파싱하며, 인코딩 추정을 위해
+같은 바이트를 다시 읽지 않습니다. 경로 → (크기, 수정 시간, 해시) 맵으로 변경되지 않은 파일은
+다시 해시하지 않습니다.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import pandas as pd
+
+from .file_hash import compute_content_hash, file_signature
+
+CACHE_VERSION = 1
+
+# Tried in order on the prefix; latin1 decodes anything and is the last resort
+# 샘플에 순서대로 시도. latin1은 모든 바이트를 디코딩하므로 마지막 수단
+CANDIDATE_ENCODINGS = ['utf-8', 'cp949', 'euc-kr']
+FALLBACK_ENCODING = 'latin1'
+
+SAMPLE_BYTES = 64 * 1024
+
+T = TypeVar('T')
+
+
+def sniff_encoding(sample: bytes, truncated: bool = False) -> str:
+    """
+    Guess the encoding of a file from its first bytes
+    파일 앞부분 바이트로 인코딩 추정
+
+    Args:
+        sample: First bytes of the file / 파일 앞부분 바이트
+        truncated: The sample is a prefix of a longer file / 샘플이 더 긴 파일의 앞부분인지
+
+    Returns:
+        'utf-8-sig', one of CANDIDATE_ENCODINGS, or FALLBACK_ENCODING
+    """
+    if sample.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    for encoding in CANDIDATE_ENCODINGS:
+        try:
+            sample.decode(encoding)
+            return encoding
+        except UnicodeDecodeError as e:
+            # A multi-byte character cut at the sample boundary is not an error
+            # 샘플 경계에서 잘린 멀티바이트 문자는 오류가 아님
+            if truncated and e.start >= len(sample) - 3:
+                return encoding
+    return FALLBACK_ENCODING
+
+
+def detect_encoding(path: Path, sample_bytes: int = SAMPLE_BYTES) -> str:
+    """
+    Guess a file's encoding from its first sample_bytes (uncached)
+    파일 앞부분 sample_bytes로 인코딩 추정 (캐시 없음)
+    """
+    with open(path, 'rb') as f:
+        sample = f.read(sample_bytes + 1)
+    return sniff_encoding(sample[:sample_bytes], truncated=len(sample) > sample_bytes)
+
+
+class EncodingCache:
+    """
+    Content-hash keyed cache of detected file encodings
+    콘텐츠 해시 기반 파일 인코딩 탐지 캐시
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        """
+        Args:
+            cache_path: JSON file the results are persisted to (None keeps them in memory)
+                        결과 저장 JSON 파일 (None이면 메모리에만 유지)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.hashes: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> 'EncodingCache':
+        """
+        Cache stored in <project_root>/.cache/encodings.json
+        <project_root>/.cache/encodings.json에 저장되는 캐시
+        """
+        return cls(Path(project_root) / '.cache' / 'encodings.json')
+
+    def _load(self) -> None:
+        if not (self.cache_path and self.cache_path.exists()):
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != CACHE_VERSION:
+            return
+        self.hashes = data.get('hashes', {})
+        self.files = data.get('files', {})
+
+    def _save(self) -> None:
+        if not self.cache_path:
+            return
+        data = {'version': CACHE_VERSION, 'hashes': self.hashes, 'files': self.files}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            print(f"⚠️ Could not save encoding cache: {e}")
+
+    def _content_hash(self, path: Path) -> str:
+        key = str(Path(path).resolve())
+        signature = file_signature(path)
+        entry = self.files.get(key)
+        if entry and entry['size'] == signature['size'] and entry['mtime_ns'] == signature['mtime_ns']:
+            return entry['hash']
+        content_hash = compute_content_hash(path)
+        self.files[key] = dict(signature, hash=content_hash)
+        self._dirty = True
+        return content_hash
+
+    def lookup(self, path: Path) -> str:
+        """
+        Encoding of path, sniffed on the first lookup of its content
+        path의 인코딩 (해당 콘텐츠를 처음 조회할 때 탐지)
+
+        Args:
+            path: Existing file / 존재하는 파일
+
+        Returns:
+            Encoding name usable with open() and pd.read_csv / open()과 pd.read_csv에 사용할 인코딩
+        """
+        content_hash = self._content_hash(path)
+        entry = self.hashes.get(content_hash)
+        if entry is None:
+            entry = {'encoding': detect_encoding(path)}
+            self.hashes[content_hash] = entry
+            self._dirty = True
+        if self._dirty:
+            self._save()
+        return entry['encoding']
+
+    def record(self, path: Path, encoding: str) -> None:
+        """
+        Store the encoding a full read of path succeeded with
+        path 전체 읽기에 성공한 인코딩 저장
+        """
+        self.hashes[self._content_hash(path)] = {'encoding': encoding}
+        self._save()
+
+    def read_with(self, path: Path, reader: Callable[[str], T]) -> T:
+        """
+        Call reader(encoding) with the cached encoding, falling back to the other
+        candidates when the rest of the file does not decode with it
+        캐시된 인코딩으로 reader(encoding) 호출 (파일 뒷부분이 디코딩되지 않으면 다른 후보로 재시도)
+
+        The sniffed prefix can be plain ASCII while a later row is cp949, so a full
+        read is the only proof; the encoding it succeeded with is recorded.
+        샘플 앞부분이 ASCII여도 뒷부분이 cp949일 수 있으므로 전체 읽기에 성공한 인코딩을 기록합니다.
+
+        Args:
+            path: File to read / 읽을 파일
+            reader: Reads the whole file with the given encoding; may be called
+                    again after a UnicodeDecodeError, so it must start over
+                    주어진 인코딩으로 파일 전체를 읽는 함수 (UnicodeDecodeError 후 처음부터 다시 호출될 수 있음)
+
+        Returns:
+            reader's result / reader의 결과
+        """
+        encoding = self.lookup(path)
+        try:
+            return reader(encoding)
+        except UnicodeDecodeError:
+            pass
+        for fallback in CANDIDATE_ENCODINGS + [FALLBACK_ENCODING]:
+            if fallback == encoding:
+                continue
+            try:
+                result = reader(fallback)
+            except UnicodeDecodeError:
+                continue
+            self.record(path, fallback)
+            return result
+        raise ValueError(f"Could not decode file / 파일 디코딩 불가: {path}")
+
+    def read_csv(self, path: Path, **kwargs: Any) -> pd.DataFrame:
+        """
+        pd.read_csv through read_with()
+        read_with()를 통한 pd.read_csv
+
+        Args:
+            path: CSV file / CSV 파일
+            **kwargs: Passed to pd.read_csv / pd.read_csv에 전달
+
+        Returns:
+            DataFrame
+        """
+        return self.read_with(path, lambda encoding: pd.read_csv(path, encoding=encoding, **kwargs))
@@ -0,0 +1,47 @@
+"""
+file_hash.py - Content hashes and change signatures for input/output files
+입력/출력 파일의 콘텐츠 해시 및 변경 서명
+
+Content hashes identify a file's bytes (cache keys that survive copies and
+re-downloads); signatures (size + mtime) are a cheap "has this file changed since"
+check that needs only a stat call.
+콘텐츠 해시는 파일 내용을 식별하고(복사/재다운로드 후에도 유지되는 캐시 키),
+서명(크기 + 수정 시간)은 stat 호출만으로 파일 변경 여부를 빠르게 확인합니다.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Dict
+
+
+def compute_content_hash(path: Path) -> str:
+    """
+    Short SHA-256 content hash of a file
+    파일의 짧은 SHA-256 콘텐츠 해시
+
+    Args:
+        path: File path / 파일 경로
+
+    Returns:
+        str: First 16 hex digits of the SHA-256 digest / SHA-256 앞 16자리
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def file_signature(path: Path) -> Dict[str, int]:
+    """
+    Size and modification time of a file
+    파일 크기 및 수정 시간
+
+    Args:
+        path: File path / 파일 경로
+
+    Returns:
+        {'size': bytes, 'mtime_ns': modification time in ns} / {'size', 'mtime_ns'}
+    """
+    stat = Path(path).stat()
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
@@ -0,0 +1,60 @@
+"""
+month_range.py - Month range arguments shared by the command line tools
+명령줄 도구가 공유하는 월 범위 인수
+
+Used by generate_dashboard.py --months and google_drive_manager.py --months.
+generate_dashboard.py --months 및 google_drive_manager.py --months에서 사용합니다.
+"""
+
+import argparse
+from typing import List, Tuple
+
+
+def parse_month_range(value: str) -> List[Tuple[int, int]]:
+    """
+    Parse --months value into (year, month) tuples
+    --months 값을 (연도, 월) 튜플 목록으로 파싱
+
+    Accepts a range "2025-07..2025-12", a list "2025-07,2025-09" or a single month.
+    범위 "2025-07..2025-12", 목록 "2025-07,2025-09" 또는 단일 월을 허용합니다.
+
+    Args:
+        value: Month range or list / 월 범위 또는 목록
+
+    Returns:
+        list: Sorted unique (year, month) tuples / 정렬된 (연도, 월) 튜플 목록
+
+    Raises:
+        argparse.ArgumentTypeError: If a month is malformed or the range is empty
+                                    월 형식이 잘못되었거나 범위가 비어 있는 경우
+    """
+    def parse_month(text: str) -> tuple:
+        try:
+            year_str, month_str = text.strip().split('-')
+            year, month = int(year_str), int(month_str)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid month '{text}' (expected YYYY-MM)")
+        if not 1 <= month <= 12:
+            raise argparse.ArgumentTypeError(f"invalid month '{text}' (month must be 01-12)")
+        return year, month
+
+    months = set()
+    for part in value.split(','):
+        if not part.strip():
+            continue
+        if '..' in part:
+            start_text, end_text = part.split('..', 1)
+            start, end = parse_month(start_text), parse_month(end_text)
+            if start > end:
+                raise argparse.ArgumentTypeError(f"empty month range '{part}'")
+            year, month = start
+            while (year, month) <= end:
+                months.add((year, month))
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        else:
+            months.add(parse_month(part))
+
+    if not months:
+        raise argparse.ArgumentTypeError("at least one month is required")
+
+    return sorted(months)
@@ -7,7 +7,7 @@ Validates data files before processing to provide early error detection.
 
 Features:
 - Check required input files exist
-- Validate file encoding (UTF-8)
+- Validate file encoding (UTF-8 or a known Korean encoding, from the shared encoding cache)
 - Check for empty/corrupted CSV files
 - Verify date columns are parseable
 - Month consistency validation across data sources
@@ -15,12 +15,13 @@ Features:
 
 import os
 import json
-import chardet
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass, field
 import pandas as pd
 
+from .encoding_cache import FALLBACK_ENCODING, EncodingCache
+
 
 @dataclass
 class ValidationResult:
@@ -151,6 +152,8 @@ class PreValidator:
         self.month_name = self.MONTH_NAMES.get(month, '')
         self.input_dir = project_root / "input_files"
         self.report = ValidationReport()
+        # Same cache the data loaders use / 데이터 로더와 같은 캐시 사용
+        self.encodings = EncodingCache.for_project(project_root)
 
     def validate_all(self) -> ValidationReport:
         """
@@ -237,8 +240,8 @@ class PreValidator:
 
     def _validate_file_encodings(self):
         """
-        Validate file encodings are UTF-8 compatible
-        파일 인코딩이 UTF-8 호환인지 확인
+        Validate file encodings are UTF-8 or a known Korean encoding
+        파일 인코딩이 UTF-8 또는 알려진 한국어 인코딩인지 확인
         """
         expected_files = self._get_expected_files()
 
@@ -247,36 +250,28 @@ class PreValidator:
                 continue
 
             try:
-                # Read first 10KB to detect encoding
-                with open(file_path, 'rb') as f:
-                    raw_data = f.read(10240)
-
-                detected = chardet.detect(raw_data)
-                encoding = detected.get('encoding', 'unknown')
-                confidence = detected.get('confidence', 0)
-
-                # Accept UTF-8, ASCII, or high-confidence encodings
-                is_valid = encoding and (
-                    encoding.lower() in ['utf-8', 'ascii', 'utf-8-sig'] or
-                    confidence >= 0.8
-                )
+                # Sniffed once per file content and shared with the loaders
+                # 파일 콘텐츠당 한 번 탐지되어 로더와 공유됨
+                encoding = self.encodings.lookup(file_path)
 
-                if is_valid:
+                # Anything that only decodes as latin1 is not a known encoding
+                # latin1로만 디코딩되는 파일은 알려진 인코딩이 아님
+                if encoding != FALLBACK_ENCODING:
                     self.report.add(ValidationResult(
                         check_name=f"encoding_{file_key}",
                         passed=True,
-                        message_ko=f"인코딩 확인: {encoding} ({confidence:.0%})",
-                        message_en=f"Encoding valid: {encoding} ({confidence:.0%})",
+                        message_ko=f"인코딩 확인: {encoding}",
+                        message_en=f"Encoding valid: {encoding}",
                         severity="info"
                     ))
                 else:
                     self.report.add(ValidationResult(
                         check_name=f"encoding_{file_key}",
                         passed=False,
-                        message_ko=f"인코딩 문제: {encoding} (신뢰도 {confidence:.0%})",
-                        message_en=f"Encoding issue: {encoding} (confidence {confidence:.0%})",
+                        message_ko=f"인코딩 문제: UTF-8/CP949/EUC-KR로 읽을 수 없음",
+                        message_en=f"Encoding issue: not readable as UTF-8/CP949/EUC-KR",
                         severity="warning",
-                        details={"encoding": encoding, "confidence": confidence}
+                        details={"encoding": encoding}
                     ))
 
             except Exception as e:
@@ -301,7 +296,7 @@ class PreValidator:
 
             try:
                 # Try to read CSV
-                df = pd.read_csv(file_path, nrows=5, encoding='utf-8')
+                df = self.encodings.read_csv(file_path, nrows=5)
 
                 if df.empty:
                     self.report.add(ValidationResult(
@@ -357,7 +352,7 @@ class PreValidator:
             return
 
         try:
-            df = pd.read_csv(basic_file, nrows=100, encoding='utf-8')
+            df = self.encodings.read_csv(basic_file, nrows=100)
 
             date_columns = ['Entrance Date', 'Stop working Date']
             for col in date_columns:
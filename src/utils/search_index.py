@@ -0,0 +1,74 @@
+"""
+search_index.py - Prefix search index for dashboard type-ahead
+대시보드 자동완성용 접두사 검색 인덱스
+
+Vietnamese names are folded once at generation time (lowercase, diacritics
+removed, 'đ' → 'd') so the browser only has to fold the short query string.
+The index is a token-sorted list that the dashboard JS binary-searches for
+prefix matches.
+베트남어 이름은 생성 시 한 번만 정규화(소문자, 성조 제거, 'đ' → 'd')하므로
+브라우저는 짧은 검색어만 정규화하면 됩니다. 인덱스는 토큰 순으로 정렬된
+목록이며 대시보드 JS가 이진 탐색으로 접두사 일치를 찾습니다.
+"""
+
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List
+
+import pandas as pd
+
+
+# Token separator: anything except letters and digits / 토큰 구분자: 문자·숫자 외 모두
+TOKEN_SPLIT_PATTERN = re.compile(r'[\W_]+')
+
+
+def fold_search_text(text: Any) -> str:
+    """
+    Lowercase and strip diacritics (Vietnamese-aware)
+    소문자 변환 및 성조/발음 구별 기호 제거 (베트남어 지원)
+
+    Args:
+        text: Any value; None/NaN become '' / 임의 값 (None/NaN은 '')
+
+    Returns:
+        Folded text, e.g. 'Nguyễn Thị Đào' → 'nguyen thi dao' / 정규화된 문자열
+    """
+    if text is None or (not isinstance(text, str) and pd.isna(text)):
+        return ''
+    decomposed = unicodedata.normalize('NFD', str(text).lower())
+    stripped = ''.join(ch for ch in decomposed if unicodedata.category(ch) != 'Mn')
+    return stripped.replace('đ', 'd')
+
+
+def tokenize_search_text(text: Any) -> List[str]:
+    """
+    Fold text and split it into search tokens
+    문자열을 정규화한 후 검색 토큰으로 분리
+    """
+    return [token for token in TOKEN_SPLIT_PATTERN.split(fold_search_text(text)) if token]
+
+
+def build_search_index(records: List[Dict[str, Any]], fields: Iterable[str]) -> List[list]:
+    """
+    Build a token-sorted [token, [row ids]] list over the given record fields
+    지정한 레코드 필드에 대해 토큰 순으로 정렬된 [토큰, [행 번호]] 목록 생성
+
+    Args:
+        records: Rows to index (row id = list position) / 인덱싱할 행 (행 번호 = 목록 위치)
+        fields: Field names whose values are tokenized / 토큰화할 필드 이름
+
+    Returns:
+        List of [token, ascending row ids] sorted by token
+        토큰 순으로 정렬된 [토큰, 오름차순 행 번호] 목록
+    """
+    fields = list(fields)
+    postings: Dict[str, List[int]] = {}
+
+    for row_id, record in enumerate(records):
+        tokens = set()
+        for field in fields:
+            tokens.update(tokenize_search_text(record.get(field)))
+        for token in tokens:
+            postings.setdefault(token, []).append(row_id)
+
+    return [[token, postings[token]] for token in sorted(postings)]
@@ -19,6 +19,7 @@ Core Features / 핵심 기능:
 - Automatic color assignment / 자동 색상 할당
 - Responsive design / 반응형 디자인
 - Multi-language label support / 다국어 라벨 지원
+- Downsampling of long trend series / 긴 추세 시계열 다운샘플링
 """
 
 import json
@@ -28,6 +29,7 @@ from dataclasses import dataclass, field
 
 from ..utils.logger import get_logger
 from ..utils.i18n import I18n
+from ..utils.downsampling import downsample_series
 from ..analytics.trend_analyzer import TrendAnalysisResult
 from ..analytics.metric_calculator import MetricCalculationResult
 
@@ -71,6 +73,11 @@ class ChartGenerator:
     새 차트에 코드 변경 불필요 - 템플릿 선택만 필요합니다.
     """
 
+    # Trend series longer than this are decimated for the overview chart
+    # (templates can override it with "max_points")
+    # 이보다 긴 추세 시계열은 개요 차트용으로 다운샘플링 (템플릿의 "max_points"로 변경 가능)
+    DEFAULT_MAX_POINTS = 500
+
     def __init__(
         self,
         template_config_path: Optional[str] = None,
@@ -184,7 +191,9 @@ class ChartGenerator:
         trend_result: TrendAnalysisResult,
         template_name: str = "line_trend",
         title: Optional[str] = None,
-        language: str = "ko"
+        language: str = "ko",
+        max_points: Optional[int] = None,
+        downsample_method: str = "lttb"
     ) -> ChartConfig:
         """
         Generate chart configuration from trend analysis result
@@ -216,9 +225,15 @@ class ChartGenerator:
                           chart_templates.json의 템플릿 이름
             title: Chart title (auto-generated if None) / 차트 제목 (None이면 자동 생성)
             language: Language for labels / 라벨 언어
+            max_points: Points kept in the overview series (default: template "max_points"
+                        or DEFAULT_MAX_POINTS) / 개요 시계열에 유지할 포인트 수
+            downsample_method: 'lttb' (keeps line shape) or 'minmax' (keeps spikes)
+                               'lttb' (선 형태 유지) 또는 'minmax' (급등락 유지)
 
         Returns:
-            ChartConfig ready for Chart.js / Chart.js용 ChartConfig
+            ChartConfig ready for Chart.js; when decimated, data.metadata['full_resolution']
+            holds the original series (see save_full_resolution()) / Chart.js용 ChartConfig
+            (다운샘플링 시 data.metadata['full_resolution']에 원본 시계열 포함, save_full_resolution() 참조)
         """
         # Get template / 템플릿 가져오기
         template = self.templates.get(template_name)
@@ -234,6 +249,32 @@ class ChartGenerator:
         labels = [point.label for point in trend_result.data_points]
         values = [point.value for point in trend_result.data_points]
 
+        # Decimate long series for the overview chart / 개요 차트용으로 긴 시계열 다운샘플링
+        if max_points is None:
+            max_points = template.get('max_points', self.DEFAULT_MAX_POINTS)
+        data_metadata = {}
+        if len(values) > max_points:
+            full_labels, full_values = labels, values
+            labels, values, _ = downsample_series(
+                full_labels, full_values, max_points,
+                method=downsample_method,
+                x=[point.timestamp.timestamp() for point in trend_result.data_points]
+            )
+            data_metadata['decimation'] = {
+                'method': downsample_method,
+                'source_points': len(full_values),
+                'points': len(values)
+            }
+            data_metadata['full_resolution'] = {'labels': full_labels, 'data': full_values}
+            self.logger.debug(
+                "추세 시계열 다운샘플링",
+                "Trend series downsampled",
+                subject=trend_result.subject,
+                metric=trend_result.metric,
+                source_points=len(full_values),
+                points=len(values)
+            )
+
         # Generate title if not provided / 제공되지 않은 경우 제목 생성
         if title is None:
             if self.i18n:
@@ -259,7 +300,8 @@ class ChartGenerator:
                 'subject': trend_result.subject,
                 'metric': trend_result.metric,
                 'period': trend_result.period,
-                'trend_direction': trend_result.trend_direction
+                'trend_direction': trend_result.trend_direction,
+                **data_metadata
             }
         )
 
@@ -542,27 +584,64 @@ class ChartGenerator:
 
         return json.dumps(chart_dict, ensure_ascii=False, indent=2)
 
+    def save_full_resolution(self, chart_config: ChartConfig, output_path: Union[str, Path]) -> Optional[Path]:
+        """
+        Write the original series of a downsampled chart to a JSON file, to be
+        fetched on demand via generate_chart_html(full_resolution_url=...)
+        다운샘플링된 차트의 원본 시계열을 JSON 파일로 저장
+        (generate_chart_html(full_resolution_url=...)로 필요할 때 로드)
+
+        Args:
+            chart_config: Chart configuration / 차트 설정
+            output_path: JSON file to write / 저장할 JSON 파일
+
+        Returns:
+            output_path, or None when the chart was not downsampled
+            저장 경로 (다운샘플링되지 않은 차트는 None)
+        """
+        full_resolution = chart_config.data.metadata.get('full_resolution')
+        if not full_resolution:
+            return None
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(full_resolution, f, ensure_ascii=False)
+        return output_path
+
     def generate_chart_html(
         self,
         chart_config: ChartConfig,
         canvas_id: str = "myChart",
         width: int = 800,
-        height: int = 400
+        height: int = 400,
+        full_resolution_url: Optional[str] = None
     ) -> str:
         """
         Generate complete HTML for chart including canvas and script
         캔버스와 스크립트를 포함한 차트용 완전한 HTML 생성
 
+        Only the overview series is embedded. For a downsampled chart, pass the URL of
+        the file written by save_full_resolution(); it is fetched on the first
+        double-click, which then toggles between the two series.
+        개요 시계열만 포함됩니다. 다운샘플링된 차트는 save_full_resolution()으로 저장한 파일의
+        URL을 전달하면 첫 더블클릭 시 로드되고, 이후 더블클릭으로 두 시계열을 전환합니다.
+
         Args:
             chart_config: Chart configuration / 차트 설정
             canvas_id: HTML canvas element ID / HTML 캔버스 요소 ID
             width: Canvas width / 캔버스 너비
             height: Canvas height / 캔버스 높이
+            full_resolution_url: URL of the full-resolution JSON (None: overview only)
+                                 전체 해상도 JSON URL (None이면 개요만)
 
         Returns:
             HTML string / HTML 문자열
         """
         chart_json = self.to_json(chart_config)
+        if not chart_config.data.metadata.get('full_resolution'):
+            full_resolution_url = None
+        full_resolution_url_json = json.dumps(full_resolution_url)
 
         html = f"""
 <div class="chart-container" style="position: relative; height:{height}px; width:{width}px;">
@@ -580,7 +659,29 @@ class ChartGenerator:
     }}
 
     // Create new chart / 새 차트 생성
-    window.{canvas_id}_instance = new Chart(ctx, chartConfig);
+    const chart = window.{canvas_id}_instance = new Chart(ctx, chartConfig);
+
+    // Double-click switches a downsampled chart to its full-resolution series and back;
+    // the series is fetched on first use
+    // 다운샘플링된 차트는 더블클릭으로 전체 해상도 시계열과 전환 (처음 사용할 때 로드)
+    const fullResolutionUrl = {full_resolution_url_json};
+    if (fullResolutionUrl) {{
+        const overview = {{ labels: chart.data.labels, data: chart.data.datasets[0].data }};
+        let fullResolution = null;
+        let zoomed = false;
+        ctx.canvas.addEventListener('dblclick', async () => {{
+            if (!fullResolution) {{
+                const response = await fetch(fullResolutionUrl);
+                if (!response.ok) return;
+                fullResolution = await response.json();
+            }}
+            zoomed = !zoomed;
+            const series = zoomed ? fullResolution : overview;
+            chart.data.labels = series.labels;
+            chart.data.datasets[0].data = series.data;
+            chart.update();
+        }});
+    }}
 }})();
 </script>
 """
@@ -7,8 +7,101 @@
  * - Team distribution charts
  * - Month-over-month comparison charts
  * - Treemap visualizations
+ * - Chart lifecycle: visible-only rendering and instance reuse
  */
 
+/**
+ * Chart.js plugin that defers layout/drawing until the canvas is near the viewport
+ * and stops running animations once it scrolls out of view or its tab/modal hides.
+ * 캔버스가 화면 근처에 올 때까지 레이아웃/그리기를 미루고,
+ * 화면 밖으로 나가거나 탭/모달이 숨겨지면 진행 중인 애니메이션을 멈추는 Chart.js 플러그인
+ */
+const ChartVisibility = {
+    id: 'chartVisibility',
+    observer: null,
+
+    getObserver: function() {
+        if (!ChartVisibility.observer && 'IntersectionObserver' in window) {
+            ChartVisibility.observer = new IntersectionObserver(entries => {
+                entries.forEach(entry => {
+                    const chart = Chart.getChart(entry.target);
+                    if (!chart) return;
+
+                    chart.$visible = entry.isIntersecting;
+                    if (chart.$visible && chart.$pendingUpdate) {
+                        chart.$pendingUpdate = false;
+                        chart.update();
+                    } else if (!chart.$visible) {
+                        chart.stop();
+                    }
+                });
+            }, { rootMargin: '200px' });
+        }
+        return ChartVisibility.observer;
+    },
+
+    isVisible: function(canvas) {
+        if (!canvas.isConnected || canvas.getClientRects().length === 0) return false;
+        const rect = canvas.getBoundingClientRect();
+        return rect.bottom >= -200 && rect.top <= window.innerHeight + 200;
+    },
+
+    afterInit: function(chart) {
+        const observer = ChartVisibility.getObserver();
+        chart.$visible = observer ? ChartVisibility.isVisible(chart.canvas) : true;
+        if (observer) observer.observe(chart.canvas);
+    },
+
+    beforeUpdate: function(chart) {
+        if (!chart.$visible) {
+            chart.$pendingUpdate = true;
+            return false;
+        }
+    },
+
+    beforeRender: function(chart) {
+        if (chart.$pendingUpdate) return false;
+    },
+
+    beforeDestroy: function(chart) {
+        if (ChartVisibility.observer && chart.canvas) ChartVisibility.observer.unobserve(chart.canvas);
+    }
+};
+
+if (typeof Chart !== 'undefined') {
+    Chart.register(ChartVisibility);
+}
+
+/**
+ * Create a chart, or update the existing one on the same canvas in place
+ * 차트를 생성하거나, 같은 캔버스의 기존 차트를 그대로 업데이트
+ *
+ * @param {Chart|null} existing - Previously created instance (e.g. modalCharts[key])
+ * @param {HTMLCanvasElement|CanvasRenderingContext2D|string} target - Canvas, its 2D context or ID
+ * @param {Object} config - Chart.js configuration
+ * @returns {Chart} Reused or new Chart.js instance
+ */
+function renderChart(existing, target, config) {
+    const canvas = typeof target === 'string' ? document.getElementById(target) : (target.canvas || target);
+    const chart = existing || Chart.getChart(canvas);
+
+    if (chart && chart.canvas === canvas && chart.config.type === config.type && !config.plugins) {
+        // Clear hover/tooltip state left over from the last time the chart was shown
+        // 이전 표시 때 남은 hover/툴팁 상태 초기화
+        chart.setActiveElements([]);
+        if (chart.tooltip) chart.tooltip.setActiveElements([], { x: 0, y: 0 });
+        chart.data = config.data;
+        chart.options = config.options || {};
+        chart.update();
+        return chart;
+    }
+
+    if (chart && chart.canvas) chart.destroy();
+    const stale = Chart.getChart(canvas);
+    if (stale) stale.destroy();
+    return new Chart(canvas, config);
+}
+
 /**
  * Calculate linear regression trendline
  * 선형 회귀 추세선 계산
@@ -79,7 +172,7 @@ function createMonthlyTrendChart(canvasId, labels, values, options = {}) {
         });
     }
 
-    return new Chart(ctx, {
+    return renderChart(null, ctx, {
         type: 'line',
         data: {
             labels: labels,
@@ -187,7 +280,7 @@ function createWeeklyTrendChart(canvasId, weeklyData, options = {}) {
         });
     }
 
-    return new Chart(ctx, {
+    return renderChart(null, ctx, {
         type: 'line',
         data: {
             labels: labels,
@@ -252,7 +345,7 @@ function createMonthOverMonthBarChart(canvasId, labels, currentValues, previousV
 
     const ctx = document.getElementById(canvasId).getContext('2d');
 
-    return new Chart(ctx, {
+    return renderChart(null, ctx, {
         type: 'bar',
         data: {
             labels: labels,
@@ -332,7 +425,7 @@ function createTeamDistributionChart(canvasId, labels, values, options = {}) {
 
     const ctx = document.getElementById(canvasId).getContext('2d');
 
-    return new Chart(ctx, {
+    return renderChart(null, ctx, {
         type: 'bar',
         data: {
             labels: labels,
@@ -401,7 +494,7 @@ function createTypeDistributionChart(canvasId, labels, values, options = {}) {
 
     const ctx = document.getElementById(canvasId).getContext('2d');
 
-    return new Chart(ctx, {
+    return renderChart(null, ctx, {
         type: 'pie',
         data: {
             labels: labels,
@@ -12,6 +12,7 @@ Enhanced with:
 """
 
 import json
+from dataclasses import asdict
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
@@ -27,8 +28,11 @@ from src.analytics.hr_metric_calculator import HRMetricCalculator
 from src.analytics.metric_validator import MetricValidator, DataQualityScore
 from src.utils.employee_counter import count_employees_by_teams_monthly
 from src.visualization.enhanced_modal_generator import EnhancedModalGenerator
+from src.visualization.virtual_scroll import VirtualScrollGenerator
+from src.visualization.dashboard_worker import DashboardWorkerGenerator
 from src.utils.i18n import I18n
 from src.utils.logger import get_logger
+from src.utils.search_index import build_search_index
 
 
 def _load_dashboard_config() -> Dict[str, Any]:
@@ -51,16 +55,60 @@ TEAM_MAPPING = _dashboard_config.get('team_mapping', {}).get('teams', {})
 TEAM_KEYWORD_MAPPING = _dashboard_config.get('team_mapping', {}).get('keyword_mapping', {})
 TEAM_FALLBACK = _dashboard_config.get('team_mapping', {}).get('fallback_team', 'QIP_MANAGER_OFFICE_OCPT')
 
+# Version of the headless metrics bundle layout (bump on breaking changes)
+# 헤드리스 메트릭 번들 구조 버전 (호환성이 깨지는 변경 시 증가)
+METRICS_BUNDLE_SCHEMA_VERSION = '1.0'
+
+# Employee Details filter chips precomputed at generation time (filter key → predicate)
+# 생성 시 미리 계산하는 직원 상세 필터 칩 (필터 키 → 조건)
+EMPLOYEE_FILTER_FLAGS = {
+    'active': lambda e: e['is_active'],
+    'hired': lambda e: e['hired_this_month'],
+    'resigned': lambda e: e['resigned_this_month'],
+    'perfect': lambda e: e['perfect_attendance'],
+    'absent': lambda e: e['absent_days'] > 0,
+    'unauthorized': lambda e: e['has_unauthorized_absence'],
+    'longterm': lambda e: e['long_term'],
+    'new60': lambda e: e['under_60_days'],
+    'pregnant': lambda e: e['is_pregnant'],
+    'long_absence': lambda e: e['absent_days'] >= 5,
+    'data_error': lambda e: e['has_data_error'],
+}
+
+# employeeDetails fields covered by the Employee Details / Individual Attendance search
+# 직원 상세 / 개인 출결 검색 대상 employeeDetails 필드
+EMPLOYEE_SEARCH_FIELDS = ['employee_id', 'employee_name', 'position', 'role_type', 'building', 'line', 'boss_name']
+
+# Input sources the builder reads; AQL and 5PRS files are never loaded for a dashboard
+# 빌더가 읽는 입력 소스 (대시보드 생성 시 AQL, 5PRS 파일은 로드하지 않음)
+DASHBOARD_SOURCES = ['basic_manpower', 'attendance']
+
+# Visualization libraries loaded on first use (window global → sources tried in order).
+# The relative 'vendor/' copies are the offline fallback: they are checked in under
+# docs/vendor/ (precached by the service worker) and copied next to the dashboards in
+# the output directory by generate_dashboard.py.
+# 처음 사용할 때 로드하는 시각화 라이브러리 (전역 이름 → 순서대로 시도할 경로).
+# 'vendor/' 사본은 오프라인 대체 경로입니다. docs/vendor/에 포함되어 서비스 워커가 사전 캐시하며,
+# generate_dashboard.py가 출력 디렉토리의 대시보드 옆에도 복사합니다.
+LAZY_VISUALIZATION_LIBRARIES = {
+    'd3': ['https://d3js.org/d3.v7.min.js', 'vendor/d3.v7.min.js'],
+    'Plotly': ['https://cdn.plot.ly/plotly-2.26.0.min.js', 'vendor/plotly-2.26.0.min.js'],
+}
+
 
 class CompleteDashboardBuilder:
     """Build complete HR dashboard with all enhanced features"""
 
-    def __init__(self, target_month: str, language: str = 'ko', report_date: Optional[datetime] = None):
+    def __init__(self, target_month: str, language: str = 'ko', report_date: Optional[datetime] = None,
+                 collector: Optional[MonthlyDataCollector] = None):
         """
         Args:
             target_month: 'YYYY-MM' format
             language: 'ko', 'en', or 'vi'
             report_date: Report generation date (default: today)
+            collector: Shared data collector, e.g. one with cache_data=True reused
+                across several builders (default: a new caching collector for the
+                target year, so each source file is parsed once per build)
         """
         self.target_month = target_month
         self.language = language
@@ -72,7 +120,7 @@ class CompleteDashboardBuilder:
         target_year = int(target_month.split('-')[0]) if '-' in target_month else datetime.now().year
 
         # Initialize components
-        self.collector = MonthlyDataCollector(self.hr_root, target_year=target_year)
+        self.collector = collector or MonthlyDataCollector(self.hr_root, target_year=target_year, cache_data=True)
         self.calculator = HRMetricCalculator(self.collector, self.report_date)
 
         # Initialize i18n and logger
@@ -88,6 +136,8 @@ class CompleteDashboardBuilder:
         self.month_labels: List[str] = []
         self.monthly_metrics: Dict[str, Dict[str, Any]] = {}
         self.employee_details: List[Dict[str, Any]] = []
+        self.employee_filter_index: Dict[str, List[int]] = {}  # Filter key → employeeDetails row ids / 필터 키 → 행 번호
+        self.employee_search_index: List[list] = []  # Sorted [token, row ids] for type-ahead / 자동완성용 정렬된 [토큰, 행 번호]
         self.modal_data: Dict[str, Any] = {}  # NEW: Store detailed modal data
         self.team_data: Dict[str, Any] = {}  # NEW: Team-based analysis data (current month)
         self.previous_month_team_data: Dict[str, Any] = {}  # NEW: Previous month team data for comparison
@@ -95,9 +145,28 @@ class CompleteDashboardBuilder:
         self.hierarchy_data: List[Dict[str, Any]] = []  # NEW: Organization hierarchy data
         self.quality_score: Optional[DataQualityScore] = None  # Data quality score / 데이터 품질 점수
         self.attendance_data: List[Dict[str, Any]] = []  # NEW: Individual attendance records / 개인 출결 기록
+        self.attendance_offsets: Dict[str, List[int]] = {}  # employee_no → [start, end) in attendance_data / 직원별 구간
 
     def build(self) -> str:
         """Build complete dashboard HTML"""
+        self.prepare()
+        return self.render()
+
+    def prepare(self, metrics_only: bool = False) -> None:
+        """
+        Load data and compute every language-independent dataset
+        언어와 무관한 모든 데이터셋 로드 및 계산
+
+        Results are kept on the builder so render() can be called once per
+        language without repeating data loading or metric computation.
+        결과는 빌더에 보관되어 render()를 언어별로 호출해도
+        데이터 로딩 및 메트릭 계산이 반복되지 않습니다.
+
+        Args:
+            metrics_only: Skip the per-employee, modal and attendance datasets
+                          that only the HTML needs (see to_metrics_bundle())
+                          HTML에만 필요한 직원별/모달/출결 데이터셋 생략
+        """
         print(f"🔨 Building HR Dashboard for {self.target_month}...")
 
         # Step 1: Detect available months
@@ -130,13 +199,19 @@ class CompleteDashboardBuilder:
         self._validate_metrics()
         print(f"✅ Data quality score: {self.quality_score.score:.1f}% (Grade: {self.quality_score.grade})")
 
-        # Step 3: Collect employee details
-        self._collect_employee_details()
-        print(f"👥 Employee details: {len(self.employee_details)} employees")
+        if not metrics_only:
+            # Step 3: Collect employee details
+            self._collect_employee_details()
+            print(f"👥 Employee details: {len(self.employee_details)} employees")
+
+            # Step 3.1: Precompute filter indexes for the Employee Details tab
+            # 직원 상세 탭용 필터 인덱스 사전 계산
+            self.employee_filter_index = self._build_employee_filter_index()
+            self.employee_search_index = build_search_index(self.employee_details, EMPLOYEE_SEARCH_FIELDS)
 
-        # Step 4: Collect modal-specific data
-        self._collect_modal_data()
-        print(f"📋 Modal data collected")
+            # Step 4: Collect modal-specific data
+            self._collect_modal_data()
+            print(f"📋 Modal data collected")
 
         # Step 4.5: Collect team-based data
         self.team_data = self._collect_team_data()
@@ -156,8 +231,69 @@ class CompleteDashboardBuilder:
 
         # Step 4.7: Collect individual attendance data
         # 개인 출결 데이터 수집
-        self._collect_attendance_data()
-        print(f"📅 Attendance data collected: {len(self.attendance_data)} records")
+        if not metrics_only:
+            self._collect_attendance_data()
+            print(f"📅 Attendance data collected: {len(self.attendance_data)} records")
+
+    def to_metrics_bundle(self) -> Dict[str, Any]:
+        """
+        Export prepared metrics and aggregates as a versioned, JSON-ready dict
+        준비된 메트릭 및 집계를 버전이 있는 JSON 호환 딕셔너리로 내보내기
+
+        Used by the headless pipeline (--output-format json) for consumers that
+        only need the numbers.
+        숫자만 필요한 소비자를 위한 헤드리스 파이프라인(--output-format json)에서 사용됩니다.
+        """
+        quality = None
+        if self.quality_score:
+            quality = {
+                'score': self.quality_score.score,
+                'grade': self.quality_score.grade,
+                'total_checks': self.quality_score.total_checks,
+                'passed_checks': self.quality_score.passed_checks,
+                'warnings': [asdict(warning) for warning in self.quality_score.warnings]
+            }
+
+        bundle = {
+            'schema_version': METRICS_BUNDLE_SCHEMA_VERSION,
+            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'target_month': self.target_month,
+            'report_date': pd.Timestamp(self.report_date).strftime('%Y-%m-%d'),
+            'available_months': self.available_months,
+            'monthly_metrics': self.monthly_metrics,
+            'data_quality': quality,
+            'team_data': self.team_data,
+            'previous_month_team_data': self.previous_month_team_data,
+            'monthly_team_counts': self.monthly_team_counts,
+            'hierarchy_data': self.hierarchy_data
+        }
+        return json.loads(self._safe_json_dumps(bundle, ensure_ascii=False))
+
+    def set_language(self, language: str) -> None:
+        """
+        Switch the rendering language of an already prepared builder
+        준비된 빌더의 렌더링 언어 전환
+
+        Args:
+            language: 'ko', 'en', or 'vi'
+        """
+        self.language = language
+        self.i18n.set_language(language)
+        self.month_labels = self.collector.get_month_labels(self.available_months, language)
+
+    def render(self, language: Optional[str] = None) -> str:
+        """
+        Render dashboard HTML from the prepared data
+        준비된 데이터로 대시보드 HTML 렌더링
+
+        Args:
+            language: Optional language override ('ko', 'en', 'vi') / 언어 지정 (선택)
+
+        Returns:
+            Complete dashboard HTML / 완전한 대시보드 HTML
+        """
+        if language and language != self.language:
+            self.set_language(language)
 
         # Step 5: Generate HTML
         html = self._generate_html()
@@ -222,7 +358,7 @@ class CompleteDashboardBuilder:
 
     def _collect_employee_details(self):
         """Collect employee details with calculated fields for the target month"""
-        data = self.collector.load_month_data(self.target_month)
+        data = self.collector.load_month_data(self.target_month, sources=DASHBOARD_SOURCES)
         df = data.get('basic_manpower', pd.DataFrame())
         attendance_df = data.get('attendance', pd.DataFrame())
 
@@ -419,9 +555,34 @@ class CompleteDashboardBuilder:
                 'error_description': error_description
             })
 
+    def _build_employee_filter_index(self) -> Dict[str, List[int]]:
+        """
+        Map each filter chip, team and TYPE to sorted employeeDetails row ids
+        각 필터 칩, 팀, TYPE을 정렬된 employeeDetails 행 번호로 매핑
+
+        Keys are 'flag:<filter>', 'team:<team_name>' and 'type:<TYPE>', so the
+        dashboard JS gets counts and filtered views without scanning every
+        employee. The flat layout also keeps the compact JSON free of '}}'.
+        키는 'flag:<필터>', 'team:<팀>', 'type:<TYPE>' 형식이며, 대시보드 JS가
+        전체 직원을 스캔하지 않고 개수와 필터 결과를 얻을 수 있습니다.
+
+        Returns:
+            Dict of key → ascending row ids / 키 → 오름차순 행 번호
+        """
+        index: Dict[str, List[int]] = {f'flag:{key}': [] for key in EMPLOYEE_FILTER_FLAGS}
+
+        for row_id, employee in enumerate(self.employee_details):
+            for key, predicate in EMPLOYEE_FILTER_FLAGS.items():
+                if predicate(employee):
+                    index[f'flag:{key}'].append(row_id)
+            index.setdefault(f"team:{employee['team_name']}", []).append(row_id)
+            index.setdefault(f"type:{employee['TYPE']}", []).append(row_id)
+
+        return index
+
     def _collect_modal_data(self):
         """Collect detailed data for each modal"""
-        data = self.collector.load_month_data(self.target_month)
+        data = self.collector.load_month_data(self.target_month, sources=DASHBOARD_SOURCES)
         attendance_df = data.get('attendance', pd.DataFrame())
         basic_df = data.get('basic_manpower', pd.DataFrame())
 
@@ -556,7 +717,9 @@ class CompleteDashboardBuilder:
                     else:
                         return '기타 (Other)'
 
-                absence_with_reasons['reason_category'] = absence_with_reasons['Reason Description'].apply(categorize_reason)
+                # Reason Description is categorical: categorize the values, not the categories
+                # Reason Description은 범주형: 범주가 아닌 값 단위로 분류
+                absence_with_reasons['reason_category'] = absence_with_reasons['Reason Description'].astype(object).apply(categorize_reason)
 
                 # Overall reason distribution
                 reason_counts = absence_with_reasons['reason_category'].value_counts().to_dict()
@@ -570,7 +733,7 @@ class CompleteDashboardBuilder:
 
                 for month_str in self.available_months:
                     # Load month data
-                    month_data = self.collector.load_month_data(month_str)
+                    month_data = self.collector.load_month_data(month_str, sources=DASHBOARD_SOURCES)
                     month_attendance = month_data.get('attendance', pd.DataFrame())
                     month_basic = month_data.get('basic_manpower', pd.DataFrame())
 
@@ -590,7 +753,7 @@ class CompleteDashboardBuilder:
                     # Get absence records
                     if 'compAdd' in month_active.columns and 'Reason Description' in month_active.columns:
                         month_absences = month_active[month_active['compAdd'] == 'Vắng mặt'].copy()
-                        month_absences['reason_category'] = month_absences['Reason Description'].apply(categorize_reason)
+                        month_absences['reason_category'] = month_absences['Reason Description'].astype(object).apply(categorize_reason)
 
                         month_reason_counts = month_absences['reason_category'].value_counts().to_dict()
                         monthly_reason_data[month_str] = {
@@ -691,7 +854,7 @@ class CompleteDashboardBuilder:
         LEGACY: Collect team data based on position_1st (동적 그룹화)
         Kept for rollback purposes only
         """
-        data = self.collector.load_month_data(self.target_month)
+        data = self.collector.load_month_data(self.target_month, sources=DASHBOARD_SOURCES)
         df = data.get('basic_manpower', pd.DataFrame())
         attendance_df = data.get('attendance', pd.DataFrame())
 
@@ -709,16 +872,9 @@ class CompleteDashboardBuilder:
             position_2nd = str(row.get('QIP POSITION 2ND  NAME', ''))
             position_3rd = str(row.get('QIP POSITION 3RD  NAME', ''))
 
-            boss_id = ''
-            if 'MST direct boss name' in row and pd.notna(row['MST direct boss name']):
-                boss_val = row['MST direct boss name']
-                try:
-                    boss_id = str(int(float(boss_val)))
-                except (ValueError, TypeError):
-                    boss_id = str(boss_val).replace('.0', '')
-
-            if boss_id in ['nan', '0', '', 'None']:
-                boss_id = ''
+            # MST direct boss name holds the boss's Employee No (nullable Int64 by the schema)
+            boss_val = row.get('MST direct boss name')
+            boss_id = str(boss_val) if pd.notna(boss_val) and boss_val != 0 else ''
 
             if position_1st and position_1st != 'nan':
                 if position_1st not in team_data:
@@ -762,7 +918,7 @@ class CompleteDashboardBuilder:
         중요: 대상 월 파일은 누적 개념 - 모든 직원의 입사일/퇴사일 포함
         """
         # Load target month data (cumulative file with all employee history)
-        data = self.collector.load_month_data(self.target_month)
+        data = self.collector.load_month_data(self.target_month, sources=DASHBOARD_SOURCES)
         df = data.get('basic_manpower', pd.DataFrame())
         attendance_df = data.get('attendance', pd.DataFrame())
 
@@ -853,16 +1009,9 @@ class CompleteDashboardBuilder:
                 continue
 
             # Extract boss_id
-            boss_id = ''
-            if 'MST direct boss name' in row and pd.notna(row['MST direct boss name']):
-                boss_val = row['MST direct boss name']
-                try:
-                    boss_id = str(int(float(boss_val)))
-                except (ValueError, TypeError):
-                    boss_id = str(boss_val).replace('.0', '')
-
-            if boss_id in ['nan', '0', '', 'None']:
-                boss_id = ''
+            # MST direct boss name holds the boss's Employee No (nullable Int64 by the schema)
+            boss_val = row.get('MST direct boss name')
+            boss_id = str(boss_val) if pd.notna(boss_val) and boss_val != 0 else ''
 
             # Get pregnant status
             pregnant_status = row.get('pregnant vacation-yes or no', '')
@@ -972,7 +1121,7 @@ class CompleteDashboardBuilder:
         print(f"📅 Loading previous month data: {previous_month}")
 
         # Load previous month data
-        data = self.collector.load_month_data(previous_month)
+        data = self.collector.load_month_data(previous_month, sources=DASHBOARD_SOURCES)
         df = data.get('basic_manpower', pd.DataFrame())
         attendance_df = data.get('attendance', pd.DataFrame())
 
@@ -1084,7 +1233,7 @@ class CompleteDashboardBuilder:
         모든 월의 팀별 인원 계산 (employee_counter 유틸리티 사용)
         """
         # Load target month data (contains all employee history)
-        data = self.collector.load_month_data(self.target_month)
+        data = self.collector.load_month_data(self.target_month, sources=['basic_manpower'])
         df = data.get('basic_manpower', pd.DataFrame())
 
         if df.empty:
@@ -1312,7 +1461,7 @@ class CompleteDashboardBuilder:
         Returns:
             List of root nodes with recursive children
         """
-        data = self.collector.load_month_data(self.target_month)
+        data = self.collector.load_month_data(self.target_month, sources=DASHBOARD_SOURCES)
         df = data.get('basic_manpower', pd.DataFrame())
         attendance_df = data.get('attendance', pd.DataFrame())
 
@@ -1332,18 +1481,9 @@ class CompleteDashboardBuilder:
             if not employee_no or employee_no == 'nan':
                 continue
 
-            # Boss ID - MST direct boss name is actually Employee No stored as float
-            boss_id = ''
-            if 'MST direct boss name' in row and pd.notna(row['MST direct boss name']):
-                boss_val = row['MST direct boss name']
-                # Convert float to int to string (e.g., 620070050.0 -> "620070050")
-                try:
-                    boss_id = str(int(float(boss_val)))
-                except (ValueError, TypeError):
-                    boss_id = str(boss_val).replace('.0', '')
-
-            if boss_id in ['nan', '0', '', 'None']:
-                boss_id = ''
+            # MST direct boss name holds the boss's Employee No (nullable Int64 by the schema)
+            boss_val = row.get('MST direct boss name')
+            boss_id = str(boss_val) if pd.notna(boss_val) and boss_val != 0 else ''
 
             employee_map[employee_no] = {
                 'id': employee_no,
@@ -1398,12 +1538,14 @@ class CompleteDashboardBuilder:
 
         return root_nodes
 
-    def _convert_to_json_serializable(self, obj):
+    @staticmethod
+    def _convert_to_json_serializable(obj):
         """Convert numpy types to Python native types for JSON serialization"""
+        convert = CompleteDashboardBuilder._convert_to_json_serializable
         if isinstance(obj, dict):
-            return {k: self._convert_to_json_serializable(v) for k, v in obj.items()}
+            return {k: convert(v) for k, v in obj.items()}
         elif isinstance(obj, list):
-            return [self._convert_to_json_serializable(item) for item in obj]
+            return [convert(item) for item in obj]
         elif isinstance(obj, (np.integer, np.int64)):
             return int(obj)
         elif isinstance(obj, (np.floating, np.float64)):
@@ -1418,7 +1560,8 @@ class CompleteDashboardBuilder:
         else:
             return obj
 
-    def _safe_json_dumps(self, obj, **kwargs):
+    @staticmethod
+    def _safe_json_dumps(obj, **kwargs):
         """Safe JSON dumps with automatic NaN handling"""
         def default_handler(o):
             # Handle pandas/numpy types
@@ -1438,7 +1581,7 @@ class CompleteDashboardBuilder:
                 raise TypeError(f"Object of type {type(o)} is not JSON serializable")
 
         # First convert with our method, then use json.dumps with default handler
-        converted = self._convert_to_json_serializable(obj)
+        converted = CompleteDashboardBuilder._convert_to_json_serializable(obj)
         return json.dumps(converted, default=default_handler, **kwargs)
 
     def _collect_attendance_data(self) -> None:
@@ -1581,7 +1724,46 @@ class CompleteDashboardBuilder:
             except Exception as e:
                 continue
 
-        self.attendance_data = records
+        self.attendance_data, self.attendance_offsets = self._index_attendance_records(records)
+
+    @staticmethod
+    def _index_attendance_records(records: List[Dict[str, Any]]) -> tuple:
+        """
+        Sort attendance records by employee and date and build an offset table
+        출결 기록을 직원·날짜순으로 정렬하고 오프셋 테이블 생성
+
+        An employee's records become the contiguous slice
+        records[start:end], so the dashboard opens one person without
+        scanning every employee-day.
+        한 직원의 기록은 records[start:end] 연속 구간이 되어 전체 스캔 없이 조회됩니다.
+
+        Args:
+            records: Attendance records from _collect_attendance_data() / 출결 기록
+
+        Returns:
+            tuple: (sorted records, {employee_no: [start, end]}) / (정렬된 기록, 직원별 오프셋)
+        """
+        if not records:
+            return [], {}
+
+        work_dates = pd.to_datetime(
+            pd.Series([record['work_date'] for record in records]).str.replace('.', '-', regex=False),
+            errors='coerce'
+        )
+        # Unparseable dates go last within the employee / 파싱 불가 날짜는 직원 내 마지막
+        date_keys = work_dates.fillna(pd.Timestamp.max).tolist()
+        order = sorted(range(len(records)), key=lambda i: (records[i]['employee_no'], date_keys[i]))
+        sorted_records = [records[i] for i in order]
+
+        offsets: Dict[str, List[int]] = {}
+        for position, record in enumerate(sorted_records):
+            employee_no = record['employee_no']
+            if employee_no in offsets:
+                offsets[employee_no][1] = position + 1
+            else:
+                offsets[employee_no] = [position, position + 1]
+
+        return sorted_records, offsets
 
     def _generate_html(self) -> str:
         """Generate complete HTML with all components"""
@@ -1642,13 +1824,10 @@ class CompleteDashboardBuilder:
 {self._embed_chart_utils()}
     </script>
 
-    <!-- D3.js for Treemap -->
-    <script src="https://d3js.org/d3.v7.min.js"
-            crossorigin="anonymous"></script>
-
-    <!-- Plotly.js for Sunburst Chart -->
-    <script src="https://cdn.plot.ly/plotly-2.26.0.min.js"
-            crossorigin="anonymous"></script>
+    <!-- D3.js (treemaps, org network) and Plotly.js (sunburst) are loaded on first use by LibraryLoader -->
+    <!-- D3.js(트리맵, 조직 네트워크)와 Plotly.js(선버스트)는 LibraryLoader가 처음 사용할 때 로드 -->
+    <link rel="preconnect" href="https://d3js.org" crossorigin>
+    <link rel="preconnect" href="https://cdn.plot.ly" crossorigin>
 
     {self._generate_css()}
 </head>
@@ -1762,6 +1941,15 @@ class CompleteDashboardBuilder:
         const targetMonth = '{self.target_month}';
         const employeeDetails =
 {self._safe_json_dumps(self.employee_details, ensure_ascii=False, indent=2)}
+;
+        const employeeFilterIndex =
+{self._safe_json_dumps(self.employee_filter_index, ensure_ascii=False, separators=(',', ':'))}
+;
+        const employeeSearchIndex =
+{self._safe_json_dumps(self.employee_search_index, ensure_ascii=False, separators=(',', ':'))}
+;
+        const lazyLibrarySources =
+{self._safe_json_dumps(LAZY_VISUALIZATION_LIBRARIES, separators=(',', ':'))}
 ;
         const modalData =
 {self._safe_json_dumps(self.modal_data, ensure_ascii=False, indent=2)}
@@ -1780,10 +1968,20 @@ class CompleteDashboardBuilder:
 ;
         const attendanceData =
 {self._safe_json_dumps(self.attendance_data, ensure_ascii=False, indent=2)}
+;
+        const attendanceOffsets =
+{self._safe_json_dumps(self.attendance_offsets, ensure_ascii=False, separators=(',', ':'))}
 ;
 
         {self._generate_javascript()}
     </script>
+    <script>
+        // Offline cache when served from docs/ (no-op for file:// and app.html iframes)
+        // docs/에서 제공될 때 오프라인 캐시 (file:// 및 app.html iframe에서는 무시)
+        if ('serviceWorker' in navigator && location.protocol.startsWith('http')) {{
+            navigator.serviceWorker.register('sw.js').catch(err => console.warn('Service worker registration failed:', err));
+        }}
+    </script>
 </body>
 </html>"""
         return html
@@ -4337,7 +4535,7 @@ class CompleteDashboardBuilder:
             <span class="nav-title lang-text" data-ko="HR 관리 시스템" data-en="HR Management System" data-vi="Hệ thống quản lý HR">HR 관리 시스템</span>
         </div>
         <div class="nav-links" role="menubar">
-            <a href="selector.html" class="nav-link active" title="HR Dashboard" role="menuitem" aria-current="page">
+            <a href="selector.html" target="_top" class="nav-link active" title="HR Dashboard" role="menuitem" aria-current="page">
                 <span class="nav-link-icon" aria-hidden="true">👥</span>
                 <span class="nav-link-text lang-text" data-ko="HR 대시보드" data-en="HR Dashboard" data-vi="Bảng điều khiển HR">HR 대시보드</span>
             </a>
@@ -6309,8 +6507,8 @@ class CompleteDashboardBuilder:
             <div class="row align-items-end">
                 <div class="col-md-6">
                     <label for="attendanceEmployeeSearch" class="form-label">
-                        <span class="lang-text" data-ko="사원번호 입력" data-en="Enter Employee Number" data-vi="Nhập mã nhân viên">
-                            사원번호 입력
+                        <span class="lang-text" data-ko="사원번호 또는 이름 입력" data-en="Enter Employee Number or Name" data-vi="Nhập mã hoặc tên nhân viên">
+                            사원번호 또는 이름 입력
                         </span>
                     </label>
                     <div class="input-group">
@@ -7339,13 +7537,13 @@ class CompleteDashboardBuilder:
         enhanced_modals = []
 
         # Get current month data
-        month_data = self.collector.load_month_data(self.target_month)
+        month_data = self.collector.load_month_data(self.target_month, sources=DASHBOARD_SOURCES)
         current_data = month_data.get('basic_manpower', pd.DataFrame())
 
         # Get historical data
         historical_data = {}
         for month in self.available_months:
-            month_dict = self.collector.load_month_data(month)
+            month_dict = self.collector.load_month_data(month, sources=['basic_manpower'])
             historical_data[month] = month_dict.get('basic_manpower', pd.DataFrame())
 
         # Get attendance data
@@ -8168,7 +8366,7 @@ class CompleteDashboardBuilder:
                 <h6 class="mb-3">팀원 목록</h6>
                 <div class="table-responsive">
                     <table class="table table-sm table-hover">
-                        <thead class="table-light">
+                        <thead class="table-light sticky-top">
                             <tr>
                                 <th scope="col">사번</th>
                                 <th scope="col">이름</th>
@@ -8530,6 +8728,8 @@ class CompleteDashboardBuilder:
         """Generate JavaScript for charts, interactivity, and modal management"""
         # Use string concatenation to set initial language from Python
         # 파이썬에서 초기 언어를 설정하기 위해 문자열 결합 사용
+        virtual_scroll = VirtualScrollGenerator()
+        dashboard_worker = DashboardWorkerGenerator()
         return f"""
 // ============================================
 // Debug Mode & Security Utilities
@@ -8544,6 +8744,67 @@ function debugLog(...args) {{
     if (DEBUG_MODE) console.log(...args);
 }}
 
+// ============================================
+// Lazy library loader (D3.js / Plotly.js)
+// 지연 라이브러리 로더 (D3.js / Plotly.js)
+// ============================================
+
+const LibraryLoader = {{
+    loading: {{}},
+
+    /**
+     * Load a library by its window global, trying each source in order (CDN, then vendor copy).
+     * Resolves true once the global exists, false if every source failed.
+     * 전역 이름으로 라이브러리 로드 (CDN → vendor 사본 순서로 시도).
+     * 전역 객체가 생기면 true, 모든 경로가 실패하면 false로 resolve.
+     */
+    load: function(globalName) {{
+        if (window[globalName]) return Promise.resolve(true);
+        if (this.loading[globalName]) return this.loading[globalName];
+
+        const sources = lazyLibrarySources[globalName] || [];
+        const tryLoad = (index) => {{
+            if (index >= sources.length) {{
+                console.warn(`Failed to load ${{globalName}} / ${{globalName}} 로드 실패`);
+                delete this.loading[globalName];
+                return Promise.resolve(false);
+            }}
+            return new Promise(resolve => {{
+                const script = document.createElement('script');
+                script.src = sources[index];
+                if (/^https?:/.test(sources[index])) script.crossOrigin = 'anonymous';
+                script.onload = () => resolve(Boolean(window[globalName]));
+                script.onerror = () => {{
+                    script.remove();
+                    resolve(false);
+                }};
+                document.head.appendChild(script);
+            }}).then(loaded => loaded || tryLoad(index + 1));
+        }};
+
+        debugLog(`📦 Loading ${{globalName}} on first use`);
+        this.loading[globalName] = tryLoad(0);
+        return this.loading[globalName];
+    }},
+
+    /**
+     * Run fn(...args) after the library has loaded (or failed; fn shows its own fallback)
+     * 라이브러리 로드 후 fn(...args) 실행 (실패 시 fn이 자체 안내 메시지 표시)
+     */
+    run: function(globalName, fn, ...args) {{
+        return this.load(globalName).then(() => fn(...args));
+    }}
+}};
+
+// Windowed rendering for the Employee Details, attendance and team member tables
+// 직원 상세, 출결, 팀원 테이블용 가상 스크롤 렌더링
+{virtual_scroll.get_virtual_scroll_js()}
+{virtual_scroll.get_integration_code()}
+
+// Off-main-thread aggregation and CSV export (Blob Web Worker)
+// 메인 스레드 밖에서 집계 및 CSV 내보내기 (Blob 웹 워커)
+{dashboard_worker.get_worker_js()}
+
 // HTML sanitization to prevent XSS
 // XSS 방지를 위한 HTML 새니타이징
 function sanitizeHTML(str) {{
@@ -9732,8 +9993,6 @@ function renderHierarchyBarChart() {{
     const ctx = document.getElementById('hierarchyBarChart');
     if (!ctx) return;
 
-    if (hierarchyBarChartInstance) hierarchyBarChartInstance.destroy();
-
     const labels = Object.keys(hierarchyChartData.position1);
     const data = Object.values(hierarchyChartData.position1);
     const total = data.reduce((a, b) => a + b, 0);
@@ -9743,7 +10002,7 @@ function renderHierarchyBarChart() {{
         '#9966FF', '#FF9F40', '#FF6384', '#C9CBCF'
     ];
 
-    hierarchyBarChartInstance = new Chart(ctx, {{
+    hierarchyBarChartInstance = renderChart(hierarchyBarChartInstance, ctx, {{
         type: 'bar',
         data: {{
             labels: labels,
@@ -9788,6 +10047,12 @@ function renderHierarchySunburstChart() {{
     const container = document.getElementById('hierarchySunburstChart');
     if (!container) return;
 
+    // Check if Plotly is available
+    if (typeof Plotly === 'undefined') {{
+        container.innerHTML = '<div style="padding: 40px; text-align: center; color: #999;">Plotly 라이브러리를 로드할 수 없습니다.</div>';
+        return;
+    }}
+
     const labels = [];
     const parents = [];
     const values = [];
@@ -9927,12 +10192,10 @@ function renderHierarchyDonutCharts() {{
     // Donut 1: Position 1 distribution
     const ctx1 = document.getElementById('hierarchyDonutChart1');
     if (ctx1) {{
-        if (hierarchyDonutChart1Instance) hierarchyDonutChart1Instance.destroy();
-
         const labels1 = Object.keys(hierarchyChartData.position1);
         const data1 = Object.values(hierarchyChartData.position1);
 
-        hierarchyDonutChart1Instance = new Chart(ctx1, {{
+        hierarchyDonutChart1Instance = renderChart(hierarchyDonutChart1Instance, ctx1, {{
             type: 'doughnut',
             data: {{
                 labels: labels1,
@@ -9983,8 +10246,6 @@ function renderHierarchyDonutCharts() {{
     // Donut 2: Position 2 distribution
     const ctx2 = document.getElementById('hierarchyDonutChart2');
     if (ctx2) {{
-        if (hierarchyDonutChart2Instance) hierarchyDonutChart2Instance.destroy();
-
         const labels2 = Object.keys(hierarchyChartData.position2);
         const data2 = Object.values(hierarchyChartData.position2);
 
@@ -9998,7 +10259,7 @@ function renderHierarchyDonutCharts() {{
             colors2.push(baseColors[i % baseColors.length] + (i < 8 ? '' : '99'));
         }}
 
-        hierarchyDonutChart2Instance = new Chart(ctx2, {{
+        hierarchyDonutChart2Instance = renderChart(hierarchyDonutChart2Instance, ctx2, {{
             type: 'doughnut',
             data: {{
                 labels: labels2,
@@ -10048,7 +10309,8 @@ function renderHierarchyDonutCharts() {{
 // Initialize all hierarchy charts
 function initializeHierarchyCharts() {{
     renderHierarchyBarChart();
-    renderHierarchySunburstChart();
+    // Sunburst (Plotly) is rendered when its pill is first shown
+    // 선버스트(Plotly)는 해당 탭이 처음 표시될 때 렌더링
     renderHierarchyDonutCharts();
     renderTeamSummaryCards();
 }}
@@ -10332,7 +10594,7 @@ document.querySelectorAll('#hierarchyChartTabs button').forEach(button => {{
         const targetId = e.target.getAttribute('data-bs-target');
         if (targetId === '#sunburstChartView') {{
             // Slight delay to ensure container is visible
-            setTimeout(renderHierarchySunburstChart, 100);
+            setTimeout(() => LibraryLoader.run('Plotly', renderHierarchySunburstChart), 100);
         }}
     }});
 }});
@@ -10409,7 +10671,7 @@ function getMetricKeyForChart(chartId, datasetIndex) {
 }
 
 // Chart 1: Employee Trend
-trendCharts.employeeTrend = new Chart(document.getElementById('employeeTrendChart'), {
+trendCharts.employeeTrend = renderChart(trendCharts.employeeTrend, document.getElementById('employeeTrendChart'), {
     type: 'line',
     data: {
         labels: monthLabels,
@@ -10430,7 +10692,7 @@ trendCharts.employeeTrend = new Chart(document.getElementById('employeeTrendChar
 });
 
 // Chart 2: Hires vs Resignations vs Maternity Leave
-trendCharts.hiresResignations = new Chart(document.getElementById('hiresResignationsChart'), {
+trendCharts.hiresResignations = renderChart(trendCharts.hiresResignations, document.getElementById('hiresResignationsChart'), {
     type: 'bar',
     data: {
         labels: monthLabels,
@@ -10492,7 +10754,7 @@ trendCharts.hiresResignations = new Chart(document.getElementById('hiresResignat
 });
 
 // Chart 3: Resignation Rate
-trendCharts.resignationRate = new Chart(document.getElementById('resignationRateChart'), {
+trendCharts.resignationRate = renderChart(trendCharts.resignationRate, document.getElementById('resignationRateChart'), {
     type: 'line',
     data: {
         labels: monthLabels,
@@ -10519,7 +10781,7 @@ trendCharts.resignationRate = new Chart(document.getElementById('resignationRate
 });
 
 // Chart 4: Long-term Employees
-trendCharts.longTerm = new Chart(document.getElementById('longTermChart'), {
+trendCharts.longTerm = renderChart(trendCharts.longTerm, document.getElementById('longTermChart'), {
     type: 'bar',
     data: {
         labels: monthLabels,
@@ -10539,7 +10801,7 @@ trendCharts.longTerm = new Chart(document.getElementById('longTermChart'), {
 });
 
 // Chart 5: Unauthorized Absence Rate (Mixed: Bar + Target Line)
-trendCharts.unauthorizedAbsence = new Chart(document.getElementById('unauthorizedAbsenceChart'), {
+trendCharts.unauthorizedAbsence = renderChart(trendCharts.unauthorizedAbsence, document.getElementById('unauthorizedAbsenceChart'), {
     type: 'bar',
     data: {
         labels: monthLabels,
@@ -10598,7 +10860,7 @@ trendCharts.unauthorizedAbsence = new Chart(document.getElementById('unauthorize
 });
 
 // Chart 6: Absence Rate (with Maternity Leave comparison)
-trendCharts.absenceRate = new Chart(document.getElementById('absenceRateChart'), {
+trendCharts.absenceRate = renderChart(trendCharts.absenceRate, document.getElementById('absenceRateChart'), {
     type: 'line',
     data: {
         labels: monthLabels,
@@ -10680,71 +10942,12 @@ trendCharts.absenceRate = new Chart(document.getElementById('absenceRateChart'),
 // ============================================
 
 let modalCharts = {{}};
-let chartLoadState = {{}}; // Track which charts have been loaded
-let observerInstance = null; // Intersection Observer for lazy loading
-
-/**
- * Performance Optimization: Lazy Loading with Intersection Observer
- * 차트가 뷰포트에 진입할 때만 렌더링하여 초기 로딩 성능 개선
- */
-function initLazyChartLoading() {{
-    if ('IntersectionObserver' in window) {{
-        const options = {{
-            root: null,
-            rootMargin: '50px', // Load 50px before entering viewport
-            threshold: 0.01 // Trigger when 1% visible
-        }};
 
-        observerInstance = new IntersectionObserver((entries, observer) => {{
-            entries.forEach(entry => {{
-                if (entry.isIntersecting) {{
-                    const chartContainer = entry.target;
-                    const modalId = chartContainer.dataset.modalId;
-                    const kpiKey = chartContainer.dataset.kpiKey;
-
-                    if (modalId && kpiKey && !chartLoadState[modalId]) {{
-                        debugLog(`🔍 Lazy loading charts for modal: ${{modalId}}`);
-                        const modalNum = parseInt(modalId.replace('kpiModal', ''));
-                        createUnifiedModalCharts(modalNum, kpiKey);
-                        chartLoadState[modalId] = true;
-                        observer.unobserve(chartContainer);
-                    }}
-                }}
-            }});
-        }}, options);
-
-        // Observe all modal chart containers
-        document.querySelectorAll('.modal-chart-container[data-modal-id]').forEach(container => {{
-            observerInstance.observe(container);
-        }});
-    }}
-}}
-
-/**
- * Destroy all charts in a modal to free memory
- * 모달 닫을 때 차트 인스턴스 제거하여 메모리 최적화
- */
-function destroyModalCharts(modalNum) {{
-    const chartKeys = [
-        `modal${{modalNum}}_weekly`,
-        `modal${{modalNum}}_teams`,
-        `modal${{modalNum}}_types`,
-        `modal${{modalNum}}_change`,
-        `modal${{modalNum}}_treemap`
-    ];
-
-    chartKeys.forEach(key => {{
-        if (modalCharts[key]) {{
-            try {{
-                modalCharts[key].destroy();
-                delete modalCharts[key];
-                debugLog(`🗑️ Destroyed chart: ${{key}}`);
-            }} catch (e) {{
-                debugLog(`Failed to destroy chart ${{key}}:`, e);
-            }}
-        }}
-    }});
-}}
+// Charts are laid out only when their canvas nears the viewport (ChartVisibility plugin in
+// chart_utils.js) and are updated in place by renderChart() when a modal is reopened, so
+// modal charts are kept between opens instead of being destroyed on close.
+// 차트는 캔버스가 화면 근처에 올 때만 그려지며 (chart_utils.js의 ChartVisibility 플러그인),
+// 모달을 다시 열면 renderChart()가 기존 인스턴스를 갱신하므로 닫을 때 제거하지 않습니다.
 
 /**
  * Debounce function for resize events
@@ -10811,7 +11014,7 @@ function createUnifiedModalCharts(modalNum, kpiKey) {{
     createTeamChangeBarChart(modalNum, kpiKey);
 
     // 5 & 6. 팀별 KPI 전월 대비 변화 (Treemap) + 상세 테이블
-    createKPITreemapAndTable(modalNum, kpiKey);
+    LibraryLoader.run('d3', createKPITreemapAndTable, modalNum, kpiKey);
 }}
 
 /**
@@ -10912,13 +11115,9 @@ function createKPIWeeklyTrendChart(modalNum, kpiKey) {{
         return;
     }}
 
-    // Destroy existing chart
     const chartKey = `modal${{modalNum}}_weekly`;
-    if (modalCharts[chartKey]) {{
-        modalCharts[chartKey].destroy();
-    }}
 
-    modalCharts[chartKey] = new Chart(ctx.getContext('2d'), {{
+    modalCharts[chartKey] = renderChart(modalCharts[chartKey], ctx.getContext('2d'), {{
         type: 'line',
         data: {{
             labels: weekLabels,
@@ -11027,7 +11226,7 @@ function createDailyAbsenceChart(modalNum) {{
     const maternityExclTrend = calculateTrendLine(absenceRatesExclMaternity);
 
     // Create chart (excl. maternity only)
-    modalCharts[canvasId] = new Chart(canvas, {{
+    modalCharts[canvasId] = renderChart(modalCharts[canvasId], canvas, {{
         type: 'line',
         data: {{
             labels: labels,
@@ -11160,7 +11359,7 @@ function createAbsenceReasonDistributionChart() {{
         '#C7CEEA'   // Other - Light Blue
     ];
 
-    modalCharts['modal2_reasonDistribution'] = new Chart(canvas, {{
+    modalCharts['modal2_reasonDistribution'] = renderChart(modalCharts['modal2_reasonDistribution'], canvas, {{
         type: 'doughnut',
         data: {{
             labels: reasons,
@@ -11263,7 +11462,7 @@ function createAbsenceReasonTrendsChart() {{
         borderColor: '#fff'
     }}));
 
-    modalCharts['modal2_reasonTrends'] = new Chart(canvas, {{
+    modalCharts['modal2_reasonTrends'] = renderChart(modalCharts['modal2_reasonTrends'], canvas, {{
         type: 'bar',
         data: {{
             labels: months.map(m => {{
@@ -11369,7 +11568,7 @@ function createTeamAbsenceReasonsChart() {{
         borderColor: '#fff'
     }}));
 
-    modalCharts['modal2_teamReasons'] = new Chart(canvas, {{
+    modalCharts['modal2_teamReasons'] = renderChart(modalCharts['modal2_teamReasons'], canvas, {{
         type: 'bar',
         data: {{
             labels: teams,
@@ -11447,9 +11646,6 @@ function createTeamDistributionChart(modalNum, kpiKey) {{
     }}
 
     const chartKey = `modal${{modalNum}}_teams`;
-    if (modalCharts[chartKey]) {{
-        modalCharts[chartKey].destroy();
-    }}
 
     // Special handling for absence_rate - show grouped bar with maternity exclusion
     if (kpiKey === 'absence_rate' || kpiKey === 'absence_rate_excl_maternity') {{
@@ -11457,7 +11653,7 @@ function createTeamDistributionChart(modalNum, kpiKey) {{
         const regularData = extractTeamKPIData('absence_rate');
         const maternityExclData = extractTeamKPIData('absence_rate_excl_maternity');
 
-        modalCharts[chartKey] = new Chart(ctx.getContext('2d'), {{
+        modalCharts[chartKey] = renderChart(modalCharts[chartKey], ctx.getContext('2d'), {{
             type: 'bar',
             data: {{
                 labels: teamNames,
@@ -11512,7 +11708,7 @@ function createTeamDistributionChart(modalNum, kpiKey) {{
         }});
     }} else {{
         // Original single bar chart for other KPIs
-        modalCharts[chartKey] = new Chart(ctx.getContext('2d'), {{
+        modalCharts[chartKey] = renderChart(modalCharts[chartKey], ctx.getContext('2d'), {{
             type: 'bar',
             data: {{
                 labels: teamNames,
@@ -11631,12 +11827,9 @@ function createTypeBreakdownChart(modalNum, kpiKey) {{
     }}
 
     const chartKey = `modal${{modalNum}}_types`;
-    if (modalCharts[chartKey]) {{
-        modalCharts[chartKey].destroy();
-    }}
 
     // Create line chart for trend visualization
-    modalCharts[chartKey] = new Chart(ctx.getContext('2d'), {{
+    modalCharts[chartKey] = renderChart(modalCharts[chartKey], ctx.getContext('2d'), {{
         type: 'line',
         data: {{
             labels: monthLabels,
@@ -11749,9 +11942,6 @@ function createTeamChangeBarChart(modalNum, kpiKey) {{
     }}
 
     const chartKey = `modal${{modalNum}}_change`;
-    if (modalCharts[chartKey]) {{
-        modalCharts[chartKey].destroy();
-    }}
 
     // Get month labels
     const metricsArray = Object.entries(monthlyMetrics)
@@ -11764,7 +11954,7 @@ function createTeamChangeBarChart(modalNum, kpiKey) {{
     const currentMonthLabel = parseInt(currentMonth.month.split('-')[1]) + '월';
     const prevMonthLabel = previousMonth ? parseInt(previousMonth.month.split('-')[1]) + '월' : '';
 
-    modalCharts[chartKey] = new Chart(ctx.getContext('2d'), {{
+    modalCharts[chartKey] = renderChart(modalCharts[chartKey], ctx.getContext('2d'), {{
         type: 'bar',
         data: {{
             labels: teamNames,
@@ -12648,9 +12838,9 @@ function createTeamDetailCharts(teamName, kpiKey) {{
     // Create all 6 charts
     createTeamMonthlyTrendChart(teamName, kpiKey);
     createTeamWeeklyTrendChart(teamName, kpiKey);
-    createTeamRoleTreemap(teamName, kpiKey);  // Changed from Donut to Treemap
+    LibraryLoader.run('d3', createTeamRoleTreemap, teamName, kpiKey);  // Changed from Donut to Treemap
     createTeamRoleBarChart(teamName, kpiKey);
-    createTeamSunburstChart(teamName, kpiKey);
+    LibraryLoader.run('Plotly', createTeamSunburstChart, teamName, kpiKey);
     createTeamMembersTable(teamName, kpiKey);
 }}
 
@@ -12668,10 +12858,9 @@ function createTeamMonthlyTrendChart(teamName, kpiKey) {{
     document.getElementById('teamDetailChart1Title').textContent = `월별 ${{teamName}} ${{config.nameKo}} 트렌드 (최근 6개월)`;
 
     // Destroy existing chart
-    if (teamDetailCharts['monthly']) teamDetailCharts['monthly'].destroy();
 
     const ctx = document.getElementById('teamDetailChart_monthly');
-    teamDetailCharts['monthly'] = new Chart(ctx, {{
+    teamDetailCharts['monthly'] = renderChart(teamDetailCharts['monthly'], ctx, {{
         type: 'line',
         data: {{
             labels: labels,
@@ -12729,10 +12918,9 @@ function createTeamWeeklyTrendChart(teamName, kpiKey) {{
     document.getElementById('teamDetailChart2Title').textContent = `주차별 ${{teamName}} ${{config.nameKo}} 트렌드 (20주)`;
 
     // Destroy existing chart
-    if (teamDetailCharts['weekly']) teamDetailCharts['weekly'].destroy();
 
     const ctx = document.getElementById('teamDetailChart_weekly');
-    teamDetailCharts['weekly'] = new Chart(ctx, {{
+    teamDetailCharts['weekly'] = renderChart(teamDetailCharts['weekly'], ctx, {{
         type: 'line',
         data: {{
             labels: labels,
@@ -13214,10 +13402,9 @@ function createTeamRoleBarChart(teamName, kpiKey) {{
     document.getElementById('teamDetailChart4Title').textContent = `${{teamName}} 역할별 ${{config.nameKo}} 현황`;
 
     // Destroy existing chart
-    if (teamDetailCharts['roleBar']) teamDetailCharts['roleBar'].destroy();
 
     const ctx = document.getElementById('teamDetailChart_roleBar');
-    teamDetailCharts['roleBar'] = new Chart(ctx, {{
+    teamDetailCharts['roleBar'] = renderChart(teamDetailCharts['roleBar'], ctx, {{
         type: 'bar',
         data: {{
             labels: labels,
@@ -13675,13 +13862,8 @@ function sortTeamMemberTable(header, columnIndex) {{
 
 // Modal 1: Total Employees
 function showModal1() {{
-    // Destroy existing charts
-    if (modalCharts['modal1_monthly']) modalCharts['modal1_monthly'].destroy();
-    if (modalCharts['modal1_weekly']) modalCharts['modal1_weekly'].destroy();
-    if (modalCharts['modal1_teams']) modalCharts['modal1_teams'].destroy();
-
     // Show modal
-    const modal = new bootstrap.Modal(document.getElementById('modal1'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal1'));
     modal.show();
 
     // Create charts after modal is shown
@@ -13803,12 +13985,7 @@ function createEnhancedTotalEmployeesCharts() {
 
     const ctx2 = document.getElementById('modalChart1_teams').getContext('2d');
 
-    // Destroy existing chart if it exists to prevent stuck tooltips
-    if (modalCharts['modal1_teams']) {
-        modalCharts['modal1_teams'].destroy();
-    }
-
-    modalCharts['modal1_teams'] = new Chart(ctx2, {
+    modalCharts['modal1_teams'] = renderChart(modalCharts['modal1_teams'], ctx2, {
         type: 'bar',
         data: {
             labels: teamNames,
@@ -13891,12 +14068,7 @@ function createEnhancedTotalEmployeesCharts() {
 
         const ctx4 = document.getElementById('modalChart1_change').getContext('2d');
 
-        // Destroy existing chart if it exists to prevent stuck tooltips
-        if (modalCharts['modal1_change']) {
-            modalCharts['modal1_change'].destroy();
-        }
-
-        modalCharts['modal1_change'] = new Chart(ctx4, {
+        modalCharts['modal1_change'] = renderChart(modalCharts['modal1_change'], ctx4, {
             type: 'bar',
             data: {
                 labels: teamNames,
@@ -13975,7 +14147,7 @@ function createEnhancedTotalEmployeesCharts() {
     }
 
     // 5. Treemap Chart and Comparison Table
-    createTreemapAndTable();
+    LibraryLoader.run('d3', createTreemapAndTable);
 }
 
 function createTreemapAndTable() {{
@@ -14838,15 +15010,8 @@ function showTeamDetailModal(teamName, kpiKey) {{
         return;
     }}
 
-    // Destroy existing charts
-    Object.keys(teamDetailCharts).forEach(key => {{
-        if (teamDetailCharts[key] && typeof teamDetailCharts[key].destroy === 'function') {{
-            teamDetailCharts[key].destroy();
-        }}
-    }});
-
     // Show modal
-    const modal = new bootstrap.Modal(document.getElementById('teamDetailModal'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('teamDetailModal'));
     modal.show();
 
     // Create charts after modal is shown (delay for rendering)
@@ -15069,12 +15234,6 @@ function sortTeamTable(columnIndex, cleanName) {
 // Modal 2: Absence Rate
 // Modal 2: Absence Rate (Unified)
 function showModal2() {{
-    // Destroy existing charts
-    ['weekly', 'daily', 'teams', 'types', 'change', 'reasonDistribution', 'reasonTrends', 'teamReasons'].forEach(type => {{
-        const chartKey = `modal2_${{type}}`;
-        if (modalCharts[chartKey]) modalCharts[chartKey].destroy();
-    }});
-
     // Populate summary metrics (excl. maternity only)
     if (modalData.absence_metrics) {{
         const metrics = modalData.absence_metrics;
@@ -15084,7 +15243,7 @@ function showModal2() {{
     }}
 
     // Show modal
-    const modal = new bootstrap.Modal(document.getElementById('modal2'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal2'));
     modal.show();
 
     // Create charts after modal is shown (all using excl. maternity data)
@@ -15101,12 +15260,6 @@ function showModal2() {{
 
 // Modal 3: Unauthorized Absence (Unified)
 function showModal3() {{
-    // Clear existing charts
-    ['trend', 'diverging', 'donut'].forEach(type => {{
-        const chartKey = `modal3_${{type}}`;
-        if (modalCharts[chartKey]) modalCharts[chartKey].destroy();
-    }});
-
     // Get team-level unauthorized rates from metrics
     const currentMonth = Object.keys(monthlyMetrics).sort().pop();
     const previousMonth = Object.keys(monthlyMetrics).sort()[Object.keys(monthlyMetrics).length - 2];
@@ -15156,7 +15309,7 @@ function showModal3() {{
         populateTeamDetailTable(teamRates, prevTeamRates);
     }}, 300);
 
-    const modal = new bootstrap.Modal(document.getElementById('modal3'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal3'));
     modal.show();
 }}
 
@@ -15168,7 +15321,7 @@ function createUnauthorizedTrendChart() {{
     const months = Object.keys(monthlyMetrics).sort();
     const trendData = months.map(month => monthlyMetrics[month]?.unauthorized_absence_rate || 0);
 
-    modalCharts['modal3_trend'] = new Chart(ctx, {{
+    modalCharts['modal3_trend'] = renderChart(modalCharts['modal3_trend'], ctx, {{
         type: 'line',
         data: {{
             labels: months.map(m => {{
@@ -15213,7 +15366,7 @@ function createDivergingBarChart(teamRates, avgRate) {{
     const deviations = teams.map(team => (teamRates[team] - avgRate).toFixed(2));
     const colors = deviations.map(d => d > 0 ? 'rgba(255, 99, 132, 0.8)' : 'rgba(75, 192, 192, 0.8)');
 
-    modalCharts['modal3_diverging'] = new Chart(ctx, {{
+    modalCharts['modal3_diverging'] = renderChart(modalCharts['modal3_diverging'], ctx, {{
         type: 'bar',
         data: {{
             labels: teams,
@@ -15274,7 +15427,7 @@ function createAbsenceTypeDonut() {{
     document.getElementById('type3Count').textContent = type3Count;
     document.getElementById('type3Rate').textContent = ((type3Count/total)*100).toFixed(1) + '%';
 
-    modalCharts['modal3_donut'] = new Chart(ctx, {{
+    modalCharts['modal3_donut'] = renderChart(modalCharts['modal3_donut'], ctx, {{
         type: 'doughnut',
         data: {{
             labels: ['무단결근', '병가', '승인결근'],
@@ -15335,27 +15488,14 @@ function populateTeamDetailTable(teamRates, prevTeamRates) {{
 
 // Modal 4: Resignation Rate (Unified)
 function showModal4() {{
-    ['weekly', 'teams', 'types', 'change'].forEach(type => {{
-        const chartKey = `modal4_${{type}}`;
-        if (modalCharts[chartKey]) modalCharts[chartKey].destroy();
-    }});
-    const modal = new bootstrap.Modal(document.getElementById('modal4'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal4'));
     modal.show();
     setTimeout(() => {{ createUnifiedModalCharts(4, 'resignation_rate'); }}, 300);
 }}
 
 // Modal 5: Recent Hires (Custom Comprehensive Analysis)
 function showModal5() {{
-    // Clear existing charts
-    ['recentHiresMonthlyTrend', 'recentHiresWeeklyTrend', 'recentHiresDailyTrend',
-     'recentHiresAbsence', 'recentHiresReasons', 'recentHiresRetention', 'recentHiresTeam'].forEach(chartKey => {{
-        if (modalCharts[chartKey]) {{
-            modalCharts[chartKey].destroy();
-            delete modalCharts[chartKey];
-        }}
-    }});
-
-    const modal = new bootstrap.Modal(document.getElementById('modal5'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal5'));
     modal.show();
 
     // Create comprehensive analysis after modal is shown
@@ -15497,7 +15637,7 @@ function createRecentHiresAbsenceChart(recentHires) {{
     const overallAbsenceRate = monthlyMetrics[targetMonth]?.absence_rate?.toFixed(1) || 0;
     const overallUnauthorizedRate = monthlyMetrics[targetMonth]?.unauthorized_absence_rate?.toFixed(1) || 0;
 
-    modalCharts.recentHiresAbsence = new Chart(ctx, {{
+    modalCharts.recentHiresAbsence = renderChart(modalCharts.recentHiresAbsence, ctx, {{
         type: 'bar',
         data: {{
             labels: ['총 결근율', '무단 결근율'],
@@ -15571,7 +15711,7 @@ function createRecentHiresReasonsChart(recentHires) {{
     const labels = Object.keys(categories);
     const data = Object.values(categories);
 
-    modalCharts.recentHiresReasons = new Chart(ctx, {{
+    modalCharts.recentHiresReasons = renderChart(modalCharts.recentHiresReasons, ctx, {{
         type: 'doughnut',
         data: {{
             labels: labels,
@@ -15648,7 +15788,7 @@ function createRecentHiresRetentionChart(recentHires) {{
     // 전체 인원 (90일 이내 입사자 기준)
     const total = employeesUnder90Days.length;
 
-    modalCharts.recentHiresRetention = new Chart(ctx, {{
+    modalCharts.recentHiresRetention = renderChart(modalCharts.recentHiresRetention, ctx, {{
         type: 'bar',
         data: {{
             labels: ['0-30일', '31-60일', '61-90일', '90일+', '재직중'],
@@ -15737,7 +15877,7 @@ function createRecentHiresTeamChart(recentHires) {{
     const labels = sortedTeams.map(t => t[0]);
     const data = sortedTeams.map(t => t[1]);
 
-    modalCharts.recentHiresTeam = new Chart(ctx, {{
+    modalCharts.recentHiresTeam = renderChart(modalCharts.recentHiresTeam, ctx, {{
         type: 'bar',
         data: {{
             labels: labels,
@@ -15866,7 +16006,7 @@ function createRecentHiresMonthlyTrendChart() {{
         return `${{year}}년 ${{parseInt(month)}}월`;
     }});
 
-    modalCharts.recentHiresMonthlyTrend = new Chart(ctx, {{
+    modalCharts.recentHiresMonthlyTrend = renderChart(modalCharts.recentHiresMonthlyTrend, ctx, {{
         type: 'line',
         data: {{
             labels: labels,
@@ -15947,7 +16087,7 @@ function createRecentHiresWeeklyTrendChart() {{
         weekLabels.push(`W${{i + 1}}`);
     }}
 
-    modalCharts.recentHiresWeeklyTrend = new Chart(ctx, {{
+    modalCharts.recentHiresWeeklyTrend = renderChart(modalCharts.recentHiresWeeklyTrend, ctx, {{
         type: 'line',
         data: {{
             labels: weekLabels,
@@ -16015,7 +16155,7 @@ function createRecentHiresDailyTrendChart() {{
         dayLabels.push(`${{day}}일`);
     }}
 
-    modalCharts.recentHiresDailyTrend = new Chart(ctx, {{
+    modalCharts.recentHiresDailyTrend = renderChart(modalCharts.recentHiresDailyTrend, ctx, {{
         type: 'bar',
         data: {{
             labels: dayLabels,
@@ -16062,91 +16202,56 @@ function createRecentHiresDailyTrendChart() {{
 
 // Modal 6: Recent Resignations (Unified)
 function showModal6() {{
-    ['weekly', 'teams', 'types', 'change'].forEach(type => {{
-        const chartKey = `modal6_${{type}}`;
-        if (modalCharts[chartKey]) modalCharts[chartKey].destroy();
-    }});
-    const modal = new bootstrap.Modal(document.getElementById('modal6'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal6'));
     modal.show();
     setTimeout(() => {{ createUnifiedModalCharts(6, 'recent_resignations'); }}, 300);
 }}
 
 // Modal 7: Under 60 Days (Unified)
 function showModal7() {{
-    ['weekly', 'teams', 'types', 'change'].forEach(type => {{
-        const chartKey = `modal7_${{type}}`;
-        if (modalCharts[chartKey]) modalCharts[chartKey].destroy();
-    }});
-    const modal = new bootstrap.Modal(document.getElementById('modal7'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal7'));
     modal.show();
     setTimeout(() => {{ createUnifiedModalCharts(7, 'under_60_days'); }}, 300);
 }}
 
 // Modal 8: Post-Assignment Resignations (Unified)
 function showModal8() {{
-    ['weekly', 'teams', 'types', 'change'].forEach(type => {{
-        const chartKey = `modal8_${{type}}`;
-        if (modalCharts[chartKey]) modalCharts[chartKey].destroy();
-    }});
-    const modal = new bootstrap.Modal(document.getElementById('modal8'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal8'));
     modal.show();
     setTimeout(() => {{ createUnifiedModalCharts(8, 'post_assignment_resignations'); }}, 300);
 }}
 
 // Modal 9: Perfect Attendance (Unified)
 function showModal9() {{
-    ['weekly', 'teams', 'types', 'change'].forEach(type => {{
-        const chartKey = `modal9_${{type}}`;
-        if (modalCharts[chartKey]) modalCharts[chartKey].destroy();
-    }});
-    const modal = new bootstrap.Modal(document.getElementById('modal9'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal9'));
     modal.show();
     setTimeout(() => {{ createUnifiedModalCharts(9, 'perfect_attendance'); }}, 300);
 }}
 
 // Modal 10: Long-term Employees (Unified)
 function showModal10() {{
-    ['weekly', 'teams', 'types', 'change'].forEach(type => {{
-        const chartKey = `modal10_${{type}}`;
-        if (modalCharts[chartKey]) modalCharts[chartKey].destroy();
-    }});
-    const modal = new bootstrap.Modal(document.getElementById('modal10'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal10'));
     modal.show();
     setTimeout(() => {{ createUnifiedModalCharts(10, 'long_term_employees'); }}, 300);
 }}
 
 // Modal 11: Data Errors (Unified)
 function showModal11() {{
-    ['weekly', 'teams', 'types', 'change'].forEach(type => {{
-        const chartKey = `modal11_${{type}}`;
-        if (modalCharts[chartKey]) modalCharts[chartKey].destroy();
-    }});
-    const modal = new bootstrap.Modal(document.getElementById('modal11'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal11'));
     modal.show();
     setTimeout(() => {{ createUnifiedModalCharts(11, 'data_errors'); }}, 300);
 }}
 
 // Modal 12: Pregnant Employees (Unified)
 function showModal12() {{
-    ['weekly', 'teams', 'types', 'change'].forEach(type => {{
-        const chartKey = `modal12_${{type}}`;
-        if (modalCharts[chartKey]) modalCharts[chartKey].destroy();
-    }});
-    const modal = new bootstrap.Modal(document.getElementById('modal12'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal12'));
     modal.show();
     setTimeout(() => {{ createUnifiedModalCharts(12, 'pregnant_employees'); }}, 300);
 }}
 
 // Modal 13: Team Absence Breakdown (팀별 결근 분석)
 function showModal13() {{
-    // Destroy existing charts
-    // 기존 차트 제거
-    ['totalRate', 'comparison', 'days', 'authorizedBreakdown'].forEach(type => {{
-        const chartKey = `modal13_${{type}}`;
-        if (modalCharts[chartKey]) modalCharts[chartKey].destroy();
-    }});
-
-    const modal = new bootstrap.Modal(document.getElementById('modal13'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal13'));
     modal.show();
 
     setTimeout(() => {{
@@ -16175,7 +16280,7 @@ function showModal13() {{
 
         // Chart 1: Total Absence Rate by Team (Bar Chart)
         // 차트 1: 팀별 전체 결근율 (막대 차트)
-        modalCharts['modal13_totalRate'] = new Chart(document.getElementById('modalChart13_totalRate'), {{
+        modalCharts['modal13_totalRate'] = renderChart(modalCharts['modal13_totalRate'], document.getElementById('modalChart13_totalRate'), {{
             type: 'bar',
             data: {{
                 labels: teams,
@@ -16223,7 +16328,7 @@ function showModal13() {{
 
         // Chart 2: Unauthorized vs Authorized by Team (Grouped Bar Chart)
         // 차트 2: 팀별 무단 vs 승인 결근율 (그룹 막대 차트)
-        modalCharts['modal13_comparison'] = new Chart(document.getElementById('modalChart13_comparison'), {{
+        modalCharts['modal13_comparison'] = renderChart(modalCharts['modal13_comparison'], document.getElementById('modalChart13_comparison'), {{
             type: 'bar',
             data: {{
                 labels: teams,
@@ -16286,7 +16391,7 @@ function showModal13() {{
         const unauthorizedDays = teams.map(t => teamData[t].unauthorized_days || 0);
         const authorizedDays = teams.map(t => teamData[t].authorized_days || 0);
 
-        modalCharts['modal13_days'] = new Chart(document.getElementById('modalChart13_days'), {{
+        modalCharts['modal13_days'] = renderChart(modalCharts['modal13_days'], document.getElementById('modalChart13_days'), {{
             type: 'bar',
             data: {{
                 labels: teams,
@@ -16349,7 +16454,7 @@ function showModal13() {{
         const sickLeaveDays = teams.map(t => teamData[t].authorized_breakdown?.sick_leave_days || 0);
         const otherAuthorizedDays = teams.map(t => teamData[t].authorized_breakdown?.other_authorized_days || 0);
 
-        modalCharts['modal13_authorizedBreakdown'] = new Chart(document.getElementById('modalChart13_authorizedBreakdown'), {{
+        modalCharts['modal13_authorizedBreakdown'] = renderChart(modalCharts['modal13_authorizedBreakdown'], document.getElementById('modalChart13_authorizedBreakdown'), {{
             type: 'bar',
             data: {{
                 labels: teams,
@@ -16429,13 +16534,7 @@ function showModal13() {{
 // ============================================
 
 function showModal14() {{
-    // Destroy existing charts / 기존 차트 제거
-    ['comparison', 'team'].forEach(type => {{
-        const chartKey = `modal14_${{type}}`;
-        if (modalCharts[chartKey]) modalCharts[chartKey].destroy();
-    }});
-
-    const modal = new bootstrap.Modal(document.getElementById('modal14'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal14'));
     modal.show();
 
     setTimeout(() => {{
@@ -16458,7 +16557,7 @@ function showModal14() {{
         const comeLate = punctualityData.come_late_total || 0;
         const leaveEarly = punctualityData.leave_early_total || 0;
 
-        modalCharts['modal14_comparison'] = new Chart(document.getElementById('modalChart14_comparison'), {{
+        modalCharts['modal14_comparison'] = renderChart(modalCharts['modal14_comparison'], document.getElementById('modalChart14_comparison'), {{
             type: 'doughnut',
             data: {{
                 labels: [
@@ -16692,7 +16791,7 @@ function showIssueSummaryModal(type, index) {{
 
     // Show modal
     // 모달 표시
-    const modal = new bootstrap.Modal(document.getElementById('issueSummaryModal'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('issueSummaryModal'));
     modal.show();
 }}
 
@@ -16771,25 +16870,25 @@ function getActionSuggestions(issueType, lang) {{
 
 // Show enhanced resignation rate modal
 function showEnhancedResignationModal() {{
-    const modal = new bootstrap.Modal(document.getElementById('modal_resignation_enhanced'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal_resignation_enhanced'));
     modal.show();
 }}
 
 // Show enhanced absence rate modal
 function showEnhancedAbsenceModal() {{
-    const modal = new bootstrap.Modal(document.getElementById('modal_absence_enhanced'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal_absence_enhanced'));
     modal.show();
 }}
 
 // Show enhanced unauthorized absence modal
 function showEnhancedUnauthorizedModal() {{
-    const modal = new bootstrap.Modal(document.getElementById('modal_unauthorized_enhanced'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal_unauthorized_enhanced'));
     modal.show();
 }}
 
 // Show enhanced early resignation modal
 function showEnhancedEarlyResignationModal() {{
-    const modal = new bootstrap.Modal(document.getElementById('modal_early_resignation_enhanced'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('modal_early_resignation_enhanced'));
     modal.show();
 }}
 
@@ -16856,7 +16955,7 @@ function updateModalContent(modalNum, teamFilter) {
     let filteredEmployees = employeeDetails;
 
     if (teamFilter && teamFilter !== 'all') {
-        filteredEmployees = employeeDetails.filter(e => e.team_name === teamFilter);
+        filteredEmployees = getIndexedEmployees(`team:${{teamFilter}}`);
     }
 
     const tbody = document.getElementById(`modalTableBody${modalNum}`);
@@ -17149,6 +17248,109 @@ function updateSortIndicators() {{
     }});
 }}
 
+// Employee Details row HTML (rendered through the table's virtual scroller)
+// 직원 상세 행 HTML (테이블 가상 스크롤러를 통해 렌더링)
+function createEmployeeRowHtml(emp) {
+    // Improved tenure display: years/months format for better readability
+    // 재직기간 표시 개선: 가독성을 위해 년/월 형식으로 표시
+    const tenureDays = emp.tenure_days || 0;
+    const tenureYears = Math.floor(tenureDays / 365);
+    const tenureMonths = Math.floor((tenureDays % 365) / 30);
+    let tenureDisplay = '-';
+    if (tenureDays > 0) {
+        if (tenureYears >= 1) {
+            tenureDisplay = tenureMonths > 0 ? `${tenureYears}년 ${tenureMonths}개월` : `${tenureYears}년`;
+        } else if (tenureMonths >= 1) {
+            tenureDisplay = `${tenureMonths}개월`;
+        } else {
+            tenureDisplay = `${tenureDays}일`;
+        }
+    }
+
+    // Determine row class based on employee status
+    let rowClass = '';
+    if (emp.resigned_this_month) rowClass = 'row-resigned';
+    else if (emp.hired_this_month) rowClass = 'row-new';
+    else if (emp.perfect_attendance) rowClass = 'row-perfect';
+    else if (emp.is_active) rowClass = 'row-active';
+
+    if (selectedEmployees.has(emp.employee_id)) {
+        rowClass += ' row-selected';
+    }
+
+    // Status badges with multilingual support (uses currentLanguage)
+    // 다국어 지원 상태 배지 (currentLanguage 사용)
+    const badgeText = (ko, en, vi) => {{
+        const texts = {{ ko, en, vi }};
+        return texts[currentLanguage] || ko;
+    }};
+
+    let statusBadges = [];
+    if (emp.is_active) {{
+        statusBadges.push(`<span class="badge bg-success badge-status lang-badge" data-ko="재직" data-en="Active" data-vi="Đang làm">${{badgeText('재직', 'Active', 'Đang làm')}}</span>`);
+    }} else {{
+        statusBadges.push(`<span class="badge bg-secondary badge-status lang-badge" data-ko="퇴사" data-en="Resigned" data-vi="Nghỉ việc">${{badgeText('퇴사', 'Resigned', 'Nghỉ việc')}}</span>`);
+    }}
+    if (emp.hired_this_month) {{
+        statusBadges.push(`<span class="badge bg-info badge-status lang-badge" data-ko="신입" data-en="New" data-vi="Mới">${{badgeText('신입', 'New', 'Mới')}}</span>`);
+    }}
+    if (emp.perfect_attendance) {{
+        statusBadges.push(`<span class="badge bg-primary badge-status lang-badge" data-ko="개근" data-en="Perfect" data-vi="Hoàn hảo">${{badgeText('개근', 'Perfect', 'Hoàn hảo')}}</span>`);
+    }}
+    if (emp.long_term) {{
+        statusBadges.push(`<span class="badge bg-warning text-dark badge-status lang-badge" data-ko="장기" data-en="Long-term" data-vi="Lâu năm">${{badgeText('장기', 'Long-term', 'Lâu năm')}}</span>`);
+    }}
+    if (emp.is_pregnant) {{
+        statusBadges.push(`<span class="badge bg-danger badge-status lang-badge" data-ko="임신" data-en="Pregnant" data-vi="Mang thai">${{badgeText('임신', 'Pregnant', 'Mang thai')}}</span>`);
+    }}
+    if (emp.under_60_days) {{
+        statusBadges.push(`<span class="badge bg-light text-dark badge-status lang-badge" data-ko="60일미만" data-en="<60 Days" data-vi="<60 Ngày">${{badgeText('60일미만', '<60 Days', '<60 Ngày')}}</span>`);
+    }}
+
+    // P2-1: Add turnover risk indicator
+    // P2-1: 이직 위험 지표 추가
+    const riskBadge = getTurnoverRiskBadge(emp, currentLanguage);
+    if (riskBadge) {{
+        statusBadges.push(riskBadge);
+    }}
+
+    const isChecked = selectedEmployees.has(emp.employee_id) ? 'checked' : '';
+
+    // Attendance data with visual indicators
+    // 출결 데이터 시각적 표시
+    const workingDays = emp.working_days || 0;
+    const absentDays = emp.absent_days || 0;
+    const unauthorizedDays = emp.unauthorized_absent_days || 0;
+
+    // Absent days badge color based on count
+    const absentBadgeClass = absentDays === 0 ? 'bg-success' : (absentDays >= 3 ? 'bg-danger' : 'bg-warning text-dark');
+    const unauthorizedBadgeClass = unauthorizedDays === 0 ? 'bg-light text-muted' : 'bg-danger';
+
+    // Apply search highlighting to searchable fields
+    // 검색 가능한 필드에 검색 하이라이팅 적용
+    const hl = (val) => currentSearchTerm ? highlightText(val, currentSearchTerm) : (val || '');
+
+    return `
+        <tr class="${rowClass}">
+            <td onclick="event.stopPropagation()"><input type="checkbox" class="employee-checkbox" value="${emp.employee_id}" ${isChecked} onchange="toggleEmployeeSelection('${emp.employee_id}')"></td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${hl(emp.employee_id)}</td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${hl(emp.employee_name)}</td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${hl(emp.position)}</td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;"><span class="badge bg-light text-dark">${hl(emp.role_type)}</span></td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${hl(emp.building)}</td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${hl(emp.line)}</td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${hl(emp.boss_name)}</td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${workingDays}</td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;"><span class="badge ${absentBadgeClass}">${absentDays}</span></td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;"><span class="badge ${unauthorizedBadgeClass}">${unauthorizedDays}</span></td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${emp.entrance_date || ''}</td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${emp.stop_date || '-'}</td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${tenureDisplay}</td>
+            <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${statusBadges.join(' ')}</td>
+        </tr>
+    `;
+}
+
 function renderEmployeeTable(employees = null) {
     const tbody = document.getElementById('employeeTableBody');
     if (!tbody) return;
@@ -17175,115 +17377,16 @@ function renderEmployeeTable(employees = null) {
     document.getElementById('nextPageBtn').disabled = currentPage >= totalPages || pageSize === -1;
 
     if (displayEmployees.length === 0) {
+        getTableScroller('employeeTableBody', createEmployeeRowHtml).updateData([]);
         tbody.innerHTML = '<tr><td colspan="15" class="text-center text-muted py-4">직원이 없습니다.</td></tr>';
         updateEmployeeCount(0);
         updateQuickStats([]);
         return;
     }
 
-    let html = '';
-    displayEmployees.forEach(emp => {
-        // Improved tenure display: years/months format for better readability
-        // 재직기간 표시 개선: 가독성을 위해 년/월 형식으로 표시
-        const tenureDays = emp.tenure_days || 0;
-        const tenureYears = Math.floor(tenureDays / 365);
-        const tenureMonths = Math.floor((tenureDays % 365) / 30);
-        let tenureDisplay = '-';
-        if (tenureDays > 0) {
-            if (tenureYears >= 1) {
-                tenureDisplay = tenureMonths > 0 ? `${tenureYears}년 ${tenureMonths}개월` : `${tenureYears}년`;
-            } else if (tenureMonths >= 1) {
-                tenureDisplay = `${tenureMonths}개월`;
-            } else {
-                tenureDisplay = `${tenureDays}일`;
-            }
-        }
-
-        // Determine row class based on employee status
-        let rowClass = '';
-        if (emp.resigned_this_month) rowClass = 'row-resigned';
-        else if (emp.hired_this_month) rowClass = 'row-new';
-        else if (emp.perfect_attendance) rowClass = 'row-perfect';
-        else if (emp.is_active) rowClass = 'row-active';
-
-        if (selectedEmployees.has(emp.employee_id)) {
-            rowClass += ' row-selected';
-        }
-
-        // Status badges with multilingual support (uses currentLanguage)
-        // 다국어 지원 상태 배지 (currentLanguage 사용)
-        const badgeText = (ko, en, vi) => {{
-            const texts = {{ ko, en, vi }};
-            return texts[currentLanguage] || ko;
-        }};
-
-        let statusBadges = [];
-        if (emp.is_active) {{
-            statusBadges.push(`<span class="badge bg-success badge-status lang-badge" data-ko="재직" data-en="Active" data-vi="Đang làm">${{badgeText('재직', 'Active', 'Đang làm')}}</span>`);
-        }} else {{
-            statusBadges.push(`<span class="badge bg-secondary badge-status lang-badge" data-ko="퇴사" data-en="Resigned" data-vi="Nghỉ việc">${{badgeText('퇴사', 'Resigned', 'Nghỉ việc')}}</span>`);
-        }}
-        if (emp.hired_this_month) {{
-            statusBadges.push(`<span class="badge bg-info badge-status lang-badge" data-ko="신입" data-en="New" data-vi="Mới">${{badgeText('신입', 'New', 'Mới')}}</span>`);
-        }}
-        if (emp.perfect_attendance) {{
-            statusBadges.push(`<span class="badge bg-primary badge-status lang-badge" data-ko="개근" data-en="Perfect" data-vi="Hoàn hảo">${{badgeText('개근', 'Perfect', 'Hoàn hảo')}}</span>`);
-        }}
-        if (emp.long_term) {{
-            statusBadges.push(`<span class="badge bg-warning text-dark badge-status lang-badge" data-ko="장기" data-en="Long-term" data-vi="Lâu năm">${{badgeText('장기', 'Long-term', 'Lâu năm')}}</span>`);
-        }}
-        if (emp.is_pregnant) {{
-            statusBadges.push(`<span class="badge bg-danger badge-status lang-badge" data-ko="임신" data-en="Pregnant" data-vi="Mang thai">${{badgeText('임신', 'Pregnant', 'Mang thai')}}</span>`);
-        }}
-        if (emp.under_60_days) {{
-            statusBadges.push(`<span class="badge bg-light text-dark badge-status lang-badge" data-ko="60일미만" data-en="<60 Days" data-vi="<60 Ngày">${{badgeText('60일미만', '<60 Days', '<60 Ngày')}}</span>`);
-        }}
-
-        // P2-1: Add turnover risk indicator
-        // P2-1: 이직 위험 지표 추가
-        const riskBadge = getTurnoverRiskBadge(emp, currentLanguage);
-        if (riskBadge) {{
-            statusBadges.push(riskBadge);
-        }}
-
-        const isChecked = selectedEmployees.has(emp.employee_id) ? 'checked' : '';
-
-        // Attendance data with visual indicators
-        // 출결 데이터 시각적 표시
-        const workingDays = emp.working_days || 0;
-        const absentDays = emp.absent_days || 0;
-        const unauthorizedDays = emp.unauthorized_absent_days || 0;
-
-        // Absent days badge color based on count
-        const absentBadgeClass = absentDays === 0 ? 'bg-success' : (absentDays >= 3 ? 'bg-danger' : 'bg-warning text-dark');
-        const unauthorizedBadgeClass = unauthorizedDays === 0 ? 'bg-light text-muted' : 'bg-danger';
-
-        // Apply search highlighting to searchable fields
-        // 검색 가능한 필드에 검색 하이라이팅 적용
-        const hl = (val) => currentSearchTerm ? highlightText(val, currentSearchTerm) : (val || '');
-
-        html += `
-            <tr class="${rowClass}">
-                <td onclick="event.stopPropagation()"><input type="checkbox" class="employee-checkbox" value="${emp.employee_id}" ${isChecked} onchange="toggleEmployeeSelection('${emp.employee_id}')"></td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${hl(emp.employee_id)}</td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${hl(emp.employee_name)}</td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${hl(emp.position)}</td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;"><span class="badge bg-light text-dark">${hl(emp.role_type)}</span></td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${hl(emp.building)}</td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${hl(emp.line)}</td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${hl(emp.boss_name)}</td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${workingDays}</td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;"><span class="badge ${absentBadgeClass}">${absentDays}</span></td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;"><span class="badge ${unauthorizedBadgeClass}">${unauthorizedDays}</span></td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${emp.entrance_date || ''}</td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${emp.stop_date || '-'}</td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${tenureDisplay}</td>
-                <td onclick="showEmployeeDetailModal('${emp.employee_id}')" style="cursor: pointer;">${statusBadges.join(' ')}</td>
-            </tr>
-        `;
-    });
-
-    tbody.innerHTML = html;
+    // Render through the virtual scroller: only visible rows reach the DOM
+    // 가상 스크롤러로 렌더링: 보이는 행만 DOM에 추가
+    getTableScroller('employeeTableBody', createEmployeeRowHtml).updateData(displayEmployees);
     updateEmployeeCount(filteredEmployees.length);
     updateQuickStats(filteredEmployees);
 }
@@ -17295,9 +17398,19 @@ function toggleEmployeeSelection(employeeId) {
         selectedEmployees.add(employeeId);
     }
     updateSelectionUI();
-    renderEmployeeTable(filteredEmployees);
+    getTableScroller('employeeTableBody', createEmployeeRowHtml).redraw();
 }
 
+// Rows/count of a precomputed filter index key ('flag:active', 'team:ASSEMBLY', ...)
+// 미리 계산된 필터 인덱스 키의 행 목록/개수
+function getIndexedEmployees(key) {{
+    return (employeeFilterIndex[key] || []).map(i => employeeDetails[i]);
+}}
+
+function countIndexedEmployees(key) {{
+    return (employeeFilterIndex[key] || []).length;
+}}
+
 function filterEmployees(filter) {
     currentFilter = filter;
 
@@ -17335,19 +17448,19 @@ function filterEmployees(filter) {
 
     switch(filter) {{
         case 'all': filtered = employeeDetails; filterName = 'all employees'; break;
-        case 'active': filtered = employeeDetails.filter(e => e.is_active); filterName = 'active employees'; break;
-        case 'hired': filtered = employeeDetails.filter(e => e.hired_this_month); filterName = 'new hires'; break;
-        case 'resigned': filtered = employeeDetails.filter(e => e.resigned_this_month); filterName = 'resigned employees'; break;
-        case 'perfect': filtered = employeeDetails.filter(e => e.perfect_attendance); filterName = 'perfect attendance'; break;
-        case 'absent': filtered = employeeDetails.filter(e => e.absent_days > 0); filterName = 'employees with absences'; break;
-        case 'unauthorized': filtered = employeeDetails.filter(e => e.has_unauthorized_absence); filterName = 'unauthorized absences'; break;
-        case 'longterm': filtered = employeeDetails.filter(e => e.long_term); filterName = 'long-term employees'; break;
-        case 'new60': filtered = employeeDetails.filter(e => e.under_60_days); filterName = 'employees under 60 days'; break;
-        case 'pregnant': filtered = employeeDetails.filter(e => e.is_pregnant); filterName = 'pregnant employees'; break;
+        case 'active': filtered = getIndexedEmployees('flag:active'); filterName = 'active employees'; break;
+        case 'hired': filtered = getIndexedEmployees('flag:hired'); filterName = 'new hires'; break;
+        case 'resigned': filtered = getIndexedEmployees('flag:resigned'); filterName = 'resigned employees'; break;
+        case 'perfect': filtered = getIndexedEmployees('flag:perfect'); filterName = 'perfect attendance'; break;
+        case 'absent': filtered = getIndexedEmployees('flag:absent'); filterName = 'employees with absences'; break;
+        case 'unauthorized': filtered = getIndexedEmployees('flag:unauthorized'); filterName = 'unauthorized absences'; break;
+        case 'longterm': filtered = getIndexedEmployees('flag:longterm'); filterName = 'long-term employees'; break;
+        case 'new60': filtered = getIndexedEmployees('flag:new60'); filterName = 'employees under 60 days'; break;
+        case 'pregnant': filtered = getIndexedEmployees('flag:pregnant'); filterName = 'pregnant employees'; break;
         // Bug Fix: Added long_absence and data_error cases
         // 버그 수정: long_absence와 data_error 케이스 추가
-        case 'long_absence': filtered = employeeDetails.filter(e => e.absent_days >= 5); filterName = 'employees with 5+ absent days'; break;
-        case 'data_error': filtered = employeeDetails.filter(e => e.has_data_error); filterName = 'employees with data errors'; break;
+        case 'long_absence': filtered = getIndexedEmployees('flag:long_absence'); filterName = 'employees with 5+ absent days'; break;
+        case 'data_error': filtered = getIndexedEmployees('flag:data_error'); filterName = 'employees with data errors'; break;
         // New: Turnover risk filter / 새로운: 이탈 위험 필터
         case 'turnover_risk':
             filtered = employeeDetails.filter(e => {{
@@ -17499,15 +17612,15 @@ function updateFilterCounts() {{
     }};
 
     safeUpdate('countAll', employeeDetails.length);
-    safeUpdate('countActive', employeeDetails.filter(e => e.is_active).length);
-    safeUpdate('countHired', employeeDetails.filter(e => e.hired_this_month).length);
-    safeUpdate('countResigned', employeeDetails.filter(e => e.resigned_this_month).length);
-    safeUpdate('countPerfect', employeeDetails.filter(e => e.perfect_attendance).length);
-    safeUpdate('countAbsent', employeeDetails.filter(e => e.absent_days > 0).length);
-    safeUpdate('countUnauthorized', employeeDetails.filter(e => e.has_unauthorized_absence).length);
-    safeUpdate('countLongTerm', employeeDetails.filter(e => e.long_term).length);
-    safeUpdate('countNew60', employeeDetails.filter(e => e.under_60_days).length);
-    safeUpdate('countPregnant', employeeDetails.filter(e => e.is_pregnant).length);
+    safeUpdate('countActive', countIndexedEmployees('flag:active'));
+    safeUpdate('countHired', countIndexedEmployees('flag:hired'));
+    safeUpdate('countResigned', countIndexedEmployees('flag:resigned'));
+    safeUpdate('countPerfect', countIndexedEmployees('flag:perfect'));
+    safeUpdate('countAbsent', countIndexedEmployees('flag:absent'));
+    safeUpdate('countUnauthorized', countIndexedEmployees('flag:unauthorized'));
+    safeUpdate('countLongTerm', countIndexedEmployees('flag:longterm'));
+    safeUpdate('countNew60', countIndexedEmployees('flag:new60'));
+    safeUpdate('countPregnant', countIndexedEmployees('flag:pregnant'));
 
     // New: Turnover risk count / 새로운: 이탈 위험 카운트
     const turnoverRiskCount = employeeDetails.filter(e => {{
@@ -17531,6 +17644,38 @@ function highlightText(text, searchTerm) {{
     return safeText.replace(regex, '<mark class="search-highlight">$1</mark>');
 }}
 
+// Lowercase and strip diacritics, matching fold_search_text() on the Python side
+// 소문자 변환 및 성조 제거 (Python의 fold_search_text()와 동일)
+function foldSearchText(text) {{
+    return String(text).toLowerCase().normalize('NFD').replace(/[\\u0300-\\u036f]/g, '').replace(/đ/g, 'd');
+}}
+
+// Row ids of employees having a token that starts with every query word, or null for an empty query
+// 모든 검색 단어로 시작하는 토큰을 가진 직원의 행 번호 (빈 검색어는 null)
+function lookupEmployeeSearchIndex(query) {{
+    const words = foldSearchText(query).split(/[^\\p{{L}}\\p{{N}}]+/u).filter(Boolean);
+    if (words.length === 0) return null;
+
+    let result = null;
+    for (const word of words) {{
+        // Binary search for the first token >= word / word 이상인 첫 토큰 이진 탐색
+        let lo = 0, hi = employeeSearchIndex.length;
+        while (lo < hi) {{
+            const mid = (lo + hi) >> 1;
+            if (employeeSearchIndex[mid][0] < word) lo = mid + 1; else hi = mid;
+        }}
+
+        const rows = new Set();
+        for (let i = lo; i < employeeSearchIndex.length && employeeSearchIndex[i][0].startsWith(word); i++) {{
+            employeeSearchIndex[i][1].forEach(rowId => rows.add(rowId));
+        }}
+
+        result = result === null ? rows : new Set([...result].filter(rowId => rows.has(rowId)));
+        if (result.size === 0) break;
+    }}
+    return Array.from(result).sort((a, b) => a - b);
+}}
+
 function searchEmployees() {{
     // Search employees by multiple fields (ID, Name, Position, Type, Building, Line)
     // 여러 필드로 직원 검색 (사번, 이름, 직급, 유형, 건물, 라인)
@@ -17546,17 +17691,10 @@ function searchEmployees() {{
         return;
     }}
 
-    const filtered = employeeDetails.filter(emp => {{
-        return (
-            (emp.employee_id && emp.employee_id.toLowerCase().includes(searchTerm)) ||
-            (emp.employee_name && emp.employee_name.toLowerCase().includes(searchTerm)) ||
-            (emp.position && emp.position.toLowerCase().includes(searchTerm)) ||
-            (emp.role_type && emp.role_type.toLowerCase().includes(searchTerm)) ||
-            (emp.building && emp.building.toLowerCase().includes(searchTerm)) ||
-            (emp.line && emp.line.toLowerCase().includes(searchTerm)) ||
-            (emp.boss_name && emp.boss_name.toLowerCase().includes(searchTerm))
-        );
-    }});
+    // Word-prefix lookup in the precomputed search index (diacritics-insensitive)
+    // 미리 계산된 검색 인덱스에서 단어 접두사 조회 (성조 무시)
+    const rowIds = lookupEmployeeSearchIndex(searchTerm);
+    const filtered = rowIds === null ? employeeDetails : rowIds.map(i => employeeDetails[i]);
 
     renderEmployeeTable(filtered);
 }}
@@ -17859,7 +17997,7 @@ function showEmployeeDetailModal(employeeId) {
     document.getElementById('empDetailAttendanceInfo').innerHTML = additionalInfo;
 
     // Show the modal
-    const modal = new bootstrap.Modal(document.getElementById('employeeDetailModal'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('employeeDetailModal'));
     modal.show();
 }
 
@@ -18248,20 +18386,17 @@ function changePageSize() {
 
 function toggleSelectAll() {
     const headerCheckbox = document.getElementById('headerCheckbox');
-    const checkboxes = document.querySelectorAll('.employee-checkbox');
+    const scroller = getTableScroller('employeeTableBody', createEmployeeRowHtml);
 
+    // Select from the scroller's backing rows, not only the rows currently in the DOM
+    // DOM에 있는 행뿐 아니라 스크롤러의 전체 행에서 선택
     if (headerCheckbox.checked) {
-        checkboxes.forEach(cb => {
-            cb.checked = true;
-            selectedEmployees.add(cb.value);
-        });
+        scroller.state.filteredData.forEach(emp => selectedEmployees.add(emp.employee_id));
     } else {
-        checkboxes.forEach(cb => {
-            cb.checked = false;
-        });
         selectedEmployees.clear();
     }
 
+    scroller.redraw();
     updateSelectionUI();
 }
 
@@ -18314,18 +18449,21 @@ function printSelected() {
     debugLog(`Printing ${selectedEmployees.size} selected employees`);
 }
 
+let quickStatsRequest = 0;
+
 function updateQuickStats(employees) {
     if (!employees || !employees.length) return;
 
-    const active = employees.filter(e => e.is_active).length;
-    const resigned = employees.filter(e => e.resigned_this_month).length;
-    const absentCount = employees.filter(e => (e.absent_days || 0) > 0).length;
-    const unauthorizedCount = employees.filter(e => e.has_unauthorized_absence).length;
-
-    document.getElementById('statsShowing').textContent = employees.length;
-    document.getElementById('statsActiveResigned').textContent = `${active}/${resigned}`;
-    document.getElementById('statsAbsentCount').textContent = `${absentCount}명`;
-    document.getElementById('statsUnauthorizedCount').textContent = `${unauthorizedCount}명`;
+    // Aggregate in the dashboard worker; ignore replies superseded by a newer filter
+    // 대시보드 워커에서 집계하며, 더 최신 필터로 대체된 응답은 무시
+    const requestId = ++quickStatsRequest;
+    DashboardWorker.request('summary', { rowIds: DashboardWorker.rowIdsOf(employees) }).then(stats => {
+        if (requestId !== quickStatsRequest) return;
+        document.getElementById('statsShowing').textContent = stats.count;
+        document.getElementById('statsActiveResigned').textContent = `${stats.active}/${stats.resigned}`;
+        document.getElementById('statsAbsentCount').textContent = `${stats.absent}명`;
+        document.getElementById('statsUnauthorizedCount').textContent = `${stats.unauthorized}명`;
+    });
 }
 
 function populateTeamFilter() {
@@ -18366,8 +18504,8 @@ document.addEventListener('DOMContentLoaded', function() {
 
     debugLog('🚀 Initializing Phase 3 optimizations...');
 
-    // 1. Initialize Lazy Chart Loading with Intersection Observer
-    initLazyChartLoading();
+    // 1. Visible-only chart rendering is registered by chart_utils.js (ChartVisibility)
+    // 1. 화면에 보이는 차트만 렌더링 - chart_utils.js에서 등록 (ChartVisibility)
 
     // 2. Initialize Organization Chart
     const orgTab = document.getElementById('org-tab');
@@ -18383,18 +18521,6 @@ document.addEventListener('DOMContentLoaded', function() {
     // 3. Add window resize listener with debounce for responsive charts
     window.addEventListener('resize', handleChartResize);
 
-    // 3. Modal close event listeners to destroy charts and free memory
-    document.querySelectorAll('.modal').forEach(modalEl => {{
-        modalEl.addEventListener('hidden.bs.modal', function() {{
-            const modalId = this.id;
-            const modalNum = parseInt(modalId.replace(/\\D/g, '')); // Extract number from ID
-            if (modalNum) {{
-                destroyModalCharts(modalNum);
-                debugLog(`🗑️ Cleaned up charts for modal ${{modalNum}}`);
-            }}
-        }});
-    }});
-
     // 4. Touch event optimization for mobile devices
     if ('ontouchstart' in window) {{
         debugLog('📱 Touch device detected - enabling mobile optimizations');
@@ -18464,40 +18590,19 @@ function exportToCSV(data = null, filenamePrefix = 'HR_Employees') {{
     const exportData = data || employeeDetails;
     const suffix = data ? '_filtered' : '';
     const filename = `${{filenamePrefix}}${{suffix}}_${{targetMonth}}.csv`;
-    const headers = ['사번,이름,직급,유형,팀,입사일,퇴사일,재직기간(일),출근일,결근일,출근률,상태'];
-
-    const rows = exportData.map(emp => {{
-        const status = [
-            emp.is_active ? '재직' : '퇴사',
-            emp.hired_this_month ? '신입' : '',
-            emp.perfect_attendance ? '개근' : '',
-            emp.long_term ? '장기' : ''
-        ].filter(s => s).join('|');
-
-        return [
-            emp.employee_id || '',
-            emp.employee_name || '',
-            emp.position || '',
-            emp.role_type || '',
-            emp.team_name || '',
-            emp.entrance_date || '',
-            emp.stop_date || '',
-            emp.tenure_days || '0',
-            emp.actual_working_days || '0',
-            emp.absent_days || '0',
-            emp.attendance_rate ? `${{emp.attendance_rate.toFixed(1)}}%` : '',
-            status
-        ].map(field => `"${{field}}"`).join(',');
-    }});
 
-    const csv = headers.concat(rows).join('\\n');
-    downloadFile(csv, filename, 'text/csv;charset=utf-8;');
+    // CSV rows are built in the dashboard worker so large exports don't freeze the page
+    // 대용량 내보내기 시 화면이 멈추지 않도록 대시보드 워커에서 CSV 행 생성
+    const rowIds = data ? DashboardWorker.rowIdsOf(data) : undefined;
+    return DashboardWorker.request('employeeCsv', {{ rowIds }}).then(csv => {{
+        downloadFile(csv, filename, 'text/csv;charset=utf-8;');
 
-    // Show download toast notification
-    // 다운로드 토스트 알림 표시
-    showDownloadToast(filename, exportData.length);
+        // Show download toast notification
+        // 다운로드 토스트 알림 표시
+        showDownloadToast(filename, exportData.length);
 
-    debugLog(`✅ Exported ${{exportData.length}} employees to CSV`);
+        debugLog(`✅ Exported ${{exportData.length}} employees to CSV`);
+    }});
 }}
 
 function exportToJSON(data = null, filenamePrefix = 'HR_Employees') {{
@@ -18614,7 +18719,7 @@ let orgNetworkChart = null;
 // Initialize Organization Chart
 function initOrgChart() {{
     calculateOrgStats();
-    renderOrgNetworkChart();
+    LibraryLoader.run('d3', renderOrgNetworkChart);
 }}
 
 // Calculate organization statistics
@@ -18665,7 +18770,7 @@ function setOrgChartView(viewType) {{
 
     // Render appropriate view
     if (viewType === 'network') {{
-        renderOrgNetworkChart();
+        LibraryLoader.run('d3', renderOrgNetworkChart);
     }} else if (viewType === 'hierarchy') {{
         renderOrgHierarchyTree();
     }} else if (viewType === 'stats') {{
@@ -18680,6 +18785,12 @@ function renderOrgNetworkChart() {{
 
     container.innerHTML = '';
 
+    // Check if D3 is available
+    if (typeof d3 === 'undefined') {{
+        container.innerHTML = '<div style="padding: 40px; text-align: center; color: #999;">D3 라이브러리를 로드할 수 없습니다.</div>';
+        return;
+    }}
+
     const allEmployees = employeeDetails || [];
     if (allEmployees.length === 0) {{
         container.innerHTML = '<p class="text-muted text-center">데이터가 없습니다.</p>';
@@ -18785,7 +18896,7 @@ function renderOrgNetworkChart() {{
 function filterOrgNetwork() {{
     const filterValue = document.getElementById('orgNetworkFilter').value;
     // Re-render with filter (simplified - just re-render for now)
-    renderOrgNetworkChart();
+    LibraryLoader.run('d3', renderOrgNetworkChart);
 }}
 
 // Hierarchy Tree Rendering
@@ -18885,7 +18996,7 @@ function renderPositionDistChart() {{
     const sortedPositions = Object.entries(positionCounts)
         .sort((a, b) => b[1] - a[1]);
 
-    new Chart(canvas, {{
+    renderChart(null, canvas, {{
         type: 'bar',
         data: {{
             labels: sortedPositions.map(p => p[0]),
@@ -18932,7 +19043,7 @@ function renderDepartmentHeadcountChart() {{
     const sortedDepts = Object.entries(deptCounts)
         .sort((a, b) => b[1] - a[1]);
 
-    new Chart(canvas, {{
+    renderChart(null, canvas, {{
         type: 'horizontalBar',
         data: {{
             labels: sortedDepts.map(d => d[0]),
@@ -19070,7 +19181,7 @@ function renderMiniChart(node) {{
 
     const metrics = node.team_metrics;
 
-    new Chart(canvas, {{
+    renderChart(null, canvas, {{
         type: 'bar',
         data: {{
             labels: ['출근율', '개근', '고위험'],
@@ -19174,7 +19285,7 @@ function renderOrgChartComparison() {{
         return avg;
     }});
 
-    new Chart(document.getElementById('positionComparisonCanvas'), {{
+    renderChart(null, document.getElementById('positionComparisonCanvas'), {{
         type: 'bar',
         data: {{
             labels: positions,
@@ -19234,7 +19345,7 @@ function showTeamDashboard(managerId) {{
     }}
 
     // Open modal with team dashboard
-    const modal = new bootstrap.Modal(document.getElementById('teamDashboardModal'));
+    const modal = bootstrap.Modal.getOrCreateInstance(document.getElementById('teamDashboardModal'));
     populateTeamDashboardModal(manager);
     modal.show();
 }}
@@ -19256,10 +19367,9 @@ function populateTeamDashboardModal(manager) {{
 
     // Render Team Type Distribution Chart
     const typeDistCtx = document.getElementById('teamTypeDistributionChart');
-    if (window.teamTypeChart) window.teamTypeChart.destroy();
 
     const typeData = metrics.type_distribution || {{}};
-    window.teamTypeChart = new Chart(typeDistCtx, {{
+    window.teamTypeChart = renderChart(window.teamTypeChart, typeDistCtx, {{
         type: 'doughnut',
         data: {{
             labels: Object.keys(typeData),
@@ -19280,9 +19390,8 @@ function populateTeamDashboardModal(manager) {{
 
     // Render Team Attendance Status Chart
     const attendanceCtx = document.getElementById('teamAttendanceStatusChart');
-    if (window.teamAttendanceChart) window.teamAttendanceChart.destroy();
 
-    window.teamAttendanceChart = new Chart(attendanceCtx, {{
+    window.teamAttendanceChart = renderChart(window.teamAttendanceChart, attendanceCtx, {{
         type: 'bar',
         data: {{
             labels: ['개근', '출근 양호', '고위험'],
@@ -19307,37 +19416,41 @@ function populateTeamDashboardModal(manager) {{
         }}
     }});
 
-    // Populate team members table
-    const tbody = document.getElementById('teamMembersTableBody');
-    tbody.innerHTML = '';
+    // Populate team members table through its virtual scroller
+    // 가상 스크롤러로 팀원 테이블 채우기
+    const scroller = getTableScroller('teamMembersTableBody', createTeamMemberRowHtml);
 
     if (manager.children && manager.children.length > 0) {{
-        manager.children.forEach(member => {{
-            const row = document.createElement('tr');
-
-            // Calculate attendance rate for member
-            const memberAttendance = '95.2%'; // Placeholder - should come from actual data
-
-            row.innerHTML = `
-                <td>${{member.id}}</td>
-                <td>${{member.name}}</td>
-                <td>${{member.position}}</td>
-                <td>${{member.entrance_date || '-'}}</td>
-                <td>-</td>
-                <td>${{memberAttendance}}</td>
-                <td>
-                    <button class="btn btn-sm btn-outline-primary" onclick="showEmployeeDetail('${{member.id}}')">
-                        상세
-                    </button>
-                </td>
-            `;
-            tbody.appendChild(row);
-        }});
+        scroller.updateData(manager.children);
     }} else {{
-        tbody.innerHTML = '<tr><td colspan="7" class="text-center text-muted">팀원 정보가 없습니다.</td></tr>';
+        scroller.updateData([]);
+        document.getElementById('teamMembersTableBody').innerHTML =
+            '<tr><td colspan="7" class="text-center text-muted">팀원 정보가 없습니다.</td></tr>';
     }}
 }}
 
+// Team modal member row HTML / 팀 모달 팀원 행 HTML
+function createTeamMemberRowHtml(member) {{
+    // Calculate attendance rate for member
+    const memberAttendance = '95.2%'; // Placeholder - should come from actual data
+
+    return `
+        <tr>
+            <td>${{member.id}}</td>
+            <td>${{member.name}}</td>
+            <td>${{member.position}}</td>
+            <td>${{member.entrance_date || '-'}}</td>
+            <td>-</td>
+            <td>${{memberAttendance}}</td>
+            <td>
+                <button class="btn btn-sm btn-outline-primary" onclick="showEmployeeDetail('${{member.id}}')">
+                    상세
+                </button>
+            </td>
+        </tr>
+    `;
+}}
+
 function showEmployeeDetail(employeeId) {{
     // Find employee in employeeDetails
     const employee = employeeDetails.find(e => e.employee_id === employeeId);
@@ -19586,7 +19699,7 @@ function createEmployeeDetailModal(employee) {{
     `;
 
     // Show modal
-    const bsModal = new bootstrap.Modal(modal);
+    const bsModal = bootstrap.Modal.getOrCreateInstance(modal);
     bsModal.show();
 
     // Apply current language to modal content
@@ -19880,13 +19993,12 @@ function renderTeamCharts(position = 'all', specificTeam = null) {{
 
     // Chart 1: Team Attendance Comparison
     const attendanceCtx = document.getElementById('teamAttendanceComparisonChart');
-    if (teamAnalysisCharts.attendance) teamAnalysisCharts.attendance.destroy();
 
     const attendanceData = teamsToAnalyze.map(key => {{
         return teamData[key].metrics?.avg_attendance_rate || 0;
     }});
 
-    teamAnalysisCharts.attendance = new Chart(attendanceCtx, {{
+    teamAnalysisCharts.attendance = renderChart(teamAnalysisCharts.attendance, attendanceCtx, {{
         type: 'bar',
         data: {{
             labels: teamsToAnalyze,
@@ -19910,13 +20022,12 @@ function renderTeamCharts(position = 'all', specificTeam = null) {{
 
     // Chart 2: Team Size Distribution
     const sizeCtx = document.getElementById('teamSizeDistributionChart');
-    if (teamAnalysisCharts.size) teamAnalysisCharts.size.destroy();
 
     const sizeData = teamsToAnalyze.map(key => {{
         return teamData[key].metrics?.total_members || 0;
     }});
 
-    teamAnalysisCharts.size = new Chart(sizeCtx, {{
+    teamAnalysisCharts.size = renderChart(teamAnalysisCharts.size, sizeCtx, {{
         type: 'doughnut',
         data: {{
             labels: teamsToAnalyze,
@@ -19938,7 +20049,6 @@ function renderTeamCharts(position = 'all', specificTeam = null) {{
 
     // Chart 3: TYPE Breakdown (aggregated)
     const typeCtx = document.getElementById('teamTypeBreakdownChart');
-    if (teamAnalysisCharts.type) teamAnalysisCharts.type.destroy();
 
     const typeAggregated = {{}};
     teamsToAnalyze.forEach(key => {{
@@ -19948,7 +20058,7 @@ function renderTeamCharts(position = 'all', specificTeam = null) {{
         }});
     }});
 
-    teamAnalysisCharts.type = new Chart(typeCtx, {{
+    teamAnalysisCharts.type = renderChart(teamAnalysisCharts.type, typeCtx, {{
         type: 'bar',
         data: {{
             labels: Object.keys(typeAggregated),
@@ -19971,13 +20081,12 @@ function renderTeamCharts(position = 'all', specificTeam = null) {{
 
     // Chart 4: Team Tenure
     const tenureCtx = document.getElementById('teamTenureChart');
-    if (teamAnalysisCharts.tenure) teamAnalysisCharts.tenure.destroy();
 
     const tenureData = teamsToAnalyze.map(key => {{
         return teamData[key].metrics?.avg_tenure_years || 0;
     }});
 
-    teamAnalysisCharts.tenure = new Chart(tenureCtx, {{
+    teamAnalysisCharts.tenure = renderChart(teamAnalysisCharts.tenure, tenureCtx, {{
         type: 'line',
         data: {{
             labels: teamsToAnalyze,
@@ -20284,6 +20393,13 @@ if (teamanalysisTab) {{
 
 let currentEmployeeAttendance = [];
 
+// One employee's date-sorted records as a slice of attendanceData (see attendanceOffsets)
+// attendanceData에서 한 직원의 날짜순 기록 구간 반환 (attendanceOffsets 참고)
+function getEmployeeAttendance(employeeNo) {{
+    const range = attendanceOffsets[employeeNo];
+    return range ? attendanceData.slice(range[0], range[1]) : [];
+}}
+
 function searchEmployeeAttendance() {{
     const searchInput = document.getElementById('attendanceEmployeeSearch');
     const employeeNo = searchInput.value.trim();
@@ -20293,12 +20409,17 @@ function searchEmployeeAttendance() {{
         return;
     }}
 
+    // Resolve ID or name to one employee: exact ID first, else the first index match
+    // ID 또는 이름을 한 명의 직원으로 변환: 정확한 ID 우선, 없으면 첫 번째 인덱스 일치
+    let targetNo = employeeNo;
+    if (!employeeDetails.some(e => e.employee_no === employeeNo)) {{
+        const rowIds = lookupEmployeeSearchIndex(employeeNo) || [];
+        if (rowIds.length > 0) targetNo = employeeDetails[rowIds[0]].employee_no;
+    }}
+
     // Filter attendance data for this employee
     // 해당 직원의 출결 데이터 필터링
-    const employeeRecords = attendanceData.filter(record =>
-        record.employee_no === employeeNo ||
-        record.employee_no.includes(employeeNo)
-    );
+    const employeeRecords = getEmployeeAttendance(targetNo);
 
     // Update UI based on results
     // 결과에 따라 UI 업데이트
@@ -20557,46 +20678,41 @@ function displayAttendanceInsights(records, presentDays, absentDays, attendanceR
     document.getElementById('attendanceInsights').innerHTML = html;
 }}
 
-function displayDailyRecords(records) {{
+// Individual Attendance daily row HTML (rendered through the table's virtual scroller)
+// 개인 출결 일별 행 HTML (테이블 가상 스크롤러를 통해 렌더링)
+function createAttendanceRowHtml(record) {{
     const lang = localStorage.getItem('selectedLanguage') || 'ko';
-    const tbody = document.getElementById('attendanceDetailBody');
-
-    // Sort records by date
-    // 날짜순 정렬
-    const sortedRecords = [...records].sort((a, b) => {{
-        return a.work_date.localeCompare(b.work_date);
-    }});
-
-    let html = '';
-    sortedRecords.forEach(record => {{
-        const statusClass = record.status === 'present' ? 'text-success' :
-                           record.status === 'absent' ? 'text-danger' : 'text-secondary';
-        const statusIcon = record.status === 'present' ? '✅' :
-                          record.status === 'absent' ? '❌' : '➖';
-        const statusText = lang === 'ko' ? record.status_ko :
-                          lang === 'en' ? record.status_en : record.status_vi;
-
-        const reason = lang === 'ko' ? record.reason_ko :
-                      lang === 'en' ? record.reason_en : record.reason_vi;
-        const reasonDisplay = record.status === 'absent' && reason ? reason : '-';
-
-        const dayText = lang === 'ko' ? record.day_of_week :
-                       lang === 'en' ? record.day_of_week_en : record.day_of_week_vi;
-
-        html += `
-            <tr class="${{record.status === 'absent' ? 'table-danger' : ''}}">
-                <td class="text-center">${{record.work_date}}</td>
-                <td class="text-center">${{dayText || '-'}}</td>
-                <td class="text-center ${{statusClass}} fw-bold">
-                    ${{statusIcon}} ${{statusText}}
-                </td>
-                <td>${{reasonDisplay}}</td>
-                <td class="text-center">${{record.work_time || '-'}}</td>
-            </tr>
-        `;
-    }});
+    const statusClass = record.status === 'present' ? 'text-success' :
+                       record.status === 'absent' ? 'text-danger' : 'text-secondary';
+    const statusIcon = record.status === 'present' ? '✅' :
+                      record.status === 'absent' ? '❌' : '➖';
+    const statusText = lang === 'ko' ? record.status_ko :
+                      lang === 'en' ? record.status_en : record.status_vi;
+
+    const reason = lang === 'ko' ? record.reason_ko :
+                  lang === 'en' ? record.reason_en : record.reason_vi;
+    const reasonDisplay = record.status === 'absent' && reason ? reason : '-';
+
+    const dayText = lang === 'ko' ? record.day_of_week :
+                   lang === 'en' ? record.day_of_week_en : record.day_of_week_vi;
+
+    return `
+        <tr class="${{record.status === 'absent' ? 'table-danger' : ''}}">
+            <td class="text-center">${{record.work_date}}</td>
+            <td class="text-center">${{dayText || '-'}}</td>
+            <td class="text-center ${{statusClass}} fw-bold">
+                ${{statusIcon}} ${{statusText}}
+            </td>
+            <td>${{reasonDisplay}}</td>
+            <td class="text-center">${{record.work_time || '-'}}</td>
+        </tr>
+    `;
+}}
 
-    tbody.innerHTML = html;
+function displayDailyRecords(records) {{
+    // Records come from getEmployeeAttendance(), already sorted by date
+    // getEmployeeAttendance()에서 이미 날짜순으로 정렬됨
+    getTableScroller('attendanceDetailBody', createAttendanceRowHtml).updateData(records);
 }}
 
 function exportAttendanceCSV() {{
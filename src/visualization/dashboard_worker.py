@@ -0,0 +1,329 @@
+"""
+dashboard_worker.py - Inline Web Worker for dashboard aggregation and export
+대시보드 집계 및 내보내기용 인라인 Web Worker
+
+Generates JavaScript that starts a Web Worker from a Blob, so the dashboard
+stays a single standalone HTML file. The worker owns a columnar copy of
+employeeDetails (numeric and flag columns sent once as transferable typed
+arrays; typed-array results are transferred back), answers summary, tenure
+bucket, team and filter queries, and builds CSV exports off the main thread.
+Blob으로 Web Worker를 시작하는 자바스크립트를 생성하므로 대시보드는 단일 HTML 파일로
+유지됩니다. 워커는 employeeDetails의 컬럼형 사본(숫자/플래그 컬럼은 transferable
+typed array로 전달)을 보유하고 요약, 근속 구간, 팀, 필터 질의와 CSV 생성을
+메인 스레드 밖에서 처리합니다.
+
+When workers are unavailable the same task functions run on the main thread,
+so callers always get a Promise.
+워커를 사용할 수 없으면 동일한 작업 함수가 메인 스레드에서 실행되므로
+호출자는 항상 Promise를 받습니다.
+"""
+
+
+class DashboardWorkerGenerator:
+    """
+    Generate the dashboard Web Worker JavaScript
+    대시보드 Web Worker 자바스크립트 생성
+    """
+
+    def get_worker_js(self) -> str:
+        """
+        Generate DashboardWorker (Blob worker + main-thread fallback)
+        DashboardWorker 생성 (Blob 워커 + 메인 스레드 폴백)
+
+        Returns:
+            JavaScript code defining DashboardWorkerTasks and DashboardWorker
+        """
+        return """
+// ========================================
+// Dashboard Web Worker
+// 대시보드 Web Worker
+// ========================================
+
+// Task functions run inside the worker (or on the main thread as fallback).
+// They must only use their arguments, because their source is copied into the Blob.
+// 작업 함수는 워커 내부(또는 폴백으로 메인 스레드)에서 실행되며,
+// 소스가 Blob으로 복사되므로 인자만 사용해야 합니다.
+const DashboardWorkerTasks = {
+    /**
+     * Store the columnar dataset / 컬럼형 데이터셋 저장
+     */
+    init: function(state, payload) {
+        Object.assign(state, payload);
+        state.rowCount = payload.numeric.tenure_days.length;
+        return state.rowCount;
+    },
+
+    /**
+     * Resolve an optional Int32Array of row ids (default: every row)
+     * 선택적 행 번호 Int32Array 해석 (기본값: 전체 행)
+     */
+    rowIds: function(state, rowIds) {
+        if (rowIds) return rowIds;
+        const all = new Int32Array(state.rowCount);
+        for (let i = 0; i < all.length; i++) all[i] = i;
+        return all;
+    },
+
+    /**
+     * Quick stats of a row set / 행 집합의 요약 통계
+     */
+    summary: function(state, payload) {
+        const ids = DashboardWorkerTasks.rowIds(state, payload.rowIds);
+        const flags = state.flags;
+        const absent = state.numeric.absent_days;
+        const result = { count: ids.length, active: 0, resigned: 0, absent: 0, unauthorized: 0 };
+        for (let k = 0; k < ids.length; k++) {
+            const i = ids[k];
+            result.active += flags.is_active[i];
+            result.resigned += flags.resigned_this_month[i];
+            result.unauthorized += flags.has_unauthorized_absence[i];
+            if (absent[i] > 0) result.absent++;
+        }
+        return result;
+    },
+
+    /**
+     * Row ids matching flag values, team and tenure range
+     * 플래그 값, 팀, 근속 범위에 맞는 행 번호
+     * payload: { flags: {is_active: 0|1, ...}, team, minTenure, maxTenure } (all optional)
+     */
+    filter: function(state, payload) {
+        const flagEntries = Object.entries(payload.flags || {});
+        const teamCode = payload.team ? state.teams.indexOf(payload.team) : -1;
+        const tenure = state.numeric.tenure_days;
+        const minTenure = payload.minTenure ?? -Infinity;
+        const maxTenure = payload.maxTenure ?? Infinity;
+        const matches = [];
+        for (let i = 0; i < state.rowCount; i++) {
+            if (payload.team && state.teamCodes[i] !== teamCode) continue;
+            if (tenure[i] < minTenure || tenure[i] > maxTenure) continue;
+            if (flagEntries.some(([name, value]) => state.flags[name][i] !== value)) continue;
+            matches.push(i);
+        }
+        return Int32Array.from(matches);
+    },
+
+    /**
+     * Count filtered rows per tenure bucket (lo, hi]; the last bucket is open-ended
+     * 근속 구간 (lo, hi]별 필터 행 수 (마지막 구간은 상한 없음)
+     * payload: filter payload + { edges: [0, 30, 60, 90] }
+     */
+    tenureBuckets: function(state, payload) {
+        const ids = DashboardWorkerTasks.filter(state, payload);
+        const edges = payload.edges;
+        const tenure = state.numeric.tenure_days;
+        const counts = new Array(edges.length).fill(0);
+        for (let k = 0; k < ids.length; k++) {
+            const days = tenure[ids[k]];
+            let bucket = edges.length - 1;
+            for (let b = 1; b < edges.length; b++) {
+                if (days <= edges[b]) { bucket = b - 1; break; }
+            }
+            counts[bucket]++;
+        }
+        return counts;
+    },
+
+    /**
+     * Headcount and absence aggregates per team / 팀별 인원 및 결근 집계
+     */
+    teamStats: function(state, payload) {
+        const ids = DashboardWorkerTasks.rowIds(state, payload.rowIds);
+        const stats = {};
+        for (let k = 0; k < ids.length; k++) {
+            const i = ids[k];
+            const team = state.teams[state.teamCodes[i]];
+            const entry = stats[team] || (stats[team] = { headcount: 0, active: 0, absentDays: 0, workingDays: 0 });
+            entry.headcount++;
+            entry.active += state.flags.is_active[i];
+            entry.absentDays += state.numeric.absent_days[i];
+            entry.workingDays += state.numeric.working_days[i];
+        }
+        Object.values(stats).forEach(entry => {
+            const scheduled = entry.absentDays + entry.workingDays;
+            entry.absenceRate = scheduled > 0 ? (entry.absentDays / scheduled) * 100 : 0;
+        });
+        return stats;
+    },
+
+    /**
+     * Employee Details CSV (same columns as exportToCSV) / 직원 상세 CSV
+     */
+    employeeCsv: function(state, payload) {
+        const ids = DashboardWorkerTasks.rowIds(state, payload.rowIds);
+        const lines = ['사번,이름,직급,유형,팀,입사일,퇴사일,재직기간(일),출근일,결근일,출근률,상태'];
+        for (let k = 0; k < ids.length; k++) {
+            const emp = state.rows[ids[k]];
+            const status = [
+                emp.is_active ? '재직' : '퇴사',
+                emp.hired_this_month ? '신입' : '',
+                emp.perfect_attendance ? '개근' : '',
+                emp.long_term ? '장기' : ''
+            ].filter(s => s).join('|');
+
+            lines.push([
+                emp.employee_id || '',
+                emp.employee_name || '',
+                emp.position || '',
+                emp.role_type || '',
+                emp.team_name || '',
+                emp.entrance_date || '',
+                emp.stop_date || '',
+                emp.tenure_days || '0',
+                emp.actual_working_days || '0',
+                emp.absent_days || '0',
+                emp.attendance_rate ? `${emp.attendance_rate.toFixed(1)}%` : '',
+                status
+            ].map(field => `"${field}"`).join(','));
+        }
+        return lines.join('\\n');
+    }
+};
+
+const DashboardWorker = {
+    // Numeric and 0/1 flag columns shipped as typed arrays / typed array로 전달할 숫자 및 0/1 플래그 컬럼
+    numericColumns: ['tenure_days', 'absent_days', 'working_days'],
+    flagColumns: ['is_active', 'hired_this_month', 'resigned_this_month', 'perfect_attendance',
+                  'has_unauthorized_absence', 'long_term', 'under_60_days', 'is_pregnant'],
+    // String fields needed by employeeCsv / employeeCsv에 필요한 문자열 필드
+    rowFields: ['employee_id', 'employee_name', 'position', 'role_type', 'team_name', 'entrance_date',
+                'stop_date', 'tenure_days', 'actual_working_days', 'absent_days', 'attendance_rate',
+                'is_active', 'hired_this_month', 'perfect_attendance', 'long_term'],
+
+    worker: null,
+    fallbackState: null,
+    pending: new Map(),
+    nextId: 1,
+    rowIdsByEmployee: null,
+
+    /**
+     * Build the columnar dataset (typed arrays + transfer list) from employeeDetails
+     * employeeDetails로 컬럼형 데이터셋 생성 (typed array + 전송 목록)
+     */
+    buildDataset: function(employees) {
+        const numeric = {};
+        const flags = {};
+        this.numericColumns.forEach(col => {
+            numeric[col] = Float64Array.from(employees, e => Number(e[col]) || 0);
+        });
+        this.flagColumns.forEach(col => {
+            flags[col] = Uint8Array.from(employees, e => e[col] ? 1 : 0);
+        });
+
+        const teams = [...new Set(employees.map(e => e.team_name || ''))];
+        const teamIndex = new Map(teams.map((team, i) => [team, i]));
+        const teamCodes = Int32Array.from(employees, e => teamIndex.get(e.team_name || ''));
+
+        const rows = employees.map(e => {
+            const row = {};
+            this.rowFields.forEach(field => { row[field] = e[field]; });
+            return row;
+        });
+
+        const transfer = [...Object.values(numeric), ...Object.values(flags), teamCodes].map(arr => arr.buffer);
+        return { payload: { numeric, flags, teams, teamCodes, rows }, transfer };
+    },
+
+    /**
+     * Start the Blob worker once (falls back to the main thread if unavailable)
+     * Blob 워커를 한 번 시작 (사용 불가 시 메인 스레드로 폴백)
+     */
+    ensureStarted: function() {
+        if (this.worker || this.fallbackState) return;
+
+        const { payload, transfer } = this.buildDataset(employeeDetails);
+        this.rowIdsByEmployee = new Map(employeeDetails.map((e, i) => [e, i]));
+
+        try {
+            const taskSource = Object.entries(DashboardWorkerTasks)
+                .map(([name, fn]) => `${name}: ${fn.toString()}`).join(',\\n');
+            const source = `
+                const DashboardWorkerTasks = {
+                    ${taskSource}
+                };
+                const state = {};
+                self.onmessage = (event) => {
+                    const { id, type, payload } = event.data;
+                    try {
+                        const result = DashboardWorkerTasks[type](state, payload);
+                        const transfer = result && result.buffer instanceof ArrayBuffer ? [result.buffer] : [];
+                        self.postMessage({ id, result }, transfer);
+                    } catch (error) {
+                        self.postMessage({ id, error: String(error) });
+                    }
+                };
+            `;
+            const url = URL.createObjectURL(new Blob([source], { type: 'text/javascript' }));
+            this.worker = new Worker(url);
+            URL.revokeObjectURL(url);
+
+            this.worker.onmessage = (event) => {
+                const { id, result, error } = event.data;
+                const handlers = this.pending.get(id);
+                if (!handlers) return;
+                this.pending.delete(id);
+                if (error) handlers.reject(new Error(error)); else handlers.resolve(result);
+            };
+            // e.g. blob: workers blocked for file:// pages / 예: file:// 페이지에서 blob: 워커 차단
+            this.worker.onerror = () => this.fallBackToMainThread();
+            this.worker.postMessage({ id: 0, type: 'init', payload }, transfer);
+            debugLog('DashboardWorker: started with', employeeDetails.length, 'rows');
+        } catch (error) {
+            // Worker/Blob unavailable: run tasks on the main thread / 워커 사용 불가: 메인 스레드에서 실행
+            debugLog('DashboardWorker: falling back to main thread', error);
+            this.fallBackToMainThread();
+        }
+    },
+
+    /**
+     * Switch to main-thread execution and replay pending requests
+     * 메인 스레드 실행으로 전환하고 대기 중인 요청 재실행
+     */
+    fallBackToMainThread: function() {
+        if (this.worker) this.worker.terminate();
+        this.worker = null;
+        this.fallbackState = {};
+        // The init columns were transferred away, so rebuild them / init 컬럼이 전송되었으므로 다시 생성
+        DashboardWorkerTasks.init(this.fallbackState, this.buildDataset(employeeDetails).payload);
+
+        const pending = [...this.pending.values()];
+        this.pending.clear();
+        pending.forEach(({ type, payload, resolve, reject }) => {
+            this.request(type, payload).then(resolve, reject);
+        });
+    },
+
+    /**
+     * Run a task and resolve with its result / 작업 실행 후 결과로 resolve
+     * @param {string} type - Task name in DashboardWorkerTasks
+     * @param {Object} payload - Task payload (copied, so it stays usable for a fallback replay)
+     * @returns {Promise}
+     */
+    request: function(type, payload = {}) {
+        this.ensureStarted();
+
+        if (!this.worker) {
+            try {
+                return Promise.resolve(DashboardWorkerTasks[type](this.fallbackState, payload));
+            } catch (error) {
+                return Promise.reject(error);
+            }
+        }
+
+        const id = this.nextId++;
+        return new Promise((resolve, reject) => {
+            this.pending.set(id, { type, payload, resolve, reject });
+            this.worker.postMessage({ id, type, payload });
+        });
+    },
+
+    /**
+     * Row ids (Int32Array) of employee objects taken from employeeDetails
+     * employeeDetails 직원 객체의 행 번호 (Int32Array)
+     */
+    rowIdsOf: function(employees) {
+        this.ensureStarted();
+        return Int32Array.from(employees, e => this.rowIdsByEmployee.get(e) ?? -1).filter(i => i >= 0);
+    }
+};
+"""
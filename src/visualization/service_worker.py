@@ -0,0 +1,249 @@
+"""
+service_worker.py - Service worker and precache manifest for the docs/ site
+docs/ 사이트용 서비스 워커 및 사전 캐시 매니페스트
+
+Generates docs/sw.js and docs/precache-manifest.json so the published site
+(auth.html, selector.html, app.html and the monthly dashboards) loads from cache on
+repeat visits and keeps working offline:
+- Precache: pages, the most recent dashboards and vendored libraries, listed with
+  content hashes. A new manifest only re-downloads files whose hash changed.
+- dashboards.json: stale-while-revalidate
+- CDN libraries (Bootstrap, Chart.js, D3, Plotly): cache-first at runtime
+- Other same-origin requests: network-first with cache fallback
+공개 사이트가 재방문 시 캐시에서 로드되고 오프라인에서도 동작하도록
+docs/sw.js와 docs/precache-manifest.json을 생성합니다.
+- 사전 캐시: 페이지, 최근 대시보드, vendor 라이브러리 (콘텐츠 해시 포함).
+  새 매니페스트는 해시가 바뀐 파일만 다시 받습니다.
+- dashboards.json: stale-while-revalidate
+- CDN 라이브러리: 런타임 cache-first
+- 기타 동일 출처 요청: network-first + 캐시 대체
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ..utils.file_hash import compute_content_hash
+
+
+# Static pages of the docs/ site / docs/ 사이트 정적 페이지
+PRECACHE_PAGES = ['index.html', 'auth.html', 'selector.html', 'app.html']
+
+# Directories whose files are precached as-is / 파일을 그대로 사전 캐시하는 디렉토리
+PRECACHE_ASSET_DIRS = ['vendor', 'assets']
+
+# Hosts whose versioned URLs are cached on first use / 버전 URL을 처음 사용 시 캐시하는 호스트
+CDN_HOSTS = ['cdn.jsdelivr.net', 'd3js.org', 'cdn.plot.ly']
+
+
+class ServiceWorkerGenerator:
+    """
+    Generate the docs/ service worker and its precache manifest
+    docs/ 서비스 워커와 사전 캐시 매니페스트 생성
+    """
+
+    def __init__(self, docs_dir: Path, max_dashboards: int = 6):
+        """
+        Args:
+            docs_dir: Published site directory / 게시 사이트 디렉토리
+            max_dashboards: Most recent dashboards to precache (older ones are cached
+                            when visited) / 사전 캐시할 최근 대시보드 수 (이전 대시보드는 방문 시 캐시)
+        """
+        self.docs_dir = Path(docs_dir)
+        self.max_dashboards = max_dashboards
+
+    def _dashboard_files(self) -> List[str]:
+        """
+        Most recent dashboard files from dashboards.json
+        dashboards.json 기준 최근 대시보드 파일
+        """
+        manifest_path = self.docs_dir / 'dashboards.json'
+        if not manifest_path.exists():
+            return []
+
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            entries = json.load(f).get('dashboards', [])
+        entries = sorted(entries, key=lambda d: (d.get('year', 0), d.get('month', 0)), reverse=True)
+        return [d['file'] for d in entries if d.get('file')][:self.max_dashboards]
+
+    def build_precache_manifest(self) -> Dict[str, Any]:
+        """
+        List precached files with content hashes
+        사전 캐시 파일과 콘텐츠 해시 목록 생성
+
+        Returns:
+            {'version': hash of the file list, 'files': [{'url', 'hash', 'bytes'}]}
+        """
+        paths = [self.docs_dir / name for name in PRECACHE_PAGES + self._dashboard_files()]
+        for dir_name in PRECACHE_ASSET_DIRS:
+            asset_dir = self.docs_dir / dir_name
+            if asset_dir.is_dir():
+                paths.extend(sorted(p for p in asset_dir.rglob('*') if p.is_file()))
+
+        files = []
+        for path in paths:
+            if path.is_file():
+                files.append({
+                    'url': path.relative_to(self.docs_dir).as_posix(),
+                    'hash': compute_content_hash(path),
+                    'bytes': path.stat().st_size
+                })
+
+        version = hashlib.sha256(json.dumps(files, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        return {'version': version, 'files': files}
+
+    def get_service_worker_js(self, version: str) -> str:
+        """
+        Generate sw.js (the version constant changes whenever the manifest does)
+        sw.js 생성 (매니페스트가 바뀌면 버전 상수도 바뀜)
+
+        Args:
+            version: Precache manifest version / 사전 캐시 매니페스트 버전
+
+        Returns:
+            Service worker JavaScript / 서비스 워커 자바스크립트
+        """
+        return """// HR Dashboard service worker - generated by src/visualization/service_worker.py
+// HR 대시보드 서비스 워커 - src/visualization/service_worker.py에서 생성
+
+const PRECACHE_VERSION = '__PRECACHE_VERSION__';
+const PRECACHE_PREFIX = 'hr-precache-';
+const PRECACHE = PRECACHE_PREFIX + PRECACHE_VERSION;
+const RUNTIME = 'hr-runtime';
+const MANIFEST_URL = 'precache-manifest.json';
+const MANIFEST_KEY = new URL('__precache-manifest__', self.registration.scope).href;
+const CDN_HOSTS = __CDN_HOSTS__;
+
+function scopeUrl(path) {
+    return new URL(path, self.registration.scope).href;
+}
+
+// Previous precache and its manifest, so unchanged files are copied instead of re-downloaded
+// 이전 사전 캐시와 매니페스트 (변경 없는 파일은 다시 받지 않고 복사)
+async function findPreviousPrecache() {
+    const names = (await caches.keys()).filter(name => name.startsWith(PRECACHE_PREFIX) && name !== PRECACHE);
+    for (const name of names.reverse()) {
+        const cache = await caches.open(name);
+        const manifestResponse = await cache.match(MANIFEST_KEY);
+        if (manifestResponse) {
+            const manifest = await manifestResponse.json();
+            const hashes = new Map(manifest.files.map(entry => [entry.url, entry.hash]));
+            return { cache, hashes };
+        }
+    }
+    return null;
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const response = await fetch(`${MANIFEST_URL}?v=${PRECACHE_VERSION}`, { cache: 'no-store' });
+        const manifest = await response.json();
+        const cache = await caches.open(PRECACHE);
+        const previous = await findPreviousPrecache();
+
+        await Promise.all(manifest.files.map(async entry => {
+            const url = scopeUrl(entry.url);
+            if (previous && previous.hashes.get(entry.url) === entry.hash) {
+                const reused = await previous.cache.match(url);
+                if (reused) return cache.put(url, reused);
+            }
+            const fresh = await fetch(url, { cache: 'no-cache' });
+            if (!fresh.ok) throw new Error(`Precache failed: ${entry.url} (${fresh.status})`);
+            return cache.put(url, fresh);
+        }));
+
+        await cache.put(MANIFEST_KEY, new Response(JSON.stringify(manifest)));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        const names = await caches.keys();
+        await Promise.all(names
+            .filter(name => name.startsWith(PRECACHE_PREFIX) && name !== PRECACHE)
+            .map(name => caches.delete(name)));
+        await self.clients.claim();
+    })());
+});
+
+// dashboards.json: answer from cache immediately, refresh it in the background
+// dashboards.json: 캐시로 즉시 응답하고 백그라운드에서 갱신
+async function staleWhileRevalidate(event, url) {
+    const cache = await caches.open(RUNTIME);
+    const key = url.origin + url.pathname;
+    const cached = await cache.match(key);
+    const network = fetch(event.request, { cache: 'no-cache' }).then(response => {
+        if (response.ok) cache.put(key, response.clone());
+        return response;
+    });
+    event.waitUntil(network.catch(() => null));
+    return cached || network;
+}
+
+// Same-origin pages: precache first, then network with a runtime-cache fallback
+// 동일 출처 페이지: 사전 캐시 우선, 이후 네트워크 (실패 시 런타임 캐시)
+async function precacheFirst(request, url) {
+    const precache = await caches.open(PRECACHE);
+    const path = url.pathname.endsWith('/') ? url.pathname + 'index.html' : url.pathname;
+    const precached = await precache.match(url.origin + path);
+    if (precached) return precached;
+
+    const runtime = await caches.open(RUNTIME);
+    try {
+        const response = await fetch(request);
+        if (response.ok) runtime.put(request, response.clone());
+        return response;
+    } catch (e) {
+        const cached = await runtime.match(request, { ignoreSearch: true });
+        if (cached) return cached;
+        throw e;
+    }
+}
+
+// Versioned CDN libraries never change: cache-first
+// 버전이 고정된 CDN 라이브러리는 변하지 않으므로 cache-first
+async function cacheFirst(request) {
+    const runtime = await caches.open(RUNTIME);
+    const cached = await runtime.match(request);
+    if (cached) return cached;
+
+    const response = await fetch(request);
+    if (response.ok || response.type === 'opaque') runtime.put(request, response.clone());
+    return response;
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+
+    const url = new URL(request.url);
+    if (url.origin === self.location.origin) {
+        if (url.pathname.endsWith('/dashboards.json')) {
+            event.respondWith(staleWhileRevalidate(event, url));
+        } else if (!url.pathname.endsWith('/' + MANIFEST_URL)) {
+            event.respondWith(precacheFirst(request, url));
+        }
+    } else if (CDN_HOSTS.includes(url.hostname)) {
+        event.respondWith(cacheFirst(request));
+    }
+});
+""".replace('__PRECACHE_VERSION__', version).replace('__CDN_HOSTS__', json.dumps(CDN_HOSTS))
+
+    def write(self) -> Dict[str, Any]:
+        """
+        Write docs/precache-manifest.json and docs/sw.js
+        docs/precache-manifest.json 및 docs/sw.js 작성
+
+        Returns:
+            The precache manifest / 사전 캐시 매니페스트
+        """
+        manifest = self.build_precache_manifest()
+
+        with open(self.docs_dir / 'precache-manifest.json', 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        with open(self.docs_dir / 'sw.js', 'w', encoding='utf-8') as f:
+            f.write(self.get_service_worker_js(manifest['version']))
+
+        return manifest
@@ -12,6 +12,7 @@ Key Benefits:
 - Reduces DOM nodes from 1000s to ~50
 - Smooth scrolling experience
 - Memory efficient
+- One independent scroller per table (VirtualScroll.create)
 """
 
 
@@ -52,7 +53,8 @@ const VirtualScroll = {{
         rowHeight: {self.row_height},
         bufferSize: {self.buffer_size},
         enabled: true,
-        threshold: 200  // Enable virtual scroll when rows > threshold
+        threshold: 200,  // Enable virtual scroll when rows > threshold
+        maxHeight: '70vh'  // Scroll viewport height while virtualized / 가상화 중 스크롤 영역 높이
     }},
 
     // State / 상태
@@ -62,46 +64,54 @@ const VirtualScroll = {{
         container: null,
         tbody: null,
         scrollTop: 0,
-        visibleStart: 0,
-        visibleEnd: 0,
+        visibleStart: -1,
+        visibleEnd: -1,
         totalHeight: 0,
         viewportHeight: 0,
         isScrolling: false,
         scrollTimeout: null,
-        renderQueue: null
+        renderQueue: null,
+        rowHeightMeasured: false
+    }},
+
+    // Optional row renderer returning a <tr> HTML string / <tr> HTML 문자열을 반환하는 행 렌더러 (선택)
+    renderRow: null,
+
+    /**
+     * Create an independent scroller (one per table)
+     * 독립적인 스크롤러 생성 (테이블별 하나)
+     * @param {{Object}} options - {{ renderRow: (rowData, index) => '<tr>...</tr>', config: {{...}} }}
+     * @returns {{Object}} Scroller sharing VirtualScroll's methods
+     */
+    create: function(options = {{}}) {{
+        const scroller = Object.create(VirtualScroll);
+        scroller.config = Object.assign({{}}, VirtualScroll.config, options.config || {{}});
+        scroller.state = Object.assign({{}}, VirtualScroll.state, {{ data: [], filteredData: [] }});
+        scroller.renderRow = options.renderRow || null;
+        return scroller;
     }},
 
     /**
      * Initialize virtual scrolling
      * 가상 스크롤링 초기화
-     * @param {{string}} containerId - Container element ID
-     * @param {{string}} tbodyId - Table body element ID
+     * @param {{string|HTMLElement}} containerId - Scroll container element or ID
+     * @param {{string|HTMLElement}} tbodyId - Table body element or ID
      * @param {{Array}} data - Data array
      */
     init: function(containerId, tbodyId, data) {{
-        this.state.container = document.getElementById(containerId);
-        this.state.tbody = document.getElementById(tbodyId);
+        const resolve = (el) => typeof el === 'string' ? document.getElementById(el) : el;
+        this.state.container = resolve(containerId);
+        this.state.tbody = resolve(tbodyId);
         this.state.data = data;
-        this.state.filteredData = [...data];
+        this.state.filteredData = data;
 
         if (!this.state.container || !this.state.tbody) {{
             debugLog('Virtual scroll: Container or tbody not found');
             return;
         }}
 
-        // Check if virtual scrolling should be enabled
-        // 가상 스크롤링 활성화 여부 확인
-        if (data.length <= this.config.threshold) {{
-            debugLog('Virtual scroll: Disabled (data below threshold)');
-            this.config.enabled = false;
-            this.renderAllRows();
-            return;
-        }}
-
-        debugLog('Virtual scroll: Enabled for', data.length, 'rows');
-        this.setupContainer();
         this.bindEvents();
-        this.render();
+        this.updateData(data);
     }},
 
     /**
@@ -109,34 +119,21 @@ const VirtualScroll = {{
      * 가상 스크롤링을 위한 컨테이너 설정
      */
     setupContainer: function() {{
-        // Make container scrollable
-        // 컨테이너를 스크롤 가능하게 만들기
-        this.state.container.style.height = '600px';
-        this.state.container.style.overflow = 'auto';
+        // Make container scrollable; thead.sticky-top stays pinned inside it
+        // 컨테이너를 스크롤 가능하게 만들기 (thead.sticky-top은 내부에 고정됨)
+        this.state.container.style.maxHeight = this.config.maxHeight;
+        this.state.container.style.overflowY = 'auto';
         this.state.container.style.position = 'relative';
-
-        // Create spacer elements for scroll area
-        // 스크롤 영역을 위한 스페이서 요소 생성
         this.state.totalHeight = this.state.filteredData.length * this.config.rowHeight;
-        this.state.viewportHeight = this.state.container.clientHeight;
-
-        // Add padding elements
-        // 패딩 요소 추가
-        const topPadding = document.createElement('tr');
-        topPadding.id = 'virtual-scroll-top-padding';
-        topPadding.style.height = '0px';
-        topPadding.setAttribute('aria-hidden', 'true');
-
-        const bottomPadding = document.createElement('tr');
-        bottomPadding.id = 'virtual-scroll-bottom-padding';
-        bottomPadding.style.height = '0px';
-        bottomPadding.setAttribute('aria-hidden', 'true');
-
-        // Clear tbody and add paddings
-        // tbody 초기화 및 패딩 추가
-        this.state.tbody.innerHTML = '';
-        this.state.tbody.appendChild(topPadding);
-        this.state.tbody.appendChild(bottomPadding);
+    }},
+
+    /**
+     * Restore the container for plain (non-virtual) rendering
+     * 일반 렌더링을 위해 컨테이너 복원
+     */
+    resetContainer: function() {{
+        this.state.container.style.maxHeight = '';
+        this.state.container.style.overflowY = '';
     }},
 
     /**
@@ -144,20 +141,12 @@ const VirtualScroll = {{
      * 스크롤 및 리사이즈 이벤트 바인딩
      */
     bindEvents: function() {{
-        // Throttled scroll handler
-        // 쓰로틀된 스크롤 핸들러
-        const throttledScroll = PerformanceUtils.throttle(() => {{
-            this.onScroll();
-        }}, 16);  // ~60fps
-
-        this.state.container.addEventListener('scroll', throttledScroll, {{ passive: true }});
+        // One render per animation frame (~60fps) / 애니메이션 프레임당 한 번 렌더링 (~60fps)
+        this.state.container.addEventListener('scroll', () => this.onScroll(), {{ passive: true }});
 
         // Resize handler
         // 리사이즈 핸들러
-        window.addEventListener('resize', PerformanceUtils.debounce(() => {{
-            this.state.viewportHeight = this.state.container.clientHeight;
-            this.render();
-        }}, 250));
+        window.addEventListener('resize', () => this.refresh());
     }},
 
     /**
@@ -169,6 +158,17 @@ const VirtualScroll = {{
         this.render();
     }},
 
+    /**
+     * Re-measure the viewport and re-render (e.g. after a tab or modal becomes visible)
+     * 뷰포트를 다시 측정하고 재렌더링 (예: 탭/모달 표시 후)
+     */
+    refresh: function() {{
+        if (!this.state.container) return;
+        this.state.visibleStart = -1;
+        this.state.visibleEnd = -1;
+        this.render();
+    }},
+
     /**
      * Calculate visible range and render rows
      * 표시 범위 계산 및 행 렌더링
@@ -176,6 +176,10 @@ const VirtualScroll = {{
     render: function() {{
         if (!this.config.enabled) return;
 
+        // Hidden tabs report 0 height; fall back to the window height
+        // 숨겨진 탭은 높이가 0이므로 창 높이로 대체
+        this.state.viewportHeight = this.state.container.clientHeight || window.innerHeight;
+
         const scrollTop = this.state.scrollTop;
         const viewportHeight = this.state.viewportHeight;
         const rowHeight = this.config.rowHeight;
@@ -208,6 +212,7 @@ const VirtualScroll = {{
         }}
 
         this.state.renderQueue = requestAnimationFrame(() => {{
+            this.state.renderQueue = null;
             this.renderRows(startIndex, endIndex);
         }});
     }},
@@ -223,47 +228,32 @@ const VirtualScroll = {{
         const data = this.state.filteredData;
         const rowHeight = this.config.rowHeight;
 
-        // Calculate padding heights
-        // 패딩 높이 계산
+        // Spacer rows keep the scrollbar proportional to the full data set
+        // 스페이서 행으로 전체 데이터 크기에 맞는 스크롤바 유지
         const topPaddingHeight = start * rowHeight;
         const bottomPaddingHeight = (data.length - end) * rowHeight;
+        const spacer = (height) => `<tr class="virtual-scroll-spacer" aria-hidden="true" style="height: ${{height}}px;"></tr>`;
 
-        // Get padding elements
-        // 패딩 요소 가져오기
-        const topPadding = document.getElementById('virtual-scroll-top-padding');
-        const bottomPadding = document.getElementById('virtual-scroll-bottom-padding');
-
-        // Create document fragment for batch DOM updates
-        // 배치 DOM 업데이트를 위한 document fragment 생성
-        const fragment = document.createDocumentFragment();
-
-        // Create top padding
-        // 상단 패딩 생성
-        const newTopPadding = document.createElement('tr');
-        newTopPadding.id = 'virtual-scroll-top-padding';
-        newTopPadding.style.height = topPaddingHeight + 'px';
-        newTopPadding.setAttribute('aria-hidden', 'true');
-        fragment.appendChild(newTopPadding);
-
-        // Render visible rows
-        // 표시되는 행 렌더링
+        const rows = [];
         for (let i = start; i < end && i < data.length; i++) {{
-            const row = this.createRow(data[i], i);
-            fragment.appendChild(row);
+            rows.push(this.rowHtml(data[i], i));
         }}
 
-        // Create bottom padding
-        // 하단 패딩 생성
-        const newBottomPadding = document.createElement('tr');
-        newBottomPadding.id = 'virtual-scroll-bottom-padding';
-        newBottomPadding.style.height = bottomPaddingHeight + 'px';
-        newBottomPadding.setAttribute('aria-hidden', 'true');
-        fragment.appendChild(newBottomPadding);
-
-        // Replace tbody content
-        // tbody 콘텐츠 교체
-        tbody.innerHTML = '';
-        tbody.appendChild(fragment);
+        // Replace tbody content in one write
+        // tbody 콘텐츠를 한 번에 교체
+        tbody.innerHTML = spacer(topPaddingHeight) + rows.join('') + spacer(bottomPaddingHeight);
+
+        // Adopt the real row height once, after the first visible render
+        // 첫 번째 표시 렌더링 후 실제 행 높이를 한 번 반영
+        const firstRow = tbody.rows[1];
+        if (!this.state.rowHeightMeasured && firstRow && firstRow.offsetHeight) {{
+            this.state.rowHeightMeasured = true;
+            if (Math.abs(firstRow.offsetHeight - rowHeight) > 1) {{
+                this.config.rowHeight = firstRow.offsetHeight;
+                this.refresh();
+                return;
+            }}
+        }}
 
         // Announce to screen readers
         // 스크린 리더에 공지
@@ -272,6 +262,14 @@ const VirtualScroll = {{
         }}
     }},
 
+    /**
+     * Row HTML from renderRow, or the generic createRow fallback
+     * renderRow의 행 HTML 또는 일반 createRow 폴백
+     */
+    rowHtml: function(rowData, index) {{
+        return this.renderRow ? this.renderRow(rowData, index) : this.createRow(rowData, index).outerHTML;
+    }},
+
     /**
      * Create a table row element
      * 테이블 행 요소 생성
@@ -280,20 +278,12 @@ const VirtualScroll = {{
      * @returns {{HTMLElement}} Table row element
      */
     createRow: function(rowData, index) {{
-        // This should be customized based on actual column structure
-        // 실제 열 구조에 따라 사용자 정의되어야 함
+        // Generic row; pass renderRow to create() for real column layouts
+        // 일반 행 - 실제 열 구조는 create()에 renderRow 전달
         const tr = document.createElement('tr');
         tr.setAttribute('data-index', index);
         tr.setAttribute('role', 'row');
 
-        // Use the global createEmployeeRow function if available
-        // 사용 가능한 경우 전역 createEmployeeRow 함수 사용
-        if (typeof createEmployeeRow === 'function') {{
-            return createEmployeeRow(rowData, index);
-        }}
-
-        // Fallback: generic row creation
-        // 폴백: 일반 행 생성
         Object.values(rowData).forEach((value, colIndex) => {{
             const td = document.createElement('td');
             td.textContent = value ?? '-';
@@ -315,12 +305,26 @@ const VirtualScroll = {{
 
         if (newData.length <= this.config.threshold) {{
             this.config.enabled = false;
+            this.resetContainer();
             this.renderAllRows();
         }} else {{
             this.config.enabled = true;
+            this.setupContainer();
             this.state.scrollTop = 0;
             this.state.container.scrollTop = 0;
-            this.render();
+            this.refresh();
+        }}
+    }},
+
+    /**
+     * Re-render the current rows in place (e.g. after a selection change), keeping the scroll position
+     * 스크롤 위치를 유지하며 현재 행 다시 렌더링 (예: 선택 변경 후)
+     */
+    redraw: function() {{
+        if (this.config.enabled) {{
+            this.refresh();
+        }} else {{
+            this.renderAllRows();
         }}
     }},
 
@@ -329,16 +333,8 @@ const VirtualScroll = {{
      * 가상 스크롤링 없이 모든 행 렌더링 (소규모 데이터 세트용)
      */
     renderAllRows: function() {{
-        const tbody = this.state.tbody;
         const data = this.state.filteredData;
-
-        const fragment = document.createDocumentFragment();
-        data.forEach((rowData, index) => {{
-            fragment.appendChild(this.createRow(rowData, index));
-        }});
-
-        tbody.innerHTML = '';
-        tbody.appendChild(fragment);
+        this.state.tbody.innerHTML = data.map((rowData, index) => this.rowHtml(rowData, index)).join('');
     }},
 
     /**
@@ -401,45 +397,41 @@ window.VirtualScroll = VirtualScroll;
 // 가상 스크롤 통합
 // ========================================
 
+// One scroller per table body / 테이블 본문별 스크롤러
+const tableScrollers = {};
+
 /**
- * Initialize virtual scrolling for employee table
- * 직원 테이블용 가상 스크롤링 초기화
+ * Get (or lazily create) the scroller of a table body
+ * 테이블 본문의 스크롤러 반환 (없으면 생성)
+ * @param {string} tbodyId - Table body element ID
+ * @param {Function} renderRow - (rowData, index) => '<tr>...</tr>'
+ * @returns {Object|null} Scroller, or null if the table is missing
  */
-function initVirtualScrolling() {
-    // Check if we have large dataset
-    // 대규모 데이터 세트 확인
-    if (typeof employeeData !== 'undefined' && employeeData.length > 200) {
-        debugLog('Initializing virtual scrolling for', employeeData.length, 'employees');
-
-        // Initialize virtual scroll
-        // 가상 스크롤 초기화
-        VirtualScroll.init('employee-table-container', 'employeeTableBody', employeeData);
-
-        // Override filter function to use virtual scroll
-        // 가상 스크롤을 사용하도록 필터 함수 재정의
-        const originalFilter = window.filterEmployees;
-        window.filterEmployees = function(filterType) {
-            const filteredData = originalFilter(filterType, true);  // Get data without rendering
-            VirtualScroll.updateData(filteredData);
-        };
-
-        // Override search function
-        // 검색 함수 재정의
-        const originalSearch = window.searchEmployees;
-        window.searchEmployees = function() {
-            const filteredData = originalSearch(true);  // Get data without rendering
-            VirtualScroll.updateData(filteredData);
-        };
+function getTableScroller(tbodyId, renderRow) {
+    if (!tableScrollers[tbodyId]) {
+        const tbody = document.getElementById(tbodyId);
+        if (!tbody) return null;
+        const container = tbody.closest('.table-responsive') || tbody.parentElement;
+        const scroller = VirtualScroll.create({ renderRow: renderRow });
+        scroller.init(container, tbody, []);
+        tableScrollers[tbodyId] = scroller;
     }
+    return tableScrollers[tbodyId];
+}
+
+/**
+ * Re-measure scrollers once their tab or modal is visible
+ * 탭 또는 모달이 표시되면 스크롤러 재측정
+ */
+function initVirtualScrolling() {
+    const refreshAll = () => Object.values(tableScrollers).forEach(scroller => scroller.refresh());
+    document.addEventListener('shown.bs.tab', refreshAll);
+    document.addEventListener('shown.bs.modal', refreshAll);
 }
 
 // Initialize on DOM ready
 // DOM 준비 시 초기화
-document.addEventListener('DOMContentLoaded', function() {
-    // Delay initialization to ensure data is loaded
-    // 데이터 로드를 보장하기 위해 초기화 지연
-    setTimeout(initVirtualScrolling, 100);
-});
+document.addEventListener('DOMContentLoaded', initVirtualScrolling);
 """
 
 
@@ -3,14 +3,19 @@
 Standalone Google Drive synchronization script
 독립 실행형 구글 드라이브 동기화 스크립트
 """
+import os
 import sys
 import json
+import subprocess
 from pathlib import Path
 from datetime import datetime
+from src.data.attendance_converter import AttendanceConverter
 from src.integration.google_drive_manager import GoogleDriveManager
+from src.utils.file_hash import compute_content_hash
 
 
-def update_sync_manifest(month: int, year: int, month_name: str, project_root: Path):
+def update_sync_manifest(month: int, year: int, month_name: str, project_root: Path,
+                         synced_files: list = None):
     """
     Update sync manifest with year info from Google Drive folder
     Google Drive 폴더 정보로 동기화 매니페스트 업데이트
@@ -20,6 +25,8 @@ def update_sync_manifest(month: int, year: int, month_name: str, project_root: P
         year: Year from Google Drive folder / Google Drive 폴더의 연도
         month_name: Month name (e.g., 'september') / 월 이름 (예: 'september')
         project_root: Project root path / 프로젝트 루트 경로
+        synced_files: Local files of this sync, recorded with content hashes
+                      이번 동기화의 로컬 파일 (콘텐츠 해시와 함께 기록)
     """
     manifest_path = project_root / "input_files" / "sync_manifest.json"
 
@@ -41,7 +48,15 @@ def update_sync_manifest(month: int, year: int, month_name: str, project_root: P
         "year": year,
         "month": month,
         "folder": f"{year}_{month:02d}",
-        "synced_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        "synced_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "files": {
+            Path(path).as_posix(): {
+                "hash": compute_content_hash(project_root / path),
+                "bytes": (project_root / path).stat().st_size
+            }
+            for path in synced_files or []
+            if (project_root / path).exists()
+        }
     }
     manifest["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -54,11 +69,48 @@ def update_sync_manifest(month: int, year: int, month_name: str, project_root: P
     print(f"📋 Updated sync manifest: {manifest_path}")
     print(f"   {month_name} → {year}_{month:02d} (from Google Drive folder)")
 
+
+def start_cache_warm(month: int, year: int, project_root: Path) -> int:
+    """
+    Warm the columnar store and metric cache for the month in a background process
+    백그라운드 프로세스에서 해당 월의 컬럼형 저장소와 메트릭 캐시 준비
+
+    Args:
+        month: Month number (1-12) / 월 번호 (1-12)
+        year: Year / 연도
+        project_root: Project root path / 프로젝트 루트 경로
+
+    Returns:
+        int: PID of the warming process / 캐시 준비 프로세스 PID
+    """
+    log_path = project_root / "logs" / "cache_warm.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    command = [
+        sys.executable, str(project_root / "src" / "generate_dashboard.py"),
+        "--month", str(month), "--year", str(year), "--warm-cache"
+    ]
+    # Detach so the sync command returns while the caches fill
+    # 캐시가 채워지는 동안 동기화 명령이 바로 종료되도록 분리 실행
+    if os.name == 'nt':
+        detach = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        detach = {"start_new_session": True}
+    with open(log_path, 'a', encoding='utf-8') as log:
+        process = subprocess.Popen(command, cwd=project_root, stdout=log, stderr=subprocess.STDOUT,
+                                   stdin=subprocess.DEVNULL, **detach)
+
+    print(f"🔥 Warming caches in the background (pid {process.pid}, log: {log_path})")
+    return process.pid
+
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description='Sync monthly data from Google Drive')
     parser.add_argument('--month', type=int, required=True, help='Month (1-12)')
     parser.add_argument('--year', type=int, required=True, help='Year (e.g., 2025)')
+    parser.add_argument('--warm', action='store_true',
+                        help='Ingest the synced files and precompute metrics in the background '
+                             '/ 동기화된 파일 적재 및 메트릭 사전 계산을 백그라운드에서 실행')
     args = parser.parse_args()
     
     # Month name mapping
@@ -109,6 +161,7 @@ def main():
         }
         
         print("\nDownloading files:")
+        synced_files = []
         for file in files:
             if file['name'] in download_map:
                 local_path = download_map[file['name']]
@@ -131,6 +184,7 @@ def main():
                 
                 size_kb = int(file.get('size', 0)) / 1024
                 print(f"  ✅ {file['name']:40s} → {local_path}  ({size_kb:.1f} KB)")
+                synced_files.append(local_path)
         
         # Download AQL file
         print("\nDownloading AQL history:")
@@ -159,37 +213,23 @@ def main():
             
             size_kb = int(file.get('size', 0)) / 1024
             print(f"  ✅ {file['name']:40s} → {local_path}  ({size_kb:.1f} KB)")
+            synced_files.append(local_path)
         
-        # Convert attendance with column standardization
-        # 출석 데이터 변환 및 컬럼 표준화
-        import pandas as pd
-        orig = f'input_files/attendance/original/attendance data {month_name}.csv'
-        conv = f'input_files/attendance/converted/attendance data {month_name}_converted.csv'
-        if Path(orig).exists():
-            df = pd.read_csv(orig)
-
-            # Column name mapping for standardization
-            # 컬럼명 표준화 매핑
-            column_mapping = {
-                'Sequence': 'No.',
-                'Company Code': 'CoCode',
-                'Combination Department Code': 'Department',
-                'Personnel Number': 'ID No',
-                'Attendance Name': 'compAdd',
-                'Work Time Code': 'WTime'
-            }
-
-            # Apply mapping only for columns that exist
-            # 존재하는 컬럼만 매핑 적용
-            df = df.rename(columns={k: v for k, v in column_mapping.items() if k in df.columns})
-            df.to_csv(conv, index=False)
-            print(f"\n✅ Created converted attendance file: {conv}")
-            print(f"   Columns standardized: {list(df.columns)}")
+        # Convert attendance with column standardization (skipped if the original is unchanged)
+        # 출석 데이터 변환 및 컬럼 표준화 (원본이 변경되지 않았으면 건너뜀)
+        project_root = Path(__file__).parent
+        converted = AttendanceConverter(project_root).convert(month_name)
+        if converted:
+            synced_files.append(converted.relative_to(project_root))
 
         # Update sync manifest with year info from Google Drive folder
         # Google Drive 폴더 정보로 동기화 매니페스트 업데이트
-        project_root = Path(__file__).parent
-        update_sync_manifest(args.month, args.year, month_name, project_root)
+        update_sync_manifest(args.month, args.year, month_name, project_root, synced_files)
+
+        # Optional post-sync hook: make the next dashboard build a warm build
+        # 선택적 동기화 후 훅: 다음 대시보드 빌드가 웜 빌드가 되도록 함
+        if args.warm:
+            start_cache_warm(args.month, args.year, project_root)
 
         print(f"\n✅ All {month_name} {args.year} data synced successfully!")
         return 0
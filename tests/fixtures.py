@@ -0,0 +1,44 @@
+"""
+fixtures.py - Shared input data for the builder and API tests
+빌더 및 API 테스트가 공유하는 입력 데이터
+
+A four-employee November 2025 month:
+- 600000, 600003: TYPE-1 ASSEMBLY, active
+- 600001: STITCHING, hired 2025-11-10, pregnant
+- 600002: CUTTING, resigned 2025-11-20
+Attendance rows: 600000 (2025.11.03, 2025.11.04), 600001 (2), 600002 (1), none for 600003.
+직원 4명의 2025년 11월 데이터 (600001 입사·임신, 600002 퇴사, 600003 출결 기록 없음)
+"""
+
+from pathlib import Path
+
+
+MANPOWER_CSV = (
+    'Employee No,Full Name,Entrance Date,Stop working Date,ROLE TYPE STD,QIP POSITION 1ST  NAME,'
+    'QIP POSITION 2ND  NAME,QIP POSITION 3RD  NAME,FINAL QIP POSITION NAME CODE,MST direct boss name,'
+    'BUILDING,LINE,Final Incentive amount,pregnant vacation-yes or no\n'
+    '600000,Nguyễn Văn An,2024-01-03,,TYPE-1,ASSEMBLY LINE TQC,ASSEMBLY,ASSEMBLY,A1,,B1,L0,0,no\n'
+    '600001,Trần Thị Bích,2025-11-10,,TYPE-2,STITCHING INSPECTOR,STITCHING,STITCHING,A1,600000.0,B1,L1,1000,yes\n'
+    '600002,Lê Hoàng Cường,2024-03-03,2025-11-20,TYPE-2,CUTTING INSPECTOR,CUTTING,CUTTING,A1,600000.0,B1,L2,0,no\n'
+    '600003,Phạm Thị Dung,2024-04-04,,TYPE-1,ASSEMBLY LINE TQC,ASSEMBLY,ASSEMBLY,A1,600000.0,B1,L1,3000,no\n'
+)
+
+ATTENDANCE_CSV = (
+    'ID No,Last name,Work Date,compAdd,Reason Description,WTime,Come late,Leave early\n'
+    '600001,Trần Thị Bích,2025.11.12,Đi làm,,8,0,0\n'
+    '600000,Nguyễn Văn An,2025.11.04,Vắng mặt,Phép năm,8,0,0\n'
+    '600001,Trần Thị Bích,2025.11.11,Đi làm,,8,0,0\n'
+    '600000,Nguyễn Văn An,2025.11.03,Đi làm,,8,0,0\n'
+    '600002,Lê Hoàng Cường,2025.11.03,Vắng mặt,Nghỉ không phép,8,0,0\n'
+)
+
+
+def write_fixture_month(root: Path) -> None:
+    """
+    Write the four-employee November 2025 input set under root
+    root 아래에 직원 4명의 2025년 11월 입력 데이터 작성
+    """
+    converted = root / 'input_files' / 'attendance' / 'converted'
+    converted.mkdir(parents=True)
+    (root / 'input_files' / 'basic manpower data november.csv').write_text(MANPOWER_CSV, encoding='utf-8')
+    (converted / 'attendance data november_converted.csv').write_text(ATTENDANCE_CSV, encoding='utf-8')
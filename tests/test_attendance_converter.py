@@ -0,0 +1,114 @@
+"""
+test_attendance_converter.py - Unit tests for the original → converted attendance stage
+원본 → 변환 출근 데이터 단계 단위 테스트
+
+Tests for:
+- AttendanceConverter.convert (attendance_converter.py)
+- ColumnarStore.read (columnar_store.py)
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.attendance_converter import AttendanceConverter
+from src.data.schemas import read_source
+
+
+ORIGINAL_CSV = """Personnel Number,Last name,Work Date,Attendance Name,Reason Description,Work Time Code,Come late,Leave early
+600001,Nguyễn Văn An,2025.11.03,Đi làm,,8,0,0
+600001,Nguyễn Văn An,2025-11-04,đi làm,,8,"1,5",
+600002,Trần Thị Bình,2025/11/5,VẮNG MẶT,ar1 -  Không phép,8,0,0
+600002,Trần Thị Bình,2025.11.06,Vắng mặt,Phép năm,8,0,10
+"""
+
+
+class TestAttendanceConverter(unittest.TestCase):
+    """
+    Test normalization, columnar output and hash-based skipping
+    정규화, 컬럼형 출력 및 해시 기반 건너뛰기 테스트
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.converter = AttendanceConverter(self.root, chunk_size=2)
+        self.original, self.converted = self.converter.paths('november')
+        self.original.parent.mkdir(parents=True)
+        self.original.write_text(ORIGINAL_CSV, encoding='utf-8')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_normalizes_columns(self):
+        """Dates, compAdd, reason codes and minutes are normalized / 날짜, compAdd, 사유 코드, 분 정규화"""
+        self.converter.convert('november')
+        df = pd.read_csv(self.converted, encoding='utf-8')
+
+        self.assertEqual(list(df.columns[:4]), ['ID No', 'Last name', 'Work Date', 'compAdd'])
+        self.assertEqual(df['Work Date'].tolist(), ['2025.11.03', '2025.11.04', '2025.11.05', '2025.11.06'])
+        self.assertEqual(df['compAdd'].tolist(), ['Đi làm', 'Đi làm', 'Vắng mặt', 'Vắng mặt'])
+        self.assertEqual(df.loc[2, 'Reason Description'], 'AR1 - Không phép')
+        self.assertEqual(df['Come late'].tolist(), [0, 1.5, 0, 0])
+        self.assertEqual(df['Leave early'].tolist(), [0, 0, 0, 10])
+
+    def test_encoding_fallback_after_prefix(self):
+        """A cp949 row past the sniffed prefix restarts the stream / 샘플 이후의 cp949 행은 스트림을 다시 시작"""
+        self.original.write_bytes(
+            ORIGINAL_CSV.splitlines()[0].encode('ascii') + b'\n'
+            + b'600001,An,2025.11.03,Di lam,,8,0,0\n' * 5000
+            + '600009,김민수,2025.11.07,Di lam,,8,0,0\n'.encode('cp949')
+        )
+        converter = AttendanceConverter(self.root)
+
+        converter.convert('november')
+
+        df = pd.read_csv(self.converted, encoding='utf-8')
+        self.assertEqual(len(df), 5001)
+        self.assertEqual(df['Last name'].iloc[-1], '김민수')
+        self.assertEqual(converter.encodings.lookup(self.original), 'cp949')
+
+    def test_cached_frame_matches_csv(self):
+        """The columnar frame equals reading the converted CSV with its schema / 컬럼형 프레임이 스키마로 읽은 변환 CSV와 동일"""
+        self.converter.convert('november')
+        cached = self.converter.store.read(self.converted)
+
+        self.assertIsNotNone(cached)
+        pd.testing.assert_frame_equal(cached, read_source(self.converted, 'attendance'))
+
+    def test_unchanged_original_is_skipped(self):
+        """Second run with the same original does not rewrite / 같은 원본이면 다시 쓰지 않음"""
+        self.converter.convert('november')
+        first_mtime = self.converted.stat().st_mtime_ns
+        self.assertTrue(self.converter.is_up_to_date('november'))
+
+        self.converter.convert('november')
+        self.assertEqual(self.converted.stat().st_mtime_ns, first_mtime)
+
+        self.original.write_text(ORIGINAL_CSV.replace('600002', '600003'), encoding='utf-8')
+        self.assertFalse(self.converter.is_up_to_date('november'))
+        self.converter.convert('november')
+        self.assertIn(600003, pd.read_csv(self.converted)['ID No'].tolist())
+
+    def test_year_folder(self):
+        """An archived original converts inside its year folder / 연도 폴더의 원본은 같은 연도 폴더에 변환"""
+        original, converted = self.converter.paths('november', 2024)
+        self.assertEqual(converted, self.root / 'input_files' / '2024' / 'attendance' / 'converted'
+                         / 'attendance data november_converted.csv')
+        original.parent.mkdir(parents=True)
+        original.write_text(ORIGINAL_CSV.replace('600002', '600004'), encoding='utf-8')
+
+        self.assertEqual(self.converter.convert('november', year=2024), converted)
+        self.assertIn(600004, pd.read_csv(converted)['ID No'].tolist())
+        self.assertFalse(self.converted.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
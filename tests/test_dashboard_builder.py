@@ -0,0 +1,205 @@
+"""
+test_dashboard_builder.py - Unit tests for CompleteDashboardBuilder data preparation
+CompleteDashboardBuilder 데이터 준비 단위 테스트
+
+Tests for:
+- prepare() / render(language) (complete_dashboard_builder.py)
+- _index_attendance_records
+- prepare(metrics_only=True) / to_metrics_bundle
+- _build_employee_filter_index
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.monthly_data_collector import MonthlyDataCollector
+from src.analytics.hr_metric_calculator import HRMetricCalculator
+from src.visualization.complete_dashboard_builder import CompleteDashboardBuilder, METRICS_BUNDLE_SCHEMA_VERSION
+from tests.fixtures import write_fixture_month
+
+
+class BuilderFixture(unittest.TestCase):
+    """
+    Builder over the fixture month; the working directory is the fixture root
+    because attendance files are read by relative path
+    픽스처 월을 사용하는 빌더 (출결 파일을 상대 경로로 읽으므로 작업 디렉토리를 픽스처 루트로 변경)
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        write_fixture_month(self.root)
+        self.cwd = os.getcwd()
+        os.chdir(self.root)
+        HRMetricCalculator.clear_cache()
+
+        collector = MonthlyDataCollector(self.root, target_year=2025, cache_data=True)
+        self.builder = CompleteDashboardBuilder(
+            '2025-11', report_date=datetime(2025, 11, 30), collector=collector
+        )
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        HRMetricCalculator.clear_cache()
+        self.tmp.cleanup()
+
+
+class TestRenderLanguages(BuilderFixture):
+    """
+    One prepare() serves every language
+    prepare() 한 번으로 모든 언어 렌더링
+    """
+
+    def test_two_languages_from_one_prepare(self):
+        """render() switches language without re-reading inputs / render()는 입력 재로딩 없이 언어 전환"""
+        self.builder.prepare()
+
+        with patch('pandas.read_csv') as read_csv, \
+                patch.object(self.builder.calculator, 'calculate_all_metrics') as calculate:
+            korean = self.builder.render('ko')
+            english = self.builder.render('en')
+        read_csv.assert_not_called()
+        calculate.assert_not_called()
+
+        self.assertIn("let currentLanguage = 'ko';", korean)
+        self.assertIn("let currentLanguage = 'en';", english)
+        self.assertEqual(self.builder.language, 'en')
+        self.assertEqual(self.builder.month_labels, self.builder.collector.get_month_labels(['2025-11'], 'en'))
+
+
+class TestAttendanceOffsets(BuilderFixture):
+    """
+    Test the per-employee attendance offset index
+    직원별 출결 오프셋 인덱스 테스트
+    """
+
+    @staticmethod
+    def _record(employee_no, work_date):
+        return {'employee_no': employee_no, 'work_date': work_date}
+
+    def test_unsorted_records(self):
+        """Records are grouped by employee and ordered by date / 직원별로 묶이고 날짜순 정렬"""
+        records = [
+            self._record('600002', '2025.11.05'),
+            self._record('600001', '2025.11.12'),
+            self._record('600002', 'not a date'),
+            self._record('600001', '2025.11.03'),
+            self._record('600002', '2025.11.04'),
+        ]
+
+        sorted_records, offsets = CompleteDashboardBuilder._index_attendance_records(records)
+
+        self.assertEqual(
+            [(r['employee_no'], r['work_date']) for r in sorted_records],
+            [('600001', '2025.11.03'), ('600001', '2025.11.12'),
+             ('600002', '2025.11.04'), ('600002', '2025.11.05'), ('600002', 'not a date')]
+        )
+        self.assertEqual(offsets, {'600001': [0, 2], '600002': [2, 5]})
+        for employee_no, (start, end) in offsets.items():
+            self.assertTrue(all(r['employee_no'] == employee_no for r in sorted_records[start:end]))
+
+    def test_no_records(self):
+        """Empty input gives an empty index / 빈 입력은 빈 인덱스"""
+        self.assertEqual(CompleteDashboardBuilder._index_attendance_records([]), ([], {}))
+
+    def test_employee_without_records(self):
+        """An employee with no attendance rows has no offset entry / 출결 기록이 없는 직원은 오프셋 없음"""
+        self.builder.prepare()
+
+        self.assertEqual(self.builder.attendance_offsets,
+                         {'600000': [0, 2], '600001': [2, 4], '600002': [4, 5]})
+        self.assertNotIn('600003', self.builder.attendance_offsets)
+        self.assertEqual([r['work_date'] for r in self.builder.attendance_data[0:2]],
+                         ['2025.11.03', '2025.11.04'])
+
+
+class TestMetricsBundle(BuilderFixture):
+    """
+    Test the headless metrics bundle
+    헤드리스 메트릭 번들 테스트
+    """
+
+    def test_metrics_only_bundle(self):
+        """Versioned, JSON-ready bundle without the HTML-only datasets / HTML 전용 데이터 없는 버전 번들"""
+        self.builder.prepare(metrics_only=True)
+        bundle = self.builder.to_metrics_bundle()
+
+        self.assertEqual(bundle['schema_version'], METRICS_BUNDLE_SCHEMA_VERSION)
+        self.assertEqual(set(bundle), {
+            'schema_version', 'generated_at', 'target_month', 'report_date', 'available_months',
+            'monthly_metrics', 'data_quality', 'team_data', 'previous_month_team_data',
+            'monthly_team_counts', 'hierarchy_data'
+        })
+        self.assertEqual((bundle['target_month'], bundle['report_date']), ('2025-11', '2025-11-30'))
+        self.assertEqual(bundle['available_months'], ['2025-11'])
+        self.assertIn('total_employees', bundle['monthly_metrics']['2025-11'])
+        self.assertEqual(set(bundle['data_quality']),
+                         {'score', 'grade', 'total_checks', 'passed_checks', 'warnings'})
+        self.assertEqual(json.loads(json.dumps(bundle)), bundle)
+
+        self.assertEqual(self.builder.employee_details, [])
+        self.assertEqual(self.builder.attendance_data, [])
+
+
+class TestEmployeeFilterIndex(BuilderFixture):
+    """
+    Precomputed filter rows equal filtering employeeDetails row by row
+    사전 계산된 필터 행이 employeeDetails를 직접 필터링한 결과와 동일
+    """
+
+    # Conditions the Employee Details filter chips stand for / 필터 칩이 의미하는 조건
+    FLAG_CONDITIONS = {
+        'active': lambda e: e['is_active'] is True,
+        'hired': lambda e: e['hired_this_month'] is True,
+        'resigned': lambda e: e['resigned_this_month'] is True,
+        'perfect': lambda e: e['perfect_attendance'] is True,
+        'absent': lambda e: e['absent_days'] >= 1,
+        'unauthorized': lambda e: e['has_unauthorized_absence'] is True,
+        'longterm': lambda e: e['long_term'] is True,
+        'new60': lambda e: e['under_60_days'] is True,
+        'pregnant': lambda e: e['is_pregnant'] is True,
+        'long_absence': lambda e: e['absent_days'] >= 5,
+        'data_error': lambda e: e['has_data_error'] is True,
+    }
+
+    def test_matches_brute_force_filter(self):
+        """Every flag:, team: and type: row list matches a scan / 모든 flag:, team:, type: 행 목록이 전체 스캔과 일치"""
+        self.builder.prepare()
+        details = self.builder.employee_details
+        index = self.builder.employee_filter_index
+
+        expected = {
+            f'flag:{flag}': [i for i, e in enumerate(details) if condition(e)]
+            for flag, condition in self.FLAG_CONDITIONS.items()
+        }
+        for field, prefix in (('team_name', 'team'), ('TYPE', 'type')):
+            for value in {e[field] for e in details}:
+                expected[f'{prefix}:{value}'] = [i for i, e in enumerate(details) if e[field] == value]
+
+        self.assertEqual(index, expected)
+
+    def test_fixture_rows(self):
+        """Known fixture employees land in the expected rows / 픽스처 직원이 예상 행에 포함"""
+        self.builder.prepare()
+        row_of = {e['employee_id']: i for i, e in enumerate(self.builder.employee_details)}
+        index = self.builder.employee_filter_index
+
+        self.assertEqual(len(row_of), 4)
+        self.assertIn(row_of['600001'], index['flag:hired'])
+        self.assertIn(row_of['600001'], index['flag:pregnant'])
+        self.assertIn(row_of['600002'], index['flag:resigned'])
+        self.assertEqual(index['type:TYPE-1'], sorted([row_of['600000'], row_of['600003']]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+test_downsampling.py - Unit tests for trend series downsampling
+추세 시계열 다운샘플링 단위 테스트
+
+Tests for:
+- lttb_indices / minmax_indices (downsampling.py)
+- downsample_series
+- ChartGenerator.save_full_resolution / generate_chart_html (chart_generator.py)
+"""
+
+import json
+import math
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.downsampling import downsample_series, lttb_indices, minmax_indices
+from src.visualization.chart_generator import ChartConfig, ChartData, ChartGenerator
+
+
+class TestLTTB(unittest.TestCase):
+    """
+    Test Largest-Triangle-Three-Buckets selection
+    LTTB 선택 테스트
+    """
+
+    def setUp(self):
+        # Two years of daily values with one spike / 스파이크 하나가 있는 2년치 일별 값
+        self.values = [math.sin(i / 50) for i in range(730)]
+        self.values[400] = 10.0
+
+    def test_point_count_and_endpoints(self):
+        """Keeps exactly threshold points incl. first/last / 첫/마지막 포함 정확히 threshold개 유지"""
+        indices = lttb_indices(self.values, 100)
+        self.assertEqual(len(indices), 100)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 729)
+        self.assertEqual(indices, sorted(set(indices)))
+
+    def test_keeps_spike(self):
+        """Visually significant spike survives / 시각적으로 중요한 스파이크 유지"""
+        self.assertIn(400, lttb_indices(self.values, 100))
+
+    def test_short_series_unchanged(self):
+        """Series at or below threshold are untouched / threshold 이하 시계열은 그대로"""
+        self.assertEqual(lttb_indices([1, 2, 3], 10), [0, 1, 2])
+
+    def test_missing_values_skipped(self):
+        """None/NaN are not chosen when a bucket has values / 버킷에 값이 있으면 None/NaN 미선택"""
+        values = [None if i % 5 == 0 else float(i % 17) for i in range(200)]
+        values[-1] = float('nan')
+        indices = lttb_indices(values, 20)
+        self.assertTrue(all(values[i] is not None for i in indices[1:-1]))
+
+
+class TestMinMax(unittest.TestCase):
+    """
+    Test min/max bucketing
+    min/max 버킷 테스트
+    """
+
+    def test_keeps_extremes(self):
+        """Each bucket's min and max are kept / 각 버킷의 최소/최대 유지"""
+        values = [0.0] * 500
+        values[123], values[321] = 9.0, -9.0
+        indices = minmax_indices(values, 50)
+        self.assertLessEqual(len(indices), 50)
+        self.assertIn(123, indices)
+        self.assertIn(321, indices)
+
+
+class TestDownsampleSeries(unittest.TestCase):
+    """
+    Test labelled series downsampling
+    라벨 시계열 다운샘플링 테스트
+    """
+
+    def test_labels_follow_values(self):
+        """Labels stay aligned with kept values / 라벨과 값 정렬 유지"""
+        labels = [f"D{i}" for i in range(1000)]
+        values = list(range(1000))
+        new_labels, new_values, indices = downsample_series(labels, values, 50)
+        self.assertEqual(len(new_values), 50)
+        self.assertEqual(new_labels, [f"D{v}" for v in new_values])
+        self.assertEqual(new_values, indices)
+
+    def test_unknown_method(self):
+        """Unknown method raises ValueError / 알 수 없는 방식은 ValueError"""
+        with self.assertRaises(ValueError):
+            downsample_series(['a'], [1], 10, method='average')
+
+
+class TestFullResolutionChart(unittest.TestCase):
+    """
+    The full-resolution series stays out of the chart HTML
+    전체 해상도 시계열은 차트 HTML에 포함되지 않음
+    """
+
+    def setUp(self):
+        self.generator = ChartGenerator()
+        full_values = [1000 + i for i in range(1000)]
+        labels, values, _ = downsample_series([f"D{i}" for i in range(1000)], full_values, 50)
+        self.chart = ChartConfig(
+            chart_type='line',
+            data=ChartData(
+                labels=labels,
+                datasets=[{'label': 'rate', 'data': values}],
+                metadata={'full_resolution': {'labels': [f"D{i}" for i in range(1000)], 'data': full_values}}
+            ),
+            options={}
+        )
+
+    def test_series_fetched_from_url(self):
+        """Only the URL is embedded, the series goes to a JSON file / URL만 포함되고 시계열은 JSON 파일로 저장"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.generator.save_full_resolution(self.chart, Path(tmp) / 'trend_full.json')
+            with open(path, 'r', encoding='utf-8') as f:
+                self.assertEqual(json.load(f), self.chart.data.metadata['full_resolution'])
+
+        html = self.generator.generate_chart_html(self.chart, full_resolution_url='trend_full.json')
+
+        self.assertIn('const fullResolutionUrl = "trend_full.json";', html)
+        dropped = set(self.chart.data.metadata['full_resolution']['labels']) - set(self.chart.data.labels)
+        self.assertEqual(len(dropped), 950)
+        self.assertFalse([label for label in dropped if f'"{label}"' in html])
+
+    def test_overview_only_by_default(self):
+        """Without a URL no zoom is wired up / URL이 없으면 확대 기능 없음"""
+        html = self.generator.generate_chart_html(self.chart)
+        self.assertIn('const fullResolutionUrl = null;', html)
+
+    def test_not_downsampled(self):
+        """Charts that were not decimated write no file / 다운샘플링되지 않은 차트는 파일 없음"""
+        self.chart.data.metadata.clear()
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(self.generator.save_full_resolution(self.chart, Path(tmp) / 'trend_full.json'))
+        self.assertIn('const fullResolutionUrl = null;',
+                      self.generator.generate_chart_html(self.chart, full_resolution_url='trend_full.json'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,291 @@
+"""
+test_drive_sync_engine.py - Unit tests for the concurrent Drive sync engine
+동시 Drive 동기화 엔진 단위 테스트
+
+Runs against FakeDriveService, a local stand-in for the Drive v3 files() API.
+Drive v3 files() API의 로컬 대체인 FakeDriveService로 실행합니다.
+
+Tests for:
+- ConcurrentDriveSync.sync (drive_sync_engine.py)
+- is_transient_error
+- download_atomic (drive_download.py)
+"""
+
+import hashlib
+import re
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.integration.drive_download import DownloadIntegrityError, download_atomic
+from src.integration.drive_sync_engine import ConcurrentDriveSync, DriveSyncTask, is_transient_error
+
+
+class FakeHttpError(Exception):
+    """Mimics googleapiclient HttpError (resp.status) / HttpError 모방"""
+
+    def __init__(self, status: int):
+        super().__init__(f"HTTP {status}")
+        self.resp = SimpleNamespace(status=status)
+
+
+class FakeDriveService:
+    """
+    In-memory Drive: paths map to bytes, every request sleeps `latency` seconds
+    메모리 Drive: 경로별 바이트, 모든 요청은 latency초 대기
+    """
+
+    def __init__(self, files: dict, latency: float = 0.0):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.list_queries = []
+        self.media_requests = []
+        self.calls = []  # every executed request by kind / 실행된 모든 요청 종류
+        self.change_log = []  # changed file ids; a page token is an offset / 변경된 파일 ID (페이지 토큰 = 위치)
+        self.failures = {}  # file id -> remaining transient failures / 남은 일시적 실패 횟수
+        self.nodes = {}  # (parent id, name) -> node
+        for path, content in files.items():
+            parent = 'root'
+            *folders, name = path.split('/')
+            for folder in folders:
+                key = (parent, folder)
+                self.nodes.setdefault(key, {'id': f"{parent}/{folder}", 'name': folder, 'folder': True})
+                parent = self.nodes[key]['id']
+            self.nodes[(parent, name)] = {'id': f"{parent}/{name}", 'name': name, 'folder': False, 'parent': parent,
+                                          'content': content, 'modifiedTime': '2025-10-01T00:00:00Z'}
+
+    def update(self, path: str, content: bytes):
+        """Upload a new revision of an existing file / 기존 파일의 새 리비전 업로드"""
+        node = next(n for n in self.nodes.values() if n['id'] == f"root/{path}")
+        node['content'] = content
+        node['modifiedTime'] = '2025-10-02T00:00:00Z'
+        self.change_log.append(node['id'])
+
+    def _resource(self, node: dict) -> dict:
+        content = node.get('content', b'')
+        return {'id': node['id'], 'name': node['name'], 'parents': [node.get('parent')], 'trashed': False,
+                'modifiedTime': node.get('modifiedTime'), 'size': str(len(content)),
+                'md5Checksum': hashlib.md5(content).hexdigest()}
+
+    def _execute(self, kind: str, result):
+        time.sleep(self.latency)
+        with self.lock:
+            self.calls.append(kind)
+        return result()
+
+    def changes(self):
+        def get_start_page_token():
+            return SimpleNamespace(execute=lambda: self._execute(
+                'getStartPageToken', lambda: {'startPageToken': str(len(self.change_log))}))
+
+        def list_changes(pageToken: str, pageSize: int, fields: str):
+            def result():
+                changed = [n for fid in self.change_log[int(pageToken):]
+                           for n in self.nodes.values() if n['id'] == fid]
+                return {'changes': [{'fileId': n['id'], 'removed': False, 'file': self._resource(n)} for n in changed],
+                        'newStartPageToken': str(len(self.change_log))}
+            return SimpleNamespace(execute=lambda: self._execute('changes', result))
+
+        return SimpleNamespace(getStartPageToken=get_start_page_token, list=list_changes)
+
+    def files(self):
+        return self
+
+    def list(self, q: str, fields: str):
+        name = re.search(r"name='((?:[^'\\]|\\.)*)'", q).group(1).replace("\\'", "'")
+        parent = re.search(r"'([^']*)' in parents", q).group(1)
+
+        def result():
+            with self.lock:
+                self.list_queries.append(q)
+            node = self.nodes.get((parent, name))
+            if node is None or ('mimeType' in q and not node['folder']):
+                return {'files': []}
+            return {'files': [self._resource(node)]}
+
+        return SimpleNamespace(execute=lambda: self._execute('list', result))
+
+    def get_media(self, fileId: str):
+        with self.lock:
+            self.calls.append('get_media')
+            self.media_requests.append(fileId)
+            if self.failures.get(fileId):
+                self.failures[fileId] -= 1
+                raise FakeHttpError(503)
+        node = next(n for n in self.nodes.values() if n['id'] == fileId)
+        return SimpleNamespace(content=node['content'])
+
+    def download(self, request, fh, start=0, on_progress=None):
+        time.sleep(self.latency)
+        fh.write(request.content[start:])
+
+
+class TestConcurrentDriveSync(unittest.TestCase):
+    """
+    Test concurrent resolution, retries and caching
+    동시 탐색, 재시도, 캐싱 테스트
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        files = {f"monthly_data/2025_{m:02d}/basic_manpower_data.csv": f"month {m}".encode() for m in (7, 8, 9)}
+        files.update({f"aql_history/AQL_REPORT_{m}_2025.csv": m.encode() for m in ('JULY', 'AUGUST', 'SEPTEMBER')})
+        self.drive = FakeDriveService(files, latency=0.05)
+        self.tasks = [DriveSyncTask(path, str(self.root / 'input' / path.replace('/', '_')), path) for path in files]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_engine(self, **kwargs) -> ConcurrentDriveSync:
+        options = dict(service_factory=lambda: self.drive, root_folder_id='root', cache_dir=self.root / 'cache',
+                       max_workers=8, backoff_seconds=0, media_download=self.drive.download)
+        options.update(kwargs)
+        return ConcurrentDriveSync(**options)
+
+    def test_parallel_sync(self):
+        """Six files take about one file's time, shared folders listed once / 6개 파일이 1개 시간, 공유 폴더는 1회 조회"""
+        started = time.perf_counter()
+        outcomes = self.make_engine().sync(self.tasks + self.tasks[:2])
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual([o.status for o in outcomes], ['downloaded'] * 6)
+        self.assertLess(elapsed, 0.05 * 4 * 3)  # sequential would take ~6 x 4 requests / 순차 실행 시 약 6 x 4 요청
+        folder_queries = [q for q in self.drive.list_queries if "name='monthly_data'" in q]
+        self.assertEqual(len(folder_queries), 1)
+        self.assertEqual(Path(self.tasks[0].local_path).read_bytes(), b'month 7')
+
+    def test_transient_errors_retried(self):
+        """503s are retried until success / 503은 성공할 때까지 재시도"""
+        self.drive.failures['root/aql_history/AQL_REPORT_JULY_2025.csv'] = 2
+        outcome = self.make_engine(retry_attempts=3).sync_one(self.tasks[3])
+
+        self.assertEqual(outcome.status, 'downloaded')
+        self.assertEqual(outcome.attempts, 5)  # 2 lookups + 3 downloads / 조회 2회 + 다운로드 3회
+
+    def test_missing_and_failed(self):
+        """Missing files and exhausted retries are reported, not raised / 없는 파일과 재시도 소진은 결과로 보고"""
+        self.drive.failures['root/aql_history/AQL_REPORT_JULY_2025.csv'] = 5
+        outcomes = self.make_engine(retry_attempts=2).sync([
+            self.tasks[3],
+            DriveSyncTask('monthly_data/2025_12/basic_manpower_data.csv', str(self.root / 'missing.csv'))
+        ])
+
+        self.assertEqual([o.status for o in outcomes], ['failed', 'missing'])
+        self.assertFalse(outcomes[0].ok)
+
+    def test_colliding_local_paths_rejected(self):
+        """Two drive paths into one local file fail before any request / 같은 로컬 파일에 기록하는 두 경로는 요청 전에 거부"""
+        tasks = [self.tasks[0], DriveSyncTask(self.tasks[1].drive_path, self.tasks[0].local_path)]
+        with self.assertRaises(ValueError):
+            self.make_engine().sync(tasks)
+        self.assertEqual(self.drive.calls, [])
+
+    def test_cache_reused(self):
+        """Second sync downloads nothing / 두 번째 동기화는 다운로드 없음"""
+        self.make_engine().sync(self.tasks)
+        self.drive.media_requests.clear()
+        outcomes = self.make_engine().sync(self.tasks)
+
+        self.assertEqual({o.status for o in outcomes}, {'cached'})
+        self.assertEqual(self.drive.media_requests, [])
+
+    def test_unchanged_sync_is_one_request(self):
+        """With the path index and changes token, a no-change sync is one request / 변경 없는 동기화는 요청 1회"""
+        self.make_engine().sync(self.tasks)
+        self.assertEqual(self.drive.calls.count('getStartPageToken'), 1)
+
+        self.drive.calls.clear()
+        outcomes = self.make_engine().sync(self.tasks)
+
+        self.assertEqual(self.drive.calls, ['changes'])
+        self.assertEqual({o.status for o in outcomes}, {'cached'})
+
+    def test_changed_file_downloaded(self):
+        """Only the file reported by the changes feed is downloaded / 변경 내역에 있는 파일만 다운로드"""
+        self.make_engine().sync(self.tasks)
+        self.drive.update('aql_history/AQL_REPORT_AUGUST_2025.csv', b'revised')
+
+        self.drive.calls.clear()
+        outcomes = self.make_engine().sync(self.tasks)
+
+        self.assertEqual(sorted(self.drive.calls), ['changes', 'get_media'])
+        self.assertEqual([o.task.drive_path for o in outcomes if o.status == 'downloaded'],
+                         ['aql_history/AQL_REPORT_AUGUST_2025.csv'])
+        self.assertEqual(Path(self.tasks[4].local_path).read_bytes(), b'revised')
+
+    def test_is_transient_error(self):
+        """Rate limits and server errors retry, client errors do not / 429/5xx만 재시도"""
+        self.assertTrue(is_transient_error(FakeHttpError(429)))
+        self.assertTrue(is_transient_error(ConnectionResetError()))
+        self.assertFalse(is_transient_error(FakeHttpError(404)))
+        self.assertFalse(is_transient_error(ValueError()))
+
+
+class TestDownloadAtomic(unittest.TestCase):
+    """
+    Test streaming downloads through a verified .part file
+    검증된 .part 파일을 통한 스트리밍 다운로드 테스트
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dest = Path(self.tmp.name) / 'attendance data october.csv'
+        self.part = self.dest.with_name(self.dest.name + '.part')
+        self.content = b'ID,Work Date\n' + b'1,2025.10.01\n' * 1000
+        self.md5 = hashlib.md5(self.content).hexdigest()
+        self.starts = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def download(self, request, fh, start=0, on_progress=None):
+        self.starts.append(start)
+        for offset in range(start, len(request), 4096):
+            fh.write(request[offset:offset + 4096])
+
+    def test_writes_verified_file(self):
+        """Complete file replaces destination, no .part left / 완성 파일이 대상 교체, .part 없음"""
+        self.dest.write_bytes(b'old')
+        size = download_atomic(self.content, str(self.dest), self.md5, len(self.content), self.download)
+
+        self.assertEqual(size, len(self.content))
+        self.assertEqual(self.dest.read_bytes(), self.content)
+        self.assertFalse(self.part.exists())
+
+    def test_md5_mismatch_keeps_old_file(self):
+        """Corrupt download raises and leaves the previous file untouched / 손상된 다운로드는 예외, 기존 파일 유지"""
+        self.dest.write_bytes(b'old')
+        with self.assertRaises(DownloadIntegrityError):
+            download_atomic(self.content, str(self.dest), 'deadbeef', len(self.content), self.download)
+
+        self.assertEqual(self.dest.read_bytes(), b'old')
+        self.assertFalse(self.part.exists())
+
+    def test_resumes_partial_download(self):
+        """Existing .part is continued from its size / 기존 .part는 그 크기부터 이어받음"""
+        self.part.write_bytes(self.content[:5000])
+        download_atomic(self.content, str(self.dest), self.md5, len(self.content), self.download)
+
+        self.assertEqual(self.starts, [5000])
+        self.assertEqual(self.dest.read_bytes(), self.content)
+
+    def test_stale_partial_restarts(self):
+        """A .part from an older revision fails md5 and is re-downloaded / 이전 리비전의 .part는 처음부터 다시 받음"""
+        self.part.write_bytes(b'X' * 5000)
+        download_atomic(self.content, str(self.dest), self.md5, len(self.content), self.download)
+
+        self.assertEqual(self.starts, [5000, 0])
+        self.assertEqual(self.dest.read_bytes(), self.content)
+
+
+if __name__ == '__main__':
+    unittest.main()
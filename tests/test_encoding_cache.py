@@ -0,0 +1,73 @@
+"""
+test_encoding_cache.py - Unit tests for the shared encoding detection cache
+공유 인코딩 탐지 캐시 단위 테스트
+
+Tests for:
+- EncodingCache.lookup / read_csv (encoding_cache.py)
+- MonthlyDataCollector.load_month_data decoding (monthly_data_collector.py)
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.monthly_data_collector import MonthlyDataCollector
+from src.utils import encoding_cache
+from src.utils.encoding_cache import EncodingCache
+
+
+class TestEncodingCache(unittest.TestCase):
+    """
+    Test detection, persistence and full-read fallback
+    탐지, 저장 및 전체 읽기 대체 테스트
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.path = self.root / 'input_files' / 'basic manpower data november.csv'
+        self.path.parent.mkdir()
+        self.path.write_bytes('Employee No,이름\n1,김민수\n'.encode('cp949'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_detected_once_per_content(self):
+        """A second cache instance reuses the persisted result / 두 번째 인스턴스는 저장된 결과 사용"""
+        self.assertEqual(EncodingCache.for_project(self.root).lookup(self.path), 'cp949')
+
+        with patch.object(encoding_cache, 'detect_encoding') as detect:
+            cache = EncodingCache.for_project(self.root)
+            self.assertEqual(cache.lookup(self.path), 'cp949')
+            self.assertEqual(cache.read_csv(self.path)['이름'].tolist(), ['김민수'])
+        detect.assert_not_called()
+
+    def test_fallback_when_prefix_misleads(self):
+        """A file whose prefix looks UTF-8 is re-read and re-recorded / 앞부분만 UTF-8인 파일은 다시 읽고 기록"""
+        self.path.write_bytes(b'Employee No,Name\n' + b'1,A\n' * 20000 + '2,김민수\n'.encode('cp949'))
+        cache = EncodingCache.for_project(self.root)
+
+        df = cache.read_csv(self.path)
+
+        self.assertEqual(df['Name'].iloc[-1], '김민수')
+        self.assertEqual(EncodingCache.for_project(self.root).lookup(self.path), 'cp949')
+
+    def test_collector_falls_back(self):
+        """load_month_data decodes past a misleading prefix / load_month_data도 샘플 이후 디코딩 실패 시 재시도"""
+        self.path.write_bytes(b'Employee No,Full Name\n' + b'1,A\n' * 20000 + '2,김민수\n'.encode('cp949'))
+        collector = MonthlyDataCollector(self.root, target_year=2025)
+
+        df = collector.load_month_data('2025-11', sources=['basic_manpower'])['basic_manpower']
+
+        self.assertEqual(len(df), 20001)
+        self.assertEqual(df['Full Name'].iloc[-1], '김민수')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+test_excel_reader.py - Unit tests for streaming Excel ingestion
+스트리밍 Excel 적재 단위 테스트
+
+Tests for:
+- read_excel_streaming (excel_reader.py)
+- DataLoader._load_csv_or_excel .xlsx path (data_loader.py)
+"""
+
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+import pandas as pd
+from openpyxl import Workbook
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.data_loader import DataLoader
+from src.data import excel_reader
+from src.data.columnar_store import ColumnarStore
+from src.data.excel_reader import read_excel_streaming
+from src.data.schemas import read_source
+from src.utils.encoding_cache import EncodingCache
+
+
+HEADER = ['Employee No', 'Full Name', 'Entrance Date', 'ROLE TYPE STD', 'MST direct boss name', 'LINE']
+ROWS = [
+    (600000, 'Nguyễn Văn An', datetime(2025, 1, 2), 'TYPE-1', None, 'L2'),
+    (600001, 'Trần Thị Bình', datetime(2025, 2, 3), 'TYPE-2', 600000, 'L1'),
+    (600002, 'Lê Hoàng Cường', datetime(2025, 3, 4), 'TYPE-2', 600000, 'L3'),
+    (None, None, None, None, None, None),
+    (600003, 'Phạm Thị Dung', datetime(2025, 4, 5), 'TYPE-3', 600001, 'L1'),
+]
+
+
+class TestExcelReader(unittest.TestCase):
+    """
+    Test batch typing and columnar caching of .xlsx files
+    .xlsx 파일의 배치 타입 지정 및 컬럼형 캐시 테스트
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.xlsx = self.root / 'basic manpower data november.xlsx'
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(HEADER)
+        for row in ROWS:
+            sheet.append(row)
+        workbook.save(self.xlsx)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_batches_match_csv_schema(self):
+        """Batched workbook equals the same data read from CSV / 배치로 읽은 워크북이 CSV와 동일"""
+        csv = self.root / 'basic manpower data november.csv'
+        csv.write_text(
+            ','.join(HEADER) + '\n'
+            '600000,Nguyễn Văn An,2025-01-02,TYPE-1,,L2\n'
+            '600001,Trần Thị Bình,2025-02-03,TYPE-2,600000.0,L1\n'
+            '600002,Lê Hoàng Cường,2025-03-04,TYPE-2,600000.0,L3\n'
+            '600003,Phạm Thị Dung,2025-04-05,TYPE-3,600001.0,L1\n',
+            encoding='utf-8'
+        )
+
+        df = read_excel_streaming(self.xlsx, 'basic_manpower', batch_size=2)
+
+        pd.testing.assert_frame_equal(df, read_source(csv, 'basic_manpower'))
+        self.assertEqual(list(df['LINE'].cat.categories), ['L1', 'L2', 'L3'])
+
+    def test_loader_reads_workbook_once(self):
+        """A second loader takes the workbook from the columnar cache / 두 번째 로더는 컬럼형 캐시 사용"""
+        def load():
+            loader = DataLoader(
+                data_root=str(self.root), cache_enabled=False,
+                encoding_cache=EncodingCache(),
+                columnar_store=ColumnarStore(self.root / '.cache', input_root=self.root)
+            )
+            return loader.load_basic_manpower(11, 2025, file_path=str(self.xlsx))
+
+        first = load()
+        with patch.object(excel_reader, 'load_workbook') as workbook:
+            second = load()
+        workbook.assert_not_called()
+
+        self.assertEqual(len(first), 4)
+        pd.testing.assert_frame_equal(first, second)
+
+
+if __name__ == '__main__':
+    unittest.main()
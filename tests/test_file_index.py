@@ -0,0 +1,110 @@
+"""
+test_file_index.py - Unit tests for the input file index
+입력 파일 인덱스 단위 테스트
+
+Tests for:
+- InputFileIndex (file_index.py)
+- MonthlyDataCollector.detect_available_months / get_file_paths_for_month
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.file_index import InputFileIndex, parse_input_path
+from src.data.monthly_data_collector import MonthlyDataCollector
+
+
+class TestInputFileIndex(unittest.TestCase):
+    """
+    Test month discovery, multi-year resolution and incremental refresh
+    월 탐지, 다중 연도 해석 및 증분 갱신 테스트
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.input_dir = self.root / 'input_files'
+        self._write('basic manpower data september.csv')
+        self._write('2024/basic manpower data september.csv')
+        self._write('basic manpower data october 2024.csv')
+        self._write('attendance/converted/attendance data september_converted.csv')
+        self._write('attendance/converted/attendance_2025_09.csv')
+        self._write('attendance/original/attendance data september.csv')
+        self._write('AQL history/1.HSRG AQL REPORT-JULY.2024.csv')
+        (self.input_dir / 'sync_manifest.json').write_text(
+            json.dumps({'months': {'september': {'year': 2025, 'month': 9}}}), encoding='utf-8')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, relative, text='Employee No\n1\n'):
+        path = self.input_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+        return path
+
+    def test_parse_input_path(self):
+        """Sources, years and directories are recognized / 소스, 연도, 디렉토리 인식"""
+        self.assertEqual(parse_input_path('2024/basic manpower data may.csv')['year'], 2024)
+        self.assertEqual(parse_input_path('AQL history/1.HSRG AQL REPORT-JULY.2024.csv')['source'], 'aql')
+        self.assertIsNone(parse_input_path('attendance/original/attendance data may.csv'))
+        self.assertIsNone(parse_input_path('attendance data may_converted.csv'))
+
+    def test_multi_year_months(self):
+        """Same month name in two years resolves to two months / 두 연도의 같은 월 이름 구분"""
+        collector = MonthlyDataCollector(self.root, target_year=2026)
+
+        self.assertEqual(collector.detect_available_months(), ['2024-07', '2024-09', '2024-10', '2025-09'])
+        paths_2024 = collector.get_file_paths_for_month('2024-09')
+        paths_2025 = collector.get_file_paths_for_month('2025-09')
+        self.assertEqual(paths_2024['basic_manpower'], self.input_dir / '2024' / 'basic manpower data september.csv')
+        self.assertEqual(paths_2025['basic_manpower'], self.input_dir / 'basic manpower data september.csv')
+        # attendance_YYYY_MM.csv takes precedence / attendance_YYYY_MM.csv 우선
+        self.assertEqual(paths_2025['attendance'].name, 'attendance_2025_09.csv')
+        self.assertIsNone(paths_2024['attendance'])
+
+    def test_tiebreak_independent_of_walk_order(self):
+        """An explicit year beats the manifest year, then path order decides / 명시적 연도 우선, 이후 경로 순서"""
+        self._write('2025/basic manpower data september.csv')
+        self._write('basic manpower data september 2025.csv')
+        index = InputFileIndex(self.input_dir)
+        index.refresh()
+
+        for files in (dict(sorted(index.files.items())), dict(sorted(index.files.items(), reverse=True))):
+            index.files = files
+            chosen = index.resolve(2026)[('basic_manpower', 2025, 9)]['path']
+            self.assertEqual(chosen, self.input_dir / '2025' / 'basic manpower data september.csv')
+
+    def test_refresh_is_incremental(self):
+        """Unchanged directories are not walked again; edits update the hash / 변경 없으면 재순회 없음"""
+        index_path = self.root / '.cache' / 'file_index.json'
+        InputFileIndex(self.input_dir, index_path).refresh()
+
+        index = InputFileIndex(self.input_dir, index_path)
+        with patch('src.data.file_index.os.walk', wraps=os.walk) as walk:
+            self.assertFalse(index.refresh())
+            walk.assert_not_called()
+
+        old_hash = index.files['basic manpower data september.csv']['hash']
+        self._write('basic manpower data september.csv', 'Employee No\n1\n2\n')
+        with patch('src.data.file_index.os.walk', wraps=os.walk) as walk:
+            self.assertTrue(index.refresh())
+            walk.assert_not_called()
+        self.assertNotEqual(index.files['basic manpower data september.csv']['hash'], old_hash)
+
+        self._write('5prs data september.csv')
+        self.assertTrue(index.refresh())
+        self.assertIn(('5prs', 2025, 9), index.resolve(2026))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+test_generate_dashboard.py - Unit tests for the dashboard generation CLI helpers
+대시보드 생성 CLI 헬퍼 단위 테스트
+
+Tests for:
+- parse_languages (generate_dashboard.py)
+- get_dashboard_filename
+- copy_vendor_libraries
+"""
+
+import argparse
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.generate_dashboard import copy_vendor_libraries, get_dashboard_filename, parse_languages
+
+
+class TestParseLanguages(unittest.TestCase):
+    """
+    Test the --languages option parser
+    --languages 옵션 파서 테스트
+    """
+
+    def test_order_kept_and_duplicates_removed(self):
+        """Input order is kept, repeats are dropped / 입력 순서 유지, 중복 제거"""
+        self.assertEqual(parse_languages('en, KO,en,,vi'), ['en', 'ko', 'vi'])
+
+    def test_single_language(self):
+        """One language is a one-item list / 단일 언어는 항목 하나인 목록"""
+        self.assertEqual(parse_languages('vi'), ['vi'])
+
+    def test_unsupported_language(self):
+        """Unknown codes are rejected / 지원하지 않는 코드는 거부"""
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_languages('ko,fr')
+
+    def test_empty_list(self):
+        """At least one language is required / 최소 한 개 언어 필요"""
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_languages(' , ')
+
+
+class TestDashboardFilename(unittest.TestCase):
+    """
+    Test dashboard file naming
+    대시보드 파일명 테스트
+    """
+
+    def test_primary_language_has_no_suffix(self):
+        """The first language keeps the standard name / 첫 번째 언어는 기본 파일명"""
+        self.assertEqual(get_dashboard_filename(2025, 11), 'HR_Dashboard_Complete_2025_11.html')
+
+    def test_language_suffix_and_month_padding(self):
+        """Other languages get _<lang>, months are zero-padded / 보조 언어는 _<lang>, 월은 0 채움"""
+        self.assertEqual(get_dashboard_filename(2025, 9, 'en'), 'HR_Dashboard_Complete_2025_09_en.html')
+
+
+class TestCopyVendorLibraries(unittest.TestCase):
+    """
+    Test copying docs/vendor/ next to output dashboards
+    docs/vendor/를 출력 대시보드 옆에 복사하는 기능 테스트
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / 'docs' / 'vendor').mkdir(parents=True)
+        (self.root / 'docs' / 'vendor' / 'd3.v7.min.js').write_text('d3', encoding='utf-8')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_copied_to_output_dir(self):
+        """Missing or different files are copied / 없거나 다른 파일은 복사"""
+        output_dir = self.root / 'output_files'
+        output_dir.mkdir()
+        copy_vendor_libraries(output_dir, self.root)
+        self.assertEqual((output_dir / 'vendor' / 'd3.v7.min.js').read_text(encoding='utf-8'), 'd3')
+
+        (self.root / 'docs' / 'vendor' / 'd3.v7.min.js').write_text('d3 v7.9', encoding='utf-8')
+        copy_vendor_libraries(output_dir, self.root)
+        self.assertEqual((output_dir / 'vendor' / 'd3.v7.min.js').read_text(encoding='utf-8'), 'd3 v7.9')
+
+    def test_docs_output_left_alone(self):
+        """Writing into docs/ itself copies nothing / docs/ 자체에 출력하면 복사하지 않음"""
+        copy_vendor_libraries(self.root / 'docs', self.root)
+        self.assertEqual(sorted(p.name for p in (self.root / 'docs' / 'vendor').iterdir()), ['d3.v7.min.js'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+test_google_drive_manager.py - Smoke tests for the Google Drive sync command line
+Google Drive 동기화 명령줄 스모크 테스트
+
+google_drive_manager.py is run as a script in a subprocess. Placeholder google
+packages are written to a temporary directory on that subprocess's PYTHONPATH, so the
+script imports without the Google client libraries and without a network connection;
+they never reach the test process.
+google_drive_manager.py를 하위 프로세스에서 스크립트로 실행합니다. 임시 디렉토리에 작성한
+대체 google 패키지를 하위 프로세스의 PYTHONPATH에만 추가하므로 Google 클라이언트 라이브러리나
+네트워크 없이 import되며, 테스트 프로세스에는 영향을 주지 않습니다.
+
+Tests for:
+- google_drive_manager.py __main__ (argument parsing, imports as a script)
+- GoogleDriveManager._monthly_sync_tasks / _archived_months
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SCRIPT = PROJECT_ROOT / 'src' / 'integration' / 'google_drive_manager.py'
+
+# Module path → source of the placeholder google packages / 대체 google 패키지 모듈 경로 → 소스
+PLACEHOLDER_MODULES = {
+    'google/auth/transport/requests.py': 'class Request:\n    pass\n',
+    'google/oauth2/credentials.py': 'class Credentials:\n    pass\n',
+    'google/oauth2/service_account.py': 'class Credentials:\n    pass\n',
+    'google_auth_oauthlib/flow.py': 'class InstalledAppFlow:\n    pass\n',
+    'googleapiclient/discovery.py': 'def build(*args, **kwargs):\n    raise RuntimeError("offline")\n',
+    'googleapiclient/errors.py': 'class HttpError(Exception):\n    pass\n',
+}
+
+# Prints the local paths of a 13-month sync / 13개월 동기화의 로컬 경로 출력
+TASKS_SCRIPT = """
+import json
+from src.integration.google_drive_manager import GoogleDriveManager
+from src.utils.month_range import parse_month_range
+names = ['january', 'february', 'march', 'april', 'may', 'june',
+         'july', 'august', 'september', 'october', 'november', 'december']
+months = [(year, names[month - 1]) for year, month in parse_month_range('2024-09..2025-09')]
+archived = GoogleDriveManager._archived_months(months)
+manager = GoogleDriveManager.__new__(GoogleDriveManager)
+tasks = [task for year, month in months
+         for task in manager._monthly_sync_tasks(year, month, (year, month) in archived)]
+print(json.dumps([[task.drive_path, task.local_path] for task in tasks]))
+"""
+
+
+class TestDriveManagerScript(unittest.TestCase):
+    """
+    Run google_drive_manager.py the way users do
+    사용자와 같은 방식으로 google_drive_manager.py 실행
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.root = Path(cls.tmp.name)
+        placeholders = cls.root / 'placeholders'
+        for relative, source in PLACEHOLDER_MODULES.items():
+            path = placeholders / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(source, encoding='utf-8')
+            for package in path.relative_to(placeholders).parents:
+                (placeholders / package / '__init__.py').touch()
+        # The script logs to logs/drive_sync.log under the working directory
+        # 스크립트는 작업 디렉토리의 logs/drive_sync.log에 기록
+        cls.workdir = cls.root / 'work'
+        (cls.workdir / 'logs').mkdir(parents=True)
+        cls.env = dict(os.environ, PYTHONPATH=str(placeholders))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def _run(self, *args, env=None):
+        return subprocess.run([sys.executable, *args], cwd=self.workdir, env=env or self.env,
+                              capture_output=True, text=True, encoding='utf-8', timeout=120)
+
+    def test_help(self):
+        """The script imports and parses arguments / 스크립트 import 및 인수 파싱"""
+        result = self._run(str(SCRIPT), '--help')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn('--months', result.stdout)
+
+    def test_malformed_month_range(self):
+        """A bad --months is an argparse error, not a traceback / 잘못된 --months는 argparse 오류"""
+        result = self._run(str(SCRIPT), '--months', '2025-13')
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("invalid month '2025-13'", result.stderr)
+        self.assertNotIn('Traceback', result.stderr)
+
+    def test_runs_without_credentials(self):
+        """Without credentials the run stops at initialization / 자격 증명이 없으면 초기화 단계에서 종료"""
+        result = self._run(str(SCRIPT), '--months', '2025-07..2025-09',
+                           '--config', 'missing.json', '--credentials', 'missing.json')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn('Failed to initialize Google Drive connection', result.stdout)
+        self.assertNotIn('Traceback', result.stderr)
+
+    def test_local_paths_unique_across_years(self):
+        """Over 12 months, earlier years go to input_files/{year}/ / 12개월 초과 시 이전 연도는 input_files/{year}/"""
+        env = dict(self.env, PYTHONPATH=os.pathsep.join([self.env['PYTHONPATH'], str(PROJECT_ROOT)]))
+        result = self._run('-c', TASKS_SCRIPT, env=env)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        tasks = dict(json.loads(result.stdout.splitlines()[-1]))
+
+        by_local = {}
+        for drive_path, local_path in tasks.items():
+            self.assertEqual(by_local.setdefault(local_path, drive_path), drive_path)
+        self.assertEqual(tasks['monthly_data/2024_09/basic_manpower_data.csv'],
+                         'input_files/2024/basic manpower data september.csv')
+        self.assertEqual(tasks['monthly_data/2025_09/attendance_data.csv'],
+                         'input_files/attendance/original/attendance data september.csv')
+        self.assertEqual(tasks['monthly_data/2024_10/5prs_data.csv'], 'input_files/5prs data october.csv')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+test_input_file_watcher.py - Unit tests for watch mode helpers
+감시 모드 헬퍼 단위 테스트
+
+Tests for:
+- InputFileWatcher (input_file_watcher.py)
+- MonthlyDataCollector.find_month_for_file / cache invalidation / per-source loading
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.input_file_watcher import InputFileWatcher
+from src.data.monthly_data_collector import MonthlyDataCollector
+
+
+class TestInputFileWatcher(unittest.TestCase):
+    """
+    Test polling change detection
+    폴링 변경 감지 테스트
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input_dir = Path(self.tmp.name)
+        self.manpower = self.input_dir / "basic manpower data october.csv"
+        self.manpower.write_text("Employee No\n1\n", encoding='utf-8')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_no_changes(self):
+        """Unchanged files are not reported / 변경 없는 파일은 보고되지 않음"""
+        watcher = InputFileWatcher(self.input_dir)
+        self.assertEqual(watcher.poll(), set())
+
+    def test_modified_added_removed(self):
+        """Modified, added and removed files are reported / 수정·추가·삭제 파일 보고"""
+        watcher = InputFileWatcher(self.input_dir)
+
+        stat = self.manpower.stat()
+        os.utime(self.manpower, (stat.st_atime, stat.st_mtime + 10))
+        added = self.input_dir / "5prs data october.csv"
+        added.write_text("x\n", encoding='utf-8')
+        self.assertEqual(watcher.poll(), {self.manpower, added})
+
+        added.unlink()
+        self.assertEqual(watcher.poll(), {added})
+
+    def test_unwatched_files_ignored(self):
+        """Files outside the watch patterns are ignored / 감시 패턴 외 파일은 무시"""
+        watcher = InputFileWatcher(self.input_dir)
+        (self.input_dir / "notes.txt").write_text("x", encoding='utf-8')
+        self.assertEqual(watcher.poll(), set())
+
+    def test_year_archives_watched(self):
+        """Year folders and year-suffixed files are inputs too / 연도 폴더와 연도 접미사 파일도 감시"""
+        watcher = InputFileWatcher(self.input_dir)
+
+        archived = self.input_dir / "2024" / "attendance" / "converted" / "attendance data october_converted.csv"
+        archived.parent.mkdir(parents=True)
+        archived.write_text("ID No\n1\n", encoding='utf-8')
+        suffixed = self.input_dir / "basic manpower data october 2024.csv"
+        suffixed.write_text("Employee No\n1\n", encoding='utf-8')
+        self.assertEqual(watcher.poll(), {archived, suffixed})
+
+        archived.write_text("ID No\n1\n2\n", encoding='utf-8')
+        self.assertEqual(watcher.poll(), {archived})
+
+    def test_wait_for_changes_debounces(self):
+        """Pending changes are returned once quiet / 변경이 잠잠해지면 반환"""
+        watcher = InputFileWatcher(self.input_dir, poll_interval=0.01, debounce_seconds=0.05)
+        (self.input_dir / "sync_manifest.json").write_text("{}", encoding='utf-8')
+        changed = watcher.wait_for_changes()
+        self.assertEqual(changed, {self.input_dir / "sync_manifest.json"})
+
+    def test_wait_for_changes_stop(self):
+        """should_stop aborts the wait / should_stop으로 대기 중단"""
+        watcher = InputFileWatcher(self.input_dir, poll_interval=0.01)
+        self.assertEqual(watcher.wait_for_changes(should_stop=lambda: True), set())
+
+
+class TestCollectorWatchSupport(unittest.TestCase):
+    """
+    Test month lookup and cache invalidation used by watch mode
+    감시 모드에서 사용하는 월 조회 및 캐시 무효화 테스트
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "input_files").mkdir()
+        self.collector = MonthlyDataCollector(self.root, target_year=2025, cache_data=True)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_find_month_for_file(self):
+        """Monthly input files map to YYYY-MM / 월별 입력 파일의 월 판별"""
+        cases = {
+            "basic manpower data september.csv": "2025-09",
+            "attendance data october_converted.csv": "2025-10",
+            "attendance_2025_11.csv": "2025-11",
+            "AQL history july.csv": "2025-07",
+            "1.HSRG AQL REPORT-AUGUST.2025.csv": "2025-08",
+            "5prs data december.csv": "2025-12",
+            "sync_manifest.json": None,
+        }
+        for filename, expected in cases.items():
+            self.assertEqual(self.collector.find_month_for_file(Path(filename)), expected, filename)
+
+    def test_cache_invalidation(self):
+        """Cached frames are reloaded after invalidation / 무효화 후 다시 로드"""
+        manpower = self.root / "input_files" / "basic manpower data october.csv"
+        manpower.write_text("Employee No\n1\n", encoding='utf-8')
+        self.assertEqual(len(self.collector.load_month_data('2025-10')['basic_manpower']), 1)
+
+        manpower.write_text("Employee No\n1\n2\n", encoding='utf-8')
+        self.assertEqual(len(self.collector.load_month_data('2025-10')['basic_manpower']), 1)
+
+        self.collector.invalidate_cache('2025-10')
+        self.assertEqual(len(self.collector.load_month_data('2025-10')['basic_manpower']), 2)
+
+    def test_load_requested_sources_only(self):
+        """Only requested sources are read, each once / 요청한 소스만 한 번씩 읽음"""
+        (self.root / "input_files" / "basic manpower data october.csv").write_text("Employee No\n1\n", encoding='utf-8')
+        (self.root / "input_files" / "5prs data october.csv").write_text("ID\n1\n", encoding='utf-8')
+        read_through = self.collector.store.read_through
+
+        with patch.object(self.collector.store, 'read_through', side_effect=read_through) as reads:
+            data = self.collector.load_month_data('2025-10', sources=['basic_manpower'])
+            self.assertEqual(list(data), ['basic_manpower'])
+            self.assertEqual(reads.call_count, 1)
+
+            data = self.collector.load_month_data('2025-10')
+            self.assertEqual(len(data['5prs']), 1)
+            self.assertEqual(reads.call_count, 2)  # basic_manpower was memoized / 메모이즈됨
+
+        with self.assertRaises(ValueError):
+            self.collector.load_month_data('2025-10', sources=['payroll'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+test_metric_cache.py - Unit tests for the persisted metric cache
+디스크에 저장되는 메트릭 캐시 단위 테스트
+
+Tests for:
+- HRMetricCalculator.calculate_all_metrics disk tier (hr_metric_calculator.py)
+"""
+
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data import schemas
+from src.data.monthly_data_collector import MonthlyDataCollector
+from src.analytics import hr_metric_calculator
+from src.analytics.hr_metric_calculator import HRMetricCalculator
+
+
+class TestPersistedMetricCache(unittest.TestCase):
+    """
+    Metrics computed by one process are reused by the next until an input changes
+    한 프로세스에서 계산한 메트릭을 입력이 바뀔 때까지 다음 프로세스가 재사용
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.manpower = self.root / 'input_files' / 'basic manpower data november.csv'
+        self.manpower.parent.mkdir(parents=True)
+        self.manpower.write_text('Employee No,FULL NAME\n1,A\n', encoding='utf-8')
+        HRMetricCalculator.clear_cache()
+
+    def tearDown(self):
+        HRMetricCalculator.clear_cache()
+        self.tmp.cleanup()
+
+    def _calculate(self):
+        """Fresh process: empty memory cache / 새 프로세스: 메모리 캐시 없음"""
+        HRMetricCalculator.clear_cache()
+        collector = MonthlyDataCollector(self.root, target_year=2025)
+        calculator = HRMetricCalculator(collector, report_date=datetime(2025, 11, 30))
+        calculator._cache_enabled = True
+        with patch.object(HRMetricCalculator, '_calculate_month', return_value={'total_employees': 1}) as calc:
+            metrics = calculator.calculate_all_metrics(['2025-11'])
+        return metrics, calc.call_count
+
+    def test_reused_across_processes(self):
+        """Second calculator reads the persisted metrics / 두 번째 계산기는 저장된 메트릭 사용"""
+        first, first_calls = self._calculate()
+        second, second_calls = self._calculate()
+
+        self.assertEqual((first_calls, second_calls), (1, 0))
+        self.assertEqual(second['2025-11'], {'total_employees': 1})
+        self.assertTrue(list((self.root / '.cache' / 'metrics').glob('2025-11_20251130.pkl')))
+
+    def test_input_change_invalidates(self):
+        """Changing an input file recomputes the month / 입력 파일 변경 시 재계산"""
+        self._calculate()
+        self.manpower.write_text('Employee No,FULL NAME\n1,A\n2,B\n', encoding='utf-8')
+
+        _, calls = self._calculate()
+        self.assertEqual(calls, 1)
+
+    def test_version_bump_invalidates(self):
+        """A schema or cache version bump recomputes the month / 스키마 또는 캐시 버전 증가 시 재계산"""
+        self._calculate()
+
+        with patch.object(schemas, 'SCHEMA_VERSION', schemas.SCHEMA_VERSION + 1):
+            _, schema_calls = self._calculate()
+        with patch.object(hr_metric_calculator, 'METRIC_CACHE_VERSION', hr_metric_calculator.METRIC_CACHE_VERSION + 1):
+            _, cache_calls = self._calculate()
+
+        self.assertEqual((schema_calls, cache_calls), (1, 1))
+
+    def test_loader_module_change_invalidates(self):
+        """Editing a module that locates or decodes inputs recomputes / 입력 탐색·디코딩 모듈 수정 시 재계산"""
+        self._calculate()
+        signature = hr_metric_calculator.file_signature
+        edited = Path(hr_metric_calculator.encoding_cache.__file__)
+
+        def edited_signature(path):
+            result = signature(path)
+            return dict(result, mtime_ns=result['mtime_ns'] + 1) if Path(path) == edited else result
+
+        with patch.object(hr_metric_calculator, 'file_signature', side_effect=edited_signature):
+            _, calls = self._calculate()
+        self.assertEqual(calls, 1)
+
+    def test_fingerprint_errors(self):
+        """A malformed month has no fingerprint; other errors are raised / 잘못된 월은 서명 없음, 그 외 오류는 전파"""
+        calculator = HRMetricCalculator(MonthlyDataCollector(self.root, target_year=2025))
+        self.assertIsNone(calculator._input_fingerprint('2025/11'))
+
+        with patch.object(calculator.data_collector, 'get_file_paths_for_month', side_effect=KeyError('source')):
+            with self.assertRaises(KeyError):
+                calculator._input_fingerprint('2025-11')
+
+
+if __name__ == '__main__':
+    unittest.main()
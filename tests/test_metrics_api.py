@@ -0,0 +1,176 @@
+"""
+test_metrics_api.py - Unit tests for the local JSON metrics API
+로컬 JSON 메트릭 API 단위 테스트
+
+Tests for:
+- create_server / MetricsRequestHandler (metrics_api.py)
+- route_key
+"""
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.client import HTTPConnection
+from pathlib import Path
+import sys
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analytics.hr_metric_calculator import HRMetricCalculator
+from src.api.metrics_api import DashboardDataStore, EncodedResponse, create_server, route_key
+from tests.fixtures import write_fixture_month
+
+
+class TestMetricsServer(unittest.TestCase):
+    """
+    Requests against a server on a free port over the fixture month
+    픽스처 월 데이터를 제공하는 임의 포트 서버에 대한 요청 테스트
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        write_fixture_month(self.root)
+        self.cwd = os.getcwd()
+        os.chdir(self.root)
+        HRMetricCalculator.clear_cache()
+
+        self.server = create_server(self.root, port=0, year=2025,
+                                    allowed_origins=['http://localhost:8000'])
+        self.server.RequestHandlerClass.log_message = lambda *args: None
+        self.store = self.server.RequestHandlerClass.store
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        os.chdir(self.cwd)
+        HRMetricCalculator.clear_cache()
+        self.tmp.cleanup()
+
+    def _get(self, path, **headers):
+        connection = HTTPConnection('127.0.0.1', self.server.server_address[1], timeout=30)
+        try:
+            connection.request('GET', path, headers=headers)
+            response = connection.getresponse()
+            return response, response.read()
+        finally:
+            connection.close()
+
+    def test_etag_revalidation(self):
+        """200 with an ETag, then 304 for If-None-Match / ETag와 함께 200, If-None-Match에는 304"""
+        response, body = self._get('/api/metrics/2025-11')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(json.loads(body)['month'], '2025-11')
+        etag = response.getheader('ETag')
+        self.assertTrue(etag.startswith('W/"'))
+
+        response, body = self._get('/api/metrics/2025-11', **{'If-None-Match': etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b'')
+
+    def test_gzip(self):
+        """Large responses are gzipped when accepted / 허용 시 큰 응답은 gzip 압축"""
+        plain_response, plain = self._get('/api/employees/2025-11')
+        response, body = self._get('/api/employees/2025-11', **{'Accept-Encoding': 'gzip'})
+
+        self.assertIsNone(plain_response.getheader('Content-Encoding'))
+        self.assertEqual(response.getheader('Content-Encoding'), 'gzip')
+        self.assertEqual(gzip.decompress(body), plain)
+        self.assertEqual(json.loads(plain)['count'], 4)
+
+    def test_team_filter(self):
+        """?team= returns that team's employees only / ?team=은 해당 팀 직원만 반환"""
+        response, body = self._get('/api/employees/2025-11?team=ASSEMBLY')
+        self.assertEqual(response.status, 200)
+        employees = json.loads(body)['employees']
+        self.assertEqual(sorted(e['employee_id'] for e in employees), ['600000', '600003'])
+
+    def test_flag_filter(self):
+        """?flag= keeps rows where the flag is true, alone or with ?team= / ?flag=는 플래그가 참인 행만 유지"""
+        _, body = self._get('/api/employees/2025-11?flag=hired_this_month')
+        self.assertEqual([e['employee_id'] for e in json.loads(body)['employees']], ['600001'])
+
+        _, body = self._get('/api/employees/2025-11?flag=is_active&team=CUTTING')
+        self.assertEqual(json.loads(body)['count'], 0)
+
+        response, body = self._get('/api/employees/2025-11?flag=employee_name')
+        self.assertEqual(response.status, 400)
+        self.assertIn('is_active', json.loads(body)['flags'])
+
+    def test_attendance_records(self):
+        """/api/attendance returns the employee's records in date order / 직원의 출결 기록을 날짜순으로 반환"""
+        _, body = self._get('/api/attendance/2025-11/600000')
+        payload = json.loads(body)
+        self.assertEqual(payload['employee_no'], '600000')
+        self.assertEqual([(r['employee_no'], r['work_date']) for r in payload['records']],
+                         [('600000', '2025.11.03'), ('600000', '2025.11.04')])
+
+        _, body = self._get('/api/attendance/2025-11/600003')
+        self.assertEqual(json.loads(body)['records'], [])
+
+    def test_unknown_month(self):
+        """A month without input files is 404 / 입력 파일이 없는 월은 404"""
+        response, body = self._get('/api/metrics/2025-01')
+        self.assertEqual(response.status, 404)
+        self.assertIn('2025-01', json.loads(body)['error'])
+
+    def test_cors_allow_list(self):
+        """Only allow-listed origins are echoed / 허용 목록의 출처만 반환"""
+        response, _ = self._get('/api/months', Origin='http://localhost:8000')
+        self.assertEqual(response.getheader('Access-Control-Allow-Origin'), 'http://localhost:8000')
+
+        response, _ = self._get('/api/months', Origin='https://example.com')
+        self.assertIsNone(response.getheader('Access-Control-Allow-Origin'))
+
+    def test_cache_keyed_by_route(self):
+        """Parameter order and unused parameters share one entry / 파라미터 순서와 미사용 파라미터는 같은 항목 사용"""
+        self._get('/api/employees/2025-11?team=ASSEMBLY&flag=is_active')
+        self._get('/api/employees/2025-11?flag=is_active&team=ASSEMBLY&_=1')
+        self._get('/api/months?_=1')
+        self._get('/api/months?_=2')
+
+        self.assertEqual(list(self.store.responses), [
+            'employees/2025-11?flag=is_active&team=ASSEMBLY',
+            'months'
+        ])
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    Test response cache keys and LRU bound
+    응답 캐시 키 및 LRU 크기 제한 테스트
+    """
+
+    def test_least_recently_used_evicted(self):
+        """Entries beyond max_responses are dropped oldest-use first / 초과 항목은 가장 오래 사용된 것부터 삭제"""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = DashboardDataStore(Path(tmp), year=2025, max_responses=2)
+            response = EncodedResponse.encode(200, b'{}')
+            store.put_response('months', response)
+            store.put_response('metrics/2025-10', response)
+            store.get_response('months')
+            store.put_response('metrics/2025-11', response)
+
+            self.assertEqual(list(store.responses), ['months', 'metrics/2025-11'])
+
+    def test_gzip_computed_once(self):
+        """Large bodies are compressed when encoded / 큰 본문은 인코딩 시 한 번 압축"""
+        body = json.dumps({'rows': list(range(1000))}).encode('utf-8')
+        self.assertEqual(gzip.decompress(EncodedResponse.encode(200, body).gzipped), body)
+        self.assertIsNone(EncodedResponse.encode(200, b'{}').gzipped)
+
+    def test_blank_parameters_dropped(self):
+        """Empty known parameters are left out / 빈 파라미터는 제외"""
+        self.assertEqual(route_key(['employees', '2025-11'], {'team': [''], 'flag': ['is_active']}),
+                         'employees/2025-11?flag=is_active')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+test_month_range.py - Unit tests for --months parsing
+--months 파싱 단위 테스트
+
+Tests for:
+- parse_month_range (month_range.py)
+"""
+
+import argparse
+import unittest
+from pathlib import Path
+import sys
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.month_range import parse_month_range
+
+
+class TestParseMonthRange(unittest.TestCase):
+    """
+    Test month ranges and lists
+    월 범위 및 목록 테스트
+    """
+
+    def test_range_across_year_end(self):
+        """A range continues into January / 범위는 다음 해 1월로 이어짐"""
+        self.assertEqual(parse_month_range('2025-11..2026-02'),
+                         [(2025, 11), (2025, 12), (2026, 1), (2026, 2)])
+
+    def test_list_sorted_and_deduplicated(self):
+        """Lists and ranges merge into sorted unique months / 목록과 범위는 정렬·중복 제거"""
+        self.assertEqual(parse_month_range('2025-09, 2025-07..2025-08,2025-09'),
+                         [(2025, 7), (2025, 8), (2025, 9)])
+
+    def test_invalid_values(self):
+        """Bad months and reversed ranges are rejected / 잘못된 월과 역순 범위는 거부"""
+        for value in ('2025-13', '2025/07', '2025-09..2025-07', ','):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                parse_month_range(value)
+
+
+if __name__ == '__main__':
+    unittest.main()
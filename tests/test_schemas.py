@@ -0,0 +1,72 @@
+"""
+test_schemas.py - Unit tests for the typed input schema registry
+타입 입력 스키마 레지스트리 단위 테스트
+
+Tests for:
+- read_source / apply_schema (schemas.py)
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.schemas import apply_schema, read_source
+
+
+BASIC_CSV = """Employee No,Full Name,Entrance Date,Stop working Date,ROLE TYPE STD,QIP POSITION 1ST  NAME,MST direct boss name,BUILDING,LINE
+600000,Nguyễn Văn An,2025-01-02,,TYPE-1,OSC LEADER,,B1,L1
+600001,Trần Thị Bình,2025-02-03,2025-11-15,TYPE-2,ASSEMBLY LINE TQC,600000.0,B1,L1
+600002,Lê Hoàng Cường,03/04/2025,,TYPE-2,ASSEMBLY LINE TQC,600000.0,B2,L2
+"""
+
+
+class TestSchemas(unittest.TestCase):
+    """
+    Test declared dtypes and violation reporting
+    선언된 dtype 및 위반 보고 테스트
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'basic manpower data november.csv'
+        self.path.write_text(BASIC_CSV, encoding='utf-8')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_declared_dtypes(self):
+        """IDs are integers, labels categoricals, dates text / ID는 정수, 라벨은 범주형, 날짜는 텍스트"""
+        df = read_source(self.path, 'basic_manpower')
+
+        self.assertEqual(df['Employee No'].dtype, 'int64')
+        self.assertEqual(df['MST direct boss name'].dtype, 'Int64')
+        self.assertEqual(df['MST direct boss name'].tolist()[1:], [600000, 600000])
+        self.assertTrue(pd.isna(df.loc[0, 'MST direct boss name']))
+        for column in ['ROLE TYPE STD', 'QIP POSITION 1ST  NAME', 'BUILDING', 'LINE']:
+            self.assertIsInstance(df[column].dtype, pd.CategoricalDtype, column)
+        self.assertEqual(df.loc[2, 'Entrance Date'], '03/04/2025')
+
+    def test_violations_are_reported(self):
+        """Bad values are reported, not raised / 잘못된 값은 예외 대신 보고"""
+        raw = pd.read_csv(self.path)
+        raw['MST direct boss name'] = ['', 'N/A', '600000']
+        raw['Entrance Date'] = ['2025-01-02', 'soon', '2025-03-04']
+
+        df, violations = apply_schema(raw, 'basic_manpower')
+
+        self.assertEqual(len(violations), 2)
+        self.assertTrue(any(v.startswith('MST direct boss name') for v in violations))
+        self.assertTrue(any(v.startswith('Entrance Date') for v in violations))
+        self.assertTrue(pd.isna(df.loc[1, 'MST direct boss name']))
+        self.assertEqual(df.loc[2, 'MST direct boss name'], 600000)
+
+
+if __name__ == '__main__':
+    unittest.main()
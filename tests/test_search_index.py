@@ -0,0 +1,66 @@
+"""
+test_search_index.py - Unit tests for the dashboard search index
+대시보드 검색 인덱스 단위 테스트
+
+Tests for:
+- fold_search_text / tokenize_search_text (search_index.py)
+- build_search_index
+"""
+
+import unittest
+from pathlib import Path
+import sys
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.search_index import build_search_index, fold_search_text, tokenize_search_text
+
+
+class TestSearchTextFolding(unittest.TestCase):
+    """
+    Test Vietnamese diacritics folding
+    베트남어 성조 제거 테스트
+    """
+
+    def test_fold_vietnamese(self):
+        """Diacritics and đ are folded / 성조 및 đ 정규화"""
+        self.assertEqual(fold_search_text('Nguyễn Thị Đào'), 'nguyen thi dao')
+        self.assertEqual(fold_search_text('TRƯƠNG Ơn'), 'truong on')
+
+    def test_fold_missing_values(self):
+        """None and NaN fold to '' / None과 NaN은 빈 문자열"""
+        self.assertEqual(fold_search_text(None), '')
+        self.assertEqual(fold_search_text(float('nan')), '')
+
+    def test_tokenize(self):
+        """Punctuation and underscores split tokens / 구두점과 밑줄로 토큰 분리"""
+        self.assertEqual(tokenize_search_text('Lê Văn-An (LINE_2)'), ['le', 'van', 'an', 'line', '2'])
+
+
+class TestBuildSearchIndex(unittest.TestCase):
+    """
+    Test sorted token postings
+    정렬된 토큰 목록 테스트
+    """
+
+    def test_postings_sorted(self):
+        """Tokens are sorted and map to ascending row ids / 토큰 정렬 및 오름차순 행 번호"""
+        records = [
+            {'employee_id': '620060128', 'employee_name': 'Nguyễn Văn An'},
+            {'employee_id': '620060129', 'employee_name': 'Trần Thị An'},
+            {'employee_id': '620060130', 'employee_name': None},
+        ]
+        index = build_search_index(records, ['employee_id', 'employee_name'])
+
+        tokens = [token for token, _ in index]
+        self.assertEqual(tokens, sorted(tokens))
+        postings = dict((token, rows) for token, rows in index)
+        self.assertEqual(postings['an'], [0, 1])
+        self.assertEqual(postings['tran'], [1])
+        self.assertEqual(postings['620060130'], [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+test_service_worker.py - Unit tests for the docs/ service worker generator
+docs/ 서비스 워커 생성기 단위 테스트
+
+Tests for:
+- ServiceWorkerGenerator.build_precache_manifest (service_worker.py)
+- ServiceWorkerGenerator.write
+- LAZY_VISUALIZATION_LIBRARIES offline fallback (complete_dashboard_builder.py)
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Add src to path
+# src를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.visualization.complete_dashboard_builder import LAZY_VISUALIZATION_LIBRARIES
+from src.visualization.service_worker import ServiceWorkerGenerator
+
+DOCS_DIR = Path(__file__).parent.parent / 'docs'
+
+
+class TestServiceWorkerGenerator(unittest.TestCase):
+    """
+    Test precache manifest and sw.js generation
+    사전 캐시 매니페스트 및 sw.js 생성 테스트
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.docs = Path(self.tmp.name)
+        for name in ['auth.html', 'selector.html', 'app.html']:
+            (self.docs / name).write_text(name, encoding='utf-8')
+        dashboards = []
+        for month in range(1, 5):
+            filename = f'HR_Dashboard_Complete_2025_{month:02d}.html'
+            (self.docs / filename).write_text(f'month {month}', encoding='utf-8')
+            dashboards.append({'file': filename, 'year': 2025, 'month': month})
+        (self.docs / 'dashboards.json').write_text(json.dumps({'dashboards': dashboards}), encoding='utf-8')
+        (self.docs / 'vendor').mkdir()
+        (self.docs / 'vendor' / 'd3.v7.min.js').write_text('d3', encoding='utf-8')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_manifest_contents(self):
+        """Pages, latest dashboards and vendor files; no dashboards.json / 페이지, 최근 대시보드, vendor 파일 포함"""
+        manifest = ServiceWorkerGenerator(self.docs, max_dashboards=2).build_precache_manifest()
+        urls = [entry['url'] for entry in manifest['files']]
+
+        self.assertIn('vendor/d3.v7.min.js', urls)
+        self.assertIn('HR_Dashboard_Complete_2025_04.html', urls)
+        self.assertIn('HR_Dashboard_Complete_2025_03.html', urls)
+        self.assertNotIn('HR_Dashboard_Complete_2025_02.html', urls)
+        self.assertNotIn('dashboards.json', urls)
+        self.assertNotIn('index.html', urls)  # missing files are skipped / 없는 파일은 제외
+
+    def test_version_tracks_content(self):
+        """Version changes only when a precached file changes / 사전 캐시 파일 변경 시에만 버전 변경"""
+        generator = ServiceWorkerGenerator(self.docs)
+        first = generator.build_precache_manifest()
+        self.assertEqual(first['version'], generator.build_precache_manifest()['version'])
+
+        (self.docs / 'HR_Dashboard_Complete_2025_04.html').write_text('rebuilt', encoding='utf-8')
+        second = generator.build_precache_manifest()
+        self.assertNotEqual(first['version'], second['version'])
+
+        old_hashes = {e['url']: e['hash'] for e in first['files']}
+        changed = [e['url'] for e in second['files'] if old_hashes.get(e['url']) != e['hash']]
+        self.assertEqual(changed, ['HR_Dashboard_Complete_2025_04.html'])
+
+    def test_write(self):
+        """sw.js embeds the manifest version / sw.js에 매니페스트 버전 포함"""
+        manifest = ServiceWorkerGenerator(self.docs).write()
+        saved = json.loads((self.docs / 'precache-manifest.json').read_text(encoding='utf-8'))
+        sw_js = (self.docs / 'sw.js').read_text(encoding='utf-8')
+
+        self.assertEqual(saved, manifest)
+        self.assertIn(f"const PRECACHE_VERSION = '{manifest['version']}';", sw_js)
+        self.assertNotIn('__PRECACHE_VERSION__', sw_js)
+
+
+class TestVendoredLibraries(unittest.TestCase):
+    """
+    The offline fallback of each lazily loaded library ships with the site
+    지연 로드 라이브러리의 오프라인 대체 파일이 사이트에 포함되어 있는지 확인
+    """
+
+    def test_fallbacks_resolve_and_are_precached(self):
+        """Every relative source exists under docs/ and is precached / 모든 상대 경로가 docs/에 있고 사전 캐시됨"""
+        precached = {entry['url'] for entry in ServiceWorkerGenerator(DOCS_DIR).build_precache_manifest()['files']}
+
+        for name, sources in LAZY_VISUALIZATION_LIBRARIES.items():
+            fallbacks = [url for url in sources if '://' not in url]
+            self.assertTrue(fallbacks, name)
+            for url in fallbacks:
+                self.assertTrue((DOCS_DIR / url).is_file(), url)
+                self.assertIn(url, precached)
+
+    def test_pinned_versions(self):
+        """Vendored files are the versions the CDN URLs pin / vendor 파일 버전이 CDN URL 버전과 일치"""
+        headers = {url: (DOCS_DIR / url).read_text(encoding='utf-8')[:200]
+                   for sources in LAZY_VISUALIZATION_LIBRARIES.values() for url in sources if '://' not in url}
+
+        self.assertIn('d3js.org v7.', headers['vendor/d3.v7.min.js'])
+        self.assertIn('plotly.js v2.26.0', headers['vendor/plotly-2.26.0.min.js'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ Tests for:
 - StyleGenerator (style_generator.py)
 - JSUtilities (js_utilities.py)
 - VirtualScrollGenerator (virtual_scroll.py)
+- DashboardWorkerGenerator (dashboard_worker.py)
 - Design Tokens (design_tokens.json)
 """
 
@@ -21,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.visualization.style_generator import StyleGenerator
 from src.visualization.js_utilities import JSUtilities
 from src.visualization.virtual_scroll import VirtualScrollGenerator
+from src.visualization.dashboard_worker import DashboardWorkerGenerator
 
 
 class TestDesignTokens(unittest.TestCase):
@@ -311,6 +313,30 @@ class TestVirtualScrollGenerator(unittest.TestCase):
         self.assertIn('rowHeight: 50', js)
 
 
+class TestDashboardWorkerGenerator(unittest.TestCase):
+    """
+    Test DashboardWorkerGenerator output
+    DashboardWorkerGenerator 출력 테스트
+    """
+
+    def test_get_worker_js(self):
+        """Test worker JS generation / 워커 JS 생성 테스트"""
+        js = DashboardWorkerGenerator().get_worker_js()
+
+        self.assertIn('DashboardWorkerTasks', js)
+        self.assertIn('DashboardWorker', js)
+        self.assertIn('new Blob', js)
+        self.assertIn('fallBackToMainThread', js)
+        for task in ('summary:', 'filter:', 'tenureBuckets:', 'teamStats:', 'employeeCsv:'):
+            self.assertIn(task, js)
+
+    def test_safe_for_builder_template(self):
+        """Output has no doubled braces (builder unescapes them) / 빌더가 변환하는 이중 중괄호 없음"""
+        js = DashboardWorkerGenerator().get_worker_js()
+        self.assertNotIn('{{', js)
+        self.assertNotIn('}}', js)
+
+
 class TestInputValidation(unittest.TestCase):
     """
     Test input validation in generate_dashboard.py